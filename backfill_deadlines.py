@@ -0,0 +1,142 @@
+# backfill_deadlines.py
+"""
+기존 채용 공고의 deadline 문자열을 deadline_at/deadline_kind로 한 번에 채우는 도구
+
+새로 저장되는 공고는 저장 시점에 deadline.annotate_deadline()으로 채워지므로,
+이 도구는 컬럼 추가 전에 쌓인 공고에만 필요하다. alembic 마이그레이션(add_deadline_at)은 컬럼과
+인덱스만 추가하므로 업그레이드 뒤 이 도구를 한 번 실행한다. 연도가 없는 마감일("~ 4/6")은
+공고 등록 시각(created_at)을 기준으로 연도를 정한다.
+
+사용 예:
+    python backfill_deadlines.py                 # SQL 저장소 (DATABASE_URL)
+    python backfill_deadlines.py --storage json  # JSON 저장소 (data/jobs.json)
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional
+import argparse
+import logging
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Connection
+
+from deadline import annotate_deadline, parse_deadline
+from models import JobPosting
+from storage import JsonCollection
+
+logger = logging.getLogger(__name__)
+
+
+def _created_at(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _backfill_batch(conn, last_id: int, batch_size: int, overwrite: bool, counts: Counter) -> Optional[int]:
+    """id가 last_id보다 큰 공고 batch_size개를 채우고 마지막 id를 반환 (남은 공고가 없으면 None)"""
+    table = JobPosting.__table__
+    query = select(table.c.id, table.c.deadline, table.c.created_at, table.c.extra).where(table.c.id > last_id)
+    if not overwrite:
+        query = query.where(table.c.deadline_at.is_(None), table.c.deadline_kind.is_(None))
+    rows = conn.execute(query.order_by(table.c.id).limit(batch_size)).all()
+    if not rows:
+        return None
+
+    params = []
+    for job_id, deadline, created_at, extra in rows:
+        # 사람인 크롤링 결과는 접수기간(application_period)이 extra에 들어 있을 수 있음
+        value = deadline or (extra or {}).get('application_period')
+        deadline_at, kind = parse_deadline(value, now=_created_at(created_at))
+        counts[kind or 'unparsed'] += 1
+        if kind:
+            params.append({'_id': job_id, '_deadline_at': deadline_at, '_deadline_kind': kind})
+    if params:
+        conn.execute(table.update().where(table.c.id == bindparam('_id'))
+                     .values(deadline_at=bindparam('_deadline_at'), deadline_kind=bindparam('_deadline_kind')), params)
+    counts['updated'] += len(params)
+    return rows[-1][0]
+
+
+def backfill(bind=None, batch_size: int = 1000, overwrite: bool = False) -> Dict[str, int]:
+    """
+    SQL 저장소의 deadline_at/deadline_kind 채우기
+
+    Args:
+        bind: 엔진 또는 이미 트랜잭션 안에 있는 연결 (기본값은 models.engine)
+        batch_size (int): 한 번에 읽고 갱신할 행 수 (엔진이면 배치마다 커밋해 쓰기 잠금을 오래 잡지 않음)
+        overwrite (bool): 이미 채워진 행도 다시 계산할지 여부
+
+    Returns:
+        Dict[str, int]: 갱신 건수와 마감 유형별 건수 (해석하지 못한 건수는 'unparsed')
+    """
+    if bind is None:
+        from models import engine as bind
+    counts: Counter = Counter()
+    last_id = 0
+    while last_id is not None:
+        if isinstance(bind, Connection):
+            last_id = _backfill_batch(bind, last_id, batch_size, overwrite, counts)
+        else:
+            with bind.begin() as conn:
+                last_id = _backfill_batch(conn, last_id, batch_size, overwrite, counts)
+        if last_id is not None:
+            logger.info(f"마감일 채우는 중: {counts['updated']}건 갱신 (id {last_id}까지)")
+    logger.info(f"마감일 채우기 완료: {dict(counts)}")
+    return dict(counts)
+
+
+def backfill_records(database, overwrite: bool = False) -> Dict[str, int]:
+    """
+    JSON/JSONL 저장소(database.Database)의 채용 공고에 deadline_at/deadline_kind 채우기
+
+    JSON 파일은 공고마다 파일 전체를 다시 쓰지 않도록 한 번에 저장하므로 서버를 멈춘 뒤 실행한다.
+    """
+    counts: Counter = Counter()
+    records = []
+    changed = []
+    for job in database.jobs.all():
+        if not job.get('deadline_kind') or overwrite:
+            annotated = annotate_deadline(dict(job), now=_created_at(job.get('created_at')), overwrite=True)
+            counts[annotated['deadline_kind'] or 'unparsed'] += 1
+            if annotated['deadline_kind']:
+                job = annotated
+                changed.append(job)
+        records.append(job)
+
+    if changed and isinstance(database.jobs, JsonCollection):
+        database.jobs.save(records)
+    else:
+        for job in changed:
+            database.jobs.replace(job['id'], job)
+    counts['updated'] = len(changed)
+    logger.info(f"마감일 채우기 완료: {dict(counts)}")
+    return dict(counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 채용 공고의 마감일을 deadline_at/deadline_kind로 채우기")
+    parser.add_argument("--storage", choices=["json", "jsonl", "sql"], default="sql", help="대상 저장소 (기본값: sql)")
+    parser.add_argument("--data-dir", default="data", help="JSON 데이터 디렉토리")
+    parser.add_argument("--database-url", default=None, help="대상 데이터베이스 URL (기본값: DATABASE_URL 또는 sqlite:///./jobs.db)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 갱신할 행 수")
+    parser.add_argument("--overwrite", action="store_true", help="이미 채워진 공고도 다시 계산")
+    args = parser.parse_args()
+
+    if args.storage == "sql":
+        from database import init_db
+        from db_engine import create_db_engine
+        bind = create_db_engine(args.database_url) if args.database_url else None
+        init_db(bind)  # deadline_at/deadline_kind 컬럼과 인덱스가 없으면 추가
+        result = backfill(bind, batch_size=args.batch_size, overwrite=args.overwrite)
+    else:
+        from database import Database
+        result = backfill_records(Database(data_dir=args.data_dir, storage=args.storage), overwrite=args.overwrite)
+    print(f"마감일 {result.get('updated', 0)}건 갱신 (해석 불가 {result.get('unparsed', 0)}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# benchmarks/bench_extraction.py
+"""
+사이트별 상세 페이지 추출 속도/메모리 벤치마크 (네트워크 없음)
+
+tests/fixtures의 상세 페이지 HTML을 사이트별 추출 함수(parse_job_detail)에 반복해서 넣어
+초당 페이지 수, 페이지당 지연 p50/p99, 페이지당 최대 메모리(tracemalloc)를 잰다.
+저장된 기준값(baseline_extraction.json)과 비교해 p50이나 최대 메모리가 허용 범위를 넘으면
+종료 코드 1로 끝나므로 배포 전 검사에 넣을 수 있다.
+
+픽스처는 실제 페이지를 저장한 것이 아니라 직접 만든 합성 HTML이다. 각 사이트 추출기가 쓰는 선택자
+구조를 따르고, 메뉴/추천 공고/푸터 같은 반복 마크업(회사명, 공고, 메뉴 항목은 지어낸 값)을 채워
+실제 페이지와 비슷한 크기로 만들었다. 실제 페이지의 추출 속도를 그대로 나타내지는 않으므로
+같은 픽스처로 잰 기준값과의 상대 비교에만 쓴다.
+
+다른 작업이 끼어들면 측정은 느려지기만 하므로, 반복을 여러 구간으로 나눠 구간마다 중앙값을 구한다.
+기계 속도 차이와 부하는 구간 바로 앞에 추출 코드와 무관한 기준 작업(calibrate)을 재서 맞춘다.
+구간마다 (추출 중앙값 / 기준 작업 시간) 비율을 구하고, 가장 작은 비율을 기준값의 비율과 비교한다.
+두 시간을 같은 시점에 재므로 기계 전체가 느려진 구간은 비율에 거의 영향을 주지 않는다.
+p99는 모든 반복에서 구하며 부하의 영향이 커서 출력만 한다.
+추출 결과의 핵심 항목(제목, 회사명 등)이 기대값과 다르면 속도와 관계없이 실패로 본다.
+
+실행:
+    python benchmarks/bench_extraction.py                     # 기준값과 비교
+    python benchmarks/bench_extraction.py --site Saramin --iterations 500
+    python benchmarks/bench_extraction.py --save-baseline     # 추출 코드를 의도적으로 바꾼 뒤 기준값 갱신
+"""
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, NamedTuple, Optional
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reextract import EXTRACTOR_FACTORIES
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures')
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_extraction.json')
+MEMORY_ITERATIONS = 5
+# 반복을 나눌 구간 수 (구간마다 기준 작업을 다시 잼)
+BLOCKS = 20
+DEFAULT_ITERATIONS = 300
+# 변경 없는 코드를 바쁜 1코어 기계에서 되풀이해 재면 비율이 ±25% 안팎으로 흔들리므로 그보다 넉넉히 잡음
+DEFAULT_TOLERANCE = 0.5
+
+
+def _linkedin_extractor():
+    from crawler.linkedin import parse_job_detail
+    return parse_job_detail
+
+
+class Case(NamedTuple):
+    site: str
+    fixture: str
+    url: str
+    factory: Callable[[], Callable[[str, str], Dict]]
+    expected: Dict[str, str]
+
+
+CASES = [
+    Case('Saramin', 'saramin_detail.html', 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=50312877',
+         EXTRACTOR_FACTORIES['Saramin'],
+         {'title': '백엔드 개발자 (Python)', 'company_name': '테스트컴퍼니', 'salary': '회사 내규에 따름'}),
+    Case('JobKorea', 'jobkorea_detail.html', 'https://www.jobkorea.co.kr/Recruit/GI_Read/45000001',
+         EXTRACTOR_FACTORIES['JobKorea'],
+         {'title': '데이터 엔지니어', 'company_name': '잡코리아회사', 'deadline': '2026.11.15'}),
+    Case('Incruit', 'incruit_detail.html', 'https://www.incruit.com/jobdb/view.asp?job=2510010001',
+         EXTRACTOR_FACTORIES['Incruit'],
+         {'title': '데이터 엔지니어', 'company_name': '인크루트회사', 'salary': '3,600만원 이상'}),
+    Case('JobPlanet', 'jobplanet_detail.html', 'https://www.jobplanet.co.kr/job/search?posting_ids%5B%5D=1200001',
+         EXTRACTOR_FACTORIES['JobPlanet'],
+         {'title': '데이터 엔지니어', 'company_name': '잡플래닛회사', 'location': '서울 성동구'}),
+    Case('Wanted', 'wanted_detail.html', 'https://www.wanted.co.kr/wd/250001',
+         EXTRACTOR_FACTORIES['Wanted'],
+         {'title': '데이터 엔지니어', 'company_name': '원티드회사', 'preferences': '대용량 크롤링 운영 경험'}),
+    Case('LinkedIn', 'linkedin_detail.html', 'https://www.linkedin.com/jobs/view/4000000001',
+         _linkedin_extractor,
+         {'title': '데이터 엔지니어', 'company_name': '링크드인회사', 'location': '서울, 대한민국'}),
+]
+
+
+def calibrate(rounds: int = 3) -> float:
+    """
+    기계 속도 기준: 고정된 HTML을 표준 라이브러리 HTMLParser로 읽는 시간(초)
+
+    추출 코드나 bs4 버전과 무관하면서 추출과 비슷한 일(문자열 처리, 작은 객체 생성)을 하는 작업을 고름.
+    잠깐 끼어드는 다른 작업의 영향을 덜 받도록 중앙값이 아니라 최솟값을 씀.
+    """
+    document = ''.join(f'<div class="row"><a href="/item/{i}">항목 {i}</a><span>값 {i}</span></div>' for i in range(2000))
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        HTMLParser().feed(document)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def measure(case: Case, iterations: int = DEFAULT_ITERATIONS, blocks: int = BLOCKS) -> Dict:
+    """
+    한 사이트의 추출 함수 측정
+
+    Returns:
+        Dict: pages_per_sec, p50_ms(가장 빠른 구간의 중앙값), p99_ms, peak_kb,
+              calibration(구간 사이 기준 작업의 가장 빠른 시간),
+              ratio(구간별 추출 중앙값 / 같은 구간 기준 작업 시간의 최솟값),
+              iterations/blocks(표본 크기)와 기대값과 다른 항목(mismatches)
+    """
+    with open(os.path.join(FIXTURE_DIR, case.fixture), encoding='utf-8') as f:
+        html = f.read()
+    previous = logging.root.manager.disable
+    logging.disable(logging.INFO)  # 필드마다 남기는 info 로그는 추출 시간에서 뺌
+    try:
+        extract = case.factory()
+        job_data = extract(html, case.url)  # 준비 실행 (선택자 컴파일 등)
+        mismatches = {key: job_data.get(key) for key, value in case.expected.items() if job_data.get(key) != value}
+
+        calibrations = []
+        block_medians = []
+        ratios = []
+        timings = []
+        per_block = max(1, iterations // blocks)
+        for _ in range(blocks):
+            calibrations.append(calibrate())
+            block = []
+            for _ in range(per_block):
+                started = time.perf_counter()
+                extract(html, case.url)
+                block.append(time.perf_counter() - started)
+            block_medians.append(statistics.median(block))
+            ratios.append(block_medians[-1] / calibrations[-1])
+            timings.extend(block)
+
+        tracemalloc.start()
+        try:
+            peak = 0
+            for _ in range(MEMORY_ITERATIONS):
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                extract(html, case.url)
+                peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+    finally:
+        logging.disable(previous)
+
+    timings.sort()
+    return {
+        'pages_per_sec': len(timings) / sum(timings),
+        'p50_ms': min(block_medians) * 1000,
+        'p99_ms': _percentile(timings, 0.99) * 1000,
+        'peak_kb': peak / 1024,
+        'calibration': min(calibrations),
+        'ratio': min(ratios),
+        'iterations': len(timings),
+        'blocks': blocks,
+        'bytes': len(html.encode('utf-8')),
+        'mismatches': mismatches,
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Optional[Dict],
+            tolerance: float = DEFAULT_TOLERANCE, memory_tolerance: float = 0.10) -> List[str]:
+    """기준값보다 느려지거나(p50 비율) 메모리를 더 쓰는(peak_kb) 사이트와 추출 결과가 틀린 사이트 목록"""
+    problems = []
+    for site, result in results.items():
+        if result['mismatches']:
+            problems.append(f"{site}: 추출 결과가 기대값과 다름 {result['mismatches']}")
+        base = (baseline or {}).get('sites', {}).get(site)
+        if base is None:
+            continue
+        change = result['ratio'] / base['ratio'] - 1
+        if change > tolerance:
+            problems.append(f"{site}: p50 {change * 100:+.0f}% > 허용 {tolerance * 100:+.0f}% "
+                            f"(기준 작업 대비 비율 {result['ratio']:.3f}, 기준 {base['ratio']:.3f})")
+        memory_limit = base['peak_kb'] * (1 + memory_tolerance)
+        if result['peak_kb'] > memory_limit:
+            problems.append(f"{site}: 최대 메모리 {result['peak_kb']:.0f}KB > 허용 {memory_limit:.0f}KB")
+    return problems
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Dict], path: str = BASELINE_PATH):
+    sites = {site: {**{key: round(result[key], 6 if key in ('calibration', 'ratio') else 3)
+                       for key in ('pages_per_sec', 'p50_ms', 'p99_ms', 'peak_kb', 'calibration', 'ratio')},
+                    'iterations': result['iterations'], 'blocks': result['blocks']}
+             for site, result in results.items()}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'python': platform.python_version(), 'sites': sites}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사이트별 상세 페이지 추출 벤치마크")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="사이트별 반복 횟수")
+    parser.add_argument("--blocks", type=int, default=BLOCKS, help="반복을 나눌 구간 수 (구간마다 기준 작업을 다시 잼)")
+    parser.add_argument("--site", action="append", choices=[case.site for case in CASES], help="측정할 사이트 (여러 번 지정 가능)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="p50 허용 증가율 (기본 0.5 = 50%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="최대 메모리 허용 증가율")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.site or case.site in args.site]
+    results = {case.site: measure(case, args.iterations, args.blocks) for case in cases}
+    baseline = load_baseline(args.baseline)
+    sites = (baseline or {}).get('sites', {})
+
+    print(f"\n{'':<11}{'KB':>6}{'pages/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{'peak KB':>9}{'p50 vs 기준':>13}")
+    for site, result in results.items():
+        base = sites.get(site)
+        change = f"{(result['ratio'] / base['ratio'] - 1) * 100:+.0f}%" if base else "-"
+        print(f"{site:<11}{result['bytes'] / 1024:>6.1f}{result['pages_per_sec']:>10.1f}{result['p50_ms']:>10.2f}"
+              f"{result['p99_ms']:>10.2f}{result['peak_kb']:>9.0f}{change:>13}")
+
+    if args.save_baseline:
+        # --site로 일부만 쟀으면 나머지 사이트의 기준값은 그대로 둠
+        save_baseline({**sites, **results}, args.baseline)
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    problems = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    for problem in problems:
+        print(f"✗ {problem}")
+    if baseline is None:
+        print("기준값 파일이 없습니다. --save-baseline으로 먼저 저장하세요.")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
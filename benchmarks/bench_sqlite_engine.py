@@ -0,0 +1,119 @@
+# benchmarks/bench_sqlite_engine.py
+"""
+SQLite 엔진 설정 비교 벤치마크 (기본 create_engine vs db_engine.create_db_engine)
+
+크롤러처럼 한 건씩 커밋하는 쓰기 스레드와, API처럼 목록/단건을 조회하는 읽기 스레드를
+동시에 돌려 초당 처리량과 조회 지연을 비교한다.
+
+실행:
+    python benchmarks/bench_sqlite_engine.py --seconds 5 --readers 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_engine import create_db_engine
+from models import Base, JobPosting
+
+SEED_ROWS = 5000
+
+
+def seed(Session):
+    with Session() as session:
+        session.bulk_insert_mappings(JobPosting, [
+            {'company_name': f'회사{i}', 'job_title': f'공고{i}', 'link': f'http://seed/{i}', 'description': '설명' * 100}
+            for i in range(SEED_ROWS)
+        ])
+        session.commit()
+
+
+def run(engine, seconds: float, readers: int):
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session)
+
+    stop = threading.Event()
+    counts = {'writes': 0, 'reads': 0, 'errors': 0}
+    latencies = []
+    lock = threading.Lock()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            try:
+                with Session() as session:
+                    session.add(JobPosting(company_name='회사', job_title=f'새 공고{i}', link=f'http://new/{i}',
+                                           description='설명' * 100))
+                    session.commit()
+                counts['writes'] += 1
+            except Exception:
+                counts['errors'] += 1
+            i += 1
+
+    def reader(offset: int):
+        i = offset
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with Session() as session:
+                    session.query(JobPosting).order_by(JobPosting.id).offset(i % SEED_ROWS).limit(10).all()
+                    session.get(JobPosting, i % SEED_ROWS + 1)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    counts['reads'] += 1
+                    latencies.append(elapsed)
+            except Exception:
+                with lock:
+                    counts['errors'] += 1
+            i += 97
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    return {
+        'writes/s': counts['writes'] / seconds,
+        'reads/s': counts['reads'] / seconds,
+        'read p99 (ms)': p99,
+        'errors': counts['errors'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite 엔진 설정 비교")
+    parser.add_argument("--seconds", type=float, default=5.0, help="설정별 측정 시간(초)")
+    parser.add_argument("--readers", type=int, default=4, help="읽기 스레드 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        default_engine = create_engine(f"sqlite:///{os.path.join(tmp, 'default.db')}",
+                                       connect_args={"check_same_thread": False})
+        tuned_engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'tuned.db')}")
+        results = {
+            '기본 설정': run(default_engine, args.seconds, args.readers),
+            'WAL + PRAGMA': run(tuned_engine, args.seconds, args.readers),
+        }
+
+    print(f"\n{'':<14}{'writes/s':>12}{'reads/s':>12}{'read p99 (ms)':>16}{'errors':>8}")
+    for name, result in results.items():
+        print(f"{name:<14}{result['writes/s']:>12.1f}{result['reads/s']:>12.1f}"
+              f"{result['read p99 (ms)']:>16.2f}{result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# crawl_queue.py
+"""
+크롤링 작업 큐
+
+Selenium 크롤링은 브라우저 시작과 페이지 대기로 수십 초가 걸리는 동기 작업이라
+API 핸들러에서 바로 실행하면 이벤트 루프 전체가 멈춘다. CrawlQueue는 요청을 받아
+작업 id만 즉시 돌려주고, 정해진 수의 워커 스레드가 순서대로 실행한다.
+상태는 /api/crawl/{id}로 조회한다.
+
+작업 상태는 프로세스 메모리가 아니라 SQLite 파일(CRAWL_QUEUE_PATH) 하나에 저장한다.
+uvicorn 워커를 여러 개 띄워도 모든 워커가 같은 파일을 보므로
+- 어느 워커로 조회가 가더라도 작업을 찾을 수 있고
+- 같은 URL은 워커와 상관없이 한 번만 대기/실행되며
+- 대기열 길이(max_pending)와 보관 개수(keep_finished)도 전체 기준이다.
+작업은 등록을 받은 워커의 스레드에서 실행된다. 그 워커가 죽어 stale_after초가 지나도록
+끝나지 않은 작업은 다음 같은 URL 요청 때 실패로 처리하고 새로 등록한다.
+
+작업 상태:
+    queued    - 대기 중
+    running   - 크롤링 중
+    succeeded - 완료 (result에 저장된 채용 공고)
+    failed    - 실패 (error에 오류 메시지)
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+# 동시에 띄울 브라우저 수 / 대기열 길이 (브라우저 하나가 수백 MB를 쓰므로 작게 유지)
+DEFAULT_WORKERS = int(os.getenv("CRAWL_WORKERS", "2"))
+DEFAULT_MAX_PENDING = int(os.getenv("CRAWL_QUEUE_SIZE", "100"))
+# 끝난 작업은 이 개수만큼만 보관하고 오래된 것부터 버린다
+DEFAULT_KEEP_FINISHED = 500
+# 작업 상태를 공유하는 SQLite 파일
+DEFAULT_QUEUE_PATH = os.getenv("CRAWL_QUEUE_PATH", os.path.join("data", "crawl_tasks.sqlite"))
+# 등록 후 이 시간(초)이 지나도 끝나지 않은 작업은 실행하던 프로세스가 죽은 것으로 봄
+DEFAULT_STALE_AFTER = float(os.getenv("CRAWL_STALE_AFTER", "3600"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_tasks (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    result TEXT,
+    error TEXT,
+    submitted_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_crawl_tasks_active_url ON crawl_tasks (url)
+    WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS ix_crawl_tasks_status ON crawl_tasks (status, finished_at);
+"""
+
+_COLUMNS = ('id', 'url', 'status', 'created_at', 'started_at', 'finished_at', 'result', 'error')
+
+
+class QueueFullError(RuntimeError):
+    """대기 중인 작업이 max_pending개에 도달해 새 작업을 받을 수 없음"""
+
+
+class CrawlQueue:
+    """
+    크롤링 작업을 워커 스레드 풀에서 실행하고 상태를 SQLite에 기록하는 큐
+
+    Args:
+        handler: url을 받아 결과(dict)를 돌려주는 함수 (예외를 던지면 실패로 기록)
+        workers (int): 이 프로세스에서 동시에 실행할 작업 수
+        max_pending (int): 대기(queued) 작업 최대 개수 (모든 프로세스 합계, 넘으면 submit이 QueueFullError)
+        keep_finished (int): 결과를 보관할 끝난 작업 수
+        path (str): 작업 상태를 저장할 SQLite 파일 경로 (':memory:'이면 이 프로세스 안에서만 공유)
+        stale_after (float): 이 시간(초)이 지나도 끝나지 않은 작업은 버려진 것으로 봄
+    """
+
+    def __init__(self, handler: Callable[[str], Optional[Dict]], workers: int = DEFAULT_WORKERS,
+                 max_pending: int = DEFAULT_MAX_PENDING, keep_finished: int = DEFAULT_KEEP_FINISHED,
+                 path: str = None, stale_after: float = DEFAULT_STALE_AFTER):
+        self.handler = handler
+        self.workers = workers
+        self.max_pending = max_pending
+        self.keep_finished = keep_finished
+        self.path = path or DEFAULT_QUEUE_PATH
+        self.stale_after = stale_after
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl")
+        self._queued = set()  # 이 프로세스가 등록했지만 아직 시작하지 않은 작업
+        self._lock = threading.Lock()
+
+    def submit(self, url: str) -> Dict:
+        """
+        크롤링 작업 등록 (바로 반환)
+
+        같은 url이 이미 대기/실행 중이면 (다른 프로세스가 등록했더라도) 새로 만들지 않고 그 작업을 돌려준다.
+
+        Returns:
+            Dict: 작업 상태 (id, url, status, ...)
+        """
+        now = time.time()
+        job = {
+            'id': uuid.uuid4().hex,
+            'url': url,
+            'status': STATUS_QUEUED,
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None,
+        }
+        with self._lock:
+            # 중복 확인과 등록을 한 쓰기 트랜잭션으로 묶어 다른 프로세스와 같은 URL을 두 번 넣지 않게 함
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire_stale(now)
+                active = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM crawl_tasks WHERE url = ? AND status IN (?, ?)",
+                    (url, STATUS_QUEUED, STATUS_RUNNING)).fetchone()
+                if active is not None:
+                    self._conn.execute("COMMIT")
+                    return self._to_dict(active)
+                pending = self._conn.execute(
+                    "SELECT COUNT(*) FROM crawl_tasks WHERE status = ?", (STATUS_QUEUED,)).fetchone()[0]
+                if pending >= self.max_pending:
+                    raise QueueFullError(f"대기 중인 크롤링 작업이 너무 많습니다 ({pending}건)")
+                self._conn.execute(
+                    "INSERT INTO crawl_tasks (id, url, status, created_at, submitted_at) VALUES (?, ?, ?, ?, ?)",
+                    (job['id'], url, STATUS_QUEUED, job['created_at'], now))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._queued.add(job['id'])
+        self._executor.submit(self._run, job['id'], url)
+        logger.info(f"크롤링 작업 등록: {job['id']} ({url})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 조회 (없거나 보관 기간이 지난 작업이면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM crawl_tasks WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        counts = {status: 0 for status in (STATUS_QUEUED, STATUS_RUNNING, STATUS_SUCCEEDED, STATUS_FAILED)}
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM crawl_tasks GROUP BY status").fetchall()
+        counts.update(rows)
+        return counts
+
+    @staticmethod
+    def _to_dict(row) -> Dict:
+        job = dict(zip(_COLUMNS, row))
+        if job['result'] is not None:
+            job['result'] = json.loads(job['result'])
+        return job
+
+    def _expire_stale(self, now: float):
+        """stale_after가 지나도록 끝나지 않은 작업을 실패로 처리 (쓰기 트랜잭션 안에서 호출)"""
+        expired = self._conn.execute(
+            "UPDATE crawl_tasks SET status = ?, error = ?, finished_at = ? "
+            "WHERE status IN (?, ?) AND submitted_at < ?",
+            (STATUS_FAILED, "작업이 제한 시간 안에 끝나지 않았습니다.", datetime.now().isoformat(),
+             STATUS_QUEUED, STATUS_RUNNING, now - self.stale_after)).rowcount
+        if expired:
+            logger.warning(f"끝나지 않은 크롤링 작업 {expired}건을 실패로 처리")
+
+    def _update(self, job_id: str, **fields):
+        assignments = ', '.join(f"{column} = ?" for column in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE crawl_tasks SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def _run(self, job_id: str, url: str):
+        with self._lock:
+            self._queued.discard(job_id)
+            started = self._conn.execute(
+                "UPDATE crawl_tasks SET status = ?, started_at = ? WHERE id = ? AND status = ?",
+                (STATUS_RUNNING, datetime.now().isoformat(), job_id, STATUS_QUEUED)).rowcount
+        if not started:
+            return  # 너무 오래 기다려 이미 실패로 처리된 작업
+        try:
+            result = self.handler(url)
+            self._update(job_id, status=STATUS_SUCCEEDED, result=json.dumps(result, ensure_ascii=False, default=str))
+            logger.info(f"크롤링 작업 완료: {job_id}")
+        except Exception as e:
+            logger.error(f"크롤링 작업 실패: {job_id} ({url}): {e}", exc_info=True)
+            self._update(job_id, status=STATUS_FAILED, error=str(e))
+        finally:
+            self._finish(job_id)
+
+    def _finish(self, job_id: str):
+        with self._lock:
+            self._conn.execute("UPDATE crawl_tasks SET finished_at = ? WHERE id = ?",
+                               (datetime.now().isoformat(), job_id))
+            self._conn.execute(
+                "DELETE FROM crawl_tasks WHERE status IN (?, ?) AND id NOT IN ("
+                "SELECT id FROM crawl_tasks WHERE status IN (?, ?) ORDER BY finished_at DESC, rowid DESC LIMIT ?)",
+                (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_SUCCEEDED, STATUS_FAILED, self.keep_finished))
+
+    def shutdown(self, wait: bool = True):
+        """대기 중인 작업은 취소(실패로 기록)하고 실행 중인 작업이 끝나기를 (wait이면) 기다림"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            cancelled = [(STATUS_FAILED, "서버 종료로 취소되었습니다.", datetime.now().isoformat(), job_id, STATUS_QUEUED)
+                         for job_id in self._queued]
+            self._queued.clear()
+            self._conn.executemany(
+                "UPDATE crawl_tasks SET status = ?, error = ?, finished_at = ? WHERE id = ? AND status = ?", cancelled)
@@ -1,18 +1,21 @@
-import requests
+import httpx
 from abc import ABC, abstractmethod
+import os
 import time
-import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 import pandas as pd
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from .dom import parse_html
+from .driver_pool import create_driver, get_driver_pool, release_driver
+from .http_cache import is_cached_response
+from .http_client import fetch, fetch_many_responses
+from .rate_limit import get_rate_limiter
+from .snapshot_archive import archive_page
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,6 +27,9 @@ logging.basicConfig(
     ]
 )
 
+# crawl에서 상세 페이지를 동시에 처리할 워커 수 (Selenium 크롤러는 웹드라이버 풀 크기 이하가 적당)
+DEFAULT_DETAIL_WORKERS = int(os.getenv("CRAWLER_DETAIL_WORKERS", "2"))
+
 class BaseCrawler(ABC):
     """
     취업 사이트 크롤러의 기본 클래스
@@ -33,54 +39,91 @@ class BaseCrawler(ABC):
     def __init__(self, site_name):
         self.site_name = site_name
         self.logger = logging.getLogger(site_name)
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
         self.data = []
         
-    def get_page(self, url, delay=1):
+    def get_page(self, url):
         """
         웹 페이지 내용을 가져오는 메서드
+        (공유 HTTP 클라이언트의 호스트별 연결을 재사용, 요청 간격은 도메인별 속도 제한이 조절)
         
         Args:
             url (str): 크롤링할 URL
-            delay (int): 요청 간 딜레이 (초)
             
         Returns:
             BeautifulSoup: 파싱된 HTML 내용
         """
         try:
-            time.sleep(delay + random.random())  # 서버 부하 방지를 위한 랜덤 딜레이
-            response = self.session.get(url)
+            response = fetch(url, headers=self.headers)
             response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.exceptions.RequestException as e:
+            if not is_cached_response(response):
+                archive_page(url, response.text, site=self.site_name, source='http')
+            return parse_html(response.text)
+        except httpx.HTTPError as e:
             self.logger.error(f"URL 요청 중 오류 발생: {url}, 오류: {e}")
             return None
     
+    def get_pages(self, urls):
+        """
+        여러 웹 페이지를 동시에 가져오는 메서드 (호스트별 동시 요청 수는 http_client.PER_HOST_LIMIT)
+        
+        Args:
+            urls (list): 크롤링할 URL 목록
+            
+        Returns:
+            list: URL 순서대로 파싱된 HTML 내용 (실패한 URL은 None)
+        """
+        pages = []
+        for url, response in zip(urls, fetch_many_responses(urls, headers=self.headers)):
+            if response is None:
+                pages.append(None)
+                continue
+            # 캐시에서 나온 본문은 처음 받았을 때 이미 보관됨
+            if not is_cached_response(response):
+                archive_page(url, response.text, site=self.site_name, source='http')
+            pages.append(parse_html(response.text))
+        return pages
+    
+    async def aget_page(self, client, url):
+        """
+        비동기 HTTP 클라이언트로 웹 페이지 내용을 가져오는 메서드
+        (crawl_job_list/crawl_job_detail을 비동기로 구현할 때 한 이벤트 루프에서 여러 페이지를 동시에 요청)
+        
+        Args:
+            client (AsyncHttpClient): 비동기 HTTP 클라이언트
+            url (str): 크롤링할 URL
+            
+        Returns:
+            BeautifulSoup: 파싱된 HTML 내용 (실패 시 None)
+        """
+        html = await client.get_text(url, headers=self.headers)
+        return parse_html(html) if html is not None else None
+    
     def setup_selenium(self, headless=True):
         """
-        Selenium 웹드라이버 설정
+        Selenium 웹드라이버 설정 (헤드리스면 공유 웹드라이버 풀에서 빌려옴)
         
         Args:
             headless (bool): 헤드리스 모드 사용 여부
             
         Returns:
-            WebDriver: 설정된 웹드라이버 객체
+            WebDriver: 설정된 웹드라이버 객체 (다 쓰면 release_selenium으로 돌려줌)
         """
-        options = Options()
         if headless:
-            options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+            return get_driver_pool().checkout()
+        return create_driver(headless=False)
+    
+    def release_selenium(self, driver, discard=False):
+        """
+        setup_selenium으로 얻은 웹드라이버 반환 (풀 드라이버는 정리 후 재사용, 그 외는 종료)
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        return driver
+        Args:
+            driver (WebDriver): 반환할 웹드라이버
+            discard (bool): 다시 쓰면 안 되는 드라이버면 True
+        """
+        release_driver(driver, discard=discard)
     
     def get_page_with_selenium(self, url, delay=2):
         """
@@ -91,19 +134,21 @@ class BaseCrawler(ABC):
             delay (int): 페이지 로딩 대기 시간 (초)
             
         Returns:
-            tuple: (WebDriver, BeautifulSoup) 웹드라이버와 파싱된 HTML 내용
+            tuple: (WebDriver, BeautifulSoup) 웹드라이버와 파싱된 HTML 내용 (웹드라이버는 release_selenium으로 반환)
         """
         try:
             driver = self.setup_selenium()
+            get_rate_limiter().acquire(url)  # 서버 부하 방지 (도메인별 속도 제한)
             driver.get(url)
             time.sleep(delay)  # 페이지 로딩 대기
             html = driver.page_source
+            archive_page(url, html, site=self.site_name, source='browser')
             soup = BeautifulSoup(html, 'html.parser')
             return driver, soup
         except Exception as e:
             self.logger.error(f"Selenium으로 URL 요청 중 오류 발생: {url}, 오류: {e}")
             if 'driver' in locals():
-                driver.quit()
+                self.release_selenium(driver)
             return None, None
     
     def save_to_csv(self, filename=None):
@@ -158,13 +203,24 @@ class BaseCrawler(ABC):
         """
         pass
     
-    def crawl(self, url, max_jobs=None):
+    def _crawl_detail_safely(self, job_url):
+        """상세 페이지 하나를 크롤링 (오류는 기록만 하고 None을 반환해 다른 URL에 번지지 않게 함)"""
+        try:
+            return self.crawl_job_detail(job_url)
+        except Exception as e:
+            self.logger.error(f"채용 공고 상세 크롤링 중 오류 발생: {job_url}, 오류: {e}")
+            return None
+    
+    def crawl(self, url, max_jobs=None, workers=None, mode='thread', preserve_order=False):
         """
         채용 공고를 크롤링하는 메인 메서드
         
         Args:
             url (str): 크롤링할 URL
             max_jobs (int): 최대 크롤링할 채용 공고 수 (기본값: None, 모든 공고 크롤링)
+            workers (int): 상세 페이지를 동시에 처리할 워커 수 (기본값: CRAWLER_DETAIL_WORKERS, 1이면 순서대로 처리)
+            mode (str): 'thread' 또는 'process' (프로세스 모드는 웹드라이버 풀/속도 제한이 프로세스마다 따로임)
+            preserve_order (bool): True면 목록 순서대로, False면 끝나는 순서대로 결과를 쌓음
             
         Returns:
             list: 수집된 채용 공고 정보 목록
@@ -186,20 +242,47 @@ class BaseCrawler(ABC):
                 job_urls = job_urls[:max_jobs]
                 self.logger.info(f"최대 {max_jobs}개의 채용 공고만 크롤링합니다.")
             
+            workers = min(max(1, workers or DEFAULT_DETAIL_WORKERS), len(job_urls))
+            
             # 채용 공고 상세 페이지 크롤링
-            for i, job_url in enumerate(job_urls):
-                self.logger.info(f"채용 공고 크롤링 중 ({i+1}/{len(job_urls)}): {job_url}")
-                
-                try:
-                    job_data = self.crawl_job_detail(job_url)
+            if workers == 1:
+                for i, job_url in enumerate(job_urls):
+                    self.logger.info(f"채용 공고 크롤링 중 ({i+1}/{len(job_urls)}): {job_url}")
+                    job_data = self._crawl_detail_safely(job_url)
                     if job_data:
                         self.data.append(job_data)
-                except Exception as e:
-                    self.logger.error(f"채용 공고 상세 크롤링 중 오류 발생: {job_url}, 오류: {e}")
+            else:
+                self._crawl_details_concurrently(job_urls, workers, mode, preserve_order)
             
             self.logger.info(f"크롤링 완료: 총 {len(self.data)}개의 채용 공고를 수집했습니다.")
             return self.data
             
         except Exception as e:
             self.logger.error(f"크롤링 중 오류 발생: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    def _crawl_details_concurrently(self, job_urls, workers, mode, preserve_order):
+        """상세 페이지를 워커 풀에서 동시에 크롤링해 self.data에 추가"""
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"지원하지 않는 실행 모드입니다: {mode}")
+        executor_class = ProcessPoolExecutor if mode == 'process' else ThreadPoolExecutor
+        self.logger.info(f"상세 페이지를 {workers}개 워커({mode})로 크롤링합니다.")
+        
+        collected = {}
+        with executor_class(max_workers=workers) as executor:
+            futures = {executor.submit(self._crawl_detail_safely, job_url): i for i, job_url in enumerate(job_urls)}
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                try:
+                    job_data = future.result()
+                except Exception as e:  # 프로세스 모드의 직렬화/워커 오류
+                    self.logger.error(f"채용 공고 상세 크롤링 중 오류 발생: {job_urls[index]}, 오류: {e}")
+                    job_data = None
+                self.logger.info(f"채용 공고 크롤링 완료 ({done}/{len(job_urls)}): {job_urls[index]}")
+                if not job_data:
+                    continue
+                if preserve_order:
+                    collected[index] = job_data
+                else:
+                    self.data.append(job_data)
+        self.data.extend(collected[index] for index in sorted(collected))
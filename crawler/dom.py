@@ -0,0 +1,57 @@
+"""
+페이지 소스(HTML) 오프라인 파싱 도우미
+
+WebDriver의 find_element/.text는 호출마다 chromedriver와 HTTP 왕복을 하므로, 크롤러는
+page_source를 한 번만 받아 파싱한 트리에서 모든 값을 추출한다. 브라우저 없이 저장된 HTML로도
+같은 추출을 돌릴 수 있다.
+
+lxml이 설치되어 있으면 BeautifulSoup 파서로 lxml을, 없으면 내장 html.parser를 쓴다.
+"""
+from bs4 import BeautifulSoup, Comment, NavigableString
+
+try:
+    import lxml  # noqa: F401  (html.parser보다 몇 배 빠름)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# 줄바꿈으로 보는 태그 (WebElement.text처럼 블록 요소 사이를 줄로 나눔)
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav',
+    'ol', 'p', 'pre', 'section', 'table', 'tbody', 'td', 'th', 'thead', 'tr', 'ul',
+})
+_INVISIBLE_TAGS = frozenset({'script', 'style', 'noscript', 'template', 'head', 'title'})
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    """HTML 문자열을 BeautifulSoup 트리로"""
+    return BeautifulSoup(html or "", HTML_PARSER)
+
+
+def element_text(element) -> str:
+    """
+    요소의 보이는 텍스트 (WebElement.text와 비슷하게 블록 요소는 줄로 나누고 줄 안의 공백은 하나로)
+
+    script/style 내용과 주석은 제외한다. CSS로 숨긴 요소는 구분하지 못한다.
+    """
+    if element is None:
+        return ""
+    parts = []
+    _collect_text(element, parts)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _collect_text(element, parts):
+    for node in element.children:
+        if isinstance(node, NavigableString):
+            if not isinstance(node, Comment):
+                parts.append(str(node))
+        elif node.name not in _INVISIBLE_TAGS:
+            block = node.name in _BLOCK_TAGS
+            if block:
+                parts.append('\n')
+            _collect_text(node, parts)
+            if block:
+                parts.append('\n')
@@ -0,0 +1,292 @@
+"""
+미리 띄워 둔 Chrome 웹드라이버 풀
+
+크롤링 한 건에서 가장 오래 걸리는 부분은 Chrome 시작(수 초)이다. 크롤러마다, 재시도마다,
+목록/상세 페이지마다 새 브라우저를 띄우던 것을 풀에서 빌려 쓰고 돌려주는 방식으로 바꾼다.
+
+- checkout(): 쉬고 있는 드라이버를 꺼내고, 없으면 size개까지 새로 띄우며, 모두 사용 중이면 기다린다.
+- checkin(): 탭과 쿠키를 정리(about:blank)한 뒤 풀에 돌려준다.
+  max_pages번 쓰였거나 브라우저 프로세스 메모리가 max_memory_mb를 넘으면 종료하고 다음에 새로 띄운다.
+- 정리 중 오류가 나거나 discard=True로 돌려받은 드라이버도 종료한다.
+
+크기와 재활용 기준은 CRAWLER_DRIVER_POOL_SIZE, CRAWLER_DRIVER_MAX_PAGES, CRAWLER_DRIVER_MAX_MEMORY_MB로 조정한다.
+"""
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+import atexit
+import logging
+import os
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36'
+
+DEFAULT_POOL_SIZE = int(os.getenv("CRAWLER_DRIVER_POOL_SIZE", "2"))
+DEFAULT_MAX_PAGES = int(os.getenv("CRAWLER_DRIVER_MAX_PAGES", "50"))
+DEFAULT_MAX_MEMORY_MB = int(os.getenv("CRAWLER_DRIVER_MAX_MEMORY_MB", "1500"))
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """ChromeDriverManager().install()은 버전 확인에 네트워크를 쓰므로 프로세스당 한 번만 호출"""
+    return ChromeDriverManager().install()
+
+
+def create_driver(headless: bool = True, user_agent: str = DEFAULT_USER_AGENT):
+    """
+    크롤러 공통 Chrome 웹드라이버 생성 (풀을 쓰지 않는 경우에도 같은 설정 사용)
+
+    Args:
+        headless (bool): 헤드리스 모드 사용 여부
+        user_agent (str): User-Agent
+
+    Returns:
+        WebDriver: 설정된 웹드라이버 객체
+    """
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument('--lang=ko_KR')
+    options.add_argument('--no-first-run')
+    options.add_argument('--password-store=basic')
+    options.add_argument(f'--user-agent={user_agent}')
+
+    # 봇 감지 회피
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    driver = webdriver.Chrome(service=Service(_chromedriver_path()), options=options)
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+    })
+    return driver
+
+
+def _process_tree_rss_mb(pid: int) -> Optional[float]:
+    """pid와 모든 하위 프로세스(chromedriver → chrome 렌더러들)의 RSS 합계 (MB, /proc이 없으면 None)"""
+    if not os.path.isdir('/proc'):
+        return None
+    children: Dict[int, list] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # "pid (comm) state ppid ..." - comm에 공백/괄호가 있을 수 있어 마지막 ')' 뒤에서 자름
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+def _driver_memory_mb(driver) -> Optional[float]:
+    try:
+        return _process_tree_rss_mb(driver.service.process.pid)
+    except AttributeError:
+        return None
+
+
+class DriverPool:
+    """
+    웹드라이버 풀
+
+    Args:
+        size (int): 동시에 띄울 수 있는 드라이버 수
+        max_pages (int): 드라이버 하나를 재활용하기 전까지 빌려줄 횟수
+        max_memory_mb (int): 돌려받을 때 브라우저 메모리가 이보다 크면 재시작
+        factory: 드라이버 생성 함수 (기본값: create_driver)
+        user_agent (str): 정리할 때 되돌릴 User-Agent (크롤러가 바꿨을 수 있음)
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_pages: int = DEFAULT_MAX_PAGES,
+                 max_memory_mb: int = DEFAULT_MAX_MEMORY_MB, factory: Callable = create_driver,
+                 user_agent: str = DEFAULT_USER_AGENT):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.factory = factory
+        self.user_agent = user_agent
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = deque()
+        self._pages: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'discarded': 0}
+
+    def checkout(self, timeout: Optional[float] = None):
+        """
+        드라이버 빌리기 (모두 사용 중이면 timeout초까지 기다리고, 넘으면 TimeoutError)
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 웹드라이버 풀입니다.")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"{timeout}초 안에 사용 가능한 웹드라이버가 없습니다.")
+        with self._lock:
+            driver = self._idle.popleft() if self._idle else None
+            if driver is not None:
+                self.stats['reused'] += 1
+        if driver is not None:
+            return driver
+
+        try:
+            started = time.monotonic()
+            driver = self.factory()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self.stats['created'] += 1
+        logger.info(f"웹드라이버 시작 ({time.monotonic() - started:.1f}초)")
+        return driver
+
+    def owns(self, driver) -> bool:
+        """이 풀이 띄운 드라이버인지 여부"""
+        with self._lock:
+            return id(driver) in self._pages
+
+    def checkin(self, driver, discard: bool = False):
+        """
+        드라이버 돌려주기 (탭/쿠키 정리 후 풀에 넣거나, 재활용 기준을 넘었으면 종료)
+
+        Args:
+            discard (bool): 드라이버가 응답하지 않는 등 다시 쓰면 안 될 때 True
+        """
+        if driver is None:
+            return
+        try:
+            with self._lock:
+                pages = self._pages.get(id(driver), 0) + 1
+                self._pages[id(driver)] = pages
+
+            reason = None
+            if discard or self._closed:
+                reason = 'discarded'
+            elif pages >= self.max_pages:
+                reason = 'recycled'
+            else:
+                memory = _driver_memory_mb(driver)
+                if memory is not None and memory > self.max_memory_mb:
+                    logger.info(f"웹드라이버 메모리 {memory:.0f}MB > {self.max_memory_mb}MB, 재시작합니다.")
+                    reason = 'recycled'
+            if reason is None:
+                try:
+                    self._reset(driver)
+                except Exception as e:
+                    logger.warning(f"웹드라이버 정리 실패, 종료합니다: {e}")
+                    reason = 'discarded'
+
+            if reason is None:
+                with self._lock:
+                    self._idle.append(driver)
+            else:
+                self._quit(driver)
+                with self._lock:
+                    self.stats[reason] += 1
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """with pool.driver() as driver: ... (블록을 벗어나면 자동으로 checkin)"""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def warm(self, count: Optional[int] = None):
+        """드라이버를 미리 count개(기본값: size)까지 띄워 둠"""
+        drivers = []
+        try:
+            for _ in range(min(count or self.size, self.size)):
+                drivers.append(self.checkout(timeout=0))
+        except TimeoutError:
+            pass
+        finally:
+            for driver in drivers:
+                self.checkin(driver)
+
+    def _reset(self, driver):
+        """다음 사용자를 위해 추가 탭 닫기, 쿠키 삭제, User-Agent 복원, 빈 페이지로 이동"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': self.user_agent})
+        driver.get('about:blank')
+
+    def _quit(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"웹드라이버 종료 중 오류: {e}")
+
+    def close(self):
+        """쉬고 있는 드라이버를 모두 종료 (사용 중인 드라이버는 돌려받을 때 종료)"""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for driver in idle:
+            self._quit(driver)
+
+
+_shared_pool: Optional[DriverPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """프로세스 전체에서 공유하는 헤드리스 웹드라이버 풀"""
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = DriverPool()
+                atexit.register(_shared_pool.close)
+    return _shared_pool
+
+
+def release_driver(driver, discard: bool = False):
+    """공유 풀에서 빌린 드라이버는 돌려주고, 풀 밖에서 만든 드라이버(create_driver)는 종료"""
+    if driver is None:
+        return
+    if _shared_pool is not None and _shared_pool.owns(driver):
+        _shared_pool.checkin(driver, discard=discard)
+        return
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"웹드라이버 종료 중 오류: {e}")
@@ -9,18 +9,24 @@ import logging
 import json
 import pandas as pd
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
+import httpx
 import requests
 from bs4 import BeautifulSoup
+from deadline import annotate_deadline
+from .dom import element_text, parse_html
+from .driver_pool import get_driver_pool, release_driver
+from .http_cache import is_cached_response
+from .http_client import fetch
+from .page_wait import PAGE_TIMEOUTS, wait_for_page
+from .rate_limit import get_rate_limiter
+from .snapshot_archive import archive_page
 import csv
 from datetime import datetime
+from urllib.parse import urljoin
 import unittest
 
 # 로깅 설정
@@ -31,6 +37,21 @@ logger = logging.getLogger(__name__)
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# 상세 페이지가 준비됐다고 볼 요소 (요약 영역, 본문 영역)
+SARAMIN_READY_SELECTORS = ('.jv_summary, .jv_header', '.jv_cont, .jv_detail')
+
+# 먼저 HTTP GET으로 받은 HTML을 추출해 보고, 필수 항목이 비었을 때만 브라우저로 다시 가져옴
+HTTP_FIRST = os.getenv("SARAMIN_HTTP_FIRST", "1") not in ("0", "false", "no")
+HTTP_TIMEOUT = float(os.getenv("SARAMIN_HTTP_TIMEOUT", "5"))
+
+# job_data['fetch_tier'] 값
+FETCH_TIER_HTTP = 'http'
+FETCH_TIER_BROWSER = 'browser'
+
+# 이 중 하나라도 비면 HTTP 결과를 버리고 브라우저로 가져옴
+REQUIRED_FIELDS = ('title', 'company_name')
+CONDITION_FIELDS = ('experience', 'education', 'employment_type', 'location', 'salary')
+
 class FinalSaraminCrawler:
     """최종 사람인 크롤러 클래스"""
     
@@ -38,40 +59,35 @@ class FinalSaraminCrawler:
         self.site_name = "Saramin"
         self.data = []
         self.max_retries = 3
-        self.wait_time = 30
+        self.wait_time = PAGE_TIMEOUTS['saramin']
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         self.jobs = []
+        self.http_first = HTTP_FIRST
+        # URL별로 어느 단계(http/browser)에서 가져왔는지 기록
+        self.fetch_tiers = {}
         
     def setup_driver(self):
-        """Selenium 웹드라이버 설정"""
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-        return driver
+        """Selenium 웹드라이버 (공유 웹드라이버 풀에서 빌려옴, 다 쓰면 release_driver로 반환)"""
+        return get_driver_pool().checkout()
 
-    def extract_text_safely(self, driver, selector, multiple=False):
+    def extract_text_safely(self, soup, selector, multiple=False):
         """안전하게 텍스트 추출"""
         try:
             if multiple:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                return [element.text.strip() for element in elements if element.text.strip()]
+                texts = [element_text(element) for element in soup.select(selector)]
+                return [text for text in texts if text]
             else:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                return element.text.strip()
+                return element_text(soup.select_one(selector))
         except Exception as e:
             return [] if multiple else ""
     
-    def extract_with_multiple_selectors(self, driver, selectors, multiple=False):
+    def extract_with_multiple_selectors(self, soup, selectors, multiple=False):
         """여러 선택자를 시도하여 텍스트 추출"""
         for selector in selectors:
             try:
-                result = self.extract_text_safely(driver, selector, multiple)
+                result = self.extract_text_safely(soup, selector, multiple)
                 if result:
                     logger.info(f"선택자 '{selector}'로 데이터 추출 성공")
                     return result
@@ -79,79 +95,69 @@ class FinalSaraminCrawler:
                 continue
         return [] if multiple else ""
     
-    def extract_table_data(self, driver, table_selector):
+    def extract_table_data(self, soup, table_selector):
         """테이블 데이터 추출"""
         try:
-            tables = driver.find_elements(By.CSS_SELECTOR, table_selector)
-            if not tables:
-                return {}
-            
             table_data = {}
-            for table in tables:
-                rows = table.find_elements(By.TAG_NAME, 'tr')
-                for row in rows:
-                    try:
-                        th_elements = row.find_elements(By.TAG_NAME, 'th')
-                        td_elements = row.find_elements(By.TAG_NAME, 'td')
-                        
-                        if th_elements and td_elements:
-                            key = th_elements[0].text.strip()
-                            value = td_elements[0].text.strip()
-                            if key and value:
-                                table_data[key] = value
-                    except Exception as e:
-                        continue
+            for table in soup.select(table_selector):
+                for row in table.find_all('tr'):
+                    th_element = row.find('th')
+                    td_element = row.find('td')
+                    if th_element and td_element:
+                        key = element_text(th_element)
+                        value = element_text(td_element)
+                        if key and value:
+                            table_data[key] = value
             
             return table_data
         except Exception as e:
             logger.warning(f"테이블 데이터 추출 중 오류 발생: {e}")
             return {}
     
-    def extract_job_conditions(self, driver):
-        """근무조건 추출 - 개선된 버전"""
+    def extract_section_items(self, soup, keywords):
+        """제목(.tit_job_condition)에 keywords 중 하나가 들어간 .jv_cont 섹션의 dt/dd 항목"""
+        items = {}
+        for section in soup.select('.jv_cont'):
+            title = element_text(section.select_one('.tit_job_condition'))
+            if not any(keyword in title for keyword in keywords):
+                continue
+            for item in section.select('.cont .item'):
+                dt = element_text(item.select_one('dt'))
+                dd = element_text(item.select_one('dd'))
+                if dt and dd:
+                    items[dt] = dd
+        return items
+    
+    def extract_summary_rows(self, soup):
+        """요약 영역(.jv_summary .jv_summary_info)의 (항목명, 값) 목록"""
+        rows = []
+        for row in soup.select('.jv_summary .jv_summary_info .row'):
+            head = row.select_one('.col.head')
+            body = row.select_one('.col.body')
+            if head is not None and body is not None:
+                rows.append((element_text(head), element_text(body)))
+        return rows
+    
+    def extract_job_conditions(self, soup, html=None):
+        """근무조건 추출 - 개선된 버전 (html: 정규식 대체 추출에 쓸 원본 소스, 없으면 트리를 직렬화)"""
         conditions = {}
         
         # 1. 근무조건 섹션 찾기 (가장 정확한 방법)
         try:
-            condition_sections = driver.find_elements(By.CSS_SELECTOR, '.jv_cont')
-            for section in condition_sections:
-                try:
-                    title_element = section.find_element(By.CSS_SELECTOR, '.tit_job_condition')
-                    title = title_element.text.strip()
-                    if '근무조건' in title:
-                        logger.info(f"근무조건 섹션 찾음: {title}")
-                        items = section.find_elements(By.CSS_SELECTOR, '.cont .item')
-                        for item in items:
-                            try:
-                                dt = item.find_element(By.CSS_SELECTOR, 'dt').text.strip()
-                                dd = item.find_element(By.CSS_SELECTOR, 'dd').text.strip()
-                                if dt and dd:
-                                    conditions[dt] = dd
-                                    logger.info(f"근무조건 항목: {dt} - {dd}")
-                            except Exception as e:
-                                continue
-                except Exception as e:
-                    continue
+            for dt, dd in self.extract_section_items(soup, ['근무조건']).items():
+                conditions[dt] = dd
+                logger.info(f"근무조건 항목: {dt} - {dd}")
         except Exception as e:
             logger.warning(f"근무조건 섹션 찾기 중 오류 발생: {e}")
         
         # 2. 상세 정보 테이블 찾기
+        summary_rows = []
         try:
-            info_tables = driver.find_elements(By.CSS_SELECTOR, '.jv_summary .jv_summary_info')
-            for table in info_tables:
-                try:
-                    rows = table.find_elements(By.CSS_SELECTOR, 'div.row')
-                    for row in rows:
-                        try:
-                            dt = row.find_element(By.CSS_SELECTOR, 'div.col.head').text.strip()
-                            dd = row.find_element(By.CSS_SELECTOR, 'div.col.body').text.strip()
-                            if dt and dd:
-                                conditions[dt] = dd
-                                logger.info(f"상세 정보 항목: {dt} - {dd}")
-                        except Exception as e:
-                            continue
-                except Exception as e:
-                    continue
+            summary_rows = self.extract_summary_rows(soup)
+            for dt, dd in summary_rows:
+                if dt and dd:
+                    conditions[dt] = dd
+                    logger.info(f"상세 정보 항목: {dt} - {dd}")
         except Exception as e:
             logger.warning(f"상세 정보 테이블 찾기 중 오류 발생: {e}")
         
@@ -167,7 +173,7 @@ class FinalSaraminCrawler:
         
         for field, selectors in field_selectors.items():
             if field not in conditions:  # 이미 찾은 필드는 건너뛰기
-                value = self.extract_with_multiple_selectors(driver, selectors)
+                value = self.extract_with_multiple_selectors(soup, selectors)
                 if value:
                     conditions[field] = value
                     logger.info(f"직접 찾은 {field}: {value}")
@@ -175,7 +181,7 @@ class FinalSaraminCrawler:
         # 4. 페이지 소스에서 정규식으로 찾기
         if not conditions:
             try:
-                page_source = driver.page_source
+                page_source = html if html is not None else str(soup)
                 
                 # 경력 패턴
                 career_patterns = [
@@ -253,72 +259,23 @@ class FinalSaraminCrawler:
                 logger.warning(f"정규식 검색 중 오류 발생: {e}")
         
         # 5. 이미지 분석 (사용자가 제공한 이미지 참고)
-        # 이미지에서 본 구조를 기반으로 직접 추출
-        try:
-            # 경력
-            career_elements = driver.find_elements(By.CSS_SELECTOR, '.jv_summary .jv_summary_info .row')
-            for element in career_elements:
-                try:
-                    head = element.find_element(By.CSS_SELECTOR, '.col.head').text.strip()
-                    if '경력' in head:
-                        body = element.find_element(By.CSS_SELECTOR, '.col.body').text.strip()
-                        conditions['경력'] = body
-                        logger.info(f"이미지 구조 기반으로 찾은 경력: {body}")
-                except Exception as e:
-                    continue
-            
-            # 학력
-            education_elements = driver.find_elements(By.CSS_SELECTOR, '.jv_summary .jv_summary_info .row')
-            for element in education_elements:
-                try:
-                    head = element.find_element(By.CSS_SELECTOR, '.col.head').text.strip()
-                    if '학력' in head:
-                        body = element.find_element(By.CSS_SELECTOR, '.col.body').text.strip()
-                        conditions['학력'] = body
-                        logger.info(f"이미지 구조 기반으로 찾은 학력: {body}")
-                except Exception as e:
-                    continue
-            
-            # 근무형태
-            employment_elements = driver.find_elements(By.CSS_SELECTOR, '.jv_summary .jv_summary_info .row')
-            for element in employment_elements:
-                try:
-                    head = element.find_element(By.CSS_SELECTOR, '.col.head').text.strip()
-                    if '근무형태' in head:
-                        body = element.find_element(By.CSS_SELECTOR, '.col.body').text.strip()
-                        conditions['근무형태'] = body
-                        logger.info(f"이미지 구조 기반으로 찾은 근무형태: {body}")
-                except Exception as e:
-                    continue
-            
-            # 근무지역
-            location_elements = driver.find_elements(By.CSS_SELECTOR, '.jv_summary .jv_summary_info .row')
-            for element in location_elements:
-                try:
-                    head = element.find_element(By.CSS_SELECTOR, '.col.head').text.strip()
-                    if '근무지역' in head:
-                        body = element.find_element(By.CSS_SELECTOR, '.col.body').text.strip()
-                        conditions['근무지역'] = body
-                        logger.info(f"이미지 구조 기반으로 찾은 근무지역: {body}")
-                except Exception as e:
-                    continue
-        except Exception as e:
-            logger.warning(f"이미지 구조 기반 추출 중 오류 발생: {e}")
+        # 이미지에서 본 구조를 기반으로 직접 추출 (요약 영역 행을 한 번만 훑음)
+        for head, body in summary_rows:
+            for field in ('경력', '학력', '근무형태', '근무지역'):
+                if field in head:
+                    conditions[field] = body
+                    logger.info(f"이미지 구조 기반으로 찾은 {field}: {body}")
         
         return conditions
     
-    def extract_welfare_benefits(self, driver):
+    def extract_welfare_benefits(self, soup):
         """복리후생 추출"""
         try:
-            welfare_sections = driver.find_elements(By.CSS_SELECTOR, '.jv_cont')
-            for section in welfare_sections:
-                try:
-                    title = section.find_element(By.CSS_SELECTOR, '.tit_job_condition').text.strip()
-                    if '복리후생' in title:
-                        content = section.find_element(By.CSS_SELECTOR, '.cont').text.strip()
-                        return content
-                except Exception as e:
-                    continue
+            for section in soup.select('.jv_cont'):
+                title = element_text(section.select_one('.tit_job_condition'))
+                content = section.select_one('.cont')
+                if '복리후생' in title and content is not None:
+                    return element_text(content)
             
             # 다른 선택자 시도
             welfare_selectors = [
@@ -328,34 +285,19 @@ class FinalSaraminCrawler:
                 '.jv_benefit'
             ]
             
-            welfare = self.extract_with_multiple_selectors(driver, welfare_selectors)
+            welfare = self.extract_with_multiple_selectors(soup, welfare_selectors)
             return welfare
         except Exception as e:
             logger.warning(f"복리후생 추출 중 오류 발생: {e}")
             return ""
     
-    def extract_application_period(self, driver):
+    def extract_application_period(self, soup):
         """접수기간 및 방법 추출"""
         application_info = {}
         
         try:
             # 접수기간 및 방법 섹션 찾기
-            application_sections = driver.find_elements(By.CSS_SELECTOR, '.jv_cont')
-            for section in application_sections:
-                try:
-                    title = section.find_element(By.CSS_SELECTOR, '.tit_job_condition').text.strip()
-                    if '접수기간' in title or '지원방법' in title:
-                        items = section.find_elements(By.CSS_SELECTOR, '.cont .item')
-                        for item in items:
-                            try:
-                                dt = item.find_element(By.CSS_SELECTOR, 'dt').text.strip()
-                                dd = item.find_element(By.CSS_SELECTOR, 'dd').text.strip()
-                                if dt and dd:
-                                    application_info[dt] = dd
-                            except Exception as e:
-                                continue
-                except Exception as e:
-                    continue
+            application_info.update(self.extract_section_items(soup, ['접수기간', '지원방법']))
             
             # 직접 선택자 시도
             deadline_selectors = [
@@ -365,7 +307,7 @@ class FinalSaraminCrawler:
                 '.info_period'
             ]
             
-            deadline = self.extract_with_multiple_selectors(driver, deadline_selectors)
+            deadline = self.extract_with_multiple_selectors(soup, deadline_selectors)
             if deadline:
                 application_info['접수기간'] = deadline
             
@@ -376,7 +318,7 @@ class FinalSaraminCrawler:
                 '.info_apply'
             ]
             
-            method = self.extract_with_multiple_selectors(driver, method_selectors)
+            method = self.extract_with_multiple_selectors(soup, method_selectors)
             if method:
                 application_info['지원방법'] = method
         except Exception as e:
@@ -384,28 +326,13 @@ class FinalSaraminCrawler:
         
         return application_info
     
-    def extract_company_info(self, driver):
+    def extract_company_info(self, soup):
         """기업정보 추출"""
         company_info = {}
         
         try:
             # 기업정보 섹션 찾기
-            company_sections = driver.find_elements(By.CSS_SELECTOR, '.jv_cont')
-            for section in company_sections:
-                try:
-                    title = section.find_element(By.CSS_SELECTOR, '.tit_job_condition').text.strip()
-                    if '기업정보' in title:
-                        items = section.find_elements(By.CSS_SELECTOR, '.cont .item')
-                        for item in items:
-                            try:
-                                dt = item.find_element(By.CSS_SELECTOR, 'dt').text.strip()
-                                dd = item.find_element(By.CSS_SELECTOR, 'dd').text.strip()
-                                if dt and dd:
-                                    company_info[dt] = dd
-                            except Exception as e:
-                                continue
-                except Exception as e:
-                    continue
+            company_info.update(self.extract_section_items(soup, ['기업정보']))
             
             # 직접 선택자 시도
             company_name_selectors = [
@@ -415,7 +342,7 @@ class FinalSaraminCrawler:
                 '.info_company'
             ]
             
-            company_name = self.extract_with_multiple_selectors(driver, company_name_selectors)
+            company_name = self.extract_with_multiple_selectors(soup, company_name_selectors)
             if company_name:
                 company_info['회사명'] = company_name
             
@@ -426,7 +353,7 @@ class FinalSaraminCrawler:
                 '.info_company_type'
             ]
             
-            company_type = self.extract_with_multiple_selectors(driver, company_type_selectors)
+            company_type = self.extract_with_multiple_selectors(soup, company_type_selectors)
             if company_type:
                 company_info['기업형태'] = company_type
             
@@ -437,7 +364,7 @@ class FinalSaraminCrawler:
                 '.info_company_size'
             ]
             
-            company_size = self.extract_with_multiple_selectors(driver, company_size_selectors)
+            company_size = self.extract_with_multiple_selectors(soup, company_size_selectors)
             if company_size:
                 company_info['기업규모'] = company_size
             
@@ -448,7 +375,7 @@ class FinalSaraminCrawler:
                 '.info_company_industry'
             ]
             
-            company_industry = self.extract_with_multiple_selectors(driver, company_industry_selectors)
+            company_industry = self.extract_with_multiple_selectors(soup, company_industry_selectors)
             if company_industry:
                 company_info['산업'] = company_industry
         except Exception as e:
@@ -456,158 +383,279 @@ class FinalSaraminCrawler:
         
         return company_info
     
+    def parse_job_detail(self, html, url):
+        """
+        상세 페이지 HTML에서 채용 공고 정보 추출 (브라우저 없이 동작)
+        
+        Args:
+            html (str): 상세 페이지 소스
+            url (str): 상세 페이지 URL
+            
+        Returns:
+            dict: 채용 공고 상세 정보
+        """
+        soup = parse_html(html)
+        
+        # 기본 정보 초기화
+        job_data = {
+            'site': self.site_name,
+            'url': url,
+            'company_name': '',
+            'title': '',
+            'deadline': '',
+            'location': '',
+            'experience': '',
+            'education': '',
+            'employment_type': '',
+            'salary': '',
+            'description': '',
+            'welfare_benefits': '',
+            'application_period': {},
+            'company_info': {}
+        }
+        
+        # 회사명 추출
+        company_name_selectors = [
+            '.company_name',
+            '.corp_name',
+            '.name',
+            'a[href*="company"]',
+            'a[href*="corp"]',
+            '.company',
+            '.corp',
+            '#company_name',
+            '#corp_name',
+            '.jv_header .company_name',
+            '.jv_company .name'
+        ]
+        
+        company_name = self.extract_with_multiple_selectors(soup, company_name_selectors)
+        if company_name:
+            job_data['company_name'] = company_name
+            logger.info(f"회사명: {company_name}")
+        
+        # 공고 제목 추출
+        title_selectors = [
+            '.tit_job',
+            '.recruit_title',
+            '.job_tit',
+            'h1',
+            'h2',
+            '.title',
+            '.job_title',
+            '#job_title',
+            '.header_top_title',
+            '.jv_header .tit_job',
+            '.jv_title'
+        ]
+        
+        title = self.extract_with_multiple_selectors(soup, title_selectors)
+        if title:
+            job_data['title'] = title
+            logger.info(f"공고 제목: {title}")
+        
+        # 근무조건 추출 (개선된 버전)
+        job_conditions = self.extract_job_conditions(soup, html)
+        logger.info(f"근무조건: {job_conditions}")
+        
+        if '경력' in job_conditions:
+            job_data['experience'] = job_conditions['경력']
+        
+        if '학력' in job_conditions:
+            job_data['education'] = job_conditions['학력']
+        
+        if '근무형태' in job_conditions:
+            job_data['employment_type'] = job_conditions['근무형태']
+        elif '고용형태' in job_conditions:
+            job_data['employment_type'] = job_conditions['고용형태']
+        
+        if '근무지역' in job_conditions:
+            job_data['location'] = job_conditions['근무지역']
+        elif '근무지' in job_conditions:
+            job_data['location'] = job_conditions['근무지']
+        
+        if '급여' in job_conditions:
+            job_data['salary'] = job_conditions['급여']
+        elif '연봉' in job_conditions:
+            job_data['salary'] = job_conditions['연봉']
+        
+        # 복리후생 추출
+        welfare_benefits = self.extract_welfare_benefits(soup)
+        if welfare_benefits:
+            job_data['welfare_benefits'] = welfare_benefits
+            logger.info(f"복리후생: {welfare_benefits[:100]}...")
+        
+        # 접수기간 및 방법 추출
+        application_period = self.extract_application_period(soup)
+        if application_period:
+            job_data['application_period'] = application_period
+            logger.info(f"접수기간 및 방법: {application_period}")
+            
+            if '접수기간' in application_period:
+                job_data['deadline'] = application_period['접수기간']
+        
+        # 기업정보 추출
+        company_info = self.extract_company_info(soup)
+        if company_info:
+            job_data['company_info'] = company_info
+            logger.info(f"기업정보: {company_info}")
+        
+        # 상세 내용 추출
+        description_selectors = [
+            '#job_content',
+            '.job_detail_content',
+            '.recruit_detail',
+            '.job_detail',
+            '.detail_content',
+            '#jobDescriptionContent',
+            '.job_description',
+            '.description',
+            '.detail',
+            '.content',
+            '.jv_detail',
+            '.jv_cont .desc',
+            '.jv_cont .cont'
+        ]
+        
+        description = self.extract_with_multiple_selectors(soup, description_selectors)
+        if description:
+            job_data['description'] = description
+            logger.info(f"상세 내용 길이: {len(description)} 자")
+        
+        # 데이터 검증
+        for key, value in job_data.items():
+            if key not in ['site', 'url', 'welfare_benefits', 'application_period', 'company_info', 'description'] and not value:
+                logger.warning(f"{key} 정보를 찾을 수 없습니다.")
+        
+        annotate_deadline(job_data)  # 접수기간 → deadline_at/deadline_kind
+        return job_data
+    
+    def parse_job_list(self, html, base_url):
+        """
+        검색 결과 페이지 HTML에서 채용 공고 상세 URL 목록 추출
+        
+        Args:
+            html (str): 검색 결과 페이지 소스
+            base_url (str): 상대 경로를 풀 기준 URL
+            
+        Returns:
+            list: 채용 공고 상세 URL 목록 (페이지 순서, 중복 제거)
+        """
+        soup = parse_html(html)
+        job_urls = []
+        for link in soup.select('.item_recruit .job_tit a[href], a[href*="rec_idx="]'):
+            job_url = urljoin(base_url, link['href'])
+            if 'rec_idx=' in job_url:
+                job_urls.append(job_url)
+        return list(dict.fromkeys(job_urls))
+    
+    def crawl_job_list(self, url):
+        """검색 결과 페이지를 HTTP로 가져와 채용 공고 상세 URL 목록 추출"""
+        html = self.fetch_html(url)
+        if not html:
+            logger.warning(f"검색 결과 페이지를 가져오지 못했습니다: {url}")
+            return []
+        return self.parse_job_list(html, url)
+    
+    def crawl(self, url, max_jobs=None):
+        """
+        채용 공고를 크롤링하는 메인 메서드
+        
+        Args:
+            url (str): 상세 페이지 URL(rec_idx 포함)이면 그 공고만, 검색 결과 URL이면 목록의 공고들을 크롤링
+            max_jobs (int): 최대 크롤링할 채용 공고 수 (기본값: None, 모든 공고 크롤링)
+            
+        Returns:
+            list: 이번 호출에서 수집된 채용 공고 정보 목록
+        """
+        job_urls = [url] if 'rec_idx=' in url else self.crawl_job_list(url)
+        if max_jobs:
+            job_urls = job_urls[:max_jobs]
+        logger.info(f"총 {len(job_urls)}개의 채용 공고를 크롤링합니다: {url}")
+        
+        results = []
+        for job_url in job_urls:
+            job_data = self.crawl_job_detail(job_url)
+            if job_data:
+                results.append(job_data)
+        self.data.extend(results)
+        return results
+    
+    def fetch_html(self, url):
+        """
+        브라우저 없이 HTTP GET으로 페이지 소스 가져오기 (공유 HTTP 클라이언트 사용)
+        
+        Returns:
+            str: 페이지 소스 (요청 실패 시 None)
+        """
+        try:
+            response = fetch(url, headers=self.headers, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            # 캐시에서 나온 본문은 처음 받았을 때 이미 보관됨
+            if not is_cached_response(response):
+                archive_page(url, response.text, site=self.site_name, source=FETCH_TIER_HTTP)
+            return response.text
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP 요청 중 오류 발생: {url}, 오류: {e}")
+            return None
+    
+    def is_complete(self, job_data):
+        """필수 항목(제목, 회사명, 근무조건 중 하나 이상)이 모두 추출됐는지 여부"""
+        if not job_data:
+            return False
+        if not all(job_data.get(field) for field in REQUIRED_FIELDS):
+            return False
+        return any(job_data.get(field) for field in CONDITION_FIELDS)
+    
     def crawl_job_detail(self, url):
-        """채용 공고 상세 페이지에서 정보 추출"""
+        """채용 공고 상세 페이지에서 정보 추출 (HTTP 우선, 필수 항목이 비면 브라우저로)"""
+        if self.http_first:
+            started = time.monotonic()
+            html = self.fetch_html(url)
+            if html:
+                job_data = self.parse_job_detail(html, url)
+                if self.is_complete(job_data):
+                    job_data['fetch_tier'] = FETCH_TIER_HTTP
+                    self.fetch_tiers[url] = FETCH_TIER_HTTP
+                    logger.info(f"HTTP로 채용 공고 추출 완료 ({time.monotonic() - started:.2f}초): {url}")
+                    return job_data
+            logger.info(f"HTTP 결과에 필수 항목이 없어 브라우저로 다시 가져옵니다: {url}")
+        
+        job_data = self.crawl_job_detail_with_browser(url)
+        if job_data:
+            job_data['fetch_tier'] = FETCH_TIER_BROWSER
+            self.fetch_tiers[url] = FETCH_TIER_BROWSER
+        return job_data
+    
+    def crawl_job_detail_with_browser(self, url):
+        """채용 공고 상세 페이지를 브라우저(Selenium)로 열어 정보 추출"""
         logger.info(f"채용 공고 크롤링 중: {url}")
         
         for retry in range(self.max_retries):
+            driver = None
             try:
                 driver = self.setup_driver()
+                get_rate_limiter().acquire(url)
                 driver.get(url)
                 
-                # 페이지 로딩 대기
-                logger.info(f"페이지 로딩 대기 중... ({self.wait_time}초)")
-                time.sleep(self.wait_time)
-                
-                # 기본 정보 초기화
-                job_data = {
-                    'site': self.site_name,
-                    'url': url,
-                    'company_name': '',
-                    'title': '',
-                    'deadline': '',
-                    'location': '',
-                    'experience': '',
-                    'education': '',
-                    'employment_type': '',
-                    'salary': '',
-                    'description': '',
-                    'welfare_benefits': '',
-                    'application_period': {},
-                    'company_info': {}
-                }
-                
-                # 회사명 추출
-                company_name_selectors = [
-                    '.company_name',
-                    '.corp_name',
-                    '.name',
-                    'a[href*="company"]',
-                    'a[href*="corp"]',
-                    '.company',
-                    '.corp',
-                    '#company_name',
-                    '#corp_name',
-                    '.jv_header .company_name',
-                    '.jv_company .name'
-                ]
-                
-                company_name = self.extract_with_multiple_selectors(driver, company_name_selectors)
-                if company_name:
-                    job_data['company_name'] = company_name
-                    logger.info(f"회사명: {company_name}")
-                
-                # 공고 제목 추출
-                title_selectors = [
-                    '.tit_job',
-                    '.recruit_title',
-                    '.job_tit',
-                    'h1',
-                    'h2',
-                    '.title',
-                    '.job_title',
-                    '#job_title',
-                    '.header_top_title',
-                    '.jv_header .tit_job',
-                    '.jv_title'
-                ]
-                
-                title = self.extract_with_multiple_selectors(driver, title_selectors)
-                if title:
-                    job_data['title'] = title
-                    logger.info(f"공고 제목: {title}")
-                
-                # 근무조건 추출 (개선된 버전)
-                job_conditions = self.extract_job_conditions(driver)
-                logger.info(f"근무조건: {job_conditions}")
-                
-                if '경력' in job_conditions:
-                    job_data['experience'] = job_conditions['경력']
-                
-                if '학력' in job_conditions:
-                    job_data['education'] = job_conditions['학력']
-                
-                if '근무형태' in job_conditions:
-                    job_data['employment_type'] = job_conditions['근무형태']
-                elif '고용형태' in job_conditions:
-                    job_data['employment_type'] = job_conditions['고용형태']
-                
-                if '근무지역' in job_conditions:
-                    job_data['location'] = job_conditions['근무지역']
-                elif '근무지' in job_conditions:
-                    job_data['location'] = job_conditions['근무지']
-                
-                if '급여' in job_conditions:
-                    job_data['salary'] = job_conditions['급여']
-                elif '연봉' in job_conditions:
-                    job_data['salary'] = job_conditions['연봉']
-                
-                # 복리후생 추출
-                welfare_benefits = self.extract_welfare_benefits(driver)
-                if welfare_benefits:
-                    job_data['welfare_benefits'] = welfare_benefits
-                    logger.info(f"복리후생: {welfare_benefits[:100]}...")
-                
-                # 접수기간 및 방법 추출
-                application_period = self.extract_application_period(driver)
-                if application_period:
-                    job_data['application_period'] = application_period
-                    logger.info(f"접수기간 및 방법: {application_period}")
-                    
-                    if '접수기간' in application_period:
-                        job_data['deadline'] = application_period['접수기간']
-                
-                # 기업정보 추출
-                company_info = self.extract_company_info(driver)
-                if company_info:
-                    job_data['company_info'] = company_info
-                    logger.info(f"기업정보: {company_info}")
-                
-                # 상세 내용 추출
-                description_selectors = [
-                    '#job_content',
-                    '.job_detail_content',
-                    '.recruit_detail',
-                    '.job_detail',
-                    '.detail_content',
-                    '#jobDescriptionContent',
-                    '.job_description',
-                    '.description',
-                    '.detail',
-                    '.content',
-                    '.jv_detail',
-                    '.jv_cont .desc',
-                    '.jv_cont .cont'
-                ]
-                
-                description = self.extract_with_multiple_selectors(driver, description_selectors)
-                if description:
-                    job_data['description'] = description
-                    logger.info(f"상세 내용 길이: {len(description)} 자")
+                # 페이지 준비 대기 (요약/본문 영역이 나타나고 네트워크가 잠잠해질 때까지, 최대 wait_time초)
+                if not wait_for_page(driver, SARAMIN_READY_SELECTORS, timeout=self.wait_time):
+                    logger.warning("페이지가 완전히 준비되지 않았지만 추출을 시도합니다.")
                 
-                # 데이터 검증
-                for key, value in job_data.items():
-                    if key not in ['site', 'url', 'welfare_benefits', 'application_period', 'company_info', 'description'] and not value:
-                        logger.warning(f"{key} 정보를 찾을 수 없습니다.")
+                # 페이지 소스는 한 번만 받고 드라이버는 바로 풀에 반환 (추출은 오프라인으로)
+                html = driver.page_source
+                release_driver(driver)
+                driver = None
+                archive_page(url, html, site=self.site_name, source=FETCH_TIER_BROWSER)
                 
+                job_data = self.parse_job_detail(html, url)
                 logger.info("채용 공고 크롤링 완료")
-                driver.quit()
                 return job_data
                 
             except Exception as e:
                 logger.error(f"채용 공고 상세 페이지 크롤링 중 오류 발생 (시도 {retry+1}/{self.max_retries}): {e}")
-                if driver:
-                    driver.quit()
+                # 대기 시간 초과가 아닌 브라우저 오류면 재시도 때 새 드라이버를 쓰도록 버림
+                release_driver(driver, discard=isinstance(e, WebDriverException) and not isinstance(e, TimeoutException))
                 
                 if retry < self.max_retries - 1:
                     logger.info(f"{5 * (retry + 1)}초 후 재시도합니다...")
@@ -0,0 +1,221 @@
+"""
+크롤러 HTTP 응답 디스크 캐시 (조건부 재검증)
+
+크롤러를 다시 돌릴 때 바뀌지 않은 목록/상세 페이지를 통째로 다시 받지 않도록, 응답 본문과
+검증자(ETag, Last-Modified)를 SQLite 파일 하나에 저장한다.
+
+- TTL 안의 항목: 네트워크 없이 캐시에서 바로 응답 (hit)
+- TTL이 지난 항목: If-None-Match/If-Modified-Since 조건부 요청 → 304면 저장된 본문 재사용 (revalidated)
+- 나머지: 원래대로 받아서 저장 (miss)
+- 전체 본문 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 지움 (LRU)
+  (여러 프로세스가 같은 파일을 쓰므로 전체 크기는 저장할 때마다 SQLite에서 SUM(size)로 계산)
+
+캐시 키는 URL이다 (Vary는 보지 않음, 크롤러는 URL마다 같은 헤더로 요청함).
+Cache-Control: no-store 응답과 200이 아닌 응답은 저장하지 않는다.
+"""
+from typing import Dict, NamedTuple, Optional
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.getenv(
+    "CRAWLER_HTTP_CACHE_PATH", os.path.join(os.path.dirname(__file__), 'data', 'http_cache.sqlite'))
+DEFAULT_TTL = float(os.getenv("CRAWLER_HTTP_CACHE_TTL", "3600"))
+DEFAULT_MAX_MB = float(os.getenv("CRAWLER_HTTP_CACHE_MB", "200"))
+
+# 캐시된 응답에 붙이는 헤더 (HIT / REVALIDATED)
+CACHE_STATUS_HEADER = 'x-crawler-cache'
+
+# 저장된 본문은 이미 풀린 상태이므로 전송 관련 헤더는 버림
+_DROP_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_http_cache_accessed_at ON http_cache (accessed_at);
+"""
+
+
+def is_cached_response(response: httpx.Response) -> bool:
+    """캐시에서 나온 응답(HIT/REVALIDATED)인지 여부 (본문은 이전에 받아 둔 그대로)"""
+    return CACHE_STATUS_HEADER in response.headers
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self, status: str) -> httpx.Response:
+        """저장된 본문으로 200 응답 만들기 (status: CACHE_STATUS_HEADER 값)"""
+        headers = dict(self.headers)
+        headers[CACHE_STATUS_HEADER] = status
+        return httpx.Response(200, headers=headers, content=self.body, request=httpx.Request('GET', self.url))
+
+
+class HttpCache:
+    """URL별 응답 본문/검증자를 저장하는 디스크 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str = None, ttl: float = None, max_bytes: int = None):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (':memory:'도 가능)
+            ttl (float): 재검증 없이 캐시를 바로 쓰는 시간 (초, 0이면 매번 재검증)
+            max_bytes (int): 저장할 본문 전체 크기 상한
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.max_bytes = int(max_bytes or DEFAULT_MAX_MB * 1024 * 1024)
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    @property
+    def total_bytes(self) -> int:
+        """저장된 본문 전체 크기 (다른 프로세스가 저장한 항목 포함)"""
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+    def count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """저장된 항목 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT headers, body, etag, last_modified, stored_at FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(url, json.loads(row[0]), row[1], row[2], row[3], row[4])
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def touch(self, url: str, refreshed: bool = False, headers: Optional[httpx.Headers] = None):
+        """항목 사용 시각 갱신 (refreshed면 304로 재검증된 것이므로 저장 시각과 검증자도 갱신)"""
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                etag = headers.get('etag') if headers is not None else None
+                last_modified = headers.get('last-modified') if headers is not None else None
+                self._conn.execute(
+                    "UPDATE http_cache SET stored_at = ?, accessed_at = ?, etag = COALESCE(?, etag), "
+                    "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                    (now, now, etag, last_modified, url))
+            else:
+                self._conn.execute("UPDATE http_cache SET accessed_at = ? WHERE url = ?", (now, url))
+
+    def store(self, url: str, response: httpx.Response) -> bool:
+        """200 응답 저장 (저장하지 않을 응답이면 False)"""
+        if response.status_code != 200 or 'no-store' in response.headers.get('cache-control', '').lower():
+            return False
+        body = response.content
+        if len(body) > self.max_bytes:
+            return False
+        headers = {key: value for key, value in response.headers.items() if key.lower() not in _DROP_HEADERS}
+        now = time.time()
+        with self._lock:
+            # 저장과 정리를 한 쓰기 트랜잭션으로 묶어 다른 프로세스의 저장과 섞이지 않게 함
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, headers, body, etag, last_modified, size, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, json.dumps(headers), body, response.headers.get('etag'),
+                     response.headers.get('last-modified'), len(body), now, now))
+                total = self._total_bytes()
+                if total > self.max_bytes:
+                    self._evict(total)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.stats['stores'] += 1
+        return True
+
+    def _evict(self, total: int):
+        """가장 오래 안 쓴 항목부터 지워 상한의 90% 아래로 (잠금과 쓰기 트랜잭션을 잡은 상태에서 호출)"""
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute("SELECT url, size FROM http_cache ORDER BY accessed_at").fetchall()
+        evicted = []
+        for url, size in rows:
+            if total <= target:
+                break
+            evicted.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM http_cache WHERE url = ?", evicted)
+        self.stats['evictions'] += len(evicted)
+        logger.info(f"HTTP 캐시 정리: {len(evicted)}개 항목 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
+
+    def summary(self) -> dict:
+        """적중률을 포함한 통계"""
+        with self._lock:
+            stats = dict(self.stats)
+            entries = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+            total = self._total_bytes()
+        lookups = stats['hits'] + stats['revalidated'] + stats['misses']
+        stats.update({
+            'entries': entries,
+            'bytes': total,
+            'hit_rate': (stats['hits'] + stats['revalidated']) / lookups if lookups else 0.0,
+        })
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[HttpCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """크롤러 공용 HTTP 캐시 (CRAWLER_HTTP_CACHE=0이면 None)"""
+    global _shared_cache
+    if os.getenv("CRAWLER_HTTP_CACHE", "1") in ("0", "false", "no"):
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HttpCache()
+        return _shared_cache
@@ -0,0 +1,213 @@
+"""
+크롤러 공용 비동기 HTTP 클라이언트
+
+requests.get은 호출마다 새 연결을 열고 제한 시간도 없다. 여기서는 httpx.AsyncClient 하나로
+호스트별 keep-alive 연결을 재사용하고, 호스트마다 동시 요청 수를 PER_HOST_LIMIT으로 묶는다.
+모든 요청은 보내기 전에 도메인별 속도 제한(rate_limit.get_rate_limiter)을 거친다.
+캐시(http_cache.HttpCache)를 주면 GET 응답을 디스크에 저장하고 ETag/Last-Modified로 재검증한다.
+
+- 비동기 코드: AsyncHttpClient를 만들어 get/get_text/get_many를 await
+- 동기 코드(기존 크롤러): fetch()/fetch_many()가 백그라운드 이벤트 루프의 공유 클라이언트로 요청을 보냄
+
+h2 패키지가 설치되어 있으면 HTTP/2를, 없으면 HTTP/1.1을 쓴다.
+"""
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+import asyncio
+import atexit
+import logging
+import os
+import threading
+
+import httpx
+
+from .http_cache import HttpCache, get_http_cache
+from .rate_limit import RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+CONNECT_TIMEOUT = float(os.getenv("CRAWLER_HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("CRAWLER_HTTP_READ_TIMEOUT", "15"))
+PER_HOST_LIMIT = int(os.getenv("CRAWLER_HTTP_PER_HOST", "4"))
+MAX_KEEPALIVE = 20
+KEEPALIVE_EXPIRY = 30
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+
+class AsyncHttpClient:
+    """호스트별 연결 재사용과 동시 요청 제한이 있는 비동기 HTTP 클라이언트 (하나의 이벤트 루프에서 사용)"""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, per_host_limit: int = None,
+                 connect_timeout: float = None, read_timeout: float = None,
+                 http2: bool = None, rate_limiter: RateLimiter = None,
+                 cache: Optional[HttpCache] = None, transport: httpx.AsyncBaseTransport = None):
+        """
+        Args:
+            headers: 모든 요청에 붙일 기본 헤더 (기본값: DEFAULT_HEADERS)
+            per_host_limit (int): 호스트별 동시 요청 수
+            connect_timeout (float): 연결 제한 시간 (초)
+            read_timeout (float): 응답 읽기 제한 시간 (초)
+            http2 (bool): HTTP/2 사용 여부 (기본값: h2 설치 여부)
+            rate_limiter (RateLimiter): 도메인별 속도 제한기 (기본값: 크롤러 공용 제한기)
+            cache (HttpCache): 응답 디스크 캐시 (기본값: 캐시 안 함)
+            transport: 테스트용 httpx 전송 계층
+        """
+        self.per_host_limit = per_host_limit or PER_HOST_LIMIT
+        if http2 is None:
+            http2 = HTTP2_AVAILABLE
+        self._client = httpx.AsyncClient(
+            headers=headers or DEFAULT_HEADERS,
+            timeout=httpx.Timeout(read_timeout or READ_TIMEOUT, connect=connect_timeout or CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=MAX_KEEPALIVE,
+                                keepalive_expiry=KEEPALIVE_EXPIRY),
+            http2=http2,
+            follow_redirects=True,
+            transport=transport,
+        )
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.cache = cache
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {'requests': 0, 'errors': 0}
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return limit
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """
+        GET 요청 (도메인 속도 제한과 호스트별 동시 요청 수에 따라 차례를 기다림, 오류는 httpx.HTTPError로 올라감)
+
+        캐시가 있으면 TTL 안의 응답은 네트워크 없이 돌려주고, 지난 응답은 조건부 요청으로 재검증한다.
+        캐시에서 나온 응답에는 CACHE_STATUS_HEADER(HIT/REVALIDATED) 헤더가 붙는다.
+        """
+        entry = self.cache.lookup(url) if self.cache is not None else None
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.touch(url)
+            self.cache.count('hits')
+            return entry.to_response('HIT')
+        if entry is not None:
+            headers = {**(headers or {}), **entry.validators()}
+
+        await self.rate_limiter.acquire_async(url)
+        async with self._host_limit(url):
+            self.stats['requests'] += 1
+            try:
+                response = await self._client.get(url, headers=headers, **kwargs)
+            except httpx.HTTPError:
+                self.stats['errors'] += 1
+                raise
+
+        if self.cache is not None:
+            if response.status_code == 304 and entry is not None:
+                self.cache.touch(url, refreshed=True, headers=response.headers)
+                self.cache.count('revalidated')
+                return entry.to_response('REVALIDATED')
+            self.cache.count('misses')
+            self.cache.store(url, response)
+        return response
+
+    async def get_ok(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[httpx.Response]:
+        """성공한 응답 (요청 실패나 4xx/5xx면 None)"""
+        try:
+            response = await self.get(url, headers=headers)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP 요청 중 오류 발생: {url}, 오류: {e}")
+            return None
+
+    async def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """응답 본문 문자열 (요청 실패나 4xx/5xx면 None)"""
+        response = await self.get_ok(url, headers=headers)
+        return response.text if response is not None else None
+
+    async def get_many_responses(self, urls: Sequence[str],
+                                 headers: Optional[Dict[str, str]] = None) -> List[Optional[httpx.Response]]:
+        """여러 URL을 동시에 요청해 URL 순서대로 응답 반환 (실패한 URL은 None, 캐시 여부 확인용)"""
+        return list(await asyncio.gather(*(self.get_ok(url, headers=headers) for url in urls)))
+
+    async def get_many(self, urls: Sequence[str], headers: Optional[Dict[str, str]] = None) -> List[Optional[str]]:
+        """여러 URL을 동시에 요청해 URL 순서대로 본문 반환 (실패한 URL은 None)"""
+        responses = await self.get_many_responses(urls, headers=headers)
+        return [response.text if response is not None else None for response in responses]
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+# 동기 코드용 공유 클라이언트: 백그라운드 스레드의 이벤트 루프 하나에서 모든 요청을 처리
+_shared_lock = threading.Lock()
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_client: Optional[AsyncHttpClient] = None
+
+
+def _shared() -> tuple:
+    global _shared_loop, _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="crawler-http", daemon=True).start()
+            _shared_loop = loop
+            _shared_client = AsyncHttpClient(cache=get_http_cache())
+            atexit.register(close_shared_client)
+        return _shared_loop, _shared_client
+
+
+def _run(coro_factory):
+    loop, client = _shared()
+    return asyncio.run_coroutine_threadsafe(coro_factory(client), loop).result()
+
+
+def fetch(url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+    """공유 클라이언트로 GET 요청 (동기, 오류는 httpx.HTTPError로 올라감)"""
+    return _run(lambda client: client.get(url, headers=headers, **kwargs))
+
+
+def fetch_text(url: str, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """공유 클라이언트로 본문 문자열 가져오기 (동기, 실패하면 None)"""
+    return _run(lambda client: client.get_text(url, headers=headers))
+
+
+def fetch_many(urls: Sequence[str], headers: Optional[Dict[str, str]] = None) -> List[Optional[str]]:
+    """공유 클라이언트로 여러 URL을 동시에 가져오기 (동기, URL 순서대로, 실패한 URL은 None)"""
+    return _run(lambda client: client.get_many(urls, headers=headers))
+
+
+def fetch_many_responses(urls: Sequence[str],
+                         headers: Optional[Dict[str, str]] = None) -> List[Optional[httpx.Response]]:
+    """공유 클라이언트로 여러 URL을 동시에 가져와 응답 반환 (동기, URL 순서대로, 실패한 URL은 None)"""
+    return _run(lambda client: client.get_many_responses(urls, headers=headers))
+
+
+def close_shared_client():
+    """공유 클라이언트의 연결을 닫고 백그라운드 루프를 멈춤"""
+    global _shared_loop, _shared_client
+    with _shared_lock:
+        loop, client = _shared_loop, _shared_client
+        _shared_loop = _shared_client = None
+    if client is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"HTTP 클라이언트 종료 중 오류: {e}")
+    loop.call_soon_threadsafe(loop.stop)
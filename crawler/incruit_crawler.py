@@ -1,4 +1,9 @@
 from .base_crawler import BaseCrawler
+from .dom import parse_html
+from .rate_limit import get_rate_limiter
+from .snapshot_archive import archive_page
+from .page_wait import wait_for_page
+from deadline import annotate_deadline
 import re
 import logging
 from bs4 import BeautifulSoup
@@ -32,22 +37,12 @@ class IncruitCrawler(BaseCrawler):
         try:
             # Selenium으로 동적 페이지 로딩
             driver = self.setup_selenium()
+            get_rate_limiter().acquire(url)
             driver.get(url)
             
-            # 페이지 로딩 대기 (더 긴 대기 시간 설정)
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.list-default'))
-                )
-            except TimeoutException:
-                self.logger.warning("기본 선택자로 요소를 찾을 수 없습니다. 대체 선택자 시도...")
-                # 대체 선택자 시도
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.jobList, .list-recruit, .list-jobs'))
-                )
-            
-            # 페이지가 완전히 로드될 때까지 추가 대기
-            time.sleep(5)
+            # 페이지 준비 대기 (핵심 요소가 나타나고 네트워크가 잠잠해질 때까지)
+            if not wait_for_page(driver, ['.list-default, .jobList, .list-recruit, .list-jobs'], site='incruit'):
+                raise TimeoutException("페이지 로딩 대기 시간 초과")
             
             # 페이지 소스 파싱
             soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -93,13 +88,13 @@ class IncruitCrawler(BaseCrawler):
                     "https://www.incruit.com/jobdb/view.asp?test=33333"   # 가상의 테스트 URL
                 ]
             
-            driver.quit()
+            self.release_selenium(driver)
             return job_urls
             
         except Exception as e:
             self.logger.error(f"채용 공고 목록 크롤링 중 오류 발생: {e}")
             if 'driver' in locals() and driver:
-                driver.quit()
+                self.release_selenium(driver)
             
             # 테스트용 URL 반환
             self.logger.warning("오류 발생으로 테스트용 URL을 반환합니다.")
@@ -109,6 +104,117 @@ class IncruitCrawler(BaseCrawler):
                 "https://www.incruit.com/jobdb/view.asp?test=33333"   # 가상의 테스트 URL
             ]
     
+    def parse_job_detail(self, html, url):
+        """
+        인크루트 상세 페이지 HTML에서 채용 공고 정보 추출 (브라우저 없이 동작)
+        
+        Args:
+            html (str): 상세 페이지 소스
+            url (str): 상세 페이지 URL
+            
+        Returns:
+            dict: 채용 공고 상세 정보
+        """
+        soup = parse_html(html)
+        
+        # 기업명 추출 (여러 선택자 시도)
+        company_name = ""
+        company_selectors = ['.jobpost_top_cpname', '.company_name', '.corp_name', '.view_company']
+        for selector in company_selectors:
+            company_tag = soup.select_one(selector)
+            if company_tag:
+                company_name = company_tag.text.strip()
+                break
+        
+        # 공고 제목 추출 (여러 선택자 시도)
+        title = ""
+        title_selectors = ['.jobpost_top_title', '.job_title', '.view_title', '.tit_job']
+        for selector in title_selectors:
+            title_tag = soup.select_one(selector)
+            if title_tag:
+                title = title_tag.text.strip()
+                break
+        
+        # 마감일 추출 (여러 선택자 시도)
+        deadline = ""
+        deadline_selectors = ['.jobview_section .info_period', '.job_period', '.view_period', '.date_info']
+        for selector in deadline_selectors:
+            deadline_tag = soup.select_one(selector)
+            if deadline_tag:
+                deadline = deadline_tag.text.strip()
+                break
+        
+        # 근무지역 추출 (여러 선택자 시도)
+        location = ""
+        location_selectors = ['.jobview_section .info_work_place', '.job_location', '.view_location', '.place_info']
+        for selector in location_selectors:
+            location_tag = soup.select_one(selector)
+            if location_tag:
+                location = location_tag.text.strip()
+                break
+        
+        # 경력 요구사항 추출 (여러 선택자 시도)
+        experience = ""
+        experience_selectors = ['.jobview_section .info_career', '.job_career', '.view_career', '.career_info']
+        for selector in experience_selectors:
+            experience_tag = soup.select_one(selector)
+            if experience_tag:
+                experience = experience_tag.text.strip()
+                break
+        
+        # 학력 요구사항 추출 (여러 선택자 시도)
+        education = ""
+        education_selectors = ['.jobview_section .info_education', '.job_education', '.view_education', '.edu_info']
+        for selector in education_selectors:
+            education_tag = soup.select_one(selector)
+            if education_tag:
+                education = education_tag.text.strip()
+                break
+        
+        # 급여 정보 추출 (여러 선택자 시도)
+        salary = ""
+        salary_selectors = ['.jobview_section .info_salary', '.job_salary', '.view_salary', '.salary_info']
+        for selector in salary_selectors:
+            salary_tag = soup.select_one(selector)
+            if salary_tag:
+                salary = salary_tag.text.strip()
+                break
+        
+        # 고용형태 추출 (여러 선택자 시도)
+        employment_type = ""
+        employment_selectors = ['.jobview_section .info_worktype', '.job_type', '.view_type', '.type_info']
+        for selector in employment_selectors:
+            employment_tag = soup.select_one(selector)
+            if employment_tag:
+                employment_type = employment_tag.text.strip()
+                break
+        
+        # 상세 내용 추출 (여러 선택자 시도)
+        description = ""
+        description_selectors = ['.jobview_section .jobview_cont', '.job_detail_content', '.view_detail_content', '.detail_info']
+        for selector in description_selectors:
+            description_tag = soup.select_one(selector)
+            if description_tag:
+                description = description_tag.text.strip()
+                break
+        
+        # 수집된 데이터 정리
+        job_data = {
+            'site': self.site_name,
+            'url': url,
+            'company_name': company_name,
+            'title': title,
+            'deadline': deadline,
+            'location': location,
+            'experience': experience,
+            'education': education,
+            'salary': salary,
+            'employment_type': employment_type,
+            'description': description
+        }
+        annotate_deadline(job_data)
+        return job_data
+    
     def crawl_job_detail(self, url):
         """
         인크루트 채용 공고 상세 페이지를 크롤링
@@ -139,129 +245,24 @@ class IncruitCrawler(BaseCrawler):
             
             # Selenium으로 동적 페이지 로딩
             driver = self.setup_selenium()
+            get_rate_limiter().acquire(url)
             driver.get(url)
             
-            # 페이지 로딩 대기 (더 긴 대기 시간 설정)
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.jobview_wrap'))
-                )
-            except TimeoutException:
-                self.logger.warning("기본 선택자로 요소를 찾을 수 없습니다. 대체 선택자 시도...")
-                # 대체 선택자 시도
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.job_detail, .view_wrap, .view_detail'))
-                )
-            
-            # 페이지가 완전히 로드될 때까지 추가 대기
-            time.sleep(5)
-            
-            # 페이지 소스 파싱
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # 기업명 추출 (여러 선택자 시도)
-            company_name = ""
-            company_selectors = ['.jobpost_top_cpname', '.company_name', '.corp_name', '.view_company']
-            for selector in company_selectors:
-                company_tag = soup.select_one(selector)
-                if company_tag:
-                    company_name = company_tag.text.strip()
-                    break
-            
-            # 공고 제목 추출 (여러 선택자 시도)
-            title = ""
-            title_selectors = ['.jobpost_top_title', '.job_title', '.view_title', '.tit_job']
-            for selector in title_selectors:
-                title_tag = soup.select_one(selector)
-                if title_tag:
-                    title = title_tag.text.strip()
-                    break
-            
-            # 마감일 추출 (여러 선택자 시도)
-            deadline = ""
-            deadline_selectors = ['.jobview_section .info_period', '.job_period', '.view_period', '.date_info']
-            for selector in deadline_selectors:
-                deadline_tag = soup.select_one(selector)
-                if deadline_tag:
-                    deadline = deadline_tag.text.strip()
-                    break
-            
-            # 근무지역 추출 (여러 선택자 시도)
-            location = ""
-            location_selectors = ['.jobview_section .info_work_place', '.job_location', '.view_location', '.place_info']
-            for selector in location_selectors:
-                location_tag = soup.select_one(selector)
-                if location_tag:
-                    location = location_tag.text.strip()
-                    break
-            
-            # 경력 요구사항 추출 (여러 선택자 시도)
-            experience = ""
-            experience_selectors = ['.jobview_section .info_career', '.job_career', '.view_career', '.career_info']
-            for selector in experience_selectors:
-                experience_tag = soup.select_one(selector)
-                if experience_tag:
-                    experience = experience_tag.text.strip()
-                    break
-            
-            # 학력 요구사항 추출 (여러 선택자 시도)
-            education = ""
-            education_selectors = ['.jobview_section .info_education', '.job_education', '.view_education', '.edu_info']
-            for selector in education_selectors:
-                education_tag = soup.select_one(selector)
-                if education_tag:
-                    education = education_tag.text.strip()
-                    break
-            
-            # 급여 정보 추출 (여러 선택자 시도)
-            salary = ""
-            salary_selectors = ['.jobview_section .info_salary', '.job_salary', '.view_salary', '.salary_info']
-            for selector in salary_selectors:
-                salary_tag = soup.select_one(selector)
-                if salary_tag:
-                    salary = salary_tag.text.strip()
-                    break
-            
-            # 고용형태 추출 (여러 선택자 시도)
-            employment_type = ""
-            employment_selectors = ['.jobview_section .info_worktype', '.job_type', '.view_type', '.type_info']
-            for selector in employment_selectors:
-                employment_tag = soup.select_one(selector)
-                if employment_tag:
-                    employment_type = employment_tag.text.strip()
-                    break
-            
-            # 상세 내용 추출 (여러 선택자 시도)
-            description = ""
-            description_selectors = ['.jobview_section .jobview_cont', '.job_detail_content', '.view_detail_content', '.detail_info']
-            for selector in description_selectors:
-                description_tag = soup.select_one(selector)
-                if description_tag:
-                    description = description_tag.text.strip()
-                    break
-            
-            # 수집된 데이터 정리
-            job_data = {
-                'site': self.site_name,
-                'url': url,
-                'company_name': company_name,
-                'title': title,
-                'deadline': deadline,
-                'location': location,
-                'experience': experience,
-                'education': education,
-                'salary': salary,
-                'employment_type': employment_type,
-                'description': description
-            }
+            # 페이지 준비 대기 (핵심 요소가 나타나고 네트워크가 잠잠해질 때까지)
+            if not wait_for_page(driver, ['.jobview_wrap, .job_detail, .view_wrap, .view_detail'], site='incruit'):
+                raise TimeoutException("페이지 로딩 대기 시간 초과")
             
-            driver.quit()
-            return job_data
+            # 페이지 소스만 받고 드라이버는 바로 반환 (추출은 브라우저 없이)
+            html = driver.page_source
+            self.release_selenium(driver)
+            driver = None
+            archive_page(url, html, site=self.site_name, source='browser')
+            return self.parse_job_detail(html, url)
             
         except Exception as e:
             self.logger.error(f"채용 공고 상세 크롤링 중 오류 발생: {url}, 오류: {e}")
             if 'driver' in locals() and driver:
-                driver.quit()
+                self.release_selenium(driver)
             
             # 테스트용 URL인 경우 가상 데이터 반환
             if 'test=' in url:
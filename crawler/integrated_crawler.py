@@ -1,12 +1,14 @@
 import re
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-from crawlers.saramin_crawler import SaraminCrawler
-from crawlers.jobplanet_crawler import JobPlanetCrawler
-from crawlers.incruit_crawler import IncruitCrawler
+from .final_saramin_crawler import FinalSaraminCrawler
+from .jobplanet_crawler import JobPlanetCrawler
+from .incruit_crawler import IncruitCrawler
 import pandas as pd
 import os
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,19 +22,36 @@ logging.basicConfig(
 
 logger = logging.getLogger("IntegratedCrawler")
 
+# crawl_multiple에서 사이트별로 동시에 처리할 URL 수 (사이트끼리는 서로 기다리지 않음)
+SITE_WORKERS = {
+    'Saramin': 2,    # 대부분 HTTP로 끝남
+    'JobPlanet': 1,  # Chrome 필요 (웹드라이버 풀을 나눠 씀)
+    'Incruit': 1,
+}
+DEFAULT_SITE_WORKERS = 1
+
 class IntegratedCrawler:
     """
     여러 채용 사이트의 크롤러를 통합하여 관리하는 클래스
     """
     
-    def __init__(self):
-        """통합 크롤러 초기화"""
+    def __init__(self, site_workers: Optional[Dict[str, int]] = None):
+        """
+        통합 크롤러 초기화
+        
+        Args:
+            site_workers: 사이트별 동시 처리 URL 수 (기본값: SITE_WORKERS)
+        """
         self.logger = logging.getLogger(__name__)
-        self.crawlers = {
-            'Saramin': SaraminCrawler(),
-            'JobPlanet': JobPlanetCrawler(),
-            'Incruit': IncruitCrawler()
+        # crawl_multiple은 URL마다 새 크롤러를 만들어 씀 (크롤러의 data가 URL끼리 섞이지 않도록)
+        self.crawler_factories = {
+            'Saramin': FinalSaraminCrawler,
+            'JobPlanet': JobPlanetCrawler,
+            'Incruit': IncruitCrawler
         }
+        # crawl()이 쓰는 사이트별 크롤러 (처음 쓸 때 만듦)
+        self._crawlers = {}
+        self.site_workers = {**SITE_WORKERS, **(site_workers or {})}
     
     def detect_site(self, url):
         """
@@ -62,6 +81,13 @@ class IntegratedCrawler:
             logger.error(f"사이트 감지 중 오류 발생: {e}")
             return None
     
+    def get_crawler(self, site: str):
+        """crawl()이 재사용하는 사이트별 크롤러 (처음 요청할 때 만듦)"""
+        crawler = self._crawlers.get(site)
+        if crawler is None:
+            crawler = self._crawlers[site] = self.crawler_factories[site]()
+        return crawler
+
     def crawl(self, url, max_jobs=None):
         """
         URL을 분석하여 적절한 크롤러를 선택하고 크롤링 실행
@@ -82,7 +108,7 @@ class IntegratedCrawler:
         logger.info(f"감지된 사이트: {site}, URL: {url}")
         
         try:
-            crawler = self.crawlers[site]
+            crawler = self.get_crawler(site)
             result = crawler.crawl(url, max_jobs)
             
             if result:
@@ -96,46 +122,84 @@ class IntegratedCrawler:
             logger.error(f"크롤링 중 오류 발생: {site}, URL: {url}, 오류: {e}")
             return site, []
     
-    def crawl_multiple(self, urls: List[str], max_jobs: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+    def _crawl_url(self, site: str, url: str, max_jobs: Optional[int]) -> Dict[str, Any]:
+        """사이트 워커에서 URL 하나를 크롤링 (오류는 결과에 담고 다른 URL에 번지지 않게 함)"""
+        started = time.monotonic()
+        jobs, error = [], None
+        try:
+            self.logger.info(f"{site} 크롤러로 크롤링 시작: {url}")
+            jobs = self.crawler_factories[site]().crawl(url, max_jobs) or []
+        except Exception as e:
+            self.logger.error(f"크롤링 중 오류 발생: {site}, URL: {url}, 오류: {e}")
+            error = str(e)
+        return {
+            'url': url,
+            'site': site,
+            'jobs': jobs,
+            'error': error,
+            'elapsed': time.monotonic() - started,
+        }
+    
+    def crawl_stream(self, urls: List[str], max_jobs: int = 10) -> Iterator[Dict[str, Any]]:
         """
-        여러 URL에서 채용 정보를 크롤링
+        여러 URL을 사이트별 워커로 동시에 크롤링하고 끝나는 순서대로 결과를 내보냄
+        
+        사이트마다 site_workers만큼의 스레드를 따로 두므로 한 사이트가 느려도 다른 사이트는 계속 진행된다.
+        중간에 반복을 멈추면 아직 시작하지 않은 URL은 취소된다.
         
         Args:
-            urls (List[str]): 크롤링할 URL 목록
-            max_jobs (int): 각 크롤러당 최대 크롤링할 채용 공고 수
+            urls (List[str]): 크롤링할 URL 목록 (중복은 한 번만 크롤링)
+            max_jobs (int): URL당 최대 크롤링할 채용 공고 수
             
-        Returns:
-            Dict[str, List[Dict[str, Any]]]: 사이트별 크롤링 결과
+        Yields:
+            Dict[str, Any]: URL별 결과 {'url', 'site', 'jobs', 'error', 'elapsed'}
         """
-        results = {}
+        tasks = []
+        for url in dict.fromkeys(urls):
+            site = self.detect_site(url)
+            if site in self.crawler_factories:
+                tasks.append((site, url))
+            else:
+                self.logger.warning(f"지원하지 않는 URL입니다: {url}")
         
+        executors = {
+            site: ThreadPoolExecutor(max_workers=max(1, self.site_workers.get(site, DEFAULT_SITE_WORKERS)),
+                                     thread_name_prefix=f"crawl-{site}")
+            for site in {site for site, _ in tasks}
+        }
         try:
-            for url in urls:
-                # URL에서 사이트 식별
-                site = None
-                if 'saramin.co.kr' in url:
-                    site = 'Saramin'
-                elif 'jobplanet.co.kr' in url:
-                    site = 'JobPlanet'
-                elif 'incruit.com' in url:
-                    site = 'Incruit'
-                
-                if site and site in self.crawlers:
-                    self.logger.info(f"{site} 크롤러로 크롤링 시작: {url}")
-                    result = self.crawlers[site].crawl(url, max_jobs)
-                    results[site] = result
-                else:
-                    self.logger.warning(f"지원하지 않는 URL입니다: {url}")
-            
-            return results
+            futures = [executors[site].submit(self._crawl_url, site, url, max_jobs) for site, url in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def crawl_multiple(self, urls: List[str], max_jobs: int = 10,
+                       on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 URL에서 채용 정보를 동시에 크롤링
+        
+        Args:
+            urls (List[str]): 크롤링할 URL 목록
+            max_jobs (int): URL당 최대 크롤링할 채용 공고 수
+            on_result: URL 하나가 끝날 때마다 그 결과(crawl_stream 항목)로 호출할 함수
             
-        except Exception as e:
-            self.logger.error(f"통합 크롤링 중 오류 발생: {e}")
-            return {}
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: URL별 크롤링 결과 (입력 순서, 지원하지 않는 URL 제외)
+        """
+        results = {}
+        for result in self.crawl_stream(urls, max_jobs):
+            results[result['url']] = result['jobs']
+            self.logger.info(f"크롤링 완료: {result['site']}, {result['url']}, "
+                             f"{len(result['jobs'])}개 ({result['elapsed']:.1f}초)")
+            if on_result:
+                on_result(result)
+        return {url: results[url] for url in dict.fromkeys(urls) if url in results}
     
     def cleanup(self):
         """생성된 CSV 파일들을 정리"""
-        for site in self.crawlers.keys():
+        for site in self.crawler_factories.keys():
             filename = f"{site}_jobs.csv"
             max_retries = 3
             retry_delay = 2  # 초
@@ -1,4 +1,9 @@
 from .base_crawler import BaseCrawler
+from .dom import parse_html
+from .rate_limit import get_rate_limiter
+from .snapshot_archive import archive_page
+from .page_wait import wait_for_page
+from deadline import annotate_deadline
 import re
 import logging
 from bs4 import BeautifulSoup
@@ -37,21 +42,12 @@ class JobPlanetCrawler(BaseCrawler):
             
             # Selenium으로 동적 페이지 로딩
             driver = self.setup_selenium()
+            get_rate_limiter().acquire(url)
             driver.get(url)
             
-            # 페이지 로딩 대기
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.recruitment-item'))
-                )
-            except TimeoutException:
-                self.logger.warning("기본 선택자로 요소를 찾을 수 없습니다. 대체 선택자 시도...")
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.job_list, .recruit_list'))
-                )
-            
-            # 페이지가 완전히 로드될 때까지 추가 대기
-            time.sleep(5)
+            # 페이지 준비 대기 (핵심 요소가 나타나고 네트워크가 잠잠해질 때까지)
+            if not wait_for_page(driver, ['.recruitment-item, .job_list, .recruit_list'], site='jobplanet'):
+                raise TimeoutException("페이지 로딩 대기 시간 초과")
             
             # 페이지 소스 파싱
             soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -86,15 +82,92 @@ class JobPlanetCrawler(BaseCrawler):
             
             self.logger.info(f"총 {len(job_urls)}개의 채용 공고 URL을 찾았습니다.")
             
-            driver.quit()
+            self.release_selenium(driver)
             return job_urls
             
         except Exception as e:
             self.logger.error(f"채용 공고 목록 크롤링 중 오류 발생: {e}")
             if 'driver' in locals() and driver:
-                driver.quit()
+                self.release_selenium(driver)
             return []
     
+    def parse_job_detail(self, html, url):
+        """
+        잡플래닛 상세 페이지 HTML에서 채용 공고 정보 추출 (브라우저 없이 동작)
+        
+        Args:
+            html (str): 상세 페이지 소스
+            url (str): 상세 페이지 URL
+            
+        Returns:
+            dict: 채용 공고 상세 정보
+        """
+        soup = parse_html(html)
+        
+        # 기업명 추출
+        company_name = ""
+        company_tag = soup.select_one('.company-name, .company_name, .view_company')
+        if company_tag:
+            company_name = company_tag.text.strip()
+        
+        # 공고 제목 추출
+        title = ""
+        title_tag = soup.select_one('.recruitment-title, .job_title, .view_title')
+        if title_tag:
+            title = title_tag.text.strip()
+        
+        # 마감일 추출
+        deadline = ""
+        deadline_tag = soup.select_one('.recruitment-info .info_period, .job_period, .view_period')
+        if deadline_tag:
+            deadline = deadline_tag.text.strip()
+        
+        # 근무지역 추출
+        location = ""
+        location_tag = soup.select_one('.recruitment-info .info_work_place, .job_location, .view_location')
+        if location_tag:
+            location = location_tag.text.strip()
+        
+        # 경력 요구사항 추출
+        experience = ""
+        experience_tag = soup.select_one('.recruitment-info .info_career, .job_career, .view_career')
+        if experience_tag:
+            experience = experience_tag.text.strip()
+        
+        # 학력 요구사항 추출
+        education = ""
+        education_tag = soup.select_one('.recruitment-info .info_education, .job_education, .view_education')
+        if education_tag:
+            education = education_tag.text.strip()
+        
+        # 고용형태 추출
+        employment_type = ""
+        employment_tag = soup.select_one('.recruitment-info .info_worktype, .job_type, .view_type')
+        if employment_tag:
+            employment_type = employment_tag.text.strip()
+        
+        # 상세 내용 추출
+        description = ""
+        description_tag = soup.select_one('.recruitment-detail-content, .job_detail_content, .view_detail_content')
+        if description_tag:
+            description = description_tag.text.strip()
+        
+        # 수집된 데이터 정리
+        job_data = {
+            'site': self.site_name,
+            'url': url,
+            'company_name': company_name,
+            'title': title,
+            'deadline': deadline,
+            'location': location,
+            'experience': experience,
+            'education': education,
+            'employment_type': employment_type,
+            'description': description
+        }
+        annotate_deadline(job_data)
+        return job_data
+    
     def crawl_job_detail(self, url):
         """
         잡플래닛 채용 공고 상세 페이지를 크롤링
@@ -108,92 +181,22 @@ class JobPlanetCrawler(BaseCrawler):
         try:
             # Selenium으로 동적 페이지 로딩
             driver = self.setup_selenium()
+            get_rate_limiter().acquire(url)
             driver.get(url)
             
-            # 페이지 로딩 대기
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.recruitment-detail'))
-                )
-            except TimeoutException:
-                self.logger.warning("기본 선택자로 요소를 찾을 수 없습니다. 대체 선택자 시도...")
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.job_detail, .view_wrap'))
-                )
-            
-            # 페이지가 완전히 로드될 때까지 추가 대기
-            time.sleep(5)
-            
-            # 페이지 소스 파싱
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # 기업명 추출
-            company_name = ""
-            company_tag = soup.select_one('.company-name, .company_name, .view_company')
-            if company_tag:
-                company_name = company_tag.text.strip()
-            
-            # 공고 제목 추출
-            title = ""
-            title_tag = soup.select_one('.recruitment-title, .job_title, .view_title')
-            if title_tag:
-                title = title_tag.text.strip()
-            
-            # 마감일 추출
-            deadline = ""
-            deadline_tag = soup.select_one('.recruitment-info .info_period, .job_period, .view_period')
-            if deadline_tag:
-                deadline = deadline_tag.text.strip()
-            
-            # 근무지역 추출
-            location = ""
-            location_tag = soup.select_one('.recruitment-info .info_work_place, .job_location, .view_location')
-            if location_tag:
-                location = location_tag.text.strip()
-            
-            # 경력 요구사항 추출
-            experience = ""
-            experience_tag = soup.select_one('.recruitment-info .info_career, .job_career, .view_career')
-            if experience_tag:
-                experience = experience_tag.text.strip()
-            
-            # 학력 요구사항 추출
-            education = ""
-            education_tag = soup.select_one('.recruitment-info .info_education, .job_education, .view_education')
-            if education_tag:
-                education = education_tag.text.strip()
-            
-            # 고용형태 추출
-            employment_type = ""
-            employment_tag = soup.select_one('.recruitment-info .info_worktype, .job_type, .view_type')
-            if employment_tag:
-                employment_type = employment_tag.text.strip()
-            
-            # 상세 내용 추출
-            description = ""
-            description_tag = soup.select_one('.recruitment-detail-content, .job_detail_content, .view_detail_content')
-            if description_tag:
-                description = description_tag.text.strip()
-            
-            # 수집된 데이터 정리
-            job_data = {
-                'site': self.site_name,
-                'url': url,
-                'company_name': company_name,
-                'title': title,
-                'deadline': deadline,
-                'location': location,
-                'experience': experience,
-                'education': education,
-                'employment_type': employment_type,
-                'description': description
-            }
+            # 페이지 준비 대기 (핵심 요소가 나타나고 네트워크가 잠잠해질 때까지)
+            if not wait_for_page(driver, ['.recruitment-detail, .job_detail, .view_wrap'], site='jobplanet'):
+                raise TimeoutException("페이지 로딩 대기 시간 초과")
             
-            driver.quit()
-            return job_data
+            # 페이지 소스만 받고 드라이버는 바로 반환 (추출은 브라우저 없이)
+            html = driver.page_source
+            self.release_selenium(driver)
+            driver = None
+            archive_page(url, html, site=self.site_name, source='browser')
+            return self.parse_job_detail(html, url)
             
         except Exception as e:
             self.logger.error(f"채용 공고 상세 크롤링 중 오류 발생: {url}, 오류: {e}")
             if 'driver' in locals() and driver:
-                driver.quit()
+                self.release_selenium(driver)
             return None 
\ No newline at end of file
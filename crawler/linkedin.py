@@ -15,14 +15,11 @@ import time
 import random
 import argparse
 import re
-import requests
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote_plus, urlparse, parse_qs
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -31,7 +28,11 @@ from selenium.common.exceptions import (
     TimeoutException, NoSuchElementException, 
     StaleElementReferenceException, ElementClickInterceptedException
 )
-from webdriver_manager.chrome import ChromeDriverManager
+
+from .dom import parse_html
+from .driver_pool import create_driver, get_driver_pool, release_driver
+from .http_client import fetch
+from .rate_limit import get_rate_limiter
 
 from bs4 import BeautifulSoup
 
@@ -65,43 +66,12 @@ class LinkedInJobCrawler:
     def _init_webdriver(self):
         """웹드라이버 초기화"""
         try:
-            chrome_options = Options()
-            
-            # 헤드리스 모드 설정
+            # 헤드리스면 공유 웹드라이버 풀에서 빌리고, 아니면 같은 설정으로 새 창을 띄움
+            # (봇 감지 회피 설정과 navigator.webdriver 숨김은 driver_pool.create_driver에서 처리)
             if self.headless:
-                chrome_options.add_argument("--headless=new")
-            
-            # 기타 옵션 설정
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            # 봇 감지 회피를 위한 설정
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            
-            # User-Agent 설정
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-            ]
-            chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
-            
-            # 웹드라이버 생성
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # 웹드라이버 설정
-            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                """
-            })
+                self.driver = get_driver_pool().checkout()
+            else:
+                self.driver = create_driver(headless=False)
             
             # 타임아웃 설정
             self.driver.set_page_load_timeout(30)
@@ -113,10 +83,11 @@ class LinkedInJobCrawler:
             sys.exit(1)
     
     def __del__(self):
-        """소멸자: 웹드라이버 종료"""
+        """소멸자: 웹드라이버 반환 (풀 드라이버는 정리 후 재사용, 그 외는 종료)"""
         if self.driver:
-            self.driver.quit()
-            print("웹드라이버가 종료되었습니다.")
+            release_driver(self.driver)
+            self.driver = None
+            print("웹드라이버가 반환되었습니다.")
     
     def login(self, email, password):
         """LinkedIn 로그인
@@ -132,7 +103,7 @@ class LinkedInJobCrawler:
             print("LinkedIn 로그인 시도 중...")
             
             # 로그인 페이지 접속
-            self.driver.get("https://www.linkedin.com/login")
+            self._navigate("https://www.linkedin.com/login")
             self._wait_for_page_load(timeout=10)
             
             # 이메일 입력
@@ -201,7 +172,7 @@ class LinkedInJobCrawler:
                     cookies = json.load(f)
                 
                 # LinkedIn 도메인 접속
-                self.driver.get("https://www.linkedin.com")
+                self._navigate("https://www.linkedin.com")
                 time.sleep(2)
                 
                 # 쿠키 추가
@@ -273,7 +244,7 @@ class LinkedInJobCrawler:
         
         try:
             # 검색 페이지 접속
-            self.driver.get(search_url)
+            self._navigate(search_url)
             print(f"검색 페이지에 접속했습니다: {search_url}")
             
             # 페이지 로딩 대기
@@ -319,7 +290,7 @@ class LinkedInJobCrawler:
                         print(f"채용 공고 URL: {job_url}")
                         
                         # 채용 공고 페이지 접속
-                        self.driver.get(job_url)
+                        self._navigate(job_url)
                         self._wait_for_page_load(timeout=15)
                         
                         # 로그인 팝업 처리
@@ -346,19 +317,16 @@ class LinkedInJobCrawler:
                                 break
                         
                         # 검색 결과 페이지로 돌아가기
-                        self.driver.get(search_url)
+                        self._navigate(search_url)
                         self._wait_for_page_load(timeout=15)
                         
                         # 페이지 스크롤
                         self._scroll_to_position(i + 1)
-                        
-                        # 랜덤 딜레이
-                        time.sleep(random.uniform(2, 4))
                     
                     except Exception as e:
                         print(f"채용 공고 처리 중 오류: {e}")
                         # 검색 결과 페이지로 돌아가기
-                        self.driver.get(search_url)
+                        self._navigate(search_url)
                         self._wait_for_page_load(timeout=15)
                         continue
                 
@@ -507,139 +475,149 @@ class LinkedInJobCrawler:
         
         return None
     
-    def _extract_job_info(self):
-        """현재 페이지에서 채용 공고 정보 추출
+    @staticmethod
+    def _parse_job_info(html, job_url):
+        """채용 공고 페이지 소스에서 채용 공고 정보 추출 (브라우저 없이 동작, 회사 상세 정보 제외)
         
+        Args:
+            html (str): 채용 공고 페이지 소스
+            job_url (str): 채용 공고 URL
+            
         Returns:
             dict: 추출된 채용 공고 정보
         """
-        try:
-            # 페이지 소스 가져오기
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # 채용 공고 제목
-            title = None
-            for title_selector in [".jobs-unified-top-card__job-title", ".topcard__title", "h1.job-title", "h1.top-card-layout__title"]:
-                title_elem = soup.select_one(title_selector)
-                if title_elem:
-                    title = title_elem.text.strip()
-                    break
-            
-            if not title:
-                title = "제목 없음"
-            
-            # 회사 정보
-            company_name = None
-            for company_selector in [".jobs-unified-top-card__company-name", ".topcard__org-name-link", "a.company-name", "a.topcard__org-name-link", "span.topcard__flavor--bullet"]:
-                company_elem = soup.select_one(company_selector)
-                if company_elem:
-                    company_name = company_elem.text.strip()
-                    break
-            
-            if not company_name:
-                company_name = "회사명 없음"
-            
-            # 회사 로고
-            company_logo_url = ""
-            for logo_selector in [".jobs-unified-top-card__company-logo", ".company-logo", "img.artdeco-entity-image", "img.lazy-image"]:
-                company_logo = soup.select_one(logo_selector)
-                if company_logo and company_logo.has_attr('src'):
-                    company_logo_url = company_logo['src']
-                    break
-            
-            # 위치 정보
-            location = None
-            for location_selector in [".jobs-unified-top-card__bullet", ".topcard__flavor--bullet", ".job-location", "span.topcard__flavor--bullet"]:
-                location_elems = soup.select(location_selector)
-                if location_elems and len(location_elems) > 0:
-                    for elem in location_elems:
-                        text = elem.text.strip()
-                        if "," in text or "시" in text or "도" in text:
-                            location = text
-                            break
-                    if location:
+        soup = parse_html(html)
+        
+        # 채용 공고 제목
+        title = None
+        for title_selector in [".jobs-unified-top-card__job-title", ".topcard__title", "h1.job-title", "h1.top-card-layout__title"]:
+            title_elem = soup.select_one(title_selector)
+            if title_elem:
+                title = title_elem.text.strip()
+                break
+        
+        if not title:
+            title = "제목 없음"
+        
+        # 회사 정보
+        company_name = None
+        for company_selector in [".jobs-unified-top-card__company-name", ".topcard__org-name-link", "a.company-name", "a.topcard__org-name-link", "span.topcard__flavor--bullet"]:
+            company_elem = soup.select_one(company_selector)
+            if company_elem:
+                company_name = company_elem.text.strip()
+                break
+        
+        if not company_name:
+            company_name = "회사명 없음"
+        
+        # 회사 로고
+        company_logo_url = ""
+        for logo_selector in [".jobs-unified-top-card__company-logo", ".company-logo", "img.artdeco-entity-image", "img.lazy-image"]:
+            company_logo = soup.select_one(logo_selector)
+            if company_logo and company_logo.has_attr('src'):
+                company_logo_url = company_logo['src']
+                break
+        
+        # 위치 정보
+        location = None
+        for location_selector in [".jobs-unified-top-card__bullet", ".topcard__flavor--bullet", ".job-location", "span.topcard__flavor--bullet"]:
+            location_elems = soup.select(location_selector)
+            if location_elems and len(location_elems) > 0:
+                for elem in location_elems:
+                    text = elem.text.strip()
+                    if "," in text or "시" in text or "도" in text:
+                        location = text
                         break
-            
-            if not location:
-                location = ""
-            
-            # 근무 형태
-            workplace_type = None
-            for workplace_selector in [".jobs-unified-top-card__workplace-type", ".topcard__flavor--workplace-type"]:
-                workplace_elem = soup.select_one(workplace_selector)
-                if workplace_elem:
-                    workplace_type = workplace_elem.text.strip()
-                    break
-            
-            if not workplace_type:
-                workplace_type = ""
-            
-            # 지원자 수
-            applicants = None
-            for applicants_selector in [".jobs-unified-top-card__applicant-count", ".topcard__flavor--metadata"]:
-                applicants_elem = soup.select_one(applicants_selector)
-                if applicants_elem:
-                    applicants = applicants_elem.text.strip()
+                if location:
                     break
+        
+        if not location:
+            location = ""
+        
+        # 근무 형태
+        workplace_type = None
+        for workplace_selector in [".jobs-unified-top-card__workplace-type", ".topcard__flavor--workplace-type"]:
+            workplace_elem = soup.select_one(workplace_selector)
+            if workplace_elem:
+                workplace_type = workplace_elem.text.strip()
+                break
+        
+        if not workplace_type:
+            workplace_type = ""
+        
+        # 지원자 수
+        applicants = None
+        for applicants_selector in [".jobs-unified-top-card__applicant-count", ".topcard__flavor--metadata"]:
+            applicants_elem = soup.select_one(applicants_selector)
+            if applicants_elem:
+                applicants = applicants_elem.text.strip()
+                break
+        
+        if not applicants:
+            applicants = ""
+        
+        # 채용 공고 상세 내용
+        job_description = None
+        for description_selector in [".jobs-description__content", ".description__text", ".show-more-less-html__markup", ".jobs-description-content"]:
+            job_description_elem = soup.select_one(description_selector)
+            if job_description_elem:
+                job_description = job_description_elem.text.strip()
+                break
+        
+        if not job_description:
+            job_description = ""
+        
+        # 채용 공고 정보 구성
+        job_info = {
+            "title": title,
+            "company_name": company_name,
+            "company_logo_url": company_logo_url,
+            "location": location,
+            "workplace_type": workplace_type,
+            "applicants": applicants,
+            "job_url": job_url,
+            "job_description": job_description,
+            "extracted_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        # 추가 정보 추출
+        criteria_container = soup.select(".jobs-unified-top-card__job-insight, .job-criteria-item, .job-details-jobs-unified-top-card__job-insight")
+        for criteria in criteria_container:
+            criteria_text = criteria.text.strip()
             
-            if not applicants:
-                applicants = ""
-            
-            # 채용 공고 URL
-            job_url = self.driver.current_url
-            
-            # 채용 공고 상세 내용
-            job_description = None
-            for description_selector in [".jobs-description__content", ".description__text", ".show-more-less-html__markup", ".jobs-description-content"]:
-                job_description_elem = soup.select_one(description_selector)
-                if job_description_elem:
-                    job_description = job_description_elem.text.strip()
-                    break
+            # 경력 요구사항
+            if "경력" in criteria_text or "experience" in criteria_text.lower():
+                job_info["experience"] = criteria_text
             
-            if not job_description:
-                job_description = ""
-            
-            # 채용 공고 정보 구성
-            job_info = {
-                "title": title,
-                "company_name": company_name,
-                "company_logo_url": company_logo_url,
-                "location": location,
-                "workplace_type": workplace_type,
-                "applicants": applicants,
-                "job_url": job_url,
-                "job_description": job_description,
-                "extracted_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            # 직원 수
+            elif "직원" in criteria_text or "employee" in criteria_text.lower():
+                job_info["company_size"] = criteria_text
             
-            # 추가 정보 추출
-            criteria_container = soup.select(".jobs-unified-top-card__job-insight, .job-criteria-item, .job-details-jobs-unified-top-card__job-insight")
-            for criteria in criteria_container:
-                criteria_text = criteria.text.strip()
-                
-                # 경력 요구사항
-                if "경력" in criteria_text or "experience" in criteria_text.lower():
-                    job_info["experience"] = criteria_text
-                
-                # 직원 수
-                elif "직원" in criteria_text or "employee" in criteria_text.lower():
-                    job_info["company_size"] = criteria_text
-                
-                # 산업 분야
-                elif "산업" in criteria_text or "industry" in criteria_text.lower():
-                    job_info["industry"] = criteria_text
+            # 산업 분야
+            elif "산업" in criteria_text or "industry" in criteria_text.lower():
+                job_info["industry"] = criteria_text
+        
+        # 직무 요구사항 및 자격 요건 추출
+        requirements = LinkedInJobCrawler._extract_job_requirements(job_description)
+        if requirements:
+            job_info["requirements"] = requirements
+        
+        return job_info
+    
+    def _extract_job_info(self):
+        """현재 페이지에서 채용 공고 정보 추출
+        
+        Returns:
+            dict: 추출된 채용 공고 정보
+        """
+        try:
+            job_info = self._parse_job_info(self.driver.page_source, self.driver.current_url)
             
-            # 회사 상세 정보 추출
-            company_info = self._extract_company_info(company_name)
+            # 회사 상세 정보 추출 (회사 페이지로 이동해야 하므로 브라우저 필요)
+            company_info = self._extract_company_info(job_info["company_name"])
             if company_info:
                 job_info["company_info"] = company_info
             
-            # 직무 요구사항 및 자격 요건 추출
-            requirements = self._extract_job_requirements(job_description)
-            if requirements:
-                job_info["requirements"] = requirements
-            
             return job_info
         
         except Exception as e:
@@ -684,7 +662,7 @@ class LinkedInJobCrawler:
             
             # 회사 페이지 URL 가져오기
             company_url = company_page_button.get_attribute('href')
-            self.driver.get(company_url)
+            self._navigate(company_url)
             
             # 페이지 로딩 대기
             self._wait_for_page_load(timeout=15)
@@ -777,7 +755,7 @@ class LinkedInJobCrawler:
             # 원래 탭으로 돌아가기
             self.driver.close()
             self.driver.switch_to.window(self.driver.window_handles[0])
-            self.driver.get(current_url)
+            self._navigate(current_url)
             
             # 페이지 로딩 대기
             self._wait_for_page_load(timeout=15)
@@ -797,7 +775,8 @@ class LinkedInJobCrawler:
             
             return None
     
-    def _extract_job_requirements(self, job_description):
+    @staticmethod
+    def _extract_job_requirements(job_description):
         """채용 공고 설명에서 요구사항 추출
         
         Args:
@@ -1042,7 +1021,7 @@ class LinkedInJobCrawler:
                 next_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?{query_string}"
                 
                 # 다음 페이지로 이동
-                self.driver.get(next_url)
+                self._navigate(next_url)
                 self._wait_for_page_load(timeout=15)
                 
                 # 로그인 팝업 처리
@@ -1055,6 +1034,15 @@ class LinkedInJobCrawler:
         
         return False
     
+    def _navigate(self, url):
+        """페이지 이동 (도메인별 속도 제한에 따라 차례를 기다린 뒤 이동)
+        
+        Args:
+            url (str): 이동할 URL
+        """
+        get_rate_limiter().acquire(url)
+        self.driver.get(url)
+    
     def _wait_for_page_load(self, timeout=10):
         """페이지 로딩 대기
         
@@ -1105,11 +1093,10 @@ class LinkedInJobCrawler:
                 "Referer": "https://www.linkedin.com/"
             }
             
-            response = requests.get(image_url, headers=headers, stream=True, timeout=10)
+            response = fetch(image_url, headers=headers, timeout=10)
             if response.status_code == 200:
                 with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(1024):
-                        f.write(chunk)
+                    f.write(response.content)
                 
                 print(f"이미지 다운로드 완료: {file_name}")
                 return file_path
@@ -1210,7 +1197,7 @@ class LinkedInJobCrawler:
         
         try:
             # 채용 공고 페이지 접속
-            self.driver.get(job_url)
+            self._navigate(job_url)
             
             # 페이지 로딩 대기
             self._wait_for_page_load(timeout=15)
@@ -1304,3 +1291,16 @@ class LinkedInJobCrawler:
         except Exception as e:
             print(f"데이터 검증 오류: {e}")
             return {'success': False, 'message': f'데이터 검증 중 오류 발생: {e}'}
+
+
+def parse_job_detail(html, url):
+    """채용 공고 페이지 소스에서 채용 공고 정보 추출 (브라우저 없이 동작, 회사 상세 정보 제외)
+    
+    Args:
+        html (str): 채용 공고 페이지 소스
+        url (str): 채용 공고 URL
+        
+    Returns:
+        dict: 추출된 채용 공고 정보
+    """
+    return LinkedInJobCrawler._parse_job_info(html, url)
@@ -0,0 +1,81 @@
+"""
+페이지 준비 상태 기반 대기
+
+driver.get() 뒤에 고정 시간(time.sleep)을 기다리는 대신 페이지가 실제로 쓸 수 있게 되는 순간까지만 기다린다.
+
+1. document.readyState가 interactive/complete이고 핵심 요소(선택자)가 모두 나타날 때까지 (사이트별 제한 시간)
+2. 이어서 네트워크가 잠잠해질 때까지 (리소스 로드 수가 NETWORK_IDLE_SECONDS 동안 그대로, 최대 SETTLE_SECONDS)
+
+광고/분석 스크립트가 계속 요청을 보내는 페이지도 있어 2단계는 최선 노력이며, 전체 대기는 MAX_PAGE_WAIT을 넘지 않는다.
+"""
+from typing import Sequence
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# 사이트별 핵심 요소 대기 제한 시간 (초)
+PAGE_TIMEOUTS = {
+    'saramin': 10,
+    'jobplanet': 20,
+    'incruit': 20,
+}
+DEFAULT_PAGE_TIMEOUT = 15
+# 어떤 설정이든 한 페이지를 이보다 오래 기다리지 않음
+MAX_PAGE_WAIT = 30
+
+NETWORK_IDLE_SECONDS = 0.5
+SETTLE_SECONDS = 3
+POLL_INTERVAL = 0.1
+
+# 각 선택자는 쉼표로 대안을 묶을 수 있다 (querySelector 규칙: 하나라도 있으면 충족)
+_PAGE_STATE_SCRIPT = """
+var selectors = arguments[0];
+var found = selectors.every(function (selector) { return document.querySelector(selector) !== null; });
+return [document.readyState, found, performance.getEntriesByType('resource').length];
+"""
+
+
+def wait_for_page(driver, selectors: Sequence[str] = (), site: str = None, timeout: float = None) -> bool:
+    """
+    페이지가 준비될 때까지 대기
+
+    Args:
+        driver: 웹드라이버
+        selectors: 모두 나타나야 하는 CSS 선택자 목록 (각 선택자 안의 쉼표는 '또는')
+        site (str): PAGE_TIMEOUTS의 사이트 키 (timeout을 주지 않았을 때 사용)
+        timeout (float): 핵심 요소 대기 제한 시간 (초, MAX_PAGE_WAIT을 넘으면 잘림)
+
+    Returns:
+        bool: 제한 시간 안에 핵심 요소가 모두 나타났는지 여부
+    """
+    if timeout is None:
+        timeout = PAGE_TIMEOUTS.get(site, DEFAULT_PAGE_TIMEOUT)
+    started = time.monotonic()
+    hard_deadline = started + MAX_PAGE_WAIT
+    deadline = min(started + timeout, hard_deadline)
+    selectors = list(selectors)
+
+    while True:
+        state, found, resources = driver.execute_script(_PAGE_STATE_SCRIPT, selectors)
+        if state in ('interactive', 'complete') and found:
+            break
+        if time.monotonic() >= deadline:
+            logger.warning(f"페이지 준비 대기 시간 초과 ({timeout}초): readyState={state}, 선택자={selectors}")
+            return False
+        time.sleep(POLL_INTERVAL)
+
+    # 네트워크 유휴 대기 (리소스 수가 NETWORK_IDLE_SECONDS 동안 변하지 않으면 끝)
+    settle_deadline = min(time.monotonic() + SETTLE_SECONDS, hard_deadline)
+    idle_since = time.monotonic()
+    while time.monotonic() < settle_deadline:
+        if state == 'complete' and time.monotonic() - idle_since >= NETWORK_IDLE_SECONDS:
+            break
+        time.sleep(POLL_INTERVAL)
+        state, _, current = driver.execute_script(_PAGE_STATE_SCRIPT, [])
+        if current != resources:
+            resources = current
+            idle_since = time.monotonic()
+
+    logger.info(f"페이지 준비 완료 ({time.monotonic() - started:.1f}초)")
+    return True
@@ -0,0 +1,141 @@
+"""
+도메인별 토큰 버킷 요청 속도 제한
+
+요청마다 고정으로 sleep하면 다른 사이트 요청까지 줄줄이 늦어진다. 여기서는 도메인마다 버킷을 두고
+초당 rate개씩 토큰을 채우며 burst개까지 모아 둘 수 있게 한다. 요청은 토큰을 하나 예약하고,
+토큰이 모자라면 다음 토큰이 생길 때까지만 기다린다. 사람인 요청은 인크루트의 예산을 기다리지 않는다.
+
+예약은 잠깐 잡는 threading.Lock 안에서 끝나므로 스레드(acquire)와 asyncio(acquire_async) 양쪽에서
+같은 제한기를 쓸 수 있다. 기다리는 순서는 예약 순서와 같다.
+
+설정 (환경 변수):
+    CRAWLER_RATE            도메인별 기본 초당 요청 수 (기본 1)
+    CRAWLER_BURST           도메인별 기본 연속 허용 요청 수 (기본 2)
+    CRAWLER_DOMAIN_RATES    도메인별 설정, 예: "saramin.co.kr=2:4,linkedin.com=0.5"
+"""
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = float(os.getenv("CRAWLER_RATE", "1"))
+DEFAULT_BURST = float(os.getenv("CRAWLER_BURST", "2"))
+
+
+def _parse_domain_rates(value: str) -> Dict[str, Tuple[float, float]]:
+    """'도메인=초당요청수[:연속허용수],...' 형식의 설정을 {도메인: (rate, burst)}로"""
+    rates = {}
+    for item in filter(None, (part.strip() for part in (value or "").split(','))):
+        try:
+            domain, setting = item.split('=', 1)
+            rate, _, burst = setting.partition(':')
+            rates[domain.strip().lower()] = (float(rate), float(burst) if burst else DEFAULT_BURST)
+        except ValueError:
+            logger.warning(f"잘못된 CRAWLER_DOMAIN_RATES 항목을 무시합니다: {item}")
+    return rates
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: float = 1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초)을 반환 (모자라면 미리 빌려 쓰고 그만큼 기다림)"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """도메인별 토큰 버킷 모음"""
+
+    def __init__(self, rate: float = None, burst: float = None,
+                 domain_rates: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        Args:
+            rate (float): 도메인별 기본 초당 요청 수
+            burst (float): 도메인별 기본 연속 허용 요청 수
+            domain_rates: {도메인: (rate, burst)} 도메인별 설정 (하위 도메인에도 적용)
+        """
+        self.rate = rate or DEFAULT_RATE
+        self.burst = burst or DEFAULT_BURST
+        self.domain_rates = dict(domain_rates or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'delayed': 0, 'waited_seconds': 0.0}
+
+    def domain_of(self, url: str) -> str:
+        """URL(또는 호스트)의 버킷 키: 설정된 도메인의 하위 호스트면 그 도메인, 아니면 www.를 뺀 호스트"""
+        host = ((urlsplit(url).hostname if '//' in url else url) or '').lower()
+        for domain in self.domain_rates:
+            if host == domain or host.endswith('.' + domain):
+                return domain
+        return host[4:] if host.startswith('www.') else host
+
+    def set_rate(self, domain: str, rate: float, burst: float = None):
+        """도메인의 속도 설정 변경 (기존 버킷은 새 설정으로 다시 만듦)"""
+        domain = domain.lower()
+        with self._lock:
+            self.domain_rates[domain] = (rate, burst or self.burst)
+            self._buckets.pop(domain, None)
+
+    def bucket(self, url: str) -> TokenBucket:
+        domain = self.domain_of(url)
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                rate, burst = self.domain_rates.get(domain, (self.rate, self.burst))
+                bucket = self._buckets[domain] = TokenBucket(rate, burst)
+            return bucket
+
+    def _reserve(self, url: str) -> float:
+        delay = self.bucket(url).reserve()
+        with self._lock:
+            self.stats['requests'] += 1
+            if delay > 0:
+                self.stats['delayed'] += 1
+                self.stats['waited_seconds'] += delay
+        return delay
+
+    def acquire(self, url: str) -> float:
+        """요청 전에 호출 (스레드용): 도메인 예산이 생길 때까지 기다리고 기다린 시간(초)을 반환"""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url: str) -> float:
+        """요청 전에 await (asyncio용): 이벤트 루프를 막지 않고 기다림"""
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """크롤러 전체가 함께 쓰는 도메인별 속도 제한기"""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(domain_rates=_parse_domain_rates(os.getenv("CRAWLER_DOMAIN_RATES", "")))
+        return _shared_limiter
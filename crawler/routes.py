@@ -83,28 +83,6 @@ async def crawl_job(req: CrawlRequest, db: Session = Depends(get_db)):
             logger.info(f"[API] 테스트 데이터: {json.dumps(test_data, ensure_ascii=False)}")
             return JSONResponse(content=test_data)
 
-        # 이미 존재하는 URL인지 확인
-        logger.info("[API] 기존 URL 확인 중...")
-        existing_job = crud.get_job_by_link(db, req.url)
-        if existing_job:
-            logger.info(f"[API] 기존 채용공고 발견 - ID: {existing_job.id}")
-            return {
-                "message": "이미 등록된 채용 공고입니다.",
-                "jobs": [{
-                    "id": existing_job.id,
-                    "title": existing_job.job_title,
-                    "company": existing_job.company_name,
-                    "deadline": existing_job.deadline,
-                    "link": existing_job.link,
-                    "experience": existing_job.experience,
-                    "education": existing_job.education,
-                    "employment_type": existing_job.employment_type,
-                    "location": existing_job.location,
-                    "salary": existing_job.salary,
-                    "description": existing_job.description
-                }]
-            }
-
         # 실제 크롤러 실행
         logger.info("[API] 크롤러 초기화 중...")
         crawler = FinalSaraminCrawler()
@@ -124,22 +102,20 @@ async def crawl_job(req: CrawlRequest, db: Session = Depends(get_db)):
         # 데이터베이스에 저장
         logger.info("[API] 데이터베이스 저장 시작")
         try:
-            job = crud.create_job_posting(
-                db,
-                company_name=job_data.get('company_name', ''),
-                job_title=job_data.get('title', ''),
-                description=job_data.get('description', ''),
-                deadline=job_data.get('deadline', ''),
-                link=req.url,
-                experience=job_data.get('experience', ''),
-                education=job_data.get('education', ''),
-                employment_type=job_data.get('employment_type', ''),
-                location=job_data.get('location', ''),
-                salary=job_data.get('salary', ''),
-                source=req.platform
-            )
-            logger.info("[API] 데이터베이스 저장 성공")
-            logger.debug(f"[API] 생성된 job 객체: {vars(job)}")
+            job, status = crud.upsert_job_posting(db, {
+                'company_name': job_data.get('company_name', ''),
+                'job_title': job_data.get('title', ''),
+                'description': job_data.get('description', ''),
+                'deadline': job_data.get('deadline', ''),
+                'link': req.url,
+                'experience': job_data.get('experience', ''),
+                'education': job_data.get('education', ''),
+                'employment_type': job_data.get('employment_type', ''),
+                'location': job_data.get('location', ''),
+                'salary': job_data.get('salary', ''),
+                'platform': req.platform
+            })
+            logger.info(f"[API] 데이터베이스 저장 성공 - ID: {job.id}, 결과: {status}")
         except Exception as db_error:
             logger.error(f"[API] 데이터베이스 저장 실패: {str(db_error)}")
             raise HTTPException(
@@ -147,8 +123,13 @@ async def crawl_job(req: CrawlRequest, db: Session = Depends(get_db)):
                 detail=f"데이터베이스 저장 중 오류가 발생했습니다: {str(db_error)}"
             )
 
+        # link가 이미 있던 공고는 최신 내용으로 갱신되었더라도 기존 공고로 안내
+        if status == 'inserted':
+            message = "채용 공고가 성공적으로 등록되었습니다."
+        else:
+            message = "이미 등록된 채용 공고입니다."
         return {
-            "message": "채용 공고가 성공적으로 등록되었습니다.",
+            "message": message,
             "jobs": [{
                 "id": job.id,
                 "title": job.job_title,
@@ -0,0 +1,284 @@
+"""
+크롤링한 원본 HTML 스냅샷 보관소 (압축, 내용 주소 기반)
+
+추출 결과만 남기면 선택자를 고친 뒤 데이터를 되살리려면 사이트를 다시 크롤링해야 한다.
+여기서는 가져온 페이지 원본을 압축해 내용 해시(SHA-256)로 저장하고, URL → 스냅샷 색인을 둔다.
+
+- 본문: objects/ab/cd/<sha256>.<codec> (같은 내용은 한 번만 저장, 원자적 쓰기)
+- 색인: index.sqlite
+    blobs      sha256별 코덱/원본 크기/압축 크기
+    snapshots  URL별 내용이 바뀔 때마다 한 행 (first_seen_at ~ last_seen_at 동안 같은 내용)
+  같은 URL을 다시 가져왔는데 내용이 같으면 행을 늘리지 않고 last_seen_at만 갱신한다.
+  (url, first_seen_at) 색인으로 URL/시점별 조회가 빠르다.
+
+zstandard 패키지가 있으면 zstd로, 없으면 내장 zlib으로 압축한다 (blob마다 코덱을 기록하므로 섞여도 읽힘).
+
+설정 (환경 변수):
+    CRAWLER_SNAPSHOTS       0이면 보관하지 않음 (기본 1)
+    CRAWLER_SNAPSHOT_DIR    보관 위치 (기본 crawler/data/snapshots)
+"""
+from datetime import datetime
+from typing import Iterator, NamedTuple, Optional, Union
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+
+try:
+    import zstandard
+    DEFAULT_CODEC = 'zst'
+except ImportError:
+    zstandard = None
+    DEFAULT_CODEC = 'zlib'
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = os.getenv(
+    "CRAWLER_SNAPSHOT_DIR", os.path.join(os.path.dirname(__file__), 'data', 'snapshots'))
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    sha256 TEXT NOT NULL REFERENCES blobs (sha256),
+    site TEXT,
+    source TEXT,
+    first_seen_at REAL NOT NULL,
+    last_seen_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_snapshots_url_first_seen_at ON snapshots (url, first_seen_at);
+CREATE INDEX IF NOT EXISTS ix_snapshots_sha256 ON snapshots (sha256);
+"""
+
+
+class Snapshot(NamedTuple):
+    """URL의 한 버전 (first_seen_at부터 last_seen_at까지 가져올 때마다 같은 내용이었음)"""
+    id: int
+    url: str
+    sha256: str
+    site: Optional[str]
+    source: Optional[str]
+    first_seen_at: float
+    last_seen_at: float
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == 'zst':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == 'zst':
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 스냅샷을 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def _timestamp(value: Union[datetime, float, None]) -> float:
+    if value is None:
+        return time.time()
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class SnapshotArchive:
+    """압축된 HTML 스냅샷 보관소 (스레드 안전, 여러 프로세스가 같은 보관소를 써도 됨)"""
+
+    def __init__(self, root: str = None, codec: str = None):
+        """
+        Args:
+            root (str): 보관 디렉토리
+            codec (str): 새 본문 압축 방식 ('zst' 또는 'zlib', 기본값: zstandard 설치 여부에 따라)
+        """
+        self.root = root or DEFAULT_ARCHIVE_DIR
+        self.codec = codec or DEFAULT_CODEC
+        if self.codec == 'zst' and zstandard is None:
+            raise RuntimeError("zstd 압축에는 zstandard 패키지가 필요합니다.")
+        if codec is None and zstandard is None:
+            logger.warning("zstandard 패키지가 없어 스냅샷을 zlib으로 압축합니다 (압축률이 낮음, pip install zstandard)")
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        self.index_path = os.path.join(self.root, 'index.sqlite')
+        self._conn = sqlite3.connect(self.index_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def _object_path(self, sha256: str, codec: str) -> str:
+        return os.path.join(self.root, 'objects', sha256[:2], sha256[2:4], f"{sha256}.{codec}")
+
+    def _write_blob(self, sha256: str, data: bytes) -> bool:
+        """본문 저장 (이미 있으면 False)"""
+        row = self._conn.execute("SELECT codec FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+        if row is not None and os.path.exists(self._object_path(sha256, row[0])):
+            return False
+        compressed = _compress(data, self.codec)
+        path = self._object_path(sha256, self.codec)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(compressed)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._conn.execute(
+            "INSERT OR REPLACE INTO blobs (sha256, codec, size, stored_size, created_at) VALUES (?, ?, ?, ?, ?)",
+            (sha256, self.codec, len(data), len(compressed), time.time()))
+        return True
+
+    def put(self, url: str, html: str, site: str = None, source: str = None,
+            fetched_at: Union[datetime, float, None] = None) -> Snapshot:
+        """
+        가져온 페이지 저장
+
+        Args:
+            url (str): 페이지 URL
+            html (str): 페이지 소스
+            site (str): 사이트 이름 (Saramin, Incruit 등)
+            source (str): 가져온 방법 (http, browser 등)
+            fetched_at: 가져온 시각 (기본값: 지금)
+
+        Returns:
+            Snapshot: 이 내용의 스냅샷 (같은 URL의 최근 내용과 같으면 그 스냅샷의 last_seen_at만 갱신)
+        """
+        data = (html or "").encode('utf-8')
+        sha256 = hashlib.sha256(data).hexdigest()
+        fetched_at = _timestamp(fetched_at)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_blob(sha256, data)
+                latest = self._conn.execute(
+                    "SELECT id, url, sha256, site, source, first_seen_at, last_seen_at FROM snapshots "
+                    "WHERE url = ? ORDER BY first_seen_at DESC LIMIT 1", (url,)).fetchone()
+                if latest is not None and latest[2] == sha256:
+                    last_seen_at = max(latest[6], fetched_at)
+                    self._conn.execute("UPDATE snapshots SET last_seen_at = ? WHERE id = ?", (last_seen_at, latest[0]))
+                    snapshot = Snapshot(*latest[:6], last_seen_at)
+                else:
+                    cursor = self._conn.execute(
+                        "INSERT INTO snapshots (url, sha256, site, source, first_seen_at, last_seen_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", (url, sha256, site, source, fetched_at, fetched_at))
+                    snapshot = Snapshot(cursor.lastrowid, url, sha256, site, source, fetched_at, fetched_at)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return snapshot
+
+    def lookup(self, url: str, at: Union[datetime, float, None] = None) -> Optional[Snapshot]:
+        """URL의 최신 스냅샷 (at을 주면 그 시각에 보였던 스냅샷)"""
+        query = ("SELECT id, url, sha256, site, source, first_seen_at, last_seen_at FROM snapshots WHERE url = ?")
+        params = [url]
+        if at is not None:
+            query += " AND first_seen_at <= ?"
+            params.append(_timestamp(at))
+        with self._lock:
+            row = self._conn.execute(query + " ORDER BY first_seen_at DESC LIMIT 1", params).fetchone()
+        return Snapshot(*row) if row else None
+
+    def history(self, url: str) -> list:
+        """URL의 스냅샷 목록 (오래된 것부터)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, url, sha256, site, source, first_seen_at, last_seen_at FROM snapshots "
+                "WHERE url = ? ORDER BY first_seen_at", (url,)).fetchall()
+        return [Snapshot(*row) for row in rows]
+
+    def read(self, sha256: str) -> str:
+        """내용 해시로 페이지 소스 읽기"""
+        with self._lock:
+            row = self._conn.execute("SELECT codec FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+        if row is None:
+            raise KeyError(sha256)
+        with open(self._object_path(sha256, row[0]), 'rb') as f:
+            return _decompress(f.read(), row[0]).decode('utf-8')
+
+    def get(self, url: str, at: Union[datetime, float, None] = None) -> Optional[str]:
+        """URL의 최신(또는 at 시각의) 페이지 소스 (없으면 None)"""
+        snapshot = self.lookup(url, at)
+        return self.read(snapshot.sha256) if snapshot else None
+
+    def iter_latest(self, site: str = None) -> Iterator[Snapshot]:
+        """
+        URL마다 최신 스냅샷 하나씩 (site를 주면 그 사이트만)
+
+        별도 연결의 커서로 흘려보내므로 스냅샷이 수백만 건이어도 목록 전체를 메모리에 올리지 않고,
+        순회하는 동안 put을 막지 않는다 (WAL 읽기 트랜잭션이라 순회 시작 시점의 내용이 보임).
+        """
+        query = """
+            SELECT id, url, sha256, site, source, first_seen_at, last_seen_at FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY url ORDER BY first_seen_at DESC) AS rank
+                FROM snapshots {where}
+            ) WHERE rank = 1 ORDER BY url
+        """.format(where="WHERE site = ?" if site else "")
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            for row in conn.execute(query, (site,) if site else ()):
+                yield Snapshot(*row)
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        """스냅샷/본문 수와 원본/압축 크기"""
+        with self._lock:
+            urls, snapshots = self._conn.execute("SELECT COUNT(DISTINCT url), COUNT(*) FROM snapshots").fetchone()
+            blobs, size, stored_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()
+        return {
+            'urls': urls,
+            'snapshots': snapshots,
+            'blobs': blobs,
+            'bytes': size,
+            'stored_bytes': stored_size,
+            'compression_ratio': size / stored_size if stored_size else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_archive: Optional[SnapshotArchive] = None
+_shared_lock = threading.Lock()
+
+
+def get_snapshot_archive() -> Optional[SnapshotArchive]:
+    """크롤러 공용 스냅샷 보관소 (CRAWLER_SNAPSHOTS=0이면 None)"""
+    global _shared_archive
+    if os.getenv("CRAWLER_SNAPSHOTS", "1") in ("0", "false", "no"):
+        return None
+    with _shared_lock:
+        if _shared_archive is None:
+            _shared_archive = SnapshotArchive()
+        return _shared_archive
+
+
+def archive_page(url: str, html: str, site: str = None, source: str = None) -> Optional[Snapshot]:
+    """크롤러에서 가져온 페이지를 공용 보관소에 저장 (보관 실패가 크롤링을 막지 않도록 오류는 기록만 함)"""
+    if not html:
+        return None
+    try:
+        archive = get_snapshot_archive()
+        return archive.put(url, html, site=site, source=source) if archive else None
+    except Exception as e:
+        logger.warning(f"스냅샷 저장 중 오류: {url}, 오류: {e}")
+        return None
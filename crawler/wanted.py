@@ -11,13 +11,14 @@ import time
 import json
 import random
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from deadline import annotate_deadline
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from .dom import parse_html
+from .driver_pool import get_driver_pool, release_driver
+from .rate_limit import get_rate_limiter
+from .snapshot_archive import archive_page
 import warnings
 
 # BeautifulSoup의 :contains 경고 무시
@@ -36,42 +37,11 @@ class WantedCrawler:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0'
         ]
         
-        # Selenium 웹드라이버 설정
-        chrome_options = Options()
+        # 공유 웹드라이버 풀에서 미리 띄워 둔 드라이버를 빌려옴 (close()에서 반환)
+        self.driver = get_driver_pool().checkout()
         
-        # 랜덤 사용자 에이전트 설정
+        # 랜덤 사용자 에이전트 설정 (풀에 반환할 때 기본값으로 되돌아감)
         self.user_agent = random.choice(user_agents)
-        chrome_options.add_argument(f'user-agent={self.user_agent}')
-        
-        # 봇 감지 회피를 위한 설정
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        # 추가적인 봇 감지 회피 설정
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--lang=ko_KR')
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_argument('--allow-running-insecure-content')
-        
-        # 세션 충돌 방지를 위한 설정
-        chrome_options.add_argument('--no-first-run')
-        chrome_options.add_argument('--no-service-autorun')
-        chrome_options.add_argument('--password-store=basic')
-        chrome_options.add_argument('--ignore-certificate-errors')
-        chrome_options.add_argument('--disable-popup-blocking')
-        
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
-        
-        # 봇 감지 회피를 위한 추가 설정
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": self.user_agent})
     
     def crawl(self, url):
@@ -90,9 +60,9 @@ class WantedCrawler:
         if not url.startswith('https://www.wanted.co.kr/wd/'):
             raise ValueError("유효한 Wanted 채용 공고 URL이 아닙니다.")
         
-        # 페이지 로드
+        # 페이지 로드 (요청 간격은 도메인별 속도 제한이 조절, 로딩은 아래에서 요소가 나타날 때까지 대기)
+        get_rate_limiter().acquire(url)
         self.driver.get(url)
-        time.sleep(5)  # 초기 로딩 대기 시간 증가
         
         try:
             # 실제 콘텐츠가 로드될 때까지 대기
@@ -123,11 +93,13 @@ class WantedCrawler:
         
         # 페이지 소스 가져오기
         page_source = self.driver.page_source
+        archive_page(url, page_source, site='Wanted', source='browser')
         soup = BeautifulSoup(page_source, 'html.parser')
         
         # 채용 정보 추출
         job_data = self._extract_job_data(soup)
         job_data['url'] = url
+        annotate_deadline(job_data)
         
         print(f"크롤링 완료: {url}")
         return job_data
@@ -178,12 +150,14 @@ class WantedCrawler:
                 self.driver.execute_script(f"window.scrollTo(0, {middle_height});")
                 time.sleep(random.uniform(0.5, 1.0))
     
-    def _extract_job_data(self, soup):
+    @staticmethod
+    def _extract_job_data(soup, verbose=True):
         """
         BeautifulSoup 객체에서 채용 정보를 추출합니다.
         
         Args:
             soup (BeautifulSoup): 파싱된 HTML
+            verbose (bool): 디버깅용 HTML/추출 결과 출력 여부
             
         Returns:
             dict: 추출된 채용 정보
@@ -192,8 +166,9 @@ class WantedCrawler:
         
         try:
             # 디버깅을 위한 HTML 저장
-            print("\n=== 페이지 HTML ===")
-            print(soup.prettify()[:1000])  # 처음 1000자만 출력
+            if verbose:
+                print("\n=== 페이지 HTML ===")
+                print(soup.prettify()[:1000])  # 처음 1000자만 출력
             
             # 회사명 추출
             company_name = soup.select_one('div.JobHeader_className__nhyKU h6')
@@ -272,7 +247,8 @@ class WantedCrawler:
                 
                 job_data['description'] = "\n\n".join(description_parts) if description_parts else "상세 내용 없음"
             else:
-                print("포지션 설명을 찾을 수 없습니다.")
+                if verbose:
+                    print("포지션 설명을 찾을 수 없습니다.")
                 job_data.update({
                     'main_tasks': "주요업무 정보 없음",
                     'requirements': "자격요건 정보 없음",
@@ -285,10 +261,11 @@ class WantedCrawler:
             job_data['deadline'] = "상시채용"
             
             # 디버깅을 위한 출력
-            print("\n=== 추출된 데이터 ===")
-            for key, value in job_data.items():
-                if key != 'description':  # description은 너무 길어서 제외
-                    print(f"{key}: {value}")
+            if verbose:
+                print("\n=== 추출된 데이터 ===")
+                for key, value in job_data.items():
+                    if key != 'description':  # description은 너무 길어서 제외
+                        print(f"{key}: {value}")
             
         except Exception as e:
             print(f"\n!!! 데이터 추출 중 오류 발생: {str(e)}")
@@ -310,8 +287,26 @@ class WantedCrawler:
         return job_data
     
     def close(self):
-        """웹드라이버 종료"""
+        """웹드라이버 반환 (풀에서 정리 후 재사용)"""
         if self.driver:
-            self.driver.quit()
-            print("웹드라이버 종료")
+            release_driver(self.driver)
+            self.driver = None
+            print("웹드라이버 반환")
+
+
+def parse_job_detail(html, url):
+    """
+    Wanted 상세 페이지 HTML에서 채용 정보를 추출합니다. (브라우저 없이 동작)
+    
+    Args:
+        html (str): 상세 페이지 소스
+        url (str): 채용 공고 URL
+        
+    Returns:
+        dict: 추출된 채용 정보
+    """
+    job_data = WantedCrawler._extract_job_data(parse_html(html), verbose=False)
+    job_data['site'] = 'Wanted'
+    job_data['url'] = url
+    return annotate_deadline(job_data)
 
@@ -1,11 +1,87 @@
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from models import JobPosting, Resume, Application, Feedback, Portfolio, PortfolioLink, Schedule, ResumeQuestion
+from pagination import decode_cursor
+from search import parse_query, search_job_ids
+from deadline import parse_deadline
 import datetime
 
 # 채용 공고 관련 CRUD 함수
-def get_jobs(db: Session, skip: int = 0, limit: int = 100):
+def get_jobs(db: Session, skip: int = 0, limit: int = 100, cursor: str = None):
+    """채용 공고 목록 (cursor가 있으면 skip 대신 커서 기준으로 조회)"""
+    if cursor:
+        return get_jobs_page(db, limit=limit, cursor=cursor)[0]
     return db.query(JobPosting).offset(skip).limit(limit).all()
 
+def _job_keyset_filter(created_at, job_id: int, forward: bool):
+    """
+    (created_at, id) 순서에서 커서 이후(forward) 또는 이전 레코드 조건
+    (SQLite는 NULL을 가장 앞에 정렬하므로 created_at이 비어 있는 행도 같은 규칙으로 처리)
+    """
+    if forward:
+        if created_at is None:
+            return or_(and_(JobPosting.created_at.is_(None), JobPosting.id > job_id), JobPosting.created_at.isnot(None))
+        return or_(JobPosting.created_at > created_at, and_(JobPosting.created_at == created_at, JobPosting.id > job_id))
+    if created_at is None:
+        return and_(JobPosting.created_at.is_(None), JobPosting.id < job_id)
+    return or_(JobPosting.created_at < created_at, JobPosting.created_at.is_(None),
+               and_(JobPosting.created_at == created_at, JobPosting.id < job_id))
+
+def get_jobs_page(db: Session, limit: int = 100, cursor: str = None, platform: str = None):
+    """
+    커서(keyset) 기준 채용 공고 목록 - 깊은 페이지도 (created_at, id) 인덱스로 바로 찾아감
+    (platform을 주면 (platform, created_at, id) 인덱스 사용)
+
+    Returns:
+        (채용 공고 목록, 이전 페이지 존재 여부, 다음 페이지 존재 여부)
+        cursor 형식이 잘못되면 ValueError
+    """
+    query = db.query(JobPosting)
+    if platform:
+        query = query.filter(JobPosting.platform == platform)
+    ascending = (JobPosting.created_at.asc(), JobPosting.id.asc())
+    if not cursor:
+        rows = query.order_by(*ascending).limit(limit + 1).all()
+        return rows[:limit], False, len(rows) > limit
+
+    position = decode_cursor(cursor)
+    created_at = datetime.datetime.fromisoformat(position.created_at) if position.created_at else None
+    job_id = int(position.id)
+    if position.direction == "next":
+        rows = query.filter(_job_keyset_filter(created_at, job_id, True)).order_by(*ascending).limit(limit + 1).all()
+        return rows[:limit], True, len(rows) > limit
+
+    descending = (JobPosting.created_at.desc(), JobPosting.id.desc())
+    rows = query.filter(_job_keyset_filter(created_at, job_id, False)).order_by(*descending).limit(limit + 1).all()
+    return list(reversed(rows[:limit])), len(rows) > limit, True
+
+def search_jobs(db: Session, query: str, limit: int = 20, offset: int = 0):
+    """
+    채용 공고 전문 검색 (job_postings_fts, BM25 순)
+
+    Returns:
+        ([(채용 공고, 점수)], 일치 건수, 건수가 search.RANK_WINDOW에서 잘렸는지 여부)
+        검색어가 비었거나 너무 길면 ValueError
+    """
+    hits, total, capped = search_job_ids(db.connection(), parse_query(query), limit, offset)
+    rows = {row.id: row for row in db.query(JobPosting).filter(JobPosting.id.in_([job_id for job_id, _ in hits]))}
+    return [(rows[job_id], score) for job_id, score in hits if job_id in rows], total, capped
+
+def get_jobs_closing_within(db: Session, within: datetime.timedelta, now: datetime.datetime = None,
+                            skip: int = 0, limit: int = 100):
+    """
+    지금부터 within 안에 마감되는 채용 공고 (마감 임박 순, deadline_at 인덱스 범위 조회)
+
+    Returns:
+        (채용 공고 목록, 전체 건수)
+    """
+    now = now or datetime.datetime.now()
+    query = db.query(JobPosting).filter(JobPosting.deadline_at >= now, JobPosting.deadline_at <= now + within)
+    total = query.with_entities(func.count(JobPosting.id)).scalar()
+    rows = query.order_by(JobPosting.deadline_at, JobPosting.id).offset(skip).limit(limit).all()
+    return rows, total
+
 def get_job(db: Session, job_id: int):
     return db.query(JobPosting).filter(JobPosting.id == job_id).first()
 
@@ -26,13 +102,16 @@ def create_job_posting(
     location: str = None,
     salary: str = None
 ):
+    deadline_at, deadline_kind = parse_deadline(deadline)
     db_job = JobPosting(
         company_name=company_name,
         job_title=job_title,
         description=description,
         deadline=deadline,
+        deadline_at=deadline_at,
+        deadline_kind=deadline_kind,
         link=link,
-        source=source,
+        platform=source or "saramin",
         experience=experience,
         education=education,
         employment_type=employment_type,
@@ -44,6 +123,101 @@ def create_job_posting(
     db.refresh(db_job)
     return db_job
 
+# 크롤링으로 채우는 컬럼 (지원 상태/지원일/등록일처럼 사용자가 관리하는 값은 덮어쓰지 않음)
+UPSERT_COLUMNS = (
+    'platform', 'company_name', 'job_title', 'description', 'deadline', 'deadline_at', 'deadline_kind',
+    'experience', 'education', 'employment_type', 'location', 'salary', 'welfare_benefits', 'extra',
+)
+UPSERT_CHUNK_SIZE = 500
+
+def _upsert_chunk(db: Session, chunk, counts, saved=None):
+    """link 기준으로 한 묶음을 upsert (바뀐 값이 없는 기존 공고는 쓰지 않음, saved가 있으면 link별 저장된 행을 채움)"""
+    table = JobPosting.__table__
+    existing = {
+        row.link: row
+        for row in db.execute(table.select().where(table.c.link.in_([row['link'] for row in chunk])))
+    }
+    groups = {}
+    for row in chunk:
+        current = existing.get(row['link'])
+        if current is None:
+            counts['inserted'] += 1
+        elif all(getattr(current, column) == row[column] for column in row if column in UPSERT_COLUMNS):
+            counts['unchanged'] += 1
+            if saved is not None:
+                saved[row['link']] = current
+            continue
+        else:
+            counts['updated'] += 1
+        # executemany는 같은 키를 가진 행끼리만 묶을 수 있음
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    for keys, params in groups.items():
+        stmt = sqlite_insert(table)
+        update = {column: stmt.excluded[column] for column in keys if column in UPSERT_COLUMNS}
+        if update:
+            stmt = stmt.on_conflict_do_update(index_elements=[table.c.link], set_=update)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.link])
+        if saved is None:
+            db.execute(stmt, params)
+        else:
+            # 저장된 행을 다시 조회하지 않도록 INSERT ... ON CONFLICT ... RETURNING으로 받음
+            for saved_row in db.execute(stmt.returning(*table.c), params):
+                saved[saved_row.link] = saved_row
+
+def bulk_upsert_job_postings(db: Session, rows, chunk_size: int = UPSERT_CHUNK_SIZE, saved: dict = None):
+    """
+    크롤링한 채용 공고 여러 건을 link 기준으로 한 트랜잭션에 저장
+    (INSERT ... ON CONFLICT(link) DO UPDATE를 chunk_size개씩 executemany)
+
+    Args:
+        rows: JobPosting 컬럼명을 키로 하는 dict 목록 (link 필수, 같은 link가 여러 번 나오면 마지막 값 사용)
+              행에 없는 컬럼은 새 공고면 기본값, 기존 공고면 원래 값을 유지한다.
+              deadline만 있으면 deadline_at/deadline_kind를 함께 계산한다.
+        saved: 주면 link → 저장된 job_postings 행(Row)을 채움 (바뀌지 않은 공고는 upsert 전에 조회한 행)
+
+    Returns:
+        {'inserted': 새로 넣은 건수, 'updated': 값이 바뀐 건수, 'unchanged': 그대로인 건수}
+        link가 없거나 알 수 없는 컬럼이 있으면 ValueError (아무것도 저장하지 않음)
+    """
+    columns = set(JobPosting.__table__.columns.keys()) - {'id'}
+    by_link = {}
+    for row in rows:
+        row = {key: value for key, value in row.items() if not (key == 'created_at' and value is None)}
+        if not row.get('link'):
+            raise ValueError(f"link가 없는 채용 공고는 저장할 수 없습니다: {row.get('job_title')}")
+        unknown = set(row) - columns
+        if unknown:
+            raise ValueError(f"알 수 없는 채용 공고 컬럼입니다: {', '.join(sorted(unknown))}")
+        if 'deadline' in row and 'deadline_kind' not in row:
+            row['deadline_at'], row['deadline_kind'] = parse_deadline(row['deadline'])
+        by_link.pop(row['link'], None)
+        by_link[row['link']] = row
+
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    unique_rows = list(by_link.values())
+    try:
+        for start in range(0, len(unique_rows), chunk_size):
+            _upsert_chunk(db, unique_rows[start:start + chunk_size], counts, saved)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return counts
+
+def upsert_job_posting(db: Session, row):
+    """
+    크롤링한 채용 공고 한 건을 link 기준으로 저장 (bulk_upsert_job_postings)
+
+    Returns:
+        (저장된 job_postings 행, 'inserted' | 'updated' | 'unchanged')
+    """
+    saved = {}
+    counts = bulk_upsert_job_postings(db, [row], saved=saved)
+    status = next(key for key, count in counts.items() if count)
+    return saved[row['link']], status
+
 def update_job(
     db: Session,
     job_id: int,
@@ -69,6 +243,7 @@ def update_job(
             db_job.description = description
         if deadline:
             db_job.deadline = deadline
+            db_job.deadline_at, db_job.deadline_kind = parse_deadline(deadline)
         if link:
             db_job.link = link
         if source:
@@ -1,12 +1,19 @@
 # database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from models import Base
-from typing import List, Optional, Dict
-from datetime import datetime
+from models import Base, SQLALCHEMY_DATABASE_URL, engine, SessionLocal, JobPosting, Application, ResumeProfile
+from storage import JsonCollection, JsonlCollection
+from pagination import decode_cursor, cursor_tokens
+from search import build_hit, ensure_search_index, parse_query, search_records
+from deadline import annotate_deadline
+import crud
+from typing import Callable, List, Optional, Dict, Tuple
+from datetime import datetime, timedelta
 import json
 import os
+import threading
+import time
 import logging
 
 # 로깅 설정
@@ -19,21 +26,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./job_manager.db"
-
-# SQLite를 사용할 경우, connect_args 설정 필요
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-
-# 세션 생성용 객체
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 엔진/세션은 models.py의 것을 그대로 사용 (jobs.db 하나로 통일)
 
 # 데이터베이스 초기화 함수
-def init_db():
+def init_db(bind=None):
+    """
+    테이블을 생성하고, 기존 테이블에 새로 추가된 nullable 컬럼과 인덱스가 없으면 추가
+
+    create_all은 이미 있는 테이블의 컬럼/인덱스를 바꾸지 않으므로, 이전 버전으로 만든
+    jobs.db에서도 바로 쓸 수 있도록 누락된 컬럼은 ALTER TABLE로, 인덱스는 CREATE INDEX로 채운다.
+    """
     # 여기서 models를 import하여 테이블 생성
-    from models import Resume, JobPosting, Application, Feedback, Portfolio
-    Base.metadata.create_all(bind=engine)
+    from models import Resume, JobPosting, Application, Feedback, Portfolio, ResumeProfile
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=bind.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                    logger.info(f"컬럼 추가: {table.name}.{column.name}")
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        # 채용 공고 전문 검색 색인 (FTS5 trigram, 트리거로 동기화)
+        ensure_search_index(conn)
 
 # 데이터베이스 세션 의존성
 def get_db():
@@ -43,15 +62,59 @@ def get_db():
     finally:
         db.close()
 
+def applied_date(application: Dict) -> Optional[str]:
+    """지원 현황의 지원일(YYYY-MM-DD) - 일별 지원 건수 집계 키"""
+    try:
+        return datetime.fromisoformat(application.get('applied_at', '')).date().isoformat()
+    except (TypeError, ValueError):
+        return None
+
+_shared_database = None
+_shared_database_lock = threading.Lock()
+
+def get_database():
+    """
+    프로세스 전체에서 공유하는 Database 인스턴스 반환
+    (JOB_MANAGER_STORAGE=sql이면 같은 메서드를 제공하는 SqlDatabase)
+
+    요청마다 Database()를 새로 만들면 데이터 파일 확인과 JSON 파싱을 매번 반복하므로,
+    API 핸들러는 이 함수로 얻은 인스턴스를 사용한다.
+    """
+    global _shared_database
+    if _shared_database is None:
+        with _shared_database_lock:
+            if _shared_database is None:
+                if os.getenv("JOB_MANAGER_STORAGE", "json") == "sql":
+                    _shared_database = SqlDatabase()
+                else:
+                    _shared_database = Database()
+    return _shared_database
+
 class Database:
-    def __init__(self):
-        """데이터베이스 초기화"""
-        self.data_dir = "data"
+    def __init__(self, data_dir: str = "data", storage: Optional[str] = None):
+        """
+        데이터베이스 초기화
+
+        Args:
+            data_dir (str): 데이터 파일 디렉토리
+            storage (str): 저장 방식 ("json": JSON 배열 파일, "jsonl": 추가 전용 로그)
+                           지정하지 않으면 환경 변수 JOB_MANAGER_STORAGE 값을 사용
+        """
+        self.data_dir = data_dir
+        self.storage = storage or os.getenv("JOB_MANAGER_STORAGE", "json")
+        if self.storage not in ("json", "jsonl"):
+            raise ValueError(f"지원하지 않는 저장 방식입니다: {self.storage}")
         self.jobs_file = os.path.join(self.data_dir, "jobs.json")
         self.resumes_file = os.path.join(self.data_dir, "resumes.json")
         self.applications_file = os.path.join(self.data_dir, "applications.json")
         self._ensure_data_files()
-        logger.info("데이터베이스 초기화 완료")
+        # 채용 공고는 링크(url)로도 조회하고 마감 임박 순으로도 조회하므로 별도 인덱스를 둔다
+        self.jobs = self._open_collection(self.jobs_file, index_fields=('url',),
+                                          sorted_indexes={'deadline_at': lambda job: job.get('deadline_at') or None})
+        self.resumes = self._open_collection(self.resumes_file)
+        # 대시보드용 일별 지원 건수는 쓰기마다 증감되는 집계로 유지
+        self.applications = self._open_collection(self.applications_file, counters={'applied_date': applied_date})
+        logger.info(f"데이터베이스 초기화 완료 (저장 방식: {self.storage})")
 
     def _ensure_data_files(self):
         """데이터 디렉토리와 파일들이 존재하는지 확인하고 없으면 생성"""
@@ -59,78 +122,147 @@ class Database:
             os.makedirs(self.data_dir, exist_ok=True)
             for file_path in [self.jobs_file, self.resumes_file, self.applications_file]:
                 if not os.path.exists(file_path):
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump([], f, ensure_ascii=False, indent=2)
+                    # 다른 워커와 동시에 만들더라도 잠금 안에서 한 번만 생성됨
+                    JsonCollection(file_path)
             logger.info("데이터 파일 확인/생성 완료")
         except Exception as e:
             logger.error(f"데이터 파일 생성 중 오류: {e}")
             raise
 
+    def _open_collection(self, file_path: str, index_fields: tuple = (), counters: Optional[Dict] = None,
+                         sorted_indexes: Optional[Dict] = None):
+        """저장 방식에 맞는 컬렉션 생성 (JSONL 로그는 최초 생성 시 기존 JSON 파일 내용을 가져옴)"""
+        if self.storage == "jsonl":
+            return JsonlCollection.open(os.path.splitext(file_path)[0] + ".jsonl", seed_path=file_path,
+                                        index_fields=index_fields, counters=counters, sorted_indexes=sorted_indexes)
+        return JsonCollection(file_path, index_fields=index_fields, counters=counters, sorted_indexes=sorted_indexes)
+
     def _load_data(self, file_path: str) -> List[Dict]:
         """JSON 파일에서 데이터 로드"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            logger.warning(f"JSON 파일 디코딩 오류: {file_path}")
-            return []
-        except Exception as e:
-            logger.error(f"데이터 로드 중 오류: {e}")
-            return []
+        return JsonCollection(file_path).load()
 
     def _save_data(self, file_path: str, data: List[Dict]):
         """데이터를 JSON 파일로 저장"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"데이터 저장 완료: {file_path}")
+            JsonCollection(file_path).save(data)
         except Exception as e:
             logger.error(f"데이터 저장 중 오류: {e}")
             raise
 
+    @staticmethod
+    def _new_job_posting(job_data: Dict) -> Dict:
+        """새 채용 공고 레코드 준비 (ID는 저장할 때 그룹 커밋 안에서 발급)"""
+        job_data['id'] = None
+
+        # 타임스탬프 추가
+        job_data['created_at'] = datetime.now().isoformat()
+        annotate_deadline(job_data)
+
+        # 필수 필드 확인
+        required_fields = ['title', 'company_name', 'url']
+        for field in required_fields:
+            if not job_data.get(field):
+                logger.warning(f"필수 필드 누락: {field}")
+        return job_data
+
     def save_job_posting(self, job_data: Dict) -> Dict:
         """채용 공고 저장"""
         try:
-            jobs = self._load_data(self.jobs_file)
-            
-            # ID 생성
-            job_data['id'] = str(len(jobs) + 1)
-            
-            # 타임스탬프 추가
-            job_data['created_at'] = datetime.now().isoformat()
-            
-            # 필수 필드 확인
-            required_fields = ['title', 'company_name', 'url']
-            for field in required_fields:
-                if not job_data.get(field):
-                    logger.warning(f"필수 필드 누락: {field}")
-            
-            jobs.append(job_data)
-            self._save_data(self.jobs_file, jobs)
+            self.jobs.insert(self._new_job_posting(job_data))
             logger.info(f"채용 공고 저장 완료: {job_data['id']}")
             return job_data
         except Exception as e:
             logger.error(f"채용 공고 저장 중 오류: {e}")
             raise
 
+    def upsert_job_postings(self, jobs: List[Dict]) -> Dict[str, int]:
+        """
+        크롤링한 채용 공고 여러 건을 url 기준으로 저장 (이미 있는 공고는 바뀐 필드만 갱신)
+
+        배치 전체를 한 번의 커밋으로 저장하므로 JSON 저장 방식에서도 파일을 한 번만 다시 쓴다.
+
+        Returns:
+            {'inserted': 새로 넣은 건수, 'updated': 값이 바뀐 건수, 'unchanged': 그대로인 건수}
+        """
+        def merge(existing: Optional[Dict], job_data: Dict) -> Optional[Dict]:
+            if existing is None:
+                return self._new_job_posting(dict(job_data))
+            merged = annotate_deadline({**existing, **job_data, 'id': existing['id'],
+                                        'created_at': existing.get('created_at')}, overwrite=True)
+            return None if merged == existing else merged
+
+        try:
+            by_url = {job['url']: job for job in jobs if job.get('url')}
+            counts = self.jobs.upsert_many('url', list(by_url.values()), merge)
+            logger.info(f"채용 공고 일괄 저장 완료: {counts}")
+            return counts
+        except Exception as e:
+            logger.error(f"채용 공고 일괄 저장 중 오류: {e}")
+            raise
+
     def get_job_postings(self, skip: int = 0, limit: int = 10) -> List[Dict]:
         """채용 공고 목록 조회"""
         try:
-            jobs = self._load_data(self.jobs_file)
-            return jobs[skip:skip + limit]
+            return self.jobs.slice(skip, limit)
         except Exception as e:
             logger.error(f"채용 공고 목록 조회 중 오류: {e}")
             return []
 
+    def get_job_postings_page(self, limit: int = 10, cursor: Optional[str] = None) -> Dict:
+        """
+        커서 기준 채용 공고 목록 조회
+
+        Returns:
+            Dict: {'jobs': [...], 'next_cursor': str|None, 'prev_cursor': str|None}
+            cursor 형식이 잘못되면 ValueError
+        """
+        position = decode_cursor(cursor) if cursor else None
+        jobs, has_prev, has_next = self.jobs.page(position.id if position else None,
+                                                  position.direction if position else None, limit)
+        return {'jobs': jobs, **cursor_tokens(jobs, has_prev, has_next)}
+
+    def count_job_postings(self) -> int:
+        """전체 채용 공고 수 조회"""
+        return self.jobs.count()
+
+    def get_job_postings_closing(self, within: timedelta, skip: int = 0, limit: int = 10,
+                                 now: Optional[datetime] = None) -> Dict:
+        """
+        지금부터 within 안에 마감되는 채용 공고 (마감 임박 순, 저장 시 계산해 둔 deadline_at 정렬 인덱스를 범위 조회)
+
+        Returns:
+            Dict: {'jobs': [...], 'total': 전체 건수}
+        """
+        now = now or datetime.now()
+        jobs, total = self.jobs.range_by('deadline_at', now.isoformat(), (now + within).isoformat(), skip, limit)
+        return {'jobs': jobs, 'total': total}
+
+    def search_job_postings(self, query: str, limit: int = 20, offset: int = 0) -> Dict:
+        """
+        채용 공고 검색 (JSON 저장소는 전체 순회 - 대량 데이터는 SQL 저장소의 FTS5 색인 사용)
+
+        Returns:
+            Dict: {'jobs': [채용 공고 + score/snippet/highlights], 'total': 일치 건수, 'total_capped': False}
+            검색어가 비었거나 너무 길면 ValueError
+        """
+        hits, total = search_records(self.jobs.all(), parse_query(query), limit, offset)
+        return {'jobs': hits, 'total': total, 'total_capped': False}
+
     def get_job_posting(self, job_id: str) -> Optional[Dict]:
         """특정 채용 공고 조회"""
         try:
-            jobs = self._load_data(self.jobs_file)
-            for job in jobs:
-                if job.get('id') == job_id:
-                    return job
-            logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
+            job = self.jobs.get(job_id)
+            if job is None:
+                logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
+            return job
+        except Exception as e:
+            logger.error(f"채용 공고 조회 중 오류: {e}")
             return None
+
+    def get_job_posting_by_link(self, link: str) -> Optional[Dict]:
+        """링크(url)로 채용 공고 조회"""
+        try:
+            return self.jobs.find_by('url', link)
         except Exception as e:
             logger.error(f"채용 공고 조회 중 오류: {e}")
             return None
@@ -138,15 +270,12 @@ class Database:
     def update_job_posting(self, job_id: str, job_data: Dict) -> Optional[Dict]:
         """채용 공고 수정"""
         try:
-            jobs = self._load_data(self.jobs_file)
-            for i, job in enumerate(jobs):
-                if job.get('id') == job_id:
-                    job_data['id'] = job_id
-                    job_data['updated_at'] = datetime.now().isoformat()
-                    jobs[i] = job_data
-                    self._save_data(self.jobs_file, jobs)
-                    logger.info(f"채용 공고 업데이트 완료: {job_id}")
-                    return job_data
+            job_data['id'] = job_id
+            job_data['updated_at'] = datetime.now().isoformat()
+            annotate_deadline(job_data, overwrite=True)
+            if self.jobs.replace(job_id, job_data):
+                logger.info(f"채용 공고 업데이트 완료: {job_id}")
+                return job_data
             logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
             return None
         except Exception as e:
@@ -156,10 +285,7 @@ class Database:
     def delete_job_posting(self, job_id: str) -> bool:
         """채용 공고 삭제"""
         try:
-            jobs = self._load_data(self.jobs_file)
-            filtered_jobs = [job for job in jobs if job.get('id') != job_id]
-            if len(filtered_jobs) < len(jobs):
-                self._save_data(self.jobs_file, filtered_jobs)
+            if self.jobs.delete(job_id):
                 logger.info(f"채용 공고 삭제 완료: {job_id}")
                 return True
             logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
@@ -171,11 +297,9 @@ class Database:
     def save_resume(self, resume_data: Dict) -> Dict:
         """이력서 저장"""
         try:
-            resumes = self._load_data(self.resumes_file)
-            
-            # ID 생성
-            resume_data['id'] = str(len(resumes) + 1)
-            
+            # ID는 저장할 때(그룹 커밋 안에서) 발급
+            resume_data['id'] = None
+
             # 타임스탬프 추가
             resume_data['created_at'] = datetime.now().isoformat()
             
@@ -185,8 +309,7 @@ class Database:
                 if not resume_data.get(field):
                     logger.warning(f"필수 필드 누락: {field}")
             
-            resumes.append(resume_data)
-            self._save_data(self.resumes_file, resumes)
+            self.resumes.insert(resume_data)
             logger.info(f"이력서 저장 완료: {resume_data['id']}")
             return resume_data
         except Exception as e:
@@ -196,8 +319,7 @@ class Database:
     def get_resumes(self, skip: int = 0, limit: int = 10) -> List[Dict]:
         """이력서 목록 조회"""
         try:
-            resumes = self._load_data(self.resumes_file)
-            return resumes[skip:skip + limit]
+            return self.resumes.slice(skip, limit)
         except Exception as e:
             logger.error(f"이력서 목록 조회 중 오류: {e}")
             return []
@@ -205,12 +327,10 @@ class Database:
     def get_resume(self, resume_id: str) -> Optional[Dict]:
         """특정 이력서 조회"""
         try:
-            resumes = self._load_data(self.resumes_file)
-            for resume in resumes:
-                if resume.get('id') == resume_id:
-                    return resume
-            logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
-            return None
+            resume = self.resumes.get(resume_id)
+            if resume is None:
+                logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
+            return resume
         except Exception as e:
             logger.error(f"이력서 조회 중 오류: {e}")
             return None
@@ -218,15 +338,11 @@ class Database:
     def update_resume(self, resume_id: str, resume_data: Dict) -> Optional[Dict]:
         """이력서 수정"""
         try:
-            resumes = self._load_data(self.resumes_file)
-            for i, resume in enumerate(resumes):
-                if resume.get('id') == resume_id:
-                    resume_data['id'] = resume_id
-                    resume_data['updated_at'] = datetime.now().isoformat()
-                    resumes[i] = resume_data
-                    self._save_data(self.resumes_file, resumes)
-                    logger.info(f"이력서 업데이트 완료: {resume_id}")
-                    return resume_data
+            resume_data['id'] = resume_id
+            resume_data['updated_at'] = datetime.now().isoformat()
+            if self.resumes.replace(resume_id, resume_data):
+                logger.info(f"이력서 업데이트 완료: {resume_id}")
+                return resume_data
             logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
             return None
         except Exception as e:
@@ -236,10 +352,7 @@ class Database:
     def delete_resume(self, resume_id: str) -> bool:
         """이력서 삭제"""
         try:
-            resumes = self._load_data(self.resumes_file)
-            filtered_resumes = [resume for resume in resumes if resume.get('id') != resume_id]
-            if len(filtered_resumes) < len(resumes):
-                self._save_data(self.resumes_file, filtered_resumes)
+            if self.resumes.delete(resume_id):
                 logger.info(f"이력서 삭제 완료: {resume_id}")
                 return True
             logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
@@ -251,11 +364,9 @@ class Database:
     def save_application(self, application_data: Dict) -> Dict:
         """지원 현황 저장"""
         try:
-            applications = self._load_data(self.applications_file)
-            
-            # ID 생성
-            application_data['id'] = str(len(applications) + 1)
-            
+            # ID는 저장할 때(그룹 커밋 안에서) 발급
+            application_data['id'] = None
+
             # 타임스탬프 추가
             if 'applied_at' not in application_data:
                 application_data['applied_at'] = datetime.now().isoformat()
@@ -267,8 +378,7 @@ class Database:
                     application_data['job_title'] = job.get('title', '')
                     application_data['company'] = job.get('company_name', '')
             
-            applications.append(application_data)
-            self._save_data(self.applications_file, applications)
+            self.applications.insert(application_data)
             logger.info(f"지원 현황 저장 완료: {application_data['id']}")
             return application_data
         except Exception as e:
@@ -278,8 +388,7 @@ class Database:
     def get_applications(self, skip: int = 0, limit: int = 10) -> List[Dict]:
         """지원 현황 목록 조회"""
         try:
-            applications = self._load_data(self.applications_file)
-            return applications[skip:skip + limit]
+            return self.applications.slice(skip, limit)
         except Exception as e:
             logger.error(f"지원 현황 목록 조회 중 오류: {e}")
             return []
@@ -287,12 +396,10 @@ class Database:
     def get_application(self, application_id: str) -> Optional[Dict]:
         """특정 지원 현황 조회"""
         try:
-            applications = self._load_data(self.applications_file)
-            for application in applications:
-                if application.get('id') == application_id:
-                    return application
-            logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
-            return None
+            application = self.applications.get(application_id)
+            if application is None:
+                logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
+            return application
         except Exception as e:
             logger.error(f"지원 현황 조회 중 오류: {e}")
             return None
@@ -300,16 +407,14 @@ class Database:
     def update_application(self, application_id: str, update_data: Dict) -> Optional[Dict]:
         """지원 현황 수정"""
         try:
-            applications = self._load_data(self.applications_file)
-            for i, application in enumerate(applications):
-                if application.get('id') == application_id:
-                    applications[i].update(update_data)
-                    applications[i]['updated_at'] = datetime.now().isoformat()
-                    self._save_data(self.applications_file, applications)
-                    logger.info(f"지원 현황 업데이트 완료: {application_id}")
-                    return applications[i]
-            logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
-            return None
+            application = self.applications.get(application_id)
+            if application is None:
+                logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
+                return None
+            application = {**application, **update_data, 'updated_at': datetime.now().isoformat()}
+            self.applications.replace(application_id, application)
+            logger.info(f"지원 현황 업데이트 완료: {application_id}")
+            return application
         except Exception as e:
             logger.error(f"지원 현황 업데이트 중 오류: {e}")
             return None
@@ -317,10 +422,7 @@ class Database:
     def delete_application(self, application_id: str) -> bool:
         """지원 현황 삭제"""
         try:
-            applications = self._load_data(self.applications_file)
-            filtered_applications = [app for app in applications if app.get('id') != application_id]
-            if len(filtered_applications) < len(applications):
-                self._save_data(self.applications_file, filtered_applications)
+            if self.applications.delete(application_id):
                 logger.info(f"지원 현황 삭제 완료: {application_id}")
                 return True
             logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
@@ -330,25 +432,504 @@ class Database:
             return False
 
     def get_dashboard_stats(self) -> Dict:
-        """대시보드 통계 정보 조회"""
+        """대시보드 통계 정보 조회 (쓰기 시점에 유지되는 집계를 읽기만 함)"""
         try:
-            jobs = self._load_data(self.jobs_file)
-            resumes = self._load_data(self.resumes_file)
-            applications = self._load_data(self.applications_file)
+            today = datetime.now().date().isoformat()
+            stats = {
+                'total_jobs': self.jobs.count(),
+                'total_resumes': self.resumes.count(),
+                'total_applications': self.applications.count(),
+                'today_applications': self.applications.count_by('applied_date', today)
+            }
+            
+            logger.info("대시보드 통계 조회 완료")
+            return stats
+        except Exception as e:
+            logger.error(f"대시보드 통계 조회 중 오류: {e}")
+            return {
+                'total_jobs': 0,
+                'total_resumes': 0,
+                'total_applications': 0,
+                'today_applications': 0
+            }
 
+    def get_application_series(self, days: int = 7) -> Dict:
+        """
+        최근 days일 동안의 일별 지원 건수 조회
+
+        Returns:
+            Dict: {'labels': ['YYYY-MM-DD', ...], 'counts': [int, ...]} (오래된 날짜부터)
+        """
+        try:
             today = datetime.now().date()
-            today_applications = [
-                app for app in applications 
-                if datetime.fromisoformat(app.get('applied_at', '')).date() == today
-            ]
+            labels = [(today - timedelta(days=offset)).isoformat() for offset in range(days - 1, -1, -1)]
+            counts = [self.applications.count_by('applied_date', label) for label in labels]
+            return {'labels': labels, 'counts': counts}
+        except Exception as e:
+            logger.error(f"일별 지원 건수 조회 중 오류: {e}")
+            return {'labels': [], 'counts': []}
+
+# ----------------------
+# SQL 저장소 (JSON 저장소와 같은 인터페이스)
+# ----------------------
+def _parse_datetime(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+def _format_datetime(value: datetime) -> str:
+    return value.isoformat()
+
+class RecordMapping:
+    """
+    JSON 저장소 레코드(dict) ↔ SQL 모델 행 변환 규칙
+
+    fields에 정의된 키는 대응 컬럼에, 나머지 키는 extra(JSON) 컬럼에 저장한다.
+    converters의 변환에 실패한 값(예: 날짜 형식이 아닌 지원일)은 원래 값 그대로 extra에 남긴다.
+    """
+
+    def __init__(self, model, fields: Dict[str, str],
+                 converters: Optional[Dict[str, Tuple[Callable, Callable]]] = None):
+        self.model = model
+        self.fields = fields
+        self.converters = converters or {}
+
+    def to_row(self, record: Dict) -> Dict:
+        """레코드 → 컬럼 값 dict (id 제외)"""
+        row = {}
+        extra = {key: value for key, value in record.items() if key != 'id' and key not in self.fields}
+        for key, column in self.fields.items():
+            value = record.get(key)
+            if value is not None and key in self.converters:
+                try:
+                    value = self.converters[key][0](value)
+                except (TypeError, ValueError):
+                    extra[key] = value
+                    value = None
+            row[column] = value
+        row['extra'] = extra or None
+        return row
+
+    def to_dict(self, row) -> Dict:
+        """모델 객체 → JSON 저장소와 같은 모양의 레코드"""
+        record = {'id': str(row.id)}
+        record.update(row.extra or {})
+        for key, column in self.fields.items():
+            value = getattr(row, column)
+            if value is None:
+                continue
+            if key in self.converters:
+                value = self.converters[key][1](value)
+            record[key] = value
+        return record
+
+JOB_POSTING_MAPPING = RecordMapping(
+    JobPosting,
+    {
+        'site': 'platform', 'company_name': 'company_name', 'title': 'job_title',
+        'url': 'link', 'deadline': 'deadline', 'location': 'location', 'experience': 'experience',
+        'education': 'education', 'employment_type': 'employment_type', 'salary': 'salary',
+        'description': 'description', 'welfare_benefits': 'welfare_benefits', 'created_at': 'created_at',
+        'deadline_at': 'deadline_at', 'deadline_kind': 'deadline_kind',
+    },
+    converters={'created_at': (_parse_datetime, _format_datetime), 'deadline_at': (_parse_datetime, _format_datetime)},
+)
+
+RESUME_MAPPING = RecordMapping(
+    ResumeProfile,
+    {
+        'name': 'name', 'email': 'email', 'phone': 'phone', 'education': 'education',
+        'experience': 'experience', 'skills': 'skills', 'created_at': 'created_at',
+    },
+    converters={'created_at': (_parse_datetime, _format_datetime)},
+)
+
+APPLICATION_MAPPING = RecordMapping(
+    Application,
+    {'job_id': 'job_id', 'status': 'status', 'applied_at': 'applied_at'},
+    converters={
+        'job_id': (int, str),
+        'applied_at': (_parse_datetime, _format_datetime),
+    },
+)
+
+class SqlDatabase:
+    """
+    Database와 같은 메서드를 SQLAlchemy 모델(jobs.db) 위에서 제공하는 저장소
+
+    JSON 파일 데이터는 migrate_json_to_sql.py로 한 번 옮긴 뒤
+    JOB_MANAGER_STORAGE=sql로 실행하면 API가 이 클래스를 사용한다.
+    """
+
+    # 전체 건수(COUNT(*))는 테이블 전체를 훑으므로 이 시간(초) 동안 캐시
+    # (이 프로세스의 쓰기는 즉시 반영되고, 다른 워커의 쓰기는 최대 TTL만큼 늦게 반영됨)
+    COUNT_CACHE_TTL = 30
+
+    def __init__(self, bind=None):
+        self.bind = bind or engine
+        self._counts: Dict[object, Tuple[int, float]] = {}
+        self._counts_lock = threading.Lock()
+        self.Session = sessionmaker(autocommit=False, autoflush=False, bind=self.bind)
+        init_db(self.bind)
+        self.storage = "sql"
+        logger.info(f"데이터베이스 초기화 완료 (저장 방식: {self.storage})")
+
+    @staticmethod
+    def _fetch(session, model, record_id):
+        """문자열 id로 행 조회 (숫자가 아닌 id는 없는 것으로 취급)"""
+        try:
+            return session.get(model, int(record_id))
+        except (TypeError, ValueError):
+            return None
+
+    def _insert(self, mapping: RecordMapping, record: Dict) -> Dict:
+        with self.Session() as session:
+            row = mapping.model(**mapping.to_row(record))
+            session.add(row)
+            session.commit()
+            self._adjust_count(mapping.model, 1)
+            return mapping.to_dict(row)
+
+    def _list(self, mapping: RecordMapping, skip: int, limit: int) -> List[Dict]:
+        with self.Session() as session:
+            rows = session.query(mapping.model).order_by(mapping.model.id).offset(skip).limit(limit).all()
+            return [mapping.to_dict(row) for row in rows]
+
+    def _get(self, mapping: RecordMapping, record_id) -> Optional[Dict]:
+        with self.Session() as session:
+            row = self._fetch(session, mapping.model, record_id)
+            return mapping.to_dict(row) if row else None
+
+    def _replace(self, mapping: RecordMapping, record_id, record: Dict) -> Optional[Dict]:
+        with self.Session() as session:
+            row = self._fetch(session, mapping.model, record_id)
+            if row is None:
+                return None
+            for column, value in mapping.to_row(record).items():
+                setattr(row, column, value)
+            session.commit()
+            return mapping.to_dict(row)
+
+    def _delete(self, mapping: RecordMapping, record_id) -> bool:
+        with self.Session() as session:
+            row = self._fetch(session, mapping.model, record_id)
+            if row is None:
+                return False
+            session.delete(row)
+            session.commit()
+            self._adjust_count(mapping.model, -1)
+            return True
+
+    def _count(self, model) -> int:
+        with self._counts_lock:
+            cached = self._counts.get(model)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+        with self.Session() as session:
+            count = session.query(func.count(model.id)).scalar()
+        with self._counts_lock:
+            self._counts[model] = (count, time.monotonic() + self.COUNT_CACHE_TTL)
+        return count
+
+    def _adjust_count(self, model, delta: int):
+        """이 프로세스에서 쓴 만큼 캐시된 전체 건수를 바로 증감"""
+        with self._counts_lock:
+            cached = self._counts.get(model)
+            if cached:
+                self._counts[model] = (cached[0] + delta, cached[1])
+
+    # ----------------------
+    # 채용 공고
+    # ----------------------
+    def save_job_posting(self, job_data: Dict) -> Dict:
+        """채용 공고 저장"""
+        try:
+            job_data['created_at'] = datetime.now().isoformat()
+            annotate_deadline(job_data)
+            saved = self._insert(JOB_POSTING_MAPPING, job_data)
+            logger.info(f"채용 공고 저장 완료: {saved['id']}")
+            return saved
+        except Exception as e:
+            logger.error(f"채용 공고 저장 중 오류: {e}")
+            raise
+
+    def upsert_job_postings(self, jobs: List[Dict]) -> Dict[str, int]:
+        """
+        크롤링한 채용 공고 여러 건을 url(link) 기준으로 한 트랜잭션에 저장 (crud.bulk_upsert_job_postings)
+
+        Returns:
+            {'inserted': 새로 넣은 건수, 'updated': 값이 바뀐 건수, 'unchanged': 그대로인 건수}
+        """
+        try:
+            rows = [JOB_POSTING_MAPPING.to_row(annotate_deadline(dict(job_data))) for job_data in jobs if job_data.get('url')]
+            with self.Session() as session:
+                counts = crud.bulk_upsert_job_postings(session, rows)
+            self._adjust_count(JobPosting, counts['inserted'])
+            logger.info(f"채용 공고 일괄 저장 완료: {counts}")
+            return counts
+        except Exception as e:
+            logger.error(f"채용 공고 일괄 저장 중 오류: {e}")
+            raise
+
+    def get_job_postings(self, skip: int = 0, limit: int = 10) -> List[Dict]:
+        """채용 공고 목록 조회"""
+        try:
+            return self._list(JOB_POSTING_MAPPING, skip, limit)
+        except Exception as e:
+            logger.error(f"채용 공고 목록 조회 중 오류: {e}")
+            return []
+
+    def get_job_postings_page(self, limit: int = 10, cursor: Optional[str] = None) -> Dict:
+        """
+        커서 기준 채용 공고 목록 조회 ((created_at, id) 인덱스 사용)
+
+        Returns:
+            Dict: {'jobs': [...], 'next_cursor': str|None, 'prev_cursor': str|None}
+            cursor 형식이 잘못되면 ValueError
+        """
+        with self.Session() as session:
+            rows, has_prev, has_next = crud.get_jobs_page(session, limit=limit, cursor=cursor)
+            jobs = [JOB_POSTING_MAPPING.to_dict(row) for row in rows]
+        return {'jobs': jobs, **cursor_tokens(jobs, has_prev, has_next)}
+
+    def count_job_postings(self) -> int:
+        """전체 채용 공고 수 조회 (COUNT_CACHE_TTL 동안 캐시)"""
+        return self._count(JobPosting)
+
+    def get_job_postings_closing(self, within: timedelta, skip: int = 0, limit: int = 10,
+                                 now: Optional[datetime] = None) -> Dict:
+        """
+        지금부터 within 안에 마감되는 채용 공고 (마감 임박 순, deadline_at 인덱스 범위 조회)
+
+        Returns:
+            Dict: {'jobs': [...], 'total': 전체 건수}
+        """
+        with self.Session() as session:
+            rows, total = crud.get_jobs_closing_within(session, within, now=now, skip=skip, limit=limit)
+            return {'jobs': [JOB_POSTING_MAPPING.to_dict(row) for row in rows], 'total': total}
+
+    def search_job_postings(self, query: str, limit: int = 20, offset: int = 0) -> Dict:
+        """
+        채용 공고 전문 검색 (FTS5 trigram 색인, BM25 순)
+
+        일치하는 공고가 search.RANK_WINDOW건을 넘으면 최근 공고 RANK_WINDOW건 안에서 순위를 매기고
+        total_capped를 True로 돌려준다.
+
+        Returns:
+            Dict: {'jobs': [채용 공고 + score/snippet/highlights], 'total': 일치 건수, 'total_capped': bool}
+            검색어가 비었거나 너무 길면 ValueError
+        """
+        terms = parse_query(query)
+        with self.Session() as session:
+            rows, total, capped = crud.search_jobs(session, query, limit=limit, offset=offset)
+            hits = [build_hit(JOB_POSTING_MAPPING.to_dict(row), terms, score) for row, score in rows]
+        return {'jobs': hits, 'total': total, 'total_capped': capped}
 
+    def get_job_posting(self, job_id: str) -> Optional[Dict]:
+        """특정 채용 공고 조회"""
+        try:
+            job = self._get(JOB_POSTING_MAPPING, job_id)
+            if job is None:
+                logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
+            return job
+        except Exception as e:
+            logger.error(f"채용 공고 조회 중 오류: {e}")
+            return None
+
+    def get_job_posting_by_link(self, link: str) -> Optional[Dict]:
+        """링크(url)로 채용 공고 조회"""
+        try:
+            with self.Session() as session:
+                row = session.query(JobPosting).filter(JobPosting.link == link).first()
+                return JOB_POSTING_MAPPING.to_dict(row) if row else None
+        except Exception as e:
+            logger.error(f"채용 공고 조회 중 오류: {e}")
+            return None
+
+    def update_job_posting(self, job_id: str, job_data: Dict) -> Optional[Dict]:
+        """채용 공고 수정"""
+        try:
+            current = self._get(JOB_POSTING_MAPPING, job_id)
+            if current is None:
+                logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
+                return None
+            job_data = {**job_data, 'created_at': current.get('created_at'), 'updated_at': datetime.now().isoformat()}
+            annotate_deadline(job_data, overwrite=True)
+            updated = self._replace(JOB_POSTING_MAPPING, job_id, job_data)
+            logger.info(f"채용 공고 업데이트 완료: {job_id}")
+            return updated
+        except Exception as e:
+            logger.error(f"채용 공고 업데이트 중 오류: {e}")
+            return None
+
+    def delete_job_posting(self, job_id: str) -> bool:
+        """채용 공고 삭제"""
+        try:
+            if self._delete(JOB_POSTING_MAPPING, job_id):
+                logger.info(f"채용 공고 삭제 완료: {job_id}")
+                return True
+            logger.warning(f"채용 공고를 찾을 수 없음: {job_id}")
+            return False
+        except Exception as e:
+            logger.error(f"채용 공고 삭제 중 오류: {e}")
+            return False
+
+    # ----------------------
+    # 이력서
+    # ----------------------
+    def save_resume(self, resume_data: Dict) -> Dict:
+        """이력서 저장"""
+        try:
+            resume_data['created_at'] = datetime.now().isoformat()
+            saved = self._insert(RESUME_MAPPING, resume_data)
+            logger.info(f"이력서 저장 완료: {saved['id']}")
+            return saved
+        except Exception as e:
+            logger.error(f"이력서 저장 중 오류: {e}")
+            raise
+
+    def get_resumes(self, skip: int = 0, limit: int = 10) -> List[Dict]:
+        """이력서 목록 조회"""
+        try:
+            return self._list(RESUME_MAPPING, skip, limit)
+        except Exception as e:
+            logger.error(f"이력서 목록 조회 중 오류: {e}")
+            return []
+
+    def get_resume(self, resume_id: str) -> Optional[Dict]:
+        """특정 이력서 조회"""
+        try:
+            resume = self._get(RESUME_MAPPING, resume_id)
+            if resume is None:
+                logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
+            return resume
+        except Exception as e:
+            logger.error(f"이력서 조회 중 오류: {e}")
+            return None
+
+    def update_resume(self, resume_id: str, resume_data: Dict) -> Optional[Dict]:
+        """이력서 수정"""
+        try:
+            current = self._get(RESUME_MAPPING, resume_id)
+            if current is None:
+                logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
+                return None
+            resume_data = {**resume_data, 'created_at': current.get('created_at'), 'updated_at': datetime.now().isoformat()}
+            updated = self._replace(RESUME_MAPPING, resume_id, resume_data)
+            logger.info(f"이력서 업데이트 완료: {resume_id}")
+            return updated
+        except Exception as e:
+            logger.error(f"이력서 업데이트 중 오류: {e}")
+            return None
+
+    def delete_resume(self, resume_id: str) -> bool:
+        """이력서 삭제"""
+        try:
+            if self._delete(RESUME_MAPPING, resume_id):
+                logger.info(f"이력서 삭제 완료: {resume_id}")
+                return True
+            logger.warning(f"이력서를 찾을 수 없음: {resume_id}")
+            return False
+        except Exception as e:
+            logger.error(f"이력서 삭제 중 오류: {e}")
+            return False
+
+    # ----------------------
+    # 지원 현황
+    # ----------------------
+    def save_application(self, application_data: Dict) -> Dict:
+        """지원 현황 저장"""
+        try:
+            if 'applied_at' not in application_data:
+                application_data['applied_at'] = datetime.now().isoformat()
+
+            # 채용 공고 정보 가져오기 (JSON 저장소와 같이 공고명/회사명 사본을 함께 저장)
+            if 'job_id' in application_data:
+                job = self.get_job_posting(application_data['job_id'])
+                if job:
+                    application_data['job_title'] = job.get('title', '')
+                    application_data['company'] = job.get('company_name', '')
+
+            saved = self._insert(APPLICATION_MAPPING, application_data)
+            logger.info(f"지원 현황 저장 완료: {saved['id']}")
+            return saved
+        except Exception as e:
+            logger.error(f"지원 현황 저장 중 오류: {e}")
+            raise
+
+    def get_applications(self, skip: int = 0, limit: int = 10) -> List[Dict]:
+        """지원 현황 목록 조회"""
+        try:
+            return self._list(APPLICATION_MAPPING, skip, limit)
+        except Exception as e:
+            logger.error(f"지원 현황 목록 조회 중 오류: {e}")
+            return []
+
+    def get_application(self, application_id: str) -> Optional[Dict]:
+        """특정 지원 현황 조회"""
+        try:
+            application = self._get(APPLICATION_MAPPING, application_id)
+            if application is None:
+                logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
+            return application
+        except Exception as e:
+            logger.error(f"지원 현황 조회 중 오류: {e}")
+            return None
+
+    def update_application(self, application_id: str, update_data: Dict) -> Optional[Dict]:
+        """지원 현황 수정"""
+        try:
+            application = self._get(APPLICATION_MAPPING, application_id)
+            if application is None:
+                logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
+                return None
+            application = {**application, **update_data, 'updated_at': datetime.now().isoformat()}
+            updated = self._replace(APPLICATION_MAPPING, application_id, application)
+            logger.info(f"지원 현황 업데이트 완료: {application_id}")
+            return updated
+        except Exception as e:
+            logger.error(f"지원 현황 업데이트 중 오류: {e}")
+            return None
+
+    def delete_application(self, application_id: str) -> bool:
+        """지원 현황 삭제"""
+        try:
+            if self._delete(APPLICATION_MAPPING, application_id):
+                logger.info(f"지원 현황 삭제 완료: {application_id}")
+                return True
+            logger.warning(f"지원 현황을 찾을 수 없음: {application_id}")
+            return False
+        except Exception as e:
+            logger.error(f"지원 현황 삭제 중 오류: {e}")
+            return False
+
+    # ----------------------
+    # 대시보드
+    # ----------------------
+    def _count_applications_by_date(self, start: datetime, end: datetime) -> Dict[str, int]:
+        """[start, end) 구간의 일별 지원 건수"""
+        with self.Session() as session:
+            day = func.date(Application.applied_at)
+            rows = (
+                session.query(day, func.count(Application.id))
+                .filter(Application.applied_at >= start, Application.applied_at < end)
+                .group_by(day)
+                .all()
+            )
+            return {str(label): count for label, count in rows}
+
+    def get_dashboard_stats(self) -> Dict:
+        """대시보드 통계 정보 조회"""
+        try:
+            today = datetime.combine(datetime.now().date(), datetime.min.time())
+            today_counts = self._count_applications_by_date(today, today + timedelta(days=1))
             stats = {
-                'total_jobs': len(jobs),
-                'total_resumes': len(resumes),
-                'total_applications': len(applications),
-                'today_applications': len(today_applications)
+                'total_jobs': self._count(JobPosting),
+                'total_resumes': self._count(ResumeProfile),
+                'total_applications': self._count(Application),
+                'today_applications': sum(today_counts.values())
             }
-            
+
             logger.info("대시보드 통계 조회 완료")
             return stats
         except Exception as e:
@@ -359,3 +940,21 @@ class Database:
                 'total_applications': 0,
                 'today_applications': 0
             }
+
+    def get_application_series(self, days: int = 7) -> Dict:
+        """
+        최근 days일 동안의 일별 지원 건수 조회
+
+        Returns:
+            Dict: {'labels': ['YYYY-MM-DD', ...], 'counts': [int, ...]} (오래된 날짜부터)
+        """
+        try:
+            today = datetime.now().date()
+            labels = [(today - timedelta(days=offset)).isoformat() for offset in range(days - 1, -1, -1)]
+            start = datetime.combine(today - timedelta(days=days - 1), datetime.min.time())
+            end = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            counts = self._count_applications_by_date(start, end)
+            return {'labels': labels, 'counts': [counts.get(label, 0) for label in labels]}
+        except Exception as e:
+            logger.error(f"일별 지원 건수 조회 중 오류: {e}")
+            return {'labels': [], 'counts': []}
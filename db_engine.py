@@ -0,0 +1,69 @@
+# db_engine.py
+"""
+SQLAlchemy 엔진 생성 (models.py, database.py, 이전 도구가 함께 사용)
+
+SQLite 파일 데이터베이스는 연결될 때마다 아래 PRAGMA를 적용한다.
+- journal_mode=WAL: 크롤러가 쓰는 동안에도 API 조회가 막히지 않음
+- synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 손상되지 않음 (체크포인트 시 fsync)
+- cache_size/mmap_size/temp_store: 페이지 캐시 확대, 메모리 매핑 읽기, 임시 테이블을 메모리에
+- busy_timeout: 다른 연결이 쓰기 잠금을 잡고 있으면 바로 실패하지 않고 기다림
+"""
+from typing import Dict, Optional
+import os
+import logging
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+
+logger = logging.getLogger(__name__)
+
+SQLITE_PRAGMAS: Dict[str, object] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,        # 음수는 KiB 단위 (약 64MB)
+    "mmap_size": 268435456,      # 256MB
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,        # ms
+}
+
+# 파일 데이터베이스 연결 풀 크기 (uvicorn 워커 하나 기준)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+
+def _is_memory_database(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def create_db_engine(url: str, pragmas: Optional[Dict[str, object]] = None, **kwargs) -> Engine:
+    """
+    데이터베이스 URL로 엔진 생성 (SQLite면 연결 시 PRAGMA 적용)
+
+    Args:
+        url (str): 데이터베이스 URL
+        pragmas (dict): SQLITE_PRAGMAS 대신 적용할 PRAGMA (일부만 지정하면 기본값과 합쳐짐)
+        **kwargs: create_engine에 그대로 전달할 옵션
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return create_engine(url, **kwargs)
+
+    connect_args = {"check_same_thread": False, **kwargs.pop("connect_args", {})}
+    if not _is_memory_database(parsed):
+        kwargs.setdefault("pool_size", POOL_SIZE)
+        kwargs.setdefault("max_overflow", MAX_OVERFLOW)
+    engine = create_engine(url, connect_args=connect_args, **kwargs)
+
+    settings = {**SQLITE_PRAGMAS, **(pragmas or {})}
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in settings.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    logger.debug(f"SQLite 엔진 생성: {url} ({settings})")
+    return engine
@@ -0,0 +1,139 @@
+# deadline.py
+"""
+채용 공고 마감일 문자열 정규화
+
+사이트마다 마감일 표기가 제각각이다("~ 4/6(일)", "2025.04.30", "2024.03.01 ~ 2024.03.31 23:59",
+"D-5", "상시채용", "채용시 마감" 등). parse_deadline()은 이를 마감 일시(deadline_at)와
+마감 유형(deadline_kind)으로 바꿔, 마감일 정렬/필터를 문자열 파싱 없이 인덱스로 처리하게 한다.
+
+마감 유형:
+    fixed        - 정해진 마감 일시가 있음 (deadline_at 채워짐)
+    rolling      - 상시채용 (deadline_at 없음)
+    until_filled - 채용 시 마감 (deadline_at 없음)
+해석하지 못한 문자열은 (None, None)을 돌려준다.
+"""
+from typing import Dict, Optional, Tuple
+from datetime import datetime, time, timedelta
+import re
+
+DEADLINE_FIXED = "fixed"
+DEADLINE_ROLLING = "rolling"
+DEADLINE_UNTIL_FILLED = "until_filled"
+
+# 시각이 없는 마감일은 그날 끝까지 지원 가능한 것으로 본다
+END_OF_DAY = time(23, 59, 59)
+
+# 연도가 없는 날짜("4/6")가 기준 시점보다 이만큼 이전이면 다음 해로 본다
+YEAR_ROLLOVER = timedelta(days=180)
+
+_UNTIL_FILLED = re.compile(r"채용\s*시|충원\s*시|마감\s*시\s*까지|조기\s*마감")
+_ROLLING = re.compile(r"상시|수시|always", re.IGNORECASE)
+_TODAY = re.compile(r"오늘\s*마감")
+_TOMORROW = re.compile(r"내일\s*마감")
+_D_DAY = re.compile(r"D\s*-\s*(\d+)|D-?DAY", re.IGNORECASE)
+
+_TIME = r"(?:\s*\([^)]*\))?(?:\s*(\d{1,2})\s*:\s*(\d{2}))?"
+_FULL_DATE = re.compile(r"(\d{4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})\.?" + _TIME)
+_KOREAN_DATE = re.compile(r"(?:(\d{4})\s*년\s*)?(\d{1,2})\s*월\s*(\d{1,2})\s*일" + _TIME)
+_SHORT_DATE = re.compile(r"(?<![\d.])(\d{1,2})\s*[./]\s*(\d{1,2})(?![\d.]*\s*[./-]\s*\d)" + _TIME)
+
+
+def _at(year: int, month: int, day: int, hour, minute) -> Optional[datetime]:
+    try:
+        if hour is not None:
+            return datetime(year, month, day, min(int(hour), 23), int(minute))
+        return datetime.combine(datetime(year, month, day).date(), END_OF_DAY)
+    except ValueError:
+        return None
+
+
+def _infer_year(month: int, day: int, hour, minute, now: datetime) -> Optional[datetime]:
+    candidate = _at(now.year, month, day, hour, minute)
+    if candidate and candidate < now - YEAR_ROLLOVER:
+        candidate = _at(now.year + 1, month, day, hour, minute)
+    return candidate
+
+
+def _last_date(text: str, now: datetime) -> Optional[datetime]:
+    """문자열에 나오는 날짜 중 마지막(기간이면 종료일)을 datetime으로"""
+    found = []
+    for match in _FULL_DATE.finditer(text):
+        year, month, day, hour, minute = match.groups()
+        found.append((match.start(), _at(int(year), int(month), int(day), hour, minute)))
+    for match in _KOREAN_DATE.finditer(text):
+        year, month, day, hour, minute = match.groups()
+        if year:
+            found.append((match.start(), _at(int(year), int(month), int(day), hour, minute)))
+        else:
+            found.append((match.start(), _infer_year(int(month), int(day), hour, minute, now)))
+    if not found:
+        for match in _SHORT_DATE.finditer(text):
+            month, day, hour, minute = match.groups()
+            found.append((match.start(), _infer_year(int(month), int(day), hour, minute, now)))
+    found = [(position, value) for position, value in found if value is not None]
+    return max(found)[1] if found else None
+
+
+def parse_deadline(value, now: Optional[datetime] = None) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    마감일 문자열을 (마감 일시, 마감 유형)으로 변환
+
+    Args:
+        value: 마감일 문자열 (사람인 접수기간처럼 dict면 '접수기간'/'마감일' 값을 사용)
+        now (datetime): 연도 없는 날짜/D-n/오늘마감의 기준 시점 (기본값: 현재 시각, 백필은 공고 등록 시각)
+
+    Returns:
+        (deadline_at, deadline_kind) - 해석하지 못하면 (None, None)
+    """
+    if isinstance(value, dict):
+        value = value.get('접수기간') or value.get('마감일')
+    if isinstance(value, datetime):
+        return value, DEADLINE_FIXED
+    if not value or not isinstance(value, str):
+        return None, None
+    now = now or datetime.now()
+    text = value.strip()
+
+    deadline_at = _last_date(text, now)
+    if deadline_at is None:
+        d_day = _D_DAY.search(text)
+        if d_day:
+            deadline_at = datetime.combine((now + timedelta(days=int(d_day.group(1) or 0))).date(), END_OF_DAY)
+        elif _TODAY.search(text):
+            deadline_at = datetime.combine(now.date(), END_OF_DAY)
+        elif _TOMORROW.search(text):
+            deadline_at = datetime.combine((now + timedelta(days=1)).date(), END_OF_DAY)
+    if deadline_at is not None:
+        return deadline_at, DEADLINE_FIXED
+    if _UNTIL_FILLED.search(text):
+        return None, DEADLINE_UNTIL_FILLED
+    if _ROLLING.search(text):
+        return None, DEADLINE_ROLLING
+    return None, None
+
+
+def annotate_deadline(job_data: Dict, now: Optional[datetime] = None, overwrite: bool = False) -> Dict:
+    """
+    크롤링 결과(dict)에 deadline_at(ISO 문자열)과 deadline_kind를 채워 돌려줌
+
+    deadline이 비어 있으면 사람인 접수기간(application_period)에서 찾는다.
+    이미 deadline_at이 있으면 overwrite가 아닌 한 그대로 둔다 (수정 시에는 overwrite=True로 다시 계산).
+    """
+    if job_data.get('deadline_at') and not overwrite:
+        return job_data
+    deadline_at, kind = parse_deadline(job_data.get('deadline') or job_data.get('application_period'), now)
+    job_data['deadline_at'] = deadline_at.isoformat() if deadline_at else None
+    job_data['deadline_kind'] = kind
+    return job_data
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    "3d", "12h", "2w", "90m" 또는 숫자(일) 형식의 기간을 timedelta로 (형식이 잘못되면 ValueError)
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([mhdw]?)\s*", str(value or ""), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"잘못된 기간 형식입니다: {value} (예: 3d, 12h, 2w)")
+    amount, unit = int(match.group(1)), (match.group(2) or "d").lower()
+    return {'m': timedelta(minutes=amount), 'h': timedelta(hours=amount),
+            'd': timedelta(days=amount), 'w': timedelta(weeks=amount)}[unit]
@@ -6,10 +6,13 @@ from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 from crawler.final_saramin_crawler import FinalSaraminCrawler
-from database import Database, get_db
+from crawl_queue import CrawlQueue, QueueFullError, STATUS_FAILED
+from database import get_database, get_db, init_db
+from deadline import parse_duration
 from sqlalchemy.orm import Session
 import logging
 import os
+import time
 from dotenv import load_dotenv
 
 # 환경 변수 로드
@@ -35,11 +38,6 @@ templates = Jinja2Templates(directory="templates")
 class CrawlRequest(BaseModel):
     url: str
 
-class JobResponse(BaseModel):
-    success: bool
-    job: Optional[dict] = None
-    message: Optional[str] = None
-
 class ResumeRequest(BaseModel):
     name: str
     email: str
@@ -53,14 +51,49 @@ class ApplicationRequest(BaseModel):
     status: str
     applied_at: Optional[str] = None
 
+@app.on_event("startup")
+async def init_storage():
+    # 저장소 선택: JOB_MANAGER_STORAGE=json|jsonl(data/ 파일) 또는 sql(jobs.db, migrate_json_to_sql.py로 이전 후 사용)
+    # 첫 요청 전에 초기화해 두어 설정 오류를 서버 시작 시점에 드러낸다
+    init_db()
+    db = get_database()
+    logger.info(f"저장소 초기화 완료: {db.storage}")
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
-@app.post("/api/crawl", response_model=JobResponse)
+def run_crawl(url: str) -> dict:
+    """크롤링 워커에서 실행: 공고를 크롤링해 저장하고 저장된 공고를 반환"""
+    crawler = FinalSaraminCrawler()
+    job_data = crawler.crawl_job_detail(url)
+    logger.info(f"크롤링 결과: {job_data}")
+    if not job_data:
+        raise LookupError("채용 공고를 찾을 수 없습니다.")
+
+    saved_job = get_database().save_job_posting(job_data)
+    logger.info(f"저장된 채용 공고: {saved_job}")
+    return saved_job
+
+_crawl_queue: Optional[CrawlQueue] = None
+
+def get_crawl_queue() -> CrawlQueue:
+    """크롤링 작업 큐 (CRAWL_WORKERS개 워커, 대기열 CRAWL_QUEUE_SIZE건)"""
+    global _crawl_queue
+    if _crawl_queue is None:
+        _crawl_queue = CrawlQueue(run_crawl)
+    return _crawl_queue
+
+@app.on_event("shutdown")
+def stop_crawl_queue():
+    if _crawl_queue is not None:
+        _crawl_queue.shutdown(wait=False)
+
+@app.post("/api/crawl", status_code=202)
 async def crawl_job(request: CrawlRequest):
+    """크롤링 작업을 등록하고 작업 id를 바로 반환 (결과는 /api/crawl/{id}로 조회)"""
     try:
-        logger.info(f"크롤링 시작: {request.url}")
+        logger.info(f"크롤링 요청: {request.url}")
         
         # URL 유효성 검사
         if not request.url or not request.url.startswith("https://www.saramin.co.kr"):
@@ -70,40 +103,51 @@ async def crawl_job(request: CrawlRequest):
                 content={"success": False, "message": "유효하지 않은 사람인 URL입니다."}
             )
 
-        # 크롤러 실행
-        crawler = FinalSaraminCrawler()
-        logger.info("크롤러 인스턴스 생성됨")
-        
-        job_data = crawler.crawl_job_detail(request.url)
-        logger.info(f"크롤링 결과: {job_data}")
-        
-        if not job_data:
-            logger.warning("채용 공고를 찾을 수 없음")
-            return JSONResponse(
-                status_code=404,
-                content={"success": False, "message": "채용 공고를 찾을 수 없습니다."}
-            )
-
-        # 데이터베이스에 저장
-        db = Database()
-        saved_job = db.save_job_posting(job_data)
-        logger.info(f"저장된 채용 공고: {saved_job}")
-
+        task = get_crawl_queue().submit(request.url)
         return JSONResponse(
-            content={"success": True, "job": saved_job}
+            status_code=202,
+            content={"success": True, "job_id": task['id'], "status": task['status'],
+                     "status_url": f"/api/crawl/{task['id']}"}
         )
 
+    except QueueFullError as e:
+        logger.warning(f"크롤링 대기열 가득 참: {e}")
+        return JSONResponse(
+            status_code=503,
+            content={"success": False, "message": str(e)}
+        )
     except Exception as e:
-        logger.error(f"크롤링 중 오류 발생: {str(e)}", exc_info=True)
+        logger.error(f"크롤링 요청 처리 중 오류 발생: {str(e)}", exc_info=True)
         return JSONResponse(
             status_code=500,
-            content={"success": False, "message": f"크롤링 중 오류가 발생했습니다: {str(e)}"}
+            content={"success": False, "message": f"크롤링 요청 처리 중 오류가 발생했습니다: {str(e)}"}
         )
 
+@app.get("/api/crawl/{job_id}")
+async def get_crawl_job(job_id: str):
+    """크롤링 작업 상태 조회 (succeeded면 job에 저장된 채용 공고, failed면 message에 오류)"""
+    task = get_crawl_queue().get(job_id)
+    if task is None:
+        return JSONResponse(
+            status_code=404,
+            content={"success": False, "message": "크롤링 작업을 찾을 수 없습니다."}
+        )
+    return JSONResponse(content={
+        "success": task['status'] != STATUS_FAILED,
+        "job_id": task['id'],
+        "url": task['url'],
+        "status": task['status'],
+        "job": task['result'],
+        "message": task['error'],
+        "created_at": task['created_at'],
+        "started_at": task['started_at'],
+        "finished_at": task['finished_at'],
+    })
+
 @app.get("/api/dashboard")
 async def get_dashboard_stats():
     try:
-        db = Database()
+        db = get_database()
         stats = db.get_dashboard_stats()
         return JSONResponse(content=stats)
     except Exception as e:
@@ -113,19 +157,64 @@ async def get_dashboard_stats():
             content={"message": f"대시보드 통계 조회 중 오류가 발생했습니다: {str(e)}"}
         )
 
+@app.get("/api/dashboard/series")
+async def get_dashboard_series(days: int = Query(7, ge=1, le=365)):
+    try:
+        db = get_database()
+        series = db.get_application_series(days=days)
+        return JSONResponse(content=series)
+    except Exception as e:
+        logger.error(f"일별 지원 건수 조회 중 오류: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={"message": f"일별 지원 건수 조회 중 오류가 발생했습니다: {str(e)}"}
+        )
+
 @app.get("/api/jobs")
-async def get_jobs(skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=100)):
+async def get_jobs(skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=100),
+                   cursor: Optional[str] = None, closing_within: Optional[str] = None):
     try:
-        db = Database()
-        jobs = db.get_job_postings(skip=skip, limit=limit)
-        total = len(db._load_data(db.jobs_file))  # 전체 채용 공고 수
+        db = get_database()
+        if closing_within:
+            # 마감 임박 공고 (예: closing_within=3d, 12h, 2w) - 마감 일시 순
+            page = db.get_job_postings_closing(parse_duration(closing_within), skip=skip, limit=limit)
+            return JSONResponse(content={
+                "success": True,
+                "jobs": page["jobs"],
+                "total": page["total"],
+                "skip": skip,
+                "limit": limit,
+                "closing_within": closing_within
+            })
+
+        total = db.count_job_postings()  # 전체 채용 공고 수 (저장소에서 캐시됨)
+        if skip and not cursor:
+            # 이전 방식(skip/limit) 호출 호환
+            jobs = db.get_job_postings(skip=skip, limit=limit)
+            return JSONResponse(content={
+                "success": True,
+                "jobs": jobs,
+                "total": total,
+                "skip": skip,
+                "limit": limit
+            })
+
+        # 커서 페이지네이션: 응답의 next_cursor/prev_cursor를 그대로 다시 보내면 다음/이전 페이지
+        page = db.get_job_postings_page(limit=limit, cursor=cursor)
         return JSONResponse(content={
             "success": True,
-            "jobs": jobs,
+            "jobs": page["jobs"],
             "total": total,
-            "skip": skip,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": page["next_cursor"],
+            "prev_cursor": page["prev_cursor"]
         })
+    except ValueError as e:
+        logger.warning(f"잘못된 페이지 요청: {str(e)}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "message": str(e)}
+        )
     except Exception as e:
         logger.error(f"채용 공고 목록 조회 중 오류: {str(e)}")
         return JSONResponse(
@@ -133,10 +222,41 @@ async def get_jobs(skip: int = Query(0, ge=0), limit: int = Query(10, ge=1, le=1
             content={"success": False, "message": f"채용 공고 목록 조회 중 오류가 발생했습니다: {str(e)}"}
         )
 
+@app.get("/api/jobs/search")
+async def search_jobs(q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100),
+                      offset: int = Query(0, ge=0)):
+    try:
+        db = get_database()
+        started = time.perf_counter()
+        result = db.search_job_postings(q, limit=limit, offset=offset)
+        # 각 결과: 채용 공고 + score(높을수록 관련), snippet{field, text, highlights}, highlights{필드: [[시작, 끝)]}
+        return JSONResponse(content={
+            "success": True,
+            "query": q,
+            "jobs": result["jobs"],
+            "total": result["total"],
+            "total_capped": result["total_capped"],  # True면 total은 하한 (최근 공고 일부만 순위 계산)
+            "limit": limit,
+            "offset": offset,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2)
+        })
+    except ValueError as e:
+        logger.warning(f"잘못된 검색 요청: {str(e)}")
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "message": str(e)}
+        )
+    except Exception as e:
+        logger.error(f"채용 공고 검색 중 오류: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "message": f"채용 공고 검색 중 오류가 발생했습니다: {str(e)}"}
+        )
+
 @app.post("/api/resumes")
 async def create_resume(resume_data: ResumeRequest):
     try:
-        db = Database()
+        db = get_database()
         saved_resume = db.save_resume(resume_data.dict())
         return JSONResponse(
             content={"success": True, "resume": saved_resume}
@@ -151,7 +271,7 @@ async def create_resume(resume_data: ResumeRequest):
 @app.get("/api/resumes")
 async def get_resumes():
     try:
-        db = Database()
+        db = get_database()
         resumes = db.get_resumes()
         return JSONResponse(content={"success": True, "resumes": resumes})
     except Exception as e:
@@ -164,7 +284,7 @@ async def get_resumes():
 @app.put("/api/resumes/{resume_id}")
 async def update_resume(resume_id: str, resume_data: ResumeRequest):
     try:
-        db = Database()
+        db = get_database()
         updated_resume = db.update_resume(resume_id, resume_data.dict())
         if not updated_resume:
             return JSONResponse(
@@ -182,7 +302,7 @@ async def update_resume(resume_id: str, resume_data: ResumeRequest):
 @app.delete("/api/resumes/{resume_id}")
 async def delete_resume(resume_id: str):
     try:
-        db = Database()
+        db = get_database()
         if db.delete_resume(resume_id):
             return JSONResponse(content={"success": True})
         return JSONResponse(
@@ -199,7 +319,7 @@ async def delete_resume(resume_id: str):
 @app.post("/api/applications")
 async def create_application(application_data: ApplicationRequest):
     try:
-        db = Database()
+        db = get_database()
         saved_application = db.save_application(application_data.dict())
         return JSONResponse(
             content={"success": True, "application": saved_application}
@@ -214,7 +334,7 @@ async def create_application(application_data: ApplicationRequest):
 @app.get("/api/applications")
 async def get_applications():
     try:
-        db = Database()
+        db = get_database()
         applications = db.get_applications()
         return JSONResponse(content={"success": True, "applications": applications})
     except Exception as e:
@@ -227,7 +347,7 @@ async def get_applications():
 @app.put("/api/applications/{application_id}")
 async def update_application_status(application_id: str, status_data: dict):
     try:
-        db = Database()
+        db = get_database()
         updated_application = db.update_application(application_id, status_data)
         if not updated_application:
             return JSONResponse(
@@ -0,0 +1,223 @@
+# migrate_json_to_sql.py
+"""
+JSON 저장소(data/*.json 또는 data/*.jsonl) → SQLite(jobs.db) 일괄 이전 도구
+
+채용 공고, 이력서, 지원 현황을 하나의 트랜잭션 안에서 배치 단위 executemany로 넣는다.
+이전이 끝나면 JOB_MANAGER_STORAGE=sql로 서버를 실행해 SQL 저장소를 사용한다.
+
+사용 예:
+    python migrate_json_to_sql.py --data-dir data --batch-size 5000
+"""
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+import argparse
+import logging
+import time
+
+from sqlalchemy import func, select
+
+from database import (
+    Database, init_db, APPLICATION_MAPPING, JOB_POSTING_MAPPING, RESUME_MAPPING, RecordMapping
+)
+from db_engine import create_db_engine
+from deadline import annotate_deadline
+from models import engine as default_engine
+
+logger = logging.getLogger(__name__)
+
+# 진행 상황 콜백: (대상 이름, 처리한 건수, 전체 건수)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def _log_progress(name: str, done: int, total: int):
+    percent = done / total * 100 if total else 100.0
+    logger.info(f"{name} 이전 중: {done}/{total} ({percent:.1f}%)")
+
+
+def _created_at(value) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _assign_ids(records: List[Dict]) -> Dict[str, int]:
+    """
+    JSON id(문자열) → 정수 id 매핑
+
+    숫자 id는 그대로 쓰고, 숫자가 아니거나 중복된 id는 최대값 다음 번호부터 새로 부여한다.
+    """
+    used = set()
+    for record in records:
+        try:
+            used.add(int(record.get('id')))
+        except (TypeError, ValueError):
+            pass
+    next_id = max(used, default=0) + 1
+
+    id_map: Dict[str, int] = {}
+    taken = set()
+    for record in records:
+        key = str(record.get('id'))
+        try:
+            number = int(record.get('id'))
+        except (TypeError, ValueError):
+            number = None
+        if number is None or number in taken:
+            number = next_id
+            next_id += 1
+        taken.add(number)
+        id_map.setdefault(key, number)
+    return id_map
+
+
+def _insert_batches(conn, mapping: RecordMapping, rows: Iterable[Dict], total: int, name: str,
+                    batch_size: int, progress: ProgressCallback) -> int:
+    """rows를 batch_size개씩 executemany로 삽입하고 삽입한 건수를 반환"""
+    table = mapping.model.__table__
+    batch: List[Dict] = []
+    done = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.execute(table.insert(), batch)
+            done += len(batch)
+            batch = []
+            progress(name, done, total)
+    if batch:
+        conn.execute(table.insert(), batch)
+        done += len(batch)
+    progress(name, done, total)
+    return done
+
+
+def _job_rows(jobs: List[Dict], id_map: Dict[str, int], skipped: Dict[str, int]):
+    """채용 공고 행 생성 (link는 unique이므로 중복 링크는 처음 것만 남기고 나머지 id를 그쪽으로 연결)"""
+    links: Dict[str, int] = {}
+    seen_ids = set()
+    for job in jobs:
+        job_id = id_map[str(job.get('id'))]
+        if job_id in seen_ids:
+            continue
+        # 마감일 컬럼 추가 전에 저장된 공고는 등록 시각 기준으로 마감 일시를 계산
+        job = annotate_deadline(dict(job), now=_created_at(job.get('created_at')))
+        row = JOB_POSTING_MAPPING.to_row(job)
+        row['link'] = row['link'] or None
+        if row['link'] in links:
+            id_map[str(job.get('id'))] = links[row['link']]
+            skipped['jobs'] += 1
+            continue
+        if row['link']:
+            links[row['link']] = job_id
+        if row['platform'] is None:
+            row['platform'] = 'saramin'
+        seen_ids.add(job_id)
+        row['id'] = job_id
+        yield row
+
+
+def _rows_with_ids(mapping: RecordMapping, records: List[Dict], id_map: Dict[str, int]):
+    seen_ids = set()
+    for record in records:
+        record_id = id_map[str(record.get('id'))]
+        if record_id in seen_ids:
+            continue
+        seen_ids.add(record_id)
+        row = mapping.to_row(record)
+        row['id'] = record_id
+        yield row
+
+
+def _application_rows(applications: List[Dict], id_map: Dict[str, int], job_ids: Dict[str, int],
+                      skipped: Dict[str, int]):
+    """지원 현황 행 생성 (job_id를 이전된 채용 공고 id로 바꾸고, 없는 공고를 가리키면 비움)"""
+    for row in _rows_with_ids(APPLICATION_MAPPING, applications, id_map):
+        if row['job_id'] is not None:
+            job_id = job_ids.get(str(row['job_id']))
+            if job_id is None:
+                skipped['application_jobs'] += 1
+            row['job_id'] = job_id
+        yield row
+
+
+def migrate(data_dir: str = "data", storage: Optional[str] = None, bind=None, batch_size: int = 5000,
+            replace: bool = False, progress: Optional[ProgressCallback] = None) -> Dict[str, int]:
+    """
+    JSON 저장소 데이터를 SQL 데이터베이스로 이전
+
+    Args:
+        data_dir (str): JSON 데이터 디렉토리
+        storage (str): 원본 저장 방식 ("json" 또는 "jsonl", 기본값은 JOB_MANAGER_STORAGE)
+        bind: 대상 엔진 (기본값은 models.engine)
+        batch_size (int): executemany 한 번에 넣을 행 수
+        replace (bool): 대상 테이블에 데이터가 있으면 지우고 이전할지 여부
+        progress: 진행 상황 콜백 (기본값은 로그 출력)
+
+    Returns:
+        Dict[str, int]: 테이블별 이전 건수와 건너뛴 건수
+    """
+    bind = bind or default_engine
+    progress = progress or _log_progress
+    started = time.perf_counter()
+
+    source = Database(data_dir=data_dir, storage=storage)
+    jobs = source.jobs.all()
+    resumes = source.resumes.all()
+    applications = source.applications.all()
+    logger.info(f"원본 데이터 로드 완료: 채용 공고 {len(jobs)}건, 이력서 {len(resumes)}건, 지원 현황 {len(applications)}건")
+
+    init_db(bind)
+    job_ids = _assign_ids(jobs)
+    skipped = {'jobs': 0, 'application_jobs': 0}
+
+    mappings = (APPLICATION_MAPPING, RESUME_MAPPING, JOB_POSTING_MAPPING)
+    with bind.begin() as conn:
+        for mapping in mappings:
+            table = mapping.model.__table__
+            existing = conn.execute(select(func.count()).select_from(table)).scalar()
+            if existing and not replace:
+                raise RuntimeError(f"대상 테이블에 이미 데이터가 있습니다: {table.name} ({existing}건). "
+                                   f"덮어쓰려면 --replace 옵션을 사용하세요.")
+            if existing:
+                conn.execute(table.delete())
+                logger.info(f"기존 데이터 삭제: {table.name} ({existing}건)")
+
+        result = {
+            'jobs': _insert_batches(conn, JOB_POSTING_MAPPING, _job_rows(jobs, job_ids, skipped),
+                                    len(jobs), "채용 공고", batch_size, progress),
+            'resumes': _insert_batches(conn, RESUME_MAPPING,
+                                       _rows_with_ids(RESUME_MAPPING, resumes, _assign_ids(resumes)),
+                                       len(resumes), "이력서", batch_size, progress),
+            'applications': _insert_batches(conn, APPLICATION_MAPPING,
+                                            _application_rows(applications, _assign_ids(applications), job_ids, skipped),
+                                            len(applications), "지원 현황", batch_size, progress),
+        }
+
+    result['skipped_duplicate_jobs'] = skipped['jobs']
+    result['unlinked_applications'] = skipped['application_jobs']
+    logger.info(f"이전 완료 ({time.perf_counter() - started:.1f}초): {result}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 저장소 데이터를 SQLite 데이터베이스로 이전")
+    parser.add_argument("--data-dir", default="data", help="JSON 데이터 디렉토리")
+    parser.add_argument("--storage", choices=["json", "jsonl"], default=None,
+                        help="원본 저장 방식 (기본값: JOB_MANAGER_STORAGE)")
+    parser.add_argument("--database-url", default=None, help="대상 데이터베이스 URL (기본값: DATABASE_URL 또는 sqlite:///./jobs.db)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="executemany 배치 크기")
+    parser.add_argument("--replace", action="store_true", help="대상 테이블의 기존 데이터를 지우고 이전")
+    args = parser.parse_args()
+
+    bind = create_db_engine(args.database_url) if args.database_url else None
+    result = migrate(data_dir=args.data_dir, storage=args.storage, bind=bind,
+                     batch_size=args.batch_size, replace=args.replace)
+    print(f"채용 공고 {result['jobs']}건, 이력서 {result['resumes']}건, 지원 현황 {result['applications']}건 이전 완료")
+    if result['skipped_duplicate_jobs']:
+        print(f"링크가 중복된 채용 공고 {result['skipped_duplicate_jobs']}건은 하나로 합쳤습니다.")
+    if result['unlinked_applications']:
+        print(f"채용 공고를 찾을 수 없는 지원 현황 {result['unlinked_applications']}건은 job_id를 비웠습니다.")
+
+
+if __name__ == "__main__":
+    main()
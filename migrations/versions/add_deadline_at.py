@@ -0,0 +1,34 @@
+"""add deadline_at/deadline_kind to job_postings
+
+Revision ID: add_deadline_at
+Revises: add_query_indexes
+Create Date: 2026-10-18 15:00:00.000000
+
+자유 형식 deadline 문자열을 해석한 마감 일시(deadline_at)와 마감 유형(deadline_kind)을 추가한다.
+새 공고는 저장 시점에 채워진다. 스키마만 바꾸며, 기존 공고는 업그레이드 후 따로 채운다:
+
+    python backfill_deadlines.py
+
+(마감일 해석 코드는 계속 바뀌므로 마이그레이션이 현재 코드를 불러 쓰지 않게 분리함)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_deadline_at'
+down_revision = 'add_query_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    existing = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('job_postings')}
+    if 'deadline_at' not in existing:
+        op.add_column('job_postings', sa.Column('deadline_at', sa.DateTime(), nullable=True))
+    if 'deadline_kind' not in existing:
+        op.add_column('job_postings', sa.Column('deadline_kind', sa.String(), nullable=True))
+    op.create_index('ix_job_postings_deadline_at', 'job_postings', ['deadline_at'], unique=False, if_not_exists=True)
+
+def downgrade():
+    op.drop_index('ix_job_postings_deadline_at', table_name='job_postings', if_exists=True)
+    op.drop_column('job_postings', 'deadline_kind')
+    op.drop_column('job_postings', 'deadline_at')
@@ -0,0 +1,54 @@
+"""add extra JSON columns, applications.applied_at and resume_profiles table
+
+Revision ID: add_extra_columns
+Revises: add_job_posting_id
+Create Date: 2026-10-18 11:00:00.000000
+
+JSON 저장소(data/*.json)를 SQL로 옮기면서 생긴 스키마 변경 (migrate_json_to_sql.py, database.SqlDatabase).
+컬럼이 없는 필드를 담는 extra(JSON) 컬럼, 지원일시(applied_at), JSON 이력서 프로필용 resume_profiles 테이블을 추가한다.
+database.init_db()가 먼저 만들었을 수 있으므로 이미 있으면 건너뛴다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_extra_columns'
+down_revision = 'add_job_posting_id'
+branch_labels = None
+depends_on = None
+
+# (테이블, 컬럼)
+COLUMNS = [
+    ('job_postings', sa.Column('extra', sa.JSON(), nullable=True)),
+    ('applications', sa.Column('applied_at', sa.DateTime(), nullable=True)),
+    ('applications', sa.Column('extra', sa.JSON(), nullable=True)),
+]
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for table, column in COLUMNS:
+        existing = {c['name'] for c in inspector.get_columns(table)}
+        if column.name not in existing:
+            op.add_column(table, column)
+
+    if not inspector.has_table('resume_profiles'):
+        op.create_table(
+            'resume_profiles',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(), nullable=True),
+            sa.Column('email', sa.String(), nullable=True),
+            sa.Column('phone', sa.String(), nullable=True),
+            sa.Column('education', sa.Text(), nullable=True),
+            sa.Column('experience', sa.Text(), nullable=True),
+            sa.Column('skills', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('extra', sa.JSON(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+    op.create_index(op.f('ix_resume_profiles_id'), 'resume_profiles', ['id'], unique=False, if_not_exists=True)
+
+def downgrade():
+    op.drop_index(op.f('ix_resume_profiles_id'), table_name='resume_profiles', if_exists=True)
+    op.drop_table('resume_profiles')
+    for table, column in reversed(COLUMNS):
+        op.drop_column(table, column.name)
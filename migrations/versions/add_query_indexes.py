@@ -0,0 +1,39 @@
+"""add composite indexes for job_postings, applications, resumes, schedules
+
+Revision ID: add_query_indexes
+Revises: add_extra_columns
+Create Date: 2026-10-18 12:00:00.000000
+
+crud.py와 화면의 조회 조건(플랫폼별 목록, 공고/이력서별 지원 현황과 일정, 기간별 지원 건수)이
+전체 테이블을 훑지 않도록 인덱스를 추가한다.
+models.py의 __table_args__와 같은 이름이며, database.init_db()가 먼저 만들었을 수 있으므로
+이미 있으면 건너뛴다.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_query_indexes'
+down_revision = 'add_extra_columns'
+branch_labels = None
+depends_on = None
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ('ix_job_postings_created_at_id', 'job_postings', ['created_at', 'id']),
+    ('ix_job_postings_platform_created_at_id', 'job_postings', ['platform', 'created_at', 'id']),
+    ('ix_applications_job_id_status', 'applications', ['job_id', 'status']),
+    ('ix_applications_resume_id_status', 'applications', ['resume_id', 'status']),
+    ('ix_applications_applied_at', 'applications', ['applied_at']),
+    ('ix_resumes_job_posting_id', 'resumes', ['job_posting_id']),
+    ('ix_schedules_job_posting_id_start_date', 'schedules', ['job_posting_id', 'start_date']),
+]
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    # 새 인덱스를 쿼리 플래너가 고르도록 통계 갱신
+    op.execute('ANALYZE')
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -1,11 +1,12 @@
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, ForeignKey, Boolean, event, JSON, create_engine
+    Column, Integer, String, Text, DateTime, ForeignKey, Boolean, event, JSON, Index
 )
 from sqlalchemy.orm import relationship, backref, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 import os
 from sqlalchemy.sql import func
+from db_engine import create_db_engine
 
 Base = declarative_base()
 
@@ -14,6 +15,10 @@ Base = declarative_base()
 # ----------------------
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # 채용공고 삭제/조회 시 연결된 자소서 찾기
+        Index("ix_resumes_job_posting_id", "job_posting_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -45,6 +50,14 @@ def delete_resume_file(mapper, connection, target):
 # ----------------------
 class JobPosting(Base):
     __tablename__ = "job_postings"
+    __table_args__ = (
+        # 목록 커서 페이지네이션 순서 (created_at, id)
+        Index("ix_job_postings_created_at_id", "created_at", "id"),
+        # 플랫폼별 목록 (같은 커서 순서)
+        Index("ix_job_postings_platform_created_at_id", "platform", "created_at", "id"),
+        # 마감 임박 공고 (deadline_at 범위 조회)
+        Index("ix_job_postings_deadline_at", "deadline_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     platform = Column(String, default="saramin")  # 플랫폼 구분
@@ -52,6 +65,8 @@ class JobPosting(Base):
     job_title = Column(String)
     description = Column(Text)
     deadline = Column(String)
+    deadline_at = Column(DateTime)  # deadline을 해석한 마감 일시 (deadline.parse_deadline)
+    deadline_kind = Column(String)  # fixed, rolling(상시채용), until_filled(채용시 마감)
     link = Column(String, unique=True)
     experience = Column(String)  # 경력
     education = Column(String)   # 학력
@@ -62,7 +77,8 @@ class JobPosting(Base):
     applied = Column(Boolean, default=False)
     application_status = Column(String, default="미지원")
     application_date = Column(DateTime)
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, default=datetime.now, server_default=func.now())
+    extra = Column(JSON)  # 컬럼이 없는 크롤링 필드 (지원기간, 회사정보 등)
     
     # 관계 설정
     resumes = relationship("Resume", back_populates="job_posting")
@@ -74,11 +90,20 @@ class JobPosting(Base):
 # ----------------------
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # 공고별/이력서별 지원 현황 (공고/이력서 삭제 시 관계 로드 포함)
+        Index("ix_applications_job_id_status", "job_id", "status"),
+        Index("ix_applications_resume_id_status", "resume_id", "status"),
+        # 기간별 지원 건수(대시보드)
+        Index("ix_applications_applied_at", "applied_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("job_postings.id"))
     resume_id = Column(Integer, ForeignKey("resumes.id"))
     status = Column(String)  # 예: "지원중", "서류합격", "불합격" 등
+    applied_at = Column(DateTime)  # 지원일시
+    extra = Column(JSON)  # 공고명/회사명 사본 등 기타 필드
 
     # 관계
     job = relationship("JobPosting", back_populates="applications")
@@ -134,6 +159,10 @@ class PortfolioLink(Base):
 # ----------------------
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        # 채용공고별 일정 (공고 조회/삭제 시 관계 로드)
+        Index("ix_schedules_job_posting_id_start_date", "job_posting_id", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)  # 일정 제목
@@ -163,13 +192,29 @@ class ResumeQuestion(Base):
     # Relationship
     resume = relationship("Resume", back_populates="questions")
 
+# ----------------------
+# 9) ResumeProfile (이력서)
+# ----------------------
+class ResumeProfile(Base):
+    __tablename__ = "resume_profiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String)
+    email = Column(String)
+    phone = Column(String)
+    education = Column(Text)
+    experience = Column(Text)
+    skills = Column(Text)
+    created_at = Column(DateTime, default=datetime.now)
+    extra = Column(JSON)  # 수정일시 등 기타 필드
+
 # 데이터베이스 연결 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///./jobs.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# API(JSON 저장소 대체)와 crud가 함께 쓰는 단일 데이터베이스
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./jobs.db")
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 테이블 생성은 import 시점이 아니라 database.init_db()에서 수행 (서버 시작 시 호출)
 
 def get_db():
     db = SessionLocal()
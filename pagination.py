@@ -0,0 +1,54 @@
+# pagination.py
+"""
+커서(keyset) 페이지네이션용 토큰
+
+목록은 (created_at, id) 순서로 정렬되며, 토큰에는 기준 레코드의 (created_at, id)와
+방향(next: 이후 레코드, prev: 이전 레코드)이 들어간다. 클라이언트는 토큰 내용을 해석하지 않고
+응답의 next_cursor/prev_cursor를 그대로 다시 보내기만 하면 된다.
+"""
+from typing import Dict, List, NamedTuple, Optional
+import base64
+import json
+
+
+class Cursor(NamedTuple):
+    created_at: Optional[str]
+    id: str
+    direction: str  # "next" 또는 "prev"
+
+
+def encode_cursor(created_at, record_id, direction: str) -> str:
+    """기준 레코드와 방향을 불투명한 토큰 문자열로 변환"""
+    if created_at is not None and not isinstance(created_at, str):
+        created_at = created_at.isoformat()
+    payload = json.dumps({'c': created_at, 'i': str(record_id), 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Cursor:
+    """토큰을 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        cursor = Cursor(payload['c'], str(payload['i']), payload['d'])
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {token}") from e
+    if cursor.direction not in ("next", "prev"):
+        raise ValueError(f"잘못된 커서입니다: {token}")
+    return cursor
+
+
+def cursor_tokens(records: List[Dict], has_prev: bool, has_next: bool) -> Dict[str, Optional[str]]:
+    """
+    조회한 페이지의 첫/마지막 레코드로 이전/다음 페이지 토큰 생성
+
+    records는 JSON 저장소 모양의 dict 목록('id', 'created_at' 키 사용)
+    """
+    next_cursor = prev_cursor = None
+    if records and has_next:
+        last = records[-1]
+        next_cursor = encode_cursor(last.get('created_at'), last.get('id'), "next")
+    if records and has_prev:
+        first = records[0]
+        prev_cursor = encode_cursor(first.get('created_at'), first.get('id'), "prev")
+    return {'next_cursor': next_cursor, 'prev_cursor': prev_cursor}
@@ -0,0 +1,280 @@
+# reextract.py
+"""
+보관해 둔 원본 HTML(crawler.snapshot_archive)을 현재 추출 코드로 다시 추출해 바뀐 공고만 고치는 도구
+
+추출 로직(예: 사람인 근무조건 정규식, 잡코리아 마감일 규칙)을 고친 뒤 사이트를 다시 크롤링하지 않고
+지금까지 모은 공고 전체에 반영할 때 쓴다. 네트워크는 쓰지 않는다.
+
+- 보관소에서 URL마다 최신 스냅샷을 흘려보내며, job_postings에 같은 link가 있는 것만 처리
+- 여러 프로세스가 각자 보관소에서 본문을 읽어 사이트별 추출 함수(parse_job_detail)로 추출
+- 추출 결과를 현재 행과 비교해 바뀐 컬럼이 있는 공고만 crud.bulk_upsert_job_postings로 한꺼번에 저장
+- 배치 N을 저장하는 동안 워커는 배치 N+1을 추출
+
+지원 상태처럼 사용자가 관리하는 컬럼과 platform은 건드리지 않는다. 추출 함수가 내놓지 않은 컬럼도
+그대로 두고, 제목/회사명을 찾지 못한 결과(선택자가 깨진 페이지 등)는 저장하지 않는다.
+연도가 없는 마감일("~ 4/6")은 스냅샷을 처음 가져온 시각을 기준으로 연도를 정한다.
+
+사용 예:
+    python reextract.py --dry-run                 # 바뀔 공고 수만 확인
+    python reextract.py --site Saramin --workers 8
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import argparse
+import itertools
+import logging
+import os
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from crawler.snapshot_archive import Snapshot, SnapshotArchive
+from database import JOB_POSTING_MAPPING
+from deadline import annotate_deadline
+from models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+# 다시 추출해서 고칠 수 있는 컬럼 (platform은 저장 경로마다 표기가 달라 비교하지 않음)
+REEXTRACT_COLUMNS = tuple(column for column in crud.UPSERT_COLUMNS if column != 'platform')
+# 하나라도 바뀌면 셋을 함께 저장 (bulk_upsert가 deadline만 보고 지금 시각 기준으로 다시 계산하지 않도록)
+DEADLINE_COLUMNS = ('deadline', 'deadline_at', 'deadline_kind')
+# 추출 함수가 값을 찾지 못했을 때 넣는 기본값
+MISSING_VALUES = frozenset({'', '회사명 없음', '채용공고명 없음', '회사명 오류', '채용공고명 오류'})
+# job_postings 조회 시 IN 절 하나에 넣을 link 수
+LOOKUP_CHUNK_SIZE = 500
+
+
+def _saramin_extractor():
+    from crawler.final_saramin_crawler import FinalSaraminCrawler
+    return FinalSaraminCrawler().parse_job_detail
+
+
+def _incruit_extractor():
+    from crawler.incruit_crawler import IncruitCrawler
+    return IncruitCrawler().parse_job_detail
+
+
+def _jobplanet_extractor():
+    from crawler.jobplanet_crawler import JobPlanetCrawler
+    return JobPlanetCrawler().parse_job_detail
+
+
+def _jobkorea_extractor():
+    from crawler.jobkorea import parse_job_detail
+    return parse_job_detail
+
+
+def _wanted_extractor():
+    from crawler.wanted import parse_job_detail
+    return parse_job_detail
+
+
+# 스냅샷 site → (html, url)을 받아 크롤링 결과 dict를 돌려주는 추출 함수를 만드는 함수
+EXTRACTOR_FACTORIES: Dict[str, Callable[[], Callable[[str, str], Dict]]] = {
+    'Saramin': _saramin_extractor,
+    'Incruit': _incruit_extractor,
+    'JobPlanet': _jobplanet_extractor,
+    'JobKorea': _jobkorea_extractor,
+    'Wanted': _wanted_extractor,
+}
+
+_extractors: Dict[str, Callable[[str, str], Dict]] = {}
+_worker_archive: Optional[SnapshotArchive] = None
+
+
+def _extractor(site: str) -> Callable[[str, str], Dict]:
+    """사이트 추출 함수 (프로세스마다 한 번만 만듦)"""
+    extractor = _extractors.get(site)
+    if extractor is None:
+        extractor = _extractors[site] = EXTRACTOR_FACTORIES[site]()
+    return extractor
+
+
+def to_row(job_data: Dict) -> Dict:
+    """
+    추출 결과 → job_postings 행 (link와, 추출 함수가 내놓은 REEXTRACT_COLUMNS 컬럼과 extra만)
+    """
+    row = JOB_POSTING_MAPPING.to_row(job_data)
+    produced = {column for key, column in JOB_POSTING_MAPPING.fields.items() if key in job_data}
+    result = {column: row[column] for column in REEXTRACT_COLUMNS if column in produced}
+    if row['extra']:
+        result['extra'] = row['extra']
+    result['link'] = job_data['url']
+    return result
+
+
+def extract_snapshot(archive: SnapshotArchive, snapshot: Snapshot) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """
+    스냅샷 하나를 다시 추출
+
+    Returns:
+        (url, job_postings 행 또는 None, 실패 이유 또는 None)
+    """
+    try:
+        job_data = _extractor(snapshot.site)(archive.read(snapshot.sha256), snapshot.url)
+        if not job_data:
+            return snapshot.url, None, "추출 결과 없음"
+        missing = [key for key in ('title', 'company_name') if job_data.get(key, '') in MISSING_VALUES]
+        if missing:
+            return snapshot.url, None, f"필수 항목 없음: {', '.join(missing)}"
+        job_data['url'] = snapshot.url
+        annotate_deadline(job_data, now=datetime.fromtimestamp(snapshot.first_seen_at), overwrite=True)
+        return snapshot.url, to_row(job_data), None
+    except Exception as e:
+        return snapshot.url, None, f"{type(e).__name__}: {e}"
+
+
+def _init_worker(archive_root: str):
+    """워커 프로세스 준비: 보관소를 따로 열고, 필드마다 남기는 info 로그는 끔"""
+    global _worker_archive
+    _worker_archive = SnapshotArchive(archive_root)
+    logging.disable(logging.INFO)
+
+
+def _extract_in_worker(snapshot: Snapshot):
+    return extract_snapshot(_worker_archive, snapshot)
+
+
+def diff_row(current: Dict, row: Dict) -> Dict:
+    """현재 행과 다시 추출한 행에서 바뀐 컬럼만 (extra는 기존 값에 새 키를 덮어쓴 결과와 비교)"""
+    changes = {}
+    for column, value in row.items():
+        if column == 'link':
+            continue
+        if column == 'extra':
+            value = {**(current['extra'] or {}), **value}
+        if current[column] != value:
+            changes[column] = value
+    if changes.keys() & set(DEADLINE_COLUMNS):
+        changes.update({column: row[column] for column in DEADLINE_COLUMNS if column in row})
+    return changes
+
+
+def _current_rows(session, links: List[str]) -> Dict[str, Dict]:
+    table = JobPosting.__table__
+    columns = [table.c.link] + [table.c[column] for column in REEXTRACT_COLUMNS]
+    current = {}
+    for start in range(0, len(links), LOOKUP_CHUNK_SIZE):
+        query = select(*columns).where(table.c.link.in_(links[start:start + LOOKUP_CHUNK_SIZE]))
+        for row in session.execute(query):
+            current[row.link] = dict(row._mapping)
+    return current
+
+
+def _batches(snapshots: Iterable[Snapshot], batch_size: int) -> Iterator[List[Snapshot]]:
+    iterator = iter(snapshots)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _apply(session, results, current: Dict[str, Dict], dry_run: bool, counts: Counter, columns: Counter):
+    """한 배치의 추출 결과를 현재 행과 비교해 바뀐 공고만 저장"""
+    rows = []
+    for url, row, error in results:
+        if row is None:
+            counts['failed'] += 1
+            logger.debug(f"다시 추출 실패: {url}, {error}")
+            continue
+        changes = diff_row(current[url], row)
+        if not changes:
+            counts['unchanged'] += 1
+            continue
+        columns.update(changes.keys())
+        rows.append({'link': url, **changes})
+    if rows and not dry_run:
+        crud.bulk_upsert_job_postings(session, rows)
+    counts['updated'] += len(rows)
+
+
+def reextract(archive: SnapshotArchive = None, bind=None, site: str = None, workers: int = None,
+              batch_size: int = 2000, dry_run: bool = False) -> Dict:
+    """
+    보관된 스냅샷을 다시 추출해 job_postings의 바뀐 공고만 갱신
+
+    Args:
+        archive (SnapshotArchive): 스냅샷 보관소 (기본값: crawler/data/snapshots)
+        bind: 엔진 (기본값은 models.engine)
+        site (str): 이 사이트의 스냅샷만 (기본값: 추출 함수가 있는 모든 사이트)
+        workers (int): 추출 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 차례로)
+        batch_size (int): 한 번에 비교하고 저장할 스냅샷 수
+        dry_run (bool): 저장하지 않고 건수만 셈
+
+    Returns:
+        Dict: 건수 ('scanned' 읽은 스냅샷, 'skipped' 공고가 없는 스냅샷, 'failed' 추출 실패,
+              'unchanged', 'updated')와 'columns' (컬럼별 바뀐 공고 수)
+    """
+    if archive is None:
+        archive = SnapshotArchive()
+    if bind is None:
+        from models import engine as bind
+    if site is not None and site not in EXTRACTOR_FACTORIES:
+        raise ValueError(f"추출 함수가 없는 사이트입니다: {site} (가능: {', '.join(EXTRACTOR_FACTORIES)})")
+    workers = workers or os.cpu_count() or 1
+
+    counts: Counter = Counter({'scanned': 0, 'skipped': 0, 'failed': 0, 'unchanged': 0, 'updated': 0})
+    columns: Counter = Counter()
+    snapshots = (snapshot for snapshot in archive.iter_latest(site) if snapshot.site in EXTRACTOR_FACTORIES)
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(archive.root,)) if workers > 1 else None
+    Session = sessionmaker(bind=bind)
+    try:
+        with Session() as session:
+            pending = None
+            for batch in _batches(snapshots, batch_size):
+                current = _current_rows(session, [snapshot.url for snapshot in batch])
+                matched = [snapshot for snapshot in batch if snapshot.url in current]
+                counts['scanned'] += len(batch)
+                counts['skipped'] += len(batch) - len(matched)
+                batch = matched
+                if executor is not None:
+                    results = executor.map(_extract_in_worker, batch, chunksize=max(1, len(batch) // (workers * 4)))
+                else:
+                    results = (extract_snapshot(archive, snapshot) for snapshot in batch)
+                if pending is not None:
+                    _apply(session, pending[0], pending[1], dry_run, counts, columns)
+                    logger.info(f"다시 추출하는 중: {dict(counts)}")
+                pending = (results, current)
+            if pending is not None:
+                _apply(session, pending[0], pending[1], dry_run, counts, columns)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    result = dict(counts)
+    result['columns'] = dict(columns)
+    logger.info(f"다시 추출 완료: {result}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 원본 HTML을 다시 추출해 바뀐 채용 공고만 갱신")
+    parser.add_argument("--site", choices=sorted(EXTRACTOR_FACTORIES), default=None, help="대상 사이트 (기본값: 전체)")
+    parser.add_argument("--workers", type=int, default=None, help="추출 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=2000, help="한 번에 비교하고 저장할 스냅샷 수")
+    parser.add_argument("--archive-dir", default=None, help="스냅샷 보관 위치 (기본값: CRAWLER_SNAPSHOT_DIR)")
+    parser.add_argument("--database-url", default=None, help="대상 데이터베이스 URL (기본값: DATABASE_URL 또는 sqlite:///./jobs.db)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 바뀔 공고 수만 확인")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    from database import init_db
+    from db_engine import create_db_engine
+    bind = create_db_engine(args.database_url) if args.database_url else None
+    init_db(bind)
+    result = reextract(SnapshotArchive(args.archive_dir), bind, site=args.site, workers=args.workers,
+                       batch_size=args.batch_size, dry_run=args.dry_run)
+    action = "바뀔" if args.dry_run else "갱신"
+    print(f"스냅샷 {result['scanned']}건 중 {action} 공고 {result['updated']}건 "
+          f"(그대로 {result['unchanged']}건, 추출 실패 {result['failed']}건, 공고 없음 {result['skipped']}건)")
+    for column, count in sorted(result['columns'].items(), key=lambda item: -item[1]):
+        print(f"  {column}: {count}건")
+
+
+if __name__ == "__main__":
+    main()
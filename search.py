@@ -0,0 +1,232 @@
+# search.py
+"""
+채용 공고 전문 검색 (SQLite FTS5 trigram)
+
+job_postings의 공고명/회사명/상세 내용/복리후생을 external content FTS5 테이블(job_postings_fts)에
+trigram 토크나이저로 색인한다. trigram은 공백이 없는 한글 부분 문자열("개발자" → "백엔드개발자")도
+찾을 수 있고, 색인은 job_postings의 INSERT/UPDATE/DELETE 트리거로 항상 함께 갱신된다.
+
+trigram 색인은 세 글자 이상만 찾을 수 있으므로 두 글자 이하 검색어("AI", "개발")는
+MATCH로 후보를 줄인 뒤 LIKE로 거르고, 검색어가 모두 짧으면 LIKE만으로 찾는다.
+JSON 저장소는 같은 결과 모양을 만드는 전체 순회 검색(search_records)을 사용한다.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "job_postings_fts"
+
+# 검색 대상 필드 (JSON 저장소 필드 → job_postings 컬럼, BM25 가중치)
+SEARCH_FIELDS = (
+    ('title', 'job_title', 10.0),
+    ('company_name', 'company_name', 5.0),
+    ('description', 'description', 1.0),
+    ('welfare_benefits', 'welfare_benefits', 1.0),
+)
+SEARCH_COLUMNS = [column for _, column, _ in SEARCH_FIELDS]
+
+MAX_QUERY_LENGTH = 200
+MIN_TRIGRAM_LENGTH = 3
+SNIPPET_WIDTH = 80
+RANK_WINDOW = 10000  # 관련도 순위를 매길 최근 일치 공고 수 상한
+
+_COLUMN_LIST = ", ".join(SEARCH_COLUMNS)
+_NEW_VALUES = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+_OLD_VALUES = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+
+_TRIGGERS = {
+    "job_postings_fts_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS job_postings_fts_ai AFTER INSERT ON job_postings BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_LIST}) VALUES (new.id, {_NEW_VALUES});
+        END""",
+    "job_postings_fts_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS job_postings_fts_ad AFTER DELETE ON job_postings BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMN_LIST}) VALUES ('delete', old.id, {_OLD_VALUES});
+        END""",
+    "job_postings_fts_au": f"""
+        CREATE TRIGGER IF NOT EXISTS job_postings_fts_au AFTER UPDATE OF id, {_COLUMN_LIST} ON job_postings BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMN_LIST}) VALUES ('delete', old.id, {_OLD_VALUES});
+            INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_LIST}) VALUES (new.id, {_NEW_VALUES});
+        END""",
+}
+
+
+def ensure_search_index(conn) -> bool:
+    """
+    FTS5 테이블과 동기화 트리거가 없으면 만들고, 새로 만들었거나 트리거가 빠져 있었으면
+    job_postings 전체로 색인을 다시 구성 (SQLite가 아니거나 FTS5가 없으면 False)
+
+    job_postings를 DROP하면 트리거도 함께 지워지므로, 트리거가 없다는 것은
+    색인이 테이블과 어긋났을 수 있다는 뜻이다.
+    """
+    if conn.dialect.name != "sqlite":
+        return False
+    existing = {row[0] for row in conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE 'job_postings_fts%'"))}
+    try:
+        if FTS_TABLE not in existing:
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({_COLUMN_LIST}, "
+                f"content='job_postings', content_rowid='id', tokenize='trigram')"))
+        for ddl in _TRIGGERS.values():
+            conn.execute(text(ddl))
+    except OperationalError as e:
+        logger.warning(f"FTS5 검색 색인을 만들 수 없습니다 (SQLite FTS5/trigram 지원 필요): {e}")
+        return False
+    if not existing.issuperset({FTS_TABLE, *_TRIGGERS}):
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        logger.info("채용 공고 검색 색인 재구성 완료")
+    return True
+
+
+def parse_query(query: str) -> List[str]:
+    """검색어를 공백 기준 단어 목록으로 분리 (비었거나 너무 길면 ValueError)"""
+    query = (query or "").strip()
+    if not query:
+        raise ValueError("검색어를 입력하세요.")
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValueError(f"검색어는 {MAX_QUERY_LENGTH}자 이하로 입력하세요.")
+    terms = []
+    for term in query.split():
+        if term.lower() not in (t.lower() for t in terms):
+            terms.append(term)
+    return terms
+
+
+def _match_expression(terms: Iterable[str]) -> str:
+    """각 단어를 따옴표로 감싼 구문으로 만들어 AND 검색 (FTS5 연산자/특수문자 무력화)"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_job_ids(conn, terms: List[str], limit: int, offset: int = 0) -> Tuple[List[Tuple[int, float]], int, bool]:
+    """
+    FTS5 색인에서 검색어를 모두 포함하는 채용 공고 id를 BM25 순으로 조회
+
+    일치하는 공고가 RANK_WINDOW건을 넘으면 가장 최근(id가 큰) RANK_WINDOW건 안에서만 순위를 매긴다.
+    BM25는 일치하는 모든 문서의 점수를 계산해야 하므로, "개발자"처럼 대부분의 공고에 나오는
+    검색어도 rowid 범위 조건으로 계산량을 묶어 두기 위함이다.
+
+    Returns:
+        ([(job_id, 점수)], 일치 건수(최대 RANK_WINDOW), 건수가 RANK_WINDOW에서 잘렸는지 여부)
+        점수는 높을수록 관련도가 높음
+    """
+    long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_TRIGRAM_LENGTH]
+
+    conditions, params = [], {}
+    if long_terms:
+        conditions.append(f"{FTS_TABLE} MATCH :match")
+        params['match'] = _match_expression(long_terms)
+    for i, term in enumerate(short_terms):
+        params[f'like{i}'] = _like_pattern(term)
+        conditions.append("(" + " OR ".join(f"{column} LIKE :like{i} ESCAPE '\\'" for column in SEARCH_COLUMNS) + ")")
+    where = " AND ".join(conditions)
+    # 짧은 검색어만 있으면 색인을 쓸 수 없으므로 FTS 테이블을 거치지 않고 원본 테이블을 바로 훑음
+    source = FTS_TABLE if long_terms else "job_postings"
+
+    # 최근 RANK_WINDOW번째 일치 공고의 id (없으면 전체가 창 안에 들어옴)
+    floor = conn.execute(text(
+        f"SELECT rowid FROM {source} WHERE {where} ORDER BY rowid DESC LIMIT 1 OFFSET :window"),
+        {**params, 'window': RANK_WINDOW}).scalar()
+    capped = floor is not None
+    if capped:
+        where += " AND rowid > :floor"
+        params['floor'] = floor
+
+    if long_terms:
+        weights = ", ".join(str(weight) for _, _, weight in SEARCH_FIELDS)
+        score, order = f"-bm25({FTS_TABLE}, {weights})", "score DESC, rowid DESC"
+    else:
+        score, order = "0.0", "rowid DESC"
+
+    rows = conn.execute(text(
+        f"SELECT rowid, {score} AS score FROM {source} WHERE {where} "
+        f"ORDER BY {order} LIMIT :limit OFFSET :offset"), {**params, 'limit': limit, 'offset': offset}).all()
+    total = RANK_WINDOW if capped else conn.execute(text(f"SELECT count(*) FROM {source} WHERE {where}"), params).scalar()
+    return [(row[0], float(row[1])) for row in rows], total, capped
+
+
+def highlight_offsets(value: Optional[str], terms: Iterable[str]) -> List[List[int]]:
+    """value 안에서 검색어가 나오는 [시작, 끝) 문자 위치 목록 (대소문자 무시, 겹치면 합침)"""
+    if not value:
+        return []
+    lowered = value.lower()
+    spans = []
+    for term in terms:
+        needle = term.lower()
+        start = lowered.find(needle)
+        while start != -1:
+            spans.append([start, start + len(needle)])
+            start = lowered.find(needle, start + 1)
+    spans.sort()
+    merged: List[List[int]] = []
+    for span in spans:
+        if merged and span[0] <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], span[1])
+        else:
+            merged.append(span)
+    return merged
+
+
+def make_snippet(record: Dict, terms: List[str], width: int = SNIPPET_WIDTH) -> Optional[Dict]:
+    """
+    검색어가 처음 나오는 본문(상세 내용, 복리후생 순) 주변 width자와 그 안의 강조 위치
+
+    본문에 없으면 공고명/회사명에서 찾는다. 강조 위치는 text 기준 [시작, 끝) 목록.
+    """
+    for field in ('description', 'welfare_benefits', 'title', 'company_name'):
+        value = record.get(field)
+        spans = highlight_offsets(value, terms)
+        if not spans:
+            continue
+        start = max(0, min(spans[0][0] - width // 4, len(value) - width))
+        end = min(len(value), start + width)
+        excerpt = value[start:end].replace("\n", " ")  # 길이를 유지해 강조 위치가 어긋나지 않게 함
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(value) else ""
+        shift = len(prefix) - start
+        highlights = [[max(s, start) + shift, min(e, end) + shift] for s, e in spans if s < end and e > start]
+        return {'field': field, 'text': prefix + excerpt + suffix, 'highlights': highlights}
+    return None
+
+
+def build_hit(record: Dict, terms: List[str], score: float) -> Dict:
+    """검색 결과 한 건: 채용 공고 + 점수 + 스니펫 + 필드별 강조 위치"""
+    highlights = {}
+    for field, _, _ in SEARCH_FIELDS:
+        spans = highlight_offsets(record.get(field), terms)
+        if spans:
+            highlights[field] = spans
+    return {**record, 'score': round(score, 4), 'snippet': make_snippet(record, terms), 'highlights': highlights}
+
+
+def search_records(records: Iterable[Dict], terms: List[str], limit: int, offset: int = 0) -> Tuple[List[Dict], int]:
+    """
+    JSON 저장소용 검색: 모든 검색어를 포함하는 레코드를 가중치 합(필드 가중치 × 등장 횟수) 순으로 정렬
+
+    Returns:
+        (검색 결과 목록, 전체 일치 건수)
+    """
+    scored = []
+    for record in records:
+        haystacks = [(str(record.get(field) or "").lower(), weight) for field, _, weight in SEARCH_FIELDS]
+        score = 0.0
+        for term in terms:
+            needle = term.lower()
+            hits = sum(weight * haystack.count(needle) for haystack, weight in haystacks)
+            if not hits:
+                break
+            score += hits
+        else:
+            scored.append((score, record))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [build_hit(record, terms, score) for score, record in scored[offset:offset + limit]], len(scored)
@@ -0,0 +1,1097 @@
+# storage.py
+"""
+JSON 파일 기반 저장소 구현
+
+- JsonCollection: JSON 배열 파일 하나를 통째로 읽고 쓰는 기존 방식
+- JsonlCollection: 추가 전용(append-only) JSONL 로그와 메모리 인덱스를 사용하는 방식
+
+여러 uvicorn 워커(프로세스)가 같은 데이터 파일을 쓰더라도 안전하도록
+- 쓰기는 파일별 권고 잠금(<파일>.lock)을 잡은 상태에서만 수행하고
+- JSON 파일은 임시 파일에 쓴 뒤 os.replace로 교체하며
+- 동시에 들어온 쓰기들은 한 번의 커밋(fsync 1회)으로 묶어서 처리한다.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+from itertools import islice
+import bisect
+import json
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+class FieldIndex:
+    """레코드 필드 값 → id 해시 인덱스 (같은 값을 가진 레코드가 여럿이면 마지막에 쓴 레코드를 가리킴)"""
+
+    def __init__(self, field: str):
+        self.field = field
+        self._ids: Dict[object, str] = {}
+        self._values: Dict[str, object] = {}
+
+    def add(self, record_id: str, record: Dict):
+        self.remove(record_id)
+        value = record.get(self.field)
+        if value:
+            self._ids[value] = record_id
+            self._values[record_id] = value
+
+    def remove(self, record_id: str):
+        value = self._values.pop(record_id, None)
+        if value is not None and self._ids.get(value) == record_id:
+            del self._ids[value]
+
+    def lookup(self, value) -> Optional[str]:
+        return self._ids.get(value)
+
+
+class GroupCounter:
+    """레코드를 key_func 결과별로 센 집계 (쓰기마다 해당 키의 개수만 증감)"""
+
+    def __init__(self, key_func: Callable[[Dict], Optional[str]]):
+        self.key_func = key_func
+        self._keys: Dict[str, str] = {}
+        self._counts: Dict[str, int] = {}
+
+    def add(self, record_id: str, record: Dict):
+        self.remove(record_id)
+        key = self.key_func(record)
+        if key is not None:
+            self._keys[record_id] = key
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def remove(self, record_id: str):
+        key = self._keys.pop(record_id, None)
+        if key is not None:
+            self._counts[key] -= 1
+            if not self._counts[key]:
+                del self._counts[key]
+
+    def get(self, key: str) -> int:
+        return self._counts.get(key, 0)
+
+
+class SortedIndex:
+    """key_func 값 순(같으면 id 순)으로 정렬한 레코드 id 목록 (범위 조회를 bisect로 처리)"""
+
+    def __init__(self, key_func: Callable[[Dict], Optional[str]]):
+        self.key_func = key_func
+        self._entries: List[Tuple] = []
+        self._keys: Dict[str, Tuple] = {}
+
+    @staticmethod
+    def _id_order(record_id) -> int:
+        return int(record_id) if str(record_id).isdigit() else 0
+
+    def add(self, record_id: str, record: Dict):
+        self.remove(record_id)
+        value = self.key_func(record)
+        if value is not None:
+            entry = (value, self._id_order(record_id), record_id)
+            bisect.insort(self._entries, entry)
+            self._keys[record_id] = entry
+
+    def remove(self, record_id: str):
+        entry = self._keys.pop(record_id, None)
+        if entry is not None:
+            del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def range(self, low, high) -> List[str]:
+        """값이 low 이상 high 이하인 레코드 id (값, id 순)"""
+        start = bisect.bisect_left(self._entries, (low,))
+        end = bisect.bisect_right(self._entries, (high, math.inf))
+        return [entry[2] for entry in self._entries[start:end]]
+
+
+def build_indexes(index_fields: Tuple[str, ...], counters: Dict[str, Callable],
+                  sorted_indexes: Dict[str, Callable]) -> Dict[str, object]:
+    """컬렉션이 관리할 보조 인덱스(필드 인덱스, 집계, 정렬 인덱스) 생성"""
+    indexes: Dict[str, object] = {field: FieldIndex(field) for field in index_fields}
+    indexes.update({name: GroupCounter(key_func) for name, key_func in counters.items()})
+    indexes.update({name: SortedIndex(key_func) for name, key_func in sorted_indexes.items()})
+    return indexes
+
+
+def _fsync_dir(directory: str):
+    """os.replace로 바뀐 디렉토리 항목까지 디스크에 반영 (POSIX 전용)"""
+    if os.name == 'nt':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: str, data: bytes):
+    """
+    같은 디렉토리의 임시 파일에 쓰고 fsync한 뒤 os.replace로 교체
+
+    읽는 쪽은 항상 이전 내용 전체 또는 새 내용 전체만 보게 되고,
+    쓰는 도중 프로세스가 죽어도 원본 파일은 손상되지 않는다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp는 0600으로 만들므로 기존 파일 권한을 유지
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+class FileLock:
+    """
+    프로세스 간 권고 잠금(advisory lock)
+
+    데이터 파일 옆의 <파일>.lock에 flock(Windows는 msvcrt.locking)을 건다.
+    같은 프로세스 안에서는 재진입 가능하며, 스레드 간에도 배타적으로 동작한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._handle = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._handle = open(self.path, 'a+b')
+                self._lock_handle(self._handle)
+            except BaseException:
+                if self._handle:
+                    self._handle.close()
+                    self._handle = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock_handle(self._handle)
+            finally:
+                self._handle.close()
+                self._handle = None
+        self._thread_lock.release()
+
+    @staticmethod
+    def _lock_handle(handle):
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            return
+        handle.seek(0)
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK은 약 10초 동안만 재시도하므로 잠금을 얻을 때까지 반복
+                time.sleep(0.05)
+
+    @staticmethod
+    def _unlock_handle(handle):
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            return
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def lock_path_for(file_path: str) -> str:
+    """데이터 파일에 대응하는 잠금 파일 경로 (json/jsonl 저장 방식이 같은 잠금을 공유)"""
+    return os.path.splitext(file_path)[0] + ".lock"
+
+
+def compact_lock_path_for(file_path: str) -> str:
+    """JSONL 로그 압축 전용 잠금 파일 경로 (압축 중에도 쓰기 잠금은 잡지 않기 위해 분리)"""
+    return os.path.splitext(file_path)[0] + ".compact.lock"
+
+
+class _PendingWrite:
+    """그룹 커밋을 기다리는 쓰기 한 건"""
+
+    def __init__(self, apply: Callable):
+        self.apply = apply
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class GroupCommit:
+    """
+    동시에 들어온 쓰기들을 한 번의 커밋으로 묶는 그룹 커밋
+
+    커밋 잠금을 먼저 얻은 스레드가 그때까지 쌓인 쓰기를 모두 가져가 commit_fn(batch)로
+    한 번에 처리한다. 앞선 커밋(fsync)을 기다리는 동안 들어온 쓰기들이 다음 배치로 묶이므로
+    쓰기가 몰릴수록 fsync 횟수가 줄어든다.
+    commit_fn은 각 쓰기의 apply()를 순서대로 호출해 result를 채우고, 실패 시 예외를 던진다.
+    """
+
+    def __init__(self, commit_fn: Callable[[List[_PendingWrite]], None]):
+        self._commit_fn = commit_fn
+        self._pending: List[_PendingWrite] = []
+        self._pending_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+
+    def submit(self, apply: Callable):
+        write = _PendingWrite(apply)
+        with self._pending_lock:
+            self._pending.append(write)
+        with self._commit_lock:
+            if not write.done:
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                try:
+                    self._commit_fn(batch)
+                except BaseException as e:
+                    for pending in batch:
+                        pending.error = e
+                for pending in batch:
+                    pending.done = True
+        if write.error is not None:
+            raise write.error
+        return write.result
+
+
+class IdAllocator:
+    """
+    단조 증가 id 발급기
+
+    마지막으로 발급한 번호를 별도 파일(.seq)에 기록해 두어, 레코드를 삭제한 뒤에도
+    같은 id가 다시 발급되지 않는다. (len(records) + 1 방식은 삭제 후 id가 겹침)
+    여러 프로세스가 함께 쓰므로 sync → reserve → persist는 파일 잠금을 잡은 커밋 안에서 호출해야 한다.
+    그룹 커밋 한 번에 여러 건을 발급해도 .seq 파일은 persist에서 한 번만 쓴다.
+    """
+
+    def __init__(self, seq_path: str):
+        self.seq_path = seq_path
+        self._stored = self._read()
+        self._last = self._stored
+
+    def _read(self) -> int:
+        try:
+            with open(self.seq_path, 'r', encoding='utf-8') as f:
+                return int(f.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def observe(self, record_id):
+        """이미 존재하는 레코드의 id를 반영 (숫자가 아닌 id는 무시)"""
+        try:
+            number = int(record_id)
+        except (TypeError, ValueError):
+            return
+        if number > self._last:
+            self._last = number
+
+    def sync(self):
+        """다른 프로세스가 기록한 마지막 번호를 반영"""
+        self._stored = self._read()
+        self._last = max(self._last, self._stored)
+
+    def reserve(self) -> str:
+        """다음 번호 발급 (메모리에서만 증가, 파일에는 persist에서 기록)"""
+        self._last += 1
+        return str(self._last)
+
+    def persist(self):
+        """발급한 마지막 번호를 .seq 파일에 기록 (바뀐 경우에만)"""
+        if self._last != self._stored:
+            atomic_write(self.seq_path, str(self._last).encode('utf-8'))
+            self._stored = self._last
+
+    def next_id(self) -> str:
+        self.sync()
+        record_id = self.reserve()
+        self.persist()
+        return record_id
+
+
+def seq_path_for(file_path: str) -> str:
+    """데이터 파일에 대응하는 id 시퀀스 파일 경로 (json/jsonl 저장 방식이 같은 파일을 공유)"""
+    return os.path.splitext(file_path)[0] + ".seq"
+
+
+def _id_key(record_id) -> Tuple[int, int, str]:
+    """id 정렬 키 (숫자 id는 숫자 순, 그 외는 문자열 순으로 뒤에)"""
+    try:
+        return 0, int(record_id), ''
+    except (TypeError, ValueError):
+        return 1, 0, str(record_id)
+
+
+def _insertion_point(count: int, id_at: Callable[[int], str], record_id) -> int:
+    """
+    삽입 순서로 정렬된 레코드에서 record_id보다 id가 큰 첫 위치 (이분 탐색)
+
+    id는 단조 증가로 발급되므로 삽입 순서가 곧 id 순서다. 커서가 가리키던 레코드가
+    삭제된 경우에도 그 다음 위치부터 이어서 조회할 수 있다.
+    """
+    key = _id_key(record_id)
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if _id_key(id_at(middle)) <= key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def page_bounds(count: int, position: Optional[int], found: bool, direction: Optional[str],
+                limit: int) -> Tuple[int, int]:
+    """
+    커서 위치 기준으로 가져올 [start, end) 구간 계산
+
+    Args:
+        count: 전체 레코드 수
+        position: 커서 레코드 위치 (삭제된 경우 그 다음 레코드가 들어갈 위치)
+        found: 커서 레코드가 아직 존재하는지
+        direction: "next"(커서 이후) / "prev"(커서 이전) / None(첫 페이지)
+    """
+    if direction is None:
+        return 0, min(limit, count)
+    if direction == "next":
+        start = position + 1 if found else position
+        return start, min(count, start + limit)
+    end = position
+    return max(0, end - limit), end
+
+
+class JsonCollection:
+    """
+    JSON 배열 파일 하나를 컬렉션으로 다루는 저장소 (쓰기마다 파일 전체를 다시 씀)
+
+    파싱한 레코드 목록은 메모리에 보관하고, 파일이 바뀐 경우(inode/mtime/크기)에만 다시 읽는다.
+    쓰기는 기존 목록을 고치지 않고 새 목록을 만들어 교체(copy-on-write)하므로,
+    조회 메서드가 돌려준 목록과 레코드는 이후 쓰기의 영향을 받지 않는다.
+    (호출자도 돌려받은 목록/레코드를 직접 수정해서는 안 된다)
+
+    쓰기는 파일 잠금을 잡고 최신 파일 내용 위에 적용한 뒤 원자적으로 교체하므로
+    다른 프로세스의 쓰기를 덮어쓰지 않는다.
+    """
+
+    def __init__(self, file_path: str, index_fields: Tuple[str, ...] = (),
+                 counters: Optional[Dict[str, Callable]] = None, sorted_indexes: Optional[Dict[str, Callable]] = None):
+        self.file_path = file_path
+        self.index_fields = tuple(index_fields)
+        self.counters = dict(counters or {})
+        self.sorted_indexes = dict(sorted_indexes or {})
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(lock_path_for(file_path))
+        self._group = GroupCommit(self._commit)
+        self._records: List[Dict] = []
+        self._by_id: Dict[str, Dict] = {}
+        self._positions: Dict[str, int] = {}
+        self._indexes: Dict[str, object] = build_indexes(self.index_fields, self.counters, self.sorted_indexes)
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._ids = IdAllocator(seq_path_for(file_path))
+        if not os.path.exists(file_path):
+            with self._file_lock:
+                if not os.path.exists(file_path):
+                    self.save([])
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.file_path)
+            return st.st_ino, st.st_mtime_ns, st.st_size
+        except FileNotFoundError:
+            return None
+
+    def _read(self) -> Optional[List[Dict]]:
+        """파일 내용을 파싱 (읽을 수 없으면 None을 반환해 마지막 정상 캐시를 유지)"""
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except json.JSONDecodeError:
+            backup_path = f"{self.file_path}.corrupt"
+            logger.error(f"JSON 파일 디코딩 오류, 마지막 정상 데이터를 유지합니다: {self.file_path} (원본 백업: {backup_path})")
+            try:
+                shutil.copyfile(self.file_path, backup_path)
+            except OSError as e:
+                logger.error(f"손상된 파일 백업 중 오류: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"데이터 로드 중 오류: {e}")
+            return None
+
+    def _write_file(self, records: List[Dict]):
+        data = json.dumps(records, ensure_ascii=False, indent=2).encode('utf-8')
+        atomic_write(self.file_path, data)
+        self._stamp = self._stat()
+        logger.info(f"데이터 저장 완료: {self.file_path}")
+
+    def _snapshot(self) -> List[Dict]:
+        """캐시된 레코드 목록 반환 (파일이 바뀐 경우에만 다시 파싱)"""
+        if self._stat() == self._stamp:
+            return self._records
+        with self._lock:
+            # 읽기 전에 stat을 잡아 두어야 읽는 도중 바뀐 내용을 다음 조회에서 다시 읽는다
+            stamp = self._stat()
+            if stamp != self._stamp:
+                records = self._read()
+                if records is not None:
+                    self._set_records(records)
+                    logger.debug(f"데이터 파일 다시 로드: {self.file_path} ({len(self._records)}건)")
+                self._stamp = stamp
+            return self._records
+
+    def _set_records(self, records: List[Dict]):
+        """레코드 목록을 교체하고 id/보조 인덱스를 다시 만든다"""
+        self._records = records
+        self._by_id = {}
+        self._positions = {}
+        self._indexes = build_indexes(self.index_fields, self.counters, self.sorted_indexes)
+        for position, record in enumerate(records):
+            self._ids.observe(record.get('id'))
+            self._index_record(record, position)
+
+    def _index_record(self, record: Dict, position: int):
+        record_id = record.get('id')
+        self._by_id[record_id] = record
+        self._positions[record_id] = position
+        for index in self._indexes.values():
+            index.add(record_id, record)
+
+    def _unindex_record(self, record_id: str):
+        del self._by_id[record_id]
+        del self._positions[record_id]
+        for index in self._indexes.values():
+            index.remove(record_id)
+
+    def _commit(self, batch: List[_PendingWrite]):
+        """쌓인 쓰기를 최신 파일 내용 위에 순서대로 적용하고 한 번에 저장"""
+        with self._lock, self._file_lock:
+            previous = self._snapshot()
+            records = list(previous)
+            self._ids.sync()
+            try:
+                changed = False
+                for write in batch:
+                    write.result = write.apply(records)
+                    changed = changed or bool(write.result)
+                if changed:
+                    self._write_file(records)
+                    self._records = records
+                    # 레코드가 먼저 저장돼야 중간에 죽어도 다시 읽을 때 id를 관찰해 복원할 수 있음
+                    self._ids.persist()
+            except BaseException:
+                self._set_records(previous)
+                raise
+
+    def load(self) -> List[Dict]:
+        """JSON 파일에서 데이터 로드"""
+        return list(self._snapshot())
+
+    def save(self, records: List[Dict]):
+        """데이터를 JSON 파일로 저장"""
+        with self._lock, self._file_lock:
+            self._write_file(records)
+            self._set_records(records)
+
+    def all(self) -> List[Dict]:
+        return self._snapshot()
+
+    def slice(self, skip: int, limit: int) -> List[Dict]:
+        return self._snapshot()[skip:skip + limit]
+
+    def page(self, cursor_id: Optional[str], direction: Optional[str], limit: int) -> Tuple[List[Dict], bool, bool]:
+        """
+        커서 기준 페이지 조회 (건너뛸 레코드를 훑지 않고 id → 위치 인덱스로 바로 이동)
+
+        Returns:
+            (레코드 목록, 이전 페이지 존재 여부, 다음 페이지 존재 여부)
+        """
+        with self._lock:
+            records = self._snapshot()
+            position = self._positions.get(cursor_id)
+            found = position is not None
+            if direction is not None and not found:
+                position = _insertion_point(len(records), lambda i: records[i].get('id'), cursor_id)
+            start, end = page_bounds(len(records), position, found, direction, limit)
+            return records[start:end], start > 0, end < len(records)
+
+    def count(self) -> int:
+        return len(self._snapshot())
+
+    def get(self, record_id: str) -> Optional[Dict]:
+        with self._lock:
+            self._snapshot()
+            return self._by_id.get(record_id)
+
+    def find_by(self, field: str, value) -> Optional[Dict]:
+        """색인된 필드 값으로 레코드 조회"""
+        with self._lock:
+            self._snapshot()
+            record_id = self._indexes[field].lookup(value)
+            return self._by_id.get(record_id) if record_id is not None else None
+
+    def count_by(self, counter: str, key: str) -> int:
+        """집계(counter)에서 key에 해당하는 레코드 수 조회"""
+        with self._lock:
+            self._snapshot()
+            return self._indexes[counter].get(key)
+
+    def range_by(self, name: str, low, high, skip: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """
+        정렬 인덱스(name) 값이 low 이상 high 이하인 레코드 조회 (값, id 순)
+
+        Returns:
+            (skip/limit 구간의 레코드 목록, 범위 안 전체 건수)
+        """
+        with self._lock:
+            self._snapshot()
+            ids = self._indexes[name].range(low, high)
+            end = None if limit is None else skip + limit
+            return [self._by_id[record_id] for record_id in ids[skip:end]], len(ids)
+
+    def allocate_id(self) -> str:
+        with self._lock, self._file_lock:
+            self._snapshot()
+            return self._ids.next_id()
+
+    def insert(self, record: Dict) -> Dict:
+        """레코드 추가 (id가 없으면 커밋 안에서 발급해 record['id']에 넣음)"""
+        def apply(records: List[Dict]) -> Dict:
+            if record.get('id') is None:
+                record['id'] = self._ids.reserve()
+            records.append(record)
+            self._index_record(record, len(records) - 1)
+            return record
+        return self._group.submit(apply)
+
+    def replace(self, record_id: str, record: Dict) -> bool:
+        def apply(records: List[Dict]) -> bool:
+            position = self._positions.get(record_id)
+            if position is None:
+                return False
+            records[position] = record
+            self._index_record(record, position)
+            return True
+        return self._group.submit(apply)
+
+    def upsert_many(self, field: str, records: List[Dict],
+                    merge: Callable[[Optional[Dict], Dict], Optional[Dict]]) -> Dict[str, int]:
+        """
+        색인된 field 값 기준으로 여러 건을 한 번의 커밋(파일 쓰기 1회)에 추가/갱신
+
+        merge(기존 레코드 또는 None, 새 레코드)는 저장할 레코드를 돌려주고, 바뀐 것이 없으면 None을 돌려준다.
+        조회와 쓰기가 같은 파일 잠금 안에서 일어나므로 다른 프로세스가 같은 값을 먼저 넣었어도 중복되지 않는다.
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+        def apply(stored: List[Dict]) -> int:
+            for record in records:
+                record_id = self._indexes[field].lookup(record.get(field))
+                existing = self._by_id.get(record_id) if record_id is not None else None
+                merged = merge(existing, record)
+                if merged is None:
+                    counts['unchanged'] += 1
+                elif existing is None:
+                    if merged.get('id') is None:
+                        merged['id'] = self._ids.reserve()
+                    stored.append(merged)
+                    self._index_record(merged, len(stored) - 1)
+                    counts['inserted'] += 1
+                else:
+                    merged['id'] = record_id
+                    position = self._positions[record_id]
+                    stored[position] = merged
+                    self._index_record(merged, position)
+                    counts['updated'] += 1
+            return counts['inserted'] + counts['updated']
+
+        self._group.submit(apply)
+        return counts
+
+    def delete(self, record_id: str) -> bool:
+        def apply(records: List[Dict]) -> bool:
+            position = self._positions.get(record_id)
+            if position is None:
+                return False
+            del records[position]
+            self._unindex_record(record_id)
+            # 삭제된 위치 뒤의 레코드들은 한 칸씩 당겨짐
+            for shifted in range(position, len(records)):
+                self._positions[records[shifted].get('id')] = shifted
+            return True
+        return self._group.submit(apply)
+
+
+class JsonlCollection:
+    """
+    추가 전용 JSONL 로그 기반 컬렉션
+
+    모든 쓰기는 로그 끝에 한 줄({"op": "put"|"del", "id": ..., "data": ...})을 추가하고,
+    메모리의 id → (오프셋, 길이) 인덱스로 해당 줄만 읽어 조회한다.
+    수정/삭제로 쌓인 죽은 줄이 많아지면 백그라운드 스레드가 살아있는 레코드만 모아
+    새 스냅샷으로 압축(compaction)한다.
+
+    다른 프로세스가 추가한 줄은 조회 시 파일 크기를 확인해 이어서 읽고,
+    다른 프로세스가 압축해 파일이 교체되면(inode 변경) 처음부터 다시 읽는다.
+    """
+
+    # 죽은 줄이 이 개수 이상이면서 살아있는 레코드 수 대비 비율을 넘으면 압축
+    COMPACT_MIN_DEAD = 1000
+    COMPACT_RATIO = 0.5
+
+    _instances: Dict[str, 'JsonlCollection'] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def open(cls, file_path: str, seed_path: Optional[str] = None, index_fields: Tuple[str, ...] = (),
+             counters: Optional[Dict[str, Callable]] = None,
+             sorted_indexes: Optional[Dict[str, Callable]] = None) -> 'JsonlCollection':
+        """
+        같은 파일에 대해서는 프로세스 내에서 하나의 인스턴스만 사용
+        (인스턴스마다 인덱스와 파일 핸들을 따로 가질 이유가 없음)
+        """
+        key = os.path.abspath(file_path)
+        with cls._instances_lock:
+            collection = cls._instances.get(key)
+            if collection is None:
+                collection = cls(file_path, seed_path=seed_path, index_fields=index_fields, counters=counters,
+                                 sorted_indexes=sorted_indexes)
+                cls._instances[key] = collection
+            return collection
+
+    def __init__(self, file_path: str, seed_path: Optional[str] = None, index_fields: Tuple[str, ...] = (),
+                 counters: Optional[Dict[str, Callable]] = None, sorted_indexes: Optional[Dict[str, Callable]] = None,
+                 auto_compact: bool = True):
+        self.file_path = file_path
+        self.index_fields = tuple(index_fields)
+        self.counters = dict(counters or {})
+        self.sorted_indexes = dict(sorted_indexes or {})
+        self.auto_compact = auto_compact
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(lock_path_for(file_path))
+        self._compact_lock = FileLock(compact_lock_path_for(file_path))
+        self._group = GroupCommit(self._commit)
+        self._ids = IdAllocator(seq_path_for(file_path))
+        self._compact_thread: Optional[threading.Thread] = None
+
+        with self._file_lock:
+            if not os.path.exists(file_path):
+                self._create(seed_path)
+            self._open_handles()
+            self._reset()
+            self._replay(0, repair=True)
+        logger.info(f"JSONL 컬렉션 로드 완료: {file_path} ({len(self._index)}건)")
+
+    # ----------------------
+    # 파일/인덱스 관리
+    # ----------------------
+    def _create(self, seed_path: Optional[str]):
+        """로그 파일 생성 (기존 JSON 배열 파일이 있으면 그 내용으로 초기화)"""
+        records = []
+        if seed_path and os.path.exists(seed_path):
+            records = JsonCollection(seed_path).load()
+            logger.info(f"기존 JSON 데이터로 JSONL 로그 초기화: {seed_path} ({len(records)}건)")
+        data = b''.join(self._encode({'op': 'put', 'id': record.get('id'), 'data': record}) for record in records)
+        atomic_write(self.file_path, data)
+
+    def _open_handles(self):
+        self._writer = open(self.file_path, 'ab')
+        self._reader = open(self.file_path, 'rb')
+        self._ino = os.fstat(self._reader.fileno()).st_ino
+
+    def _close_handles(self):
+        self._writer.close()
+        self._reader.close()
+
+    def _reset(self):
+        """인덱스를 비움 (로그를 처음부터 다시 읽기 전에 호출)"""
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._indexes: Dict[str, object] = build_indexes(self.index_fields, self.counters, self.sorted_indexes)
+        self._order: Optional[List[str]] = None
+        self._dead = 0
+        self._size = 0
+
+    @staticmethod
+    def _encode(entry: Dict) -> bytes:
+        return (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
+    def _apply(self, index: Dict[str, Tuple[int, int]], entry: Dict, offset: int, length: int) -> int:
+        """로그 한 줄을 인덱스에 반영하고 새로 생긴 죽은 줄 수를 반환"""
+        self._order = None
+        record_id = entry.get('id')
+        if entry.get('op') == 'del':
+            return 2 if index.pop(record_id, None) is not None else 1
+        dead = 1 if record_id in index else 0
+        index[record_id] = (offset, length)
+        return dead
+
+    def _replay(self, start: int, repair: bool = False):
+        """
+        start 오프셋부터 로그를 읽어 인덱스에 반영
+
+        repair=True(파일 잠금을 잡은 상태)이면 중단된 마지막 줄을 잘라내고,
+        아니면 다른 프로세스가 아직 쓰는 중일 수 있으므로 완전한 줄까지만 읽는다.
+        """
+        offset = start
+        self._reader.seek(start)
+        for line in self._reader:
+            if not line.endswith(b'\n'):
+                if repair:
+                    # 쓰는 도중 중단된 마지막 줄은 버린다
+                    logger.warning(f"불완전한 로그 줄 제거: {self.file_path} (offset={offset})")
+                    self._writer.truncate(offset)
+                break
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                if repair:
+                    logger.warning(f"손상된 로그 줄 제거: {self.file_path} (offset={offset})")
+                    self._writer.truncate(offset)
+                break
+            self._dead += self._apply(self._index, entry, offset, len(line))
+            self._index_entry(entry)
+            offset += len(line)
+        self._size = offset
+
+    def _refresh(self, repair: bool = False):
+        """다른 프로세스가 쓴 내용을 반영"""
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return
+        if st.st_ino != self._ino or st.st_size < self._size:
+            # 다른 프로세스가 압축해 파일이 교체됨
+            self._close_handles()
+            self._open_handles()
+            self._reset()
+            self._replay(0, repair=repair)
+            logger.debug(f"JSONL 로그 다시 로드: {self.file_path} ({len(self._index)}건)")
+        elif st.st_size > self._size:
+            self._replay(self._size, repair=repair)
+
+    def _index_entry(self, entry: Dict):
+        """로그 한 줄을 보조 인덱스와 id 발급기에 반영"""
+        record_id = entry.get('id')
+        if entry.get('op') == 'del':
+            for index in self._indexes.values():
+                index.remove(record_id)
+            return
+        self._ids.observe(record_id)
+        for index in self._indexes.values():
+            index.add(record_id, entry['data'])
+
+    def _read_at(self, location: Tuple[int, int]) -> Dict:
+        offset, length = location
+        self._reader.seek(offset)
+        return json.loads(self._reader.read(length))['data']
+
+    def _read_pending(self, buffer: bytearray, location: Tuple[int, int]) -> Dict:
+        """커밋 중 조회 (같은 배치에서 버퍼에만 쌓이고 아직 파일에 없는 줄도 읽음)"""
+        offset, length = location
+        if offset >= self._size:
+            start = offset - self._size
+            return json.loads(bytes(buffer[start:start + length]))['data']
+        return self._read_at(location)
+
+    # ----------------------
+    # 조회
+    # ----------------------
+    def all(self) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            return [self._read_at(location) for location in self._index.values()]
+
+    def slice(self, skip: int, limit: int) -> List[Dict]:
+        with self._lock:
+            self._refresh()
+            locations = list(islice(self._index.values(), skip, skip + limit))
+            return [self._read_at(location) for location in locations]
+
+    def _ordered_ids(self) -> List[str]:
+        """삽입 순서의 id 목록과 id → 위치 인덱스 (쓰기가 있을 때만 다시 만듦)"""
+        if self._order is None:
+            self._order = list(self._index)
+            self._order_positions = {record_id: position for position, record_id in enumerate(self._order)}
+        return self._order
+
+    def page(self, cursor_id: Optional[str], direction: Optional[str], limit: int) -> Tuple[List[Dict], bool, bool]:
+        """
+        커서 기준 페이지 조회 (JsonCollection.page와 같은 규칙)
+
+        Returns:
+            (레코드 목록, 이전 페이지 존재 여부, 다음 페이지 존재 여부)
+        """
+        with self._lock:
+            self._refresh()
+            ids = self._ordered_ids()
+            position = self._order_positions.get(cursor_id)
+            found = position is not None
+            if direction is not None and not found:
+                position = _insertion_point(len(ids), ids.__getitem__, cursor_id)
+            start, end = page_bounds(len(ids), position, found, direction, limit)
+            records = [self._read_at(self._index[record_id]) for record_id in ids[start:end]]
+            return records, start > 0, end < len(ids)
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._index)
+
+    def get(self, record_id: str) -> Optional[Dict]:
+        with self._lock:
+            self._refresh()
+            location = self._index.get(record_id)
+            return self._read_at(location) if location else None
+
+    def find_by(self, field: str, value) -> Optional[Dict]:
+        """색인된 필드 값으로 레코드 조회"""
+        with self._lock:
+            self._refresh()
+            record_id = self._indexes[field].lookup(value)
+            return self.get(record_id) if record_id is not None else None
+
+    def count_by(self, counter: str, key: str) -> int:
+        """집계(counter)에서 key에 해당하는 레코드 수 조회"""
+        with self._lock:
+            self._refresh()
+            return self._indexes[counter].get(key)
+
+    def range_by(self, name: str, low, high, skip: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict], int]:
+        """정렬 인덱스 범위 조회 (JsonCollection.range_by와 같은 규칙, 구간 안의 레코드만 읽음)"""
+        with self._lock:
+            self._refresh()
+            ids = self._indexes[name].range(low, high)
+            end = None if limit is None else skip + limit
+            return [self._read_at(self._index[record_id]) for record_id in ids[skip:end]], len(ids)
+
+    def allocate_id(self) -> str:
+        with self._lock, self._file_lock:
+            self._refresh(repair=True)
+            return self._ids.next_id()
+
+    # ----------------------
+    # 쓰기
+    # ----------------------
+    def _stage(self, buffer: bytearray, entry: Dict):
+        """로그 한 줄을 버퍼에 쌓고 모든 인덱스에 반영 (파일에는 커밋 시 한 번에 기록)"""
+        line = self._encode(entry)
+        offset = self._size + len(buffer)
+        buffer += line
+        self._dead += self._apply(self._index, entry, offset, len(line))
+        self._index_entry(entry)
+
+    def _commit(self, batch: List[_PendingWrite]):
+        """쌓인 쓰기를 로그 끝에 한 번에 추가하고 fsync"""
+        with self._lock, self._file_lock:
+            self._refresh(repair=True)
+            self._ids.sync()
+            buffer = bytearray()
+            try:
+                for write in batch:
+                    write.result = write.apply(buffer)
+                if buffer:
+                    self._writer.write(buffer)
+                    self._writer.flush()
+                    os.fsync(self._writer.fileno())
+                    self._size += len(buffer)
+                    self._ids.persist()
+            except BaseException:
+                # 일부만 기록됐을 수 있으므로 커밋 이전 상태로 되돌리고 다시 읽는다
+                self._writer.truncate(self._size)
+                self._reset()
+                self._replay(0, repair=True)
+                raise
+
+    def insert(self, record: Dict) -> Dict:
+        """레코드 추가 (id가 없으면 커밋 안에서 발급해 record['id']에 넣음)"""
+        def apply(buffer: bytearray) -> Dict:
+            if record.get('id') is None:
+                record['id'] = self._ids.reserve()
+            self._stage(buffer, {'op': 'put', 'id': record.get('id'), 'data': record})
+            return record
+        result = self._group.submit(apply)
+        self._maybe_compact()
+        return result
+
+    def replace(self, record_id: str, record: Dict) -> bool:
+        def apply(buffer: bytearray) -> bool:
+            if record_id not in self._index:
+                return False
+            self._stage(buffer, {'op': 'put', 'id': record_id, 'data': record})
+            return True
+        result = self._group.submit(apply)
+        self._maybe_compact()
+        return result
+
+    def upsert_many(self, field: str, records: List[Dict],
+                    merge: Callable[[Optional[Dict], Dict], Optional[Dict]]) -> Dict[str, int]:
+        """색인된 field 값 기준으로 여러 건을 한 번의 커밋(fsync 1회)에 추가/갱신 (JsonCollection.upsert_many와 같은 규칙)"""
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+        def apply(buffer: bytearray) -> int:
+            for record in records:
+                record_id = self._indexes[field].lookup(record.get(field))
+                existing = self._read_pending(buffer, self._index[record_id]) if record_id is not None else None
+                merged = merge(existing, record)
+                if merged is None:
+                    counts['unchanged'] += 1
+                    continue
+                if existing is None:
+                    if merged.get('id') is None:
+                        merged['id'] = self._ids.reserve()
+                    counts['inserted'] += 1
+                else:
+                    merged['id'] = record_id
+                    counts['updated'] += 1
+                self._stage(buffer, {'op': 'put', 'id': merged['id'], 'data': merged})
+            return counts['inserted'] + counts['updated']
+
+        self._group.submit(apply)
+        self._maybe_compact()
+        return counts
+
+    def delete(self, record_id: str) -> bool:
+        def apply(buffer: bytearray) -> bool:
+            if record_id not in self._index:
+                return False
+            self._stage(buffer, {'op': 'del', 'id': record_id})
+            return True
+        result = self._group.submit(apply)
+        self._maybe_compact()
+        return result
+
+    # ----------------------
+    # 압축
+    # ----------------------
+    def _needs_compaction(self) -> bool:
+        return (self._dead >= self.COMPACT_MIN_DEAD
+                and self._dead > len(self._index) * self.COMPACT_RATIO)
+
+    def _maybe_compact(self):
+        if not self.auto_compact or not self._needs_compaction():
+            return
+        with self._lock:
+            if self._compact_thread and self._compact_thread.is_alive():
+                return
+            self._compact_thread = threading.Thread(
+                target=self.compact, name=f"compact-{os.path.basename(self.file_path)}", daemon=True
+            )
+            self._compact_thread.start()
+
+    def compact(self):
+        """
+        살아있는 레코드만 모아 새 스냅샷을 만든 뒤 원본 로그와 교체
+
+        모든 워커가 같은 로그를 재생하므로 거의 같은 시점에 압축을 시작할 수 있다.
+        압축 잠금(<파일>.compact.lock)으로 한 번에 한 프로세스만 압축하고, 스냅샷은 프로세스마다
+        따로 만든 임시 파일에 쓴다. 스냅샷 작성 중에는 쓰기 잠금을 잡지 않으며, 그 사이 추가된
+        로그 꼬리만 파일 잠금을 잡은 상태에서 옮겨 적은 뒤 파일을 교체한다.
+        압축 잠금을 기다리는 동안 다른 프로세스가 먼저 압축했다면(inode 변경) 이번 압축은 건너뛴다.
+        """
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        tmp_path = None
+        with self._lock:
+            self._refresh()
+            started_ino = self._ino
+        try:
+            with self._compact_lock:
+                with self._lock:
+                    self._refresh()
+                    if self._ino != started_ino:
+                        logger.info(f"다른 프로세스가 이미 압축함: {self.file_path}")
+                        return
+                    snapshot = list(self._index.items())
+                    snapshot_end = self._size
+                    snapshot_ino = self._ino
+
+                fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(self.file_path)}.", suffix='.compact',
+                                                dir=directory)
+                new_index: Dict[str, Tuple[int, int]] = {}
+                offset = 0
+                with open(self.file_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                    if os.fstat(src.fileno()).st_ino != snapshot_ino:
+                        logger.info(f"다른 프로세스가 이미 압축함: {self.file_path}")
+                        return
+                    for record_id, (old_offset, length) in snapshot:
+                        src.seek(old_offset)
+                        dst.write(src.read(length))
+                        new_index[record_id] = (offset, length)
+                        offset += length
+
+                with self._lock, self._file_lock:
+                    self._refresh(repair=True)
+                    if self._ino != snapshot_ino:
+                        logger.info(f"다른 프로세스가 이미 압축함: {self.file_path}")
+                        return
+
+                    # 스냅샷 이후 추가된 로그를 그대로 이어 붙임
+                    dead = 0
+                    with open(self.file_path, 'rb') as src, open(tmp_path, 'ab') as dst:
+                        src.seek(snapshot_end)
+                        for line in src:
+                            dst.write(line)
+                            dead += self._apply(new_index, json.loads(line), offset, len(line))
+                            offset += len(line)
+                        dst.flush()
+                        os.fsync(dst.fileno())
+
+                    # mkstemp는 0600으로 만들므로 기존 로그 권한을 유지
+                    os.chmod(tmp_path, os.stat(self.file_path).st_mode & 0o777)
+                    self._close_handles()
+                    os.replace(tmp_path, self.file_path)
+                    tmp_path = None
+                    _fsync_dir(directory)
+                    self._open_handles()
+                    self._index = new_index
+                    self._order = None
+                    self._dead = dead
+                    self._size = offset
+            logger.info(f"JSONL 로그 압축 완료: {self.file_path} ({len(new_index)}건)")
+        except Exception as e:
+            logger.error(f"JSONL 로그 압축 중 오류: {e}")
+            raise
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def close(self):
+        if self._compact_thread and self._compact_thread.is_alive():
+            self._compact_thread.join()
+        with self._lock:
+            self._close_handles()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+import time
+import threading
+from unittest import mock
+
+import httpx
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler import base_crawler
+from crawler.base_crawler import BaseCrawler
+from crawler.http_cache import CACHE_STATUS_HEADER
+
+class FakeCrawler(BaseCrawler):
+    """상세 페이지마다 조금씩 걸리는 가짜 크롤러 (프로세스 모드에서 쓰도록 모듈 최상위에 둠)"""
+
+    def __init__(self, count=8, delay=0.1, fail_on=()):
+        super().__init__("FakeSite")
+        self.count = count
+        self.delay = delay
+        self.fail_on = set(fail_on)
+
+    def crawl_job_list(self, url):
+        return [f"{url}/jobs/{i}" for i in range(self.count)]
+
+    def crawl_job_detail(self, url):
+        index = int(url.rsplit('/', 1)[1])
+        # 뒤쪽 공고가 먼저 끝나도록 앞쪽일수록 오래 걸림
+        time.sleep(self.delay * (1 + (self.count - index) / self.count))
+        if index in self.fail_on:
+            raise RuntimeError("상세 페이지 구조 변경")
+        return {'url': url, 'index': index, 'worker': threading.current_thread().name}
+
+class TestBaseCrawlerWorkers(unittest.TestCase):
+    def test_sequential(self):
+        """워커 1개면 예전처럼 순서대로 처리하는지 테스트"""
+        print("\n=== 순차 상세 크롤링 테스트 ===")
+
+        crawler = FakeCrawler(count=4, delay=0.01, fail_on={1})
+        results = crawler.crawl('https://example.com', workers=1)
+        self.assertEqual([job['index'] for job in results], [0, 2, 3])
+        self.assertEqual({job['worker'] for job in results}, {threading.current_thread().name})
+        print("✓ 순차 처리/오류 격리 확인")
+
+    def test_thread_workers(self):
+        """스레드 워커 수에 비례해 빨라지고 max_jobs/순서 보존/오류 격리를 지키는지 테스트"""
+        print("\n=== 스레드 워커 상세 크롤링 테스트 ===")
+
+        start = time.monotonic()
+        results = FakeCrawler(fail_on={3}).crawl('https://example.com', workers=4, preserve_order=True)
+        elapsed = time.monotonic() - start
+        # 순차라면 약 1.2초, 4개 워커면 약 0.35초
+        self.assertLess(elapsed, 0.7)
+        self.assertEqual([job['index'] for job in results], [0, 1, 2, 4, 5, 6, 7])
+        self.assertGreater(len({job['worker'] for job in results}), 1)
+        print(f"✓ 병렬 처리/순서 보존/오류 격리 확인 ({elapsed:.2f}초)")
+
+        results = FakeCrawler().crawl('https://example.com', max_jobs=5, workers=5)
+        self.assertEqual(sorted(job['index'] for job in results), [0, 1, 2, 3, 4])
+        # 끝나는 순서대로 쌓이므로 오래 걸리는 0번이 마지막
+        self.assertEqual(results[-1]['index'], 0)
+        print("✓ max_jobs/완료 순서 확인")
+
+    def test_process_workers(self):
+        """프로세스 워커로도 같은 결과를 내는지 테스트"""
+        print("\n=== 프로세스 워커 상세 크롤링 테스트 ===")
+
+        crawler = FakeCrawler(count=4, delay=0.05, fail_on={2})
+        results = crawler.crawl('https://example.com', workers=2, mode='process', preserve_order=True)
+        self.assertEqual([job['index'] for job in results], [0, 1, 3])
+        self.assertEqual(FakeCrawler().crawl('https://example.com', workers=2, mode='fiber'), [])
+        print("✓ 프로세스 모드 확인")
+
+class TestBaseCrawlerPages(unittest.TestCase):
+    def test_get_pages_archive(self):
+        """여러 페이지를 가져올 때 새로 받은 페이지만 보관하는지 테스트"""
+        print("\n=== 여러 페이지 보관 테스트 ===")
+
+        def response(url, cache_status=None):
+            headers = {CACHE_STATUS_HEADER: cache_status} if cache_status else {}
+            return httpx.Response(200, text=f"<p>{url}</p>", headers=headers, request=httpx.Request('GET', url))
+
+        urls = ['https://example.com/new', 'https://example.com/hit', 'https://example.com/304', 'https://example.com/x']
+        responses = [response(urls[0]), response(urls[1], 'HIT'), response(urls[2], 'REVALIDATED'), None]
+        with mock.patch.object(base_crawler, 'fetch_many_responses', return_value=responses), \
+                mock.patch.object(base_crawler, 'archive_page') as archive_page:
+            pages = FakeCrawler().get_pages(urls)
+        self.assertEqual([page.get_text() if page else None for page in pages], urls[:3] + [None])
+        self.assertEqual([call.args[0] for call in archive_page.call_args_list], [urls[0]])
+        print("✓ 캐시 응답 보관 생략/실패 URL None 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,170 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import crud
+from models import JobPosting
+from database import Database, SqlDatabase, init_db
+from deadline import DEADLINE_FIXED
+from storage import JsonlCollection
+
+def make_rows(count, title="백엔드 개발자"):
+    return [{'job_title': f'{title} {i}', 'company_name': f'회사{i}', 'link': f'http://{i}.com',
+             'deadline': '2025.04.30', 'platform': 'saramin'} for i in range(count)]
+
+class TestBulkUpsert(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.engine = create_engine('sqlite://')
+        init_db(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.db.close()
+        self.engine.dispose()
+
+    def test_counts(self):
+        """link 기준 삽입/갱신/무변경 건수 테스트"""
+        print("\n=== 채용 공고 일괄 upsert 테스트 ===")
+
+        self.assertEqual(crud.bulk_upsert_job_postings(self.db, make_rows(5), chunk_size=2),
+                         {'inserted': 5, 'updated': 0, 'unchanged': 0})
+        job = crud.get_job_by_link(self.db, 'http://0.com')
+        self.assertEqual(job.deadline_kind, DEADLINE_FIXED)
+        print("✓ 새 공고 삽입 확인")
+
+        # 사용자가 바꾼 지원 상태는 다시 크롤링해도 유지
+        job.application_status = "지원완료"
+        self.db.commit()
+        rows = make_rows(7)
+        rows[1]['salary'] = '5000만원'
+        rows[2]['job_title'] = '제목 변경'
+        self.assertEqual(crud.bulk_upsert_job_postings(self.db, rows, chunk_size=3),
+                         {'inserted': 2, 'updated': 2, 'unchanged': 3})
+        self.db.expire_all()
+        self.assertEqual(self.db.query(JobPosting).count(), 7)
+        self.assertEqual(crud.get_job_by_link(self.db, 'http://1.com').salary, '5000만원')
+        self.assertEqual(crud.get_job_by_link(self.db, 'http://2.com').job_title, '제목 변경')
+        self.assertEqual(crud.get_job_by_link(self.db, 'http://0.com').application_status, "지원완료")
+        print("✓ 바뀐 공고만 갱신 확인")
+
+        # 행에 없는 컬럼은 기존 값 유지, 같은 link는 마지막 값 사용
+        counts = crud.bulk_upsert_job_postings(self.db, [
+            {'link': 'http://3.com', 'location': '부산'},
+            {'link': 'http://3.com', 'location': '서울'},
+        ])
+        self.assertEqual(counts, {'inserted': 0, 'updated': 1, 'unchanged': 0})
+        self.db.expire_all()
+        job = crud.get_job_by_link(self.db, 'http://3.com')
+        self.assertEqual((job.location, job.job_title), ('서울', '백엔드 개발자 3'))
+        print("✓ 부분 갱신/중복 link 처리 확인")
+
+    def test_single_upsert(self):
+        """한 건 upsert가 다시 조회하지 않고 저장된 행과 결과를 돌려주는지 테스트"""
+        print("\n=== 채용 공고 한 건 upsert 테스트 ===")
+
+        statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        row = make_rows(1)[0]
+        job, status = crud.upsert_job_posting(self.db, row)
+        self.assertEqual((status, job.job_title, job.deadline_kind), ('inserted', '백엔드 개발자 0', DEADLINE_FIXED))
+        # 기존 link 조회 1번 + INSERT ... RETURNING 1번
+        self.assertEqual(len([s for s in statements if s.lstrip().upper().startswith('SELECT')]), 1)
+        self.assertIn('RETURNING', statements[-1])
+
+        same, status = crud.upsert_job_posting(self.db, row)
+        self.assertEqual((same.id, status), (job.id, 'unchanged'))
+        changed, status = crud.upsert_job_posting(self.db, dict(row, salary='5000만원'))
+        self.assertEqual((changed.id, changed.salary, status), (job.id, '5000만원', 'updated'))
+        self.assertEqual(self.db.query(JobPosting).count(), 1)
+        print("✓ 저장된 행/삽입·갱신·무변경 결과 확인")
+
+    def test_single_transaction(self):
+        """잘못된 행이 있으면 아무것도 저장하지 않고, 정상이면 한 번만 커밋하는지 테스트"""
+        print("\n=== 일괄 upsert 트랜잭션 테스트 ===")
+
+        with self.assertRaises(ValueError):
+            crud.bulk_upsert_job_postings(self.db, make_rows(3) + [{'job_title': 'link 없음'}])
+        with self.assertRaises(ValueError):
+            crud.bulk_upsert_job_postings(self.db, [{'link': 'http://x.com', 'unknown': 1}])
+        self.assertEqual(self.db.query(JobPosting).count(), 0)
+
+        commits = []
+        event.listen(self.engine, "commit", lambda conn: commits.append(conn))
+        statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        counts = crud.bulk_upsert_job_postings(self.db, make_rows(1200), chunk_size=500)
+        self.assertEqual(counts['inserted'], 1200)
+        self.assertEqual(len(commits), 1)
+        # 묶음마다 기존 link 조회 1번 + executemany 1번
+        self.assertEqual(len([s for s in statements if 'ON CONFLICT' in s]), 3)
+        print("✓ 한 트랜잭션/묶음 단위 실행 확인")
+
+class TestStorageUpsert(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+        self.engine = create_engine('sqlite://')
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.engine.dispose()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def check_storage(self, db):
+        jobs = [{'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com', 'deadline': '~ 4/6(일)',
+                 'application_period': {'접수기간': '2025.03.01 ~ 2025.04.06'}} for i in range(3)]
+        self.assertEqual(db.upsert_job_postings(jobs), {'inserted': 3, 'updated': 0, 'unchanged': 0})
+        jobs[0]['title'] = '공고 수정'
+        self.assertEqual(db.upsert_job_postings(jobs), {'inserted': 0, 'updated': 1, 'unchanged': 2})
+        self.assertEqual(db.get_job_posting_by_link('http://0.com')['title'], '공고 수정')
+        self.assertEqual(db.get_job_posting_by_link('http://1.com')['application_period']['접수기간'],
+                         '2025.03.01 ~ 2025.04.06')
+        self.assertEqual(db.count_job_postings(), 3)
+
+    def test_sql_storage(self):
+        """SQL 저장소 일괄 저장 테스트"""
+        print("\n=== SQL 저장소 일괄 저장 테스트 ===")
+        self.check_storage(SqlDatabase(bind=self.engine))
+        print("✓ SQL 저장소 일괄 저장 확인")
+
+    def test_json_storage(self):
+        """JSON 저장소 일괄 저장 테스트"""
+        print("\n=== JSON 저장소 일괄 저장 테스트 ===")
+        db = Database(data_dir=self.data_dir, storage="json")
+        writes = []
+        original_write = db.jobs._write_file
+        db.jobs._write_file = lambda records: writes.append(len(records)) or original_write(records)
+        self.check_storage(db)
+        # 배치마다 파일을 한 번만 다시 씀 (바뀐 것이 있을 때만)
+        self.assertEqual(writes, [3, 3])
+        print("✓ JSON 저장소 일괄 저장 확인")
+
+    def test_jsonl_storage(self):
+        """JSONL 저장소 일괄 저장 테스트"""
+        print("\n=== JSONL 저장소 일괄 저장 테스트 ===")
+        db = Database(data_dir=self.data_dir, storage="jsonl")
+        try:
+            self.check_storage(db)
+            with open(db.jobs.file_path, encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 4)
+        finally:
+            for collection in (db.jobs, db.resumes, db.applications):
+                collection.close()
+                JsonlCollection._instances.pop(os.path.abspath(collection.file_path), None)
+        print("✓ JSONL 저장소 일괄 저장 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
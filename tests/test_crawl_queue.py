@@ -0,0 +1,173 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawl_queue import (CrawlQueue, QueueFullError,
+                         STATUS_QUEUED, STATUS_RUNNING, STATUS_SUCCEEDED, STATUS_FAILED)
+
+class BlockingCrawler:
+    """gate가 열릴 때까지 크롤링이 끝나지 않는 가짜 핸들러"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, url):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            self.gate.wait(5)
+            if 'fail' in url:
+                raise LookupError("채용 공고를 찾을 수 없습니다.")
+            return {'url': url, 'title': '공고'}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+def wait_for(queue, job_id, statuses, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job['status'] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"작업 상태가 {statuses}가 되지 않음: {queue.get(job_id)}")
+
+class TestCrawlQueue(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'crawl_tasks.sqlite')
+        self.crawler = BlockingCrawler()
+        self.queue = CrawlQueue(self.crawler, workers=2, max_pending=2, path=self.path)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.crawler.gate.set()
+        self.queue.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_submit_returns_immediately(self):
+        """작업 등록이 크롤링을 기다리지 않고 바로 반환되는지, 워커 수가 제한되는지 테스트"""
+        print("\n=== 크롤링 작업 큐 테스트 ===")
+
+        start = time.monotonic()
+        jobs = [self.queue.submit(f'http://{i}.com') for i in range(4)]
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertTrue(all(job['status'] == STATUS_QUEUED for job in jobs))
+        wait_for(self.queue, jobs[0]['id'], {STATUS_RUNNING})
+        wait_for(self.queue, jobs[1]['id'], {STATUS_RUNNING})
+        self.assertEqual(self.queue.get(jobs[3]['id'])['status'], STATUS_QUEUED)
+        print("✓ 즉시 반환 확인")
+
+        # 대기열이 가득 차면 거절
+        with self.assertRaises(QueueFullError):
+            self.queue.submit('http://full.com')
+        # 같은 url은 기존 작업을 돌려줌
+        self.assertEqual(self.queue.submit('http://3.com')['id'], jobs[3]['id'])
+        print("✓ 대기열 제한/중복 요청 확인")
+
+        self.crawler.gate.set()
+        for job in jobs:
+            done = wait_for(self.queue, job['id'], {STATUS_SUCCEEDED})
+            self.assertEqual(done['result']['url'], job['url'])
+            self.assertIsNotNone(done['finished_at'])
+        self.assertEqual(self.crawler.max_running, 2)
+        print("✓ 워커 수 제한 및 결과 확인")
+
+    def test_failure_and_retention(self):
+        """실패 기록과 끝난 작업 보관 개수 테스트"""
+        print("\n=== 크롤링 작업 실패/보관 테스트 ===")
+
+        self.queue.keep_finished = 3
+        self.crawler.gate.set()
+        failed = self.queue.submit('http://fail.com')
+        job = wait_for(self.queue, failed['id'], {STATUS_FAILED})
+        self.assertIn("찾을 수 없습니다", job['error'])
+        print("✓ 실패 기록 확인")
+
+        # 끝난 작업은 submit으로 다시 등록할 수 있음
+        retried = self.queue.submit('http://fail.com')
+        self.assertNotEqual(retried['id'], failed['id'])
+        wait_for(self.queue, retried['id'], {STATUS_FAILED})
+
+        ids = []
+        for i in range(3):
+            ids.append(self.queue.submit(f'http://ok{i}.com')['id'])
+            wait_for(self.queue, ids[-1], {STATUS_SUCCEEDED})
+        self.assertIsNone(self.queue.get(failed['id']))
+        self.assertEqual(self.queue.stats()[STATUS_SUCCEEDED], 3)
+        print("✓ 보관 개수 제한 확인")
+
+    def test_shared_between_workers(self):
+        """같은 파일을 쓰는 큐(uvicorn 워커 여러 개)끼리 작업 조회/중복 제거/대기열 제한을 공유하는지 테스트"""
+        print("\n=== 크롤링 작업 큐 워커 간 공유 테스트 ===")
+
+        other = CrawlQueue(self.crawler, workers=1, max_pending=2, path=self.path)
+        try:
+            first = self.queue.submit('http://shared.com')
+            # 다른 워커로 간 조회/같은 URL 요청
+            self.assertEqual(other.get(first['id'])['url'], 'http://shared.com')
+            self.assertEqual(other.submit('http://shared.com')['id'], first['id'])
+            print("✓ 다른 워커에서 조회/중복 요청 확인")
+
+            # 다른 워커의 대기 작업까지 합쳐 max_pending건이면 어느 워커든 거절
+            wait_for(other, first['id'], {STATUS_RUNNING})
+            jobs = [other.submit('http://0.com')]
+            wait_for(other, jobs[0]['id'], {STATUS_RUNNING})
+            jobs += [other.submit(f'http://{i}.com') for i in range(1, 3)]
+            self.assertEqual(self.queue.stats()[STATUS_QUEUED], 2)
+            with self.assertRaises(QueueFullError):
+                self.queue.submit('http://full.com')
+            print("✓ 전체 대기열 제한 확인")
+
+            self.crawler.gate.set()
+            done = wait_for(self.queue, jobs[2]['id'], {STATUS_SUCCEEDED})
+            self.assertEqual(done['result'], {'url': 'http://2.com', 'title': '공고'})
+            print("✓ 다른 워커가 실행한 결과 조회 확인")
+        finally:
+            other.shutdown()
+
+    def test_stale_and_cancelled(self):
+        """죽은 워커가 남긴 작업은 시간이 지나면 실패로 처리하고, 종료 시 대기 작업은 취소로 기록하는지 테스트"""
+        print("\n=== 크롤링 작업 정리 테스트 ===")
+
+        # 등록만 하고 실행하지 못한 채 죽은 워커
+        dead = CrawlQueue(self.crawler, workers=1, path=self.path)
+        dead._executor.shutdown(cancel_futures=True)
+        dead._executor = mock.Mock()
+        abandoned = dead.submit('http://abandoned.com')
+
+        self.assertEqual(self.queue.submit('http://abandoned.com')['id'], abandoned['id'])
+        self.queue.stale_after = 0
+        retried = self.queue.submit('http://abandoned.com')
+        self.assertNotEqual(retried['id'], abandoned['id'])
+        self.assertEqual(self.queue.get(abandoned['id'])['status'], STATUS_FAILED)
+        print("✓ 오래된 작업 실패 처리 확인")
+
+        # 종료 시 시작하지 못한 작업은 대기 상태로 남기지 않음
+        self.queue.stale_after = 3600
+        dead.shutdown()
+        self.assertEqual(self.queue.get(abandoned['id'])['status'], STATUS_FAILED)
+        jobs = [self.queue.submit(f'http://{i}.com') for i in range(2)]
+        wait_for(self.queue, retried['id'], {STATUS_RUNNING})
+        wait_for(self.queue, jobs[0]['id'], {STATUS_RUNNING})
+        self.queue.shutdown(wait=False)
+        self.assertEqual(self.queue.get(jobs[1]['id'])['status'], STATUS_FAILED)
+        self.assertIn("취소", self.queue.get(jobs[1]['id'])['error'])
+        print("✓ 종료 시 대기 작업 취소 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,454 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import multiprocessing
+import time
+from unittest import mock
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from database import Database
+from storage import JsonCollection, JsonlCollection, atomic_write
+
+def insert_jobs(data_dir, storage, worker, count):
+    """별도 프로세스(워커)에서 채용 공고를 저장"""
+    db = Database(data_dir=data_dir, storage=storage)
+    for i in range(count):
+        db.save_job_posting({'title': f'공고{worker}-{i}', 'company_name': '회사', 'url': f'http://{worker}-{i}.com'})
+
+class TestJsonlStorage(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+        self.db = Database(data_dir=self.data_dir, storage="jsonl")
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        for collection in (self.db.jobs, self.db.resumes, self.db.applications):
+            collection.close()
+            JsonlCollection._instances.pop(os.path.abspath(collection.file_path), None)
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def reopen(self):
+        """같은 로그 파일을 새 인스턴스로 다시 읽음"""
+        return JsonlCollection(self.db.jobs.file_path)
+
+    def test_crud_roundtrip(self):
+        """저장/조회/수정/삭제 테스트"""
+        print("\n=== JSONL 저장소 CRUD 테스트 ===")
+
+        job = self.db.save_job_posting({'title': '백엔드 개발자', 'company_name': '회사1', 'url': 'http://a.com'})
+        self.assertEqual(self.db.get_job_posting(job['id'])['title'], '백엔드 개발자')
+
+        self.db.update_job_posting(job['id'], {'title': '수정된 제목', 'company_name': '회사1', 'url': 'http://a.com'})
+        self.assertEqual(self.db.get_job_posting(job['id'])['title'], '수정된 제목')
+
+        self.assertTrue(self.db.delete_job_posting(job['id']))
+        self.assertIsNone(self.db.get_job_posting(job['id']))
+        self.assertFalse(self.db.delete_job_posting(job['id']))
+        print("✓ CRUD 확인")
+
+    def test_log_is_append_only_and_replayed(self):
+        """쓰기는 로그 끝에만 추가되고, 재시작 시 인덱스가 복원되는지 테스트"""
+        print("\n=== JSONL 로그 재생 테스트 ===")
+
+        for i in range(3):
+            self.db.save_job_posting({'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com'})
+        size_before = os.path.getsize(self.db.jobs.file_path)
+        self.db.update_job_posting('2', {'title': '공고1-수정', 'company_name': '회사', 'url': 'http://1.com'})
+        self.db.delete_job_posting('1')
+
+        with open(self.db.jobs.file_path, 'rb') as f:
+            self.assertEqual(len(f.read(size_before).splitlines()), 3)
+
+        reopened = self.reopen()
+        self.assertEqual(reopened.count(), 2)
+        self.assertEqual([job['title'] for job in reopened.all()], ['공고1-수정', '공고2'])
+        reopened.close()
+        print("✓ 로그 재생 확인")
+
+    def test_compaction(self):
+        """압축 후 죽은 줄이 제거되고 데이터가 유지되는지 테스트"""
+        print("\n=== JSONL 로그 압축 테스트 ===")
+
+        jobs = self.db.jobs
+        jobs.auto_compact = False
+        for i in range(10):
+            self.db.save_job_posting({'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com'})
+        for i in range(1, 6):
+            self.db.delete_job_posting(str(i))
+
+        jobs.compact()
+
+        with open(jobs.file_path, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(all(line['op'] == 'put' for line in lines))
+        self.assertEqual(self.db.get_job_posting('7')['title'], '공고6')
+        self.assertEqual(self.db.get_job_postings(skip=0, limit=2)[0]['title'], '공고5')
+        print("✓ 압축 확인")
+
+    def test_concurrent_compaction(self):
+        """여러 워커(인스턴스)가 동시에 압축해도 로그가 손상되지 않는지 테스트"""
+        print("\n=== JSONL 동시 압축 테스트 ===")
+
+        self.db.jobs.auto_compact = False
+        for i in range(20):
+            self.db.save_job_posting({'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com'})
+        for i in range(1, 11):
+            self.db.delete_job_posting(str(i))
+
+        # 인스턴스마다 잠금 핸들이 따로라 다른 프로세스와 같은 조건
+        workers = [self.reopen() for _ in range(3)]
+        threads = [threading.Thread(target=worker.compact) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(self.db.jobs.file_path, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line['id'] for line in lines], [str(i) for i in range(11, 21)])
+        self.assertEqual([name for name in os.listdir(self.data_dir) if name.endswith('.compact')], [])
+        for worker in workers:
+            self.assertEqual(worker.count(), 10)
+            worker.close()
+        print("✓ 동시 압축 확인")
+
+    def test_seed_from_json(self):
+        """기존 JSON 파일 내용으로 JSONL 로그가 초기화되는지 테스트"""
+        print("\n=== 기존 JSON 데이터 이전 테스트 ===")
+
+        seed_dir = tempfile.mkdtemp(prefix="test_seed_")
+        try:
+            with open(os.path.join(seed_dir, "jobs.json"), 'w', encoding='utf-8') as f:
+                json.dump([{'id': '1', 'title': '기존 공고'}], f, ensure_ascii=False)
+            collection = JsonlCollection(os.path.join(seed_dir, "jobs.jsonl"), seed_path=os.path.join(seed_dir, "jobs.json"))
+            self.assertEqual(collection.get('1')['title'], '기존 공고')
+            collection.close()
+        finally:
+            shutil.rmtree(seed_dir, ignore_errors=True)
+        print("✓ JSON 데이터 이전 확인")
+
+class TestPrimaryKeyIndex(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        for path in list(JsonlCollection._instances):
+            if path.startswith(self.data_dir):
+                JsonlCollection._instances.pop(path).close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def check_storage(self, storage):
+        db = Database(data_dir=self.data_dir, storage=storage)
+
+        first = db.save_job_posting({'title': '공고1', 'company_name': '회사', 'url': 'http://a.com'})
+        second = db.save_job_posting({'title': '공고2', 'company_name': '회사', 'url': 'http://b.com'})
+        self.assertEqual(db.get_job_posting_by_link('http://b.com')['id'], second['id'])
+
+        # 마지막 레코드를 삭제해도 id가 다시 발급되지 않아야 함
+        db.delete_job_posting(second['id'])
+        third = db.save_job_posting({'title': '공고3', 'company_name': '회사', 'url': 'http://c.com'})
+        self.assertNotEqual(third['id'], second['id'])
+        self.assertIsNone(db.get_job_posting_by_link('http://b.com'))
+
+        # 링크가 바뀌면 인덱스도 따라감
+        db.update_job_posting(first['id'], {'title': '공고1', 'company_name': '회사', 'url': 'http://d.com'})
+        self.assertIsNone(db.get_job_posting_by_link('http://a.com'))
+        self.assertEqual(db.get_job_posting_by_link('http://d.com')['id'], first['id'])
+
+        application = db.save_application({'job_id': third['id'], 'status': '지원중'})
+        self.assertEqual(application['job_title'], '공고3')
+
+    def test_json_storage(self):
+        """JSON 저장 방식의 id/링크 인덱스 테스트"""
+        print("\n=== JSON 인덱스 테스트 ===")
+        self.check_storage("json")
+        print("✓ JSON 인덱스 확인")
+
+    def test_jsonl_storage(self):
+        """JSONL 저장 방식의 id/링크 인덱스 테스트"""
+        print("\n=== JSONL 인덱스 테스트 ===")
+        self.check_storage("jsonl")
+        print("✓ JSONL 인덱스 확인")
+
+class TestDashboardStats(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        for path in list(JsonlCollection._instances):
+            if path.startswith(self.data_dir):
+                JsonlCollection._instances.pop(path).close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def check_storage(self, storage):
+        db = Database(data_dir=self.data_dir, storage=storage)
+        today = datetime.now()
+        yesterday = today - timedelta(days=1)
+
+        job = db.save_job_posting({'title': '공고', 'company_name': '회사', 'url': 'http://a.com'})
+        db.save_application({'job_id': job['id'], 'status': '지원중'})
+        db.save_application({'job_id': job['id'], 'status': '지원중', 'applied_at': yesterday.isoformat()})
+        moved = db.save_application({'job_id': job['id'], 'status': '지원중', 'applied_at': yesterday.isoformat()})
+        db.save_application({'job_id': job['id'], 'status': '지원중', 'applied_at': '날짜 아님'})
+
+        stats = db.get_dashboard_stats()
+        self.assertEqual(stats, {'total_jobs': 1, 'total_resumes': 0, 'total_applications': 4, 'today_applications': 1})
+
+        # 지원일 수정/삭제도 집계에 반영
+        db.update_application(moved['id'], {'applied_at': today.isoformat()})
+        self.assertEqual(db.get_dashboard_stats()['today_applications'], 2)
+        db.delete_application(moved['id'])
+        self.assertEqual(db.get_dashboard_stats()['today_applications'], 1)
+
+        series = db.get_application_series(days=7)
+        self.assertEqual(len(series['labels']), 7)
+        self.assertEqual(series['labels'][-1], today.date().isoformat())
+        self.assertEqual(series['counts'][-2:], [1, 1])
+
+        # 다시 열어도 같은 집계가 만들어짐
+        if storage == "json":
+            self.assertEqual(Database(data_dir=self.data_dir, storage=storage).get_dashboard_stats(), db.get_dashboard_stats())
+
+    def test_json_storage(self):
+        """JSON 저장 방식의 대시보드 집계 테스트"""
+        print("\n=== JSON 대시보드 집계 테스트 ===")
+        self.check_storage("json")
+        print("✓ JSON 대시보드 집계 확인")
+
+    def test_jsonl_storage(self):
+        """JSONL 저장 방식의 대시보드 집계 테스트"""
+        print("\n=== JSONL 대시보드 집계 테스트 ===")
+        self.check_storage("jsonl")
+        print("✓ JSONL 대시보드 집계 확인")
+
+class TestJsonCache(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+        self.file_path = os.path.join(self.data_dir, "jobs.json")
+        self.collection = JsonCollection(self.file_path)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def test_no_reparse_when_unchanged(self):
+        """파일이 바뀌지 않으면 다시 파싱하지 않는지 테스트"""
+        print("\n=== JSON 캐시 재사용 테스트 ===")
+
+        self.collection.insert({'id': '1', 'title': '공고'})
+        reads = []
+        original_read = self.collection._read
+        self.collection._read = lambda: reads.append(1) or original_read()
+
+        for _ in range(5):
+            self.collection.all()
+            self.collection.get('1')
+        self.assertEqual(reads, [])
+        print("✓ 캐시 재사용 확인")
+
+    def test_reload_on_external_change(self):
+        """다른 프로세스가 파일을 바꾸면 다시 읽는지 테스트"""
+        print("\n=== JSON 캐시 무효화 테스트 ===")
+
+        self.collection.insert({'id': '1', 'title': '공고'})
+        snapshot = self.collection.all()
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            json.dump([{'id': '1', 'title': '공고'}, {'id': '2', 'title': '외부에서 추가된 공고'}], f, ensure_ascii=False)
+
+        self.assertEqual(self.collection.count(), 2)
+        self.assertEqual(self.collection.get('2')['title'], '외부에서 추가된 공고')
+        # 이전에 돌려준 목록은 그대로 유지
+        self.assertEqual(len(snapshot), 1)
+        print("✓ 캐시 무효화 확인")
+
+    def test_shared_database(self):
+        """get_database가 같은 인스턴스를 돌려주는지 테스트"""
+        import database
+        original = database._shared_database
+        try:
+            database._shared_database = Database(data_dir=self.data_dir)
+            self.assertIs(database.get_database(), database.get_database())
+        finally:
+            database._shared_database = original
+
+class TestConcurrentWrites(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        for path in list(JsonlCollection._instances):
+            if path.startswith(self.data_dir):
+                JsonlCollection._instances.pop(path).close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def check_processes(self, storage):
+        workers, count = 4, 15
+        processes = [
+            multiprocessing.Process(target=insert_jobs, args=(self.data_dir, storage, worker, count))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        jobs = Database(data_dir=self.data_dir, storage=storage).get_job_postings(skip=0, limit=1000)
+        self.assertEqual(len(jobs), workers * count)
+        self.assertEqual(len({job['id'] for job in jobs}), workers * count)
+
+    def test_json_processes(self):
+        """여러 프로세스가 동시에 JSON 파일에 써도 유실되지 않는지 테스트"""
+        print("\n=== JSON 다중 프로세스 쓰기 테스트 ===")
+        self.check_processes("json")
+        print("✓ JSON 다중 프로세스 쓰기 확인")
+
+    def test_jsonl_processes(self):
+        """여러 프로세스가 동시에 JSONL 로그에 써도 유실되지 않는지 테스트"""
+        print("\n=== JSONL 다중 프로세스 쓰기 테스트 ===")
+        self.check_processes("jsonl")
+        print("✓ JSONL 다중 프로세스 쓰기 확인")
+
+    def test_group_commit(self):
+        """동시에 들어온 쓰기가 더 적은 횟수의 커밋으로 묶이는지 테스트"""
+        print("\n=== 그룹 커밋 테스트 ===")
+        collection = JsonCollection(os.path.join(self.data_dir, "jobs.json"))
+        commits = []
+        original_write = collection._write_file
+        collection._write_file = lambda records: commits.append(len(records)) or original_write(records)
+
+        threads = [
+            threading.Thread(target=collection.insert, args=({'id': str(i), 'title': f'공고{i}'},))
+            for i in range(50)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(JsonCollection(collection.file_path).count(), 50)
+        self.assertLessEqual(len(commits), 50)
+        self.assertEqual(commits[-1], 50)
+        print(f"✓ 쓰기 50건 → 커밋 {len(commits)}회")
+
+    def test_group_commit_allocates_ids(self):
+        """id 발급이 그룹 커밋에 묶여 .seq 파일을 커밋마다 한 번만 쓰는지 테스트"""
+        print("\n=== 그룹 커밋 id 발급 테스트 ===")
+        collection = JsonCollection(os.path.join(self.data_dir, "jobs.json"))
+        commits = []
+        original_write = collection._write_file
+        collection._write_file = lambda records: commits.append(len(records)) or original_write(records)
+        seq_writes = []
+
+        def counting_atomic_write(path, data):
+            if path == collection._ids.seq_path:
+                seq_writes.append(data)
+            atomic_write(path, data)
+
+        # 첫 커밋이 끝나기 전에 나머지 쓰기가 모두 쌓이도록 파일 잠금을 잡아 둠
+        collection._file_lock.acquire()
+        with mock.patch('storage.atomic_write', counting_atomic_write):
+            threads = [
+                threading.Thread(target=collection.insert, args=({'title': f'공고{i}'},))
+                for i in range(30)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.2)
+            collection._file_lock.release()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(int(record['id']) for record in collection.all()), list(range(1, 31)))
+        self.assertEqual(len(seq_writes), len(commits))
+        self.assertLessEqual(len(commits), 2)
+        self.assertEqual(seq_writes[-1], b'30')
+        print(f"✓ 쓰기 30건 → 커밋 {len(commits)}회, .seq 기록 {len(seq_writes)}회")
+
+    def test_corrupt_file_keeps_cache(self):
+        """파일이 손상돼도 빈 목록 대신 마지막 정상 데이터를 유지하는지 테스트"""
+        print("\n=== 손상된 JSON 파일 테스트 ===")
+        collection = JsonCollection(os.path.join(self.data_dir, "jobs.json"))
+        collection.insert({'id': '1', 'title': '공고'})
+        with open(collection.file_path, 'w', encoding='utf-8') as f:
+            f.write('[{"id": "1", "ti')
+
+        self.assertEqual(collection.count(), 1)
+        self.assertEqual(collection.get('1')['title'], '공고')
+        self.assertTrue(os.path.exists(f"{collection.file_path}.corrupt"))
+        print("✓ 마지막 정상 데이터 유지 확인")
+
+class TestCursorPagination(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        for path in list(JsonlCollection._instances):
+            if path.startswith(self.data_dir):
+                JsonlCollection._instances.pop(path).close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def check_storage(self, storage):
+        db = Database(data_dir=self.data_dir, storage=storage)
+        for i in range(25):
+            db.save_job_posting({'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com'})
+
+        # 다음 페이지로 끝까지 이동
+        titles, cursor, pages = [], None, []
+        while True:
+            page = db.get_job_postings_page(limit=10, cursor=cursor)
+            pages.append(page)
+            titles += [job['title'] for job in page['jobs']]
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(titles, [f'공고{i}' for i in range(25)])
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]['prev_cursor'])
+
+        # 마지막 페이지에서 이전 페이지로
+        previous = db.get_job_postings_page(limit=10, cursor=pages[-1]['prev_cursor'])
+        self.assertEqual([job['title'] for job in previous['jobs']], [f'공고{i}' for i in range(10, 20)])
+
+        # 커서가 가리키던 공고가 삭제돼도 그 다음부터 이어짐
+        db.delete_job_posting(pages[0]['jobs'][-1]['id'])
+        page = db.get_job_postings_page(limit=3, cursor=pages[0]['next_cursor'])
+        self.assertEqual([job['title'] for job in page['jobs']], ['공고10', '공고11', '공고12'])
+
+        with self.assertRaises(ValueError):
+            db.get_job_postings_page(limit=10, cursor='잘못된 커서')
+
+    def test_json_storage(self):
+        """JSON 저장 방식의 커서 페이지네이션 테스트"""
+        print("\n=== JSON 커서 페이지네이션 테스트 ===")
+        self.check_storage("json")
+        print("✓ JSON 커서 페이지네이션 확인")
+
+    def test_jsonl_storage(self):
+        """JSONL 저장 방식의 커서 페이지네이션 테스트"""
+        print("\n=== JSONL 커서 페이지네이션 테스트 ===")
+        self.check_storage("jsonl")
+        print("✓ JSONL 커서 페이지네이션 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
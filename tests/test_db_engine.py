@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from sqlalchemy import inspect, text
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from db_engine import create_db_engine
+from database import init_db
+
+class TestDbEngine(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.tmp_dir = tempfile.mkdtemp(prefix="test_engine_")
+        self.engine = create_db_engine(f"sqlite:///{os.path.join(self.tmp_dir, 'test.db')}")
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def pragma(self, conn, name):
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_pragmas(self):
+        """연결마다 WAL 및 PRAGMA 설정이 적용되는지 테스트"""
+        print("\n=== SQLite PRAGMA 테스트 ===")
+        with self.engine.connect() as conn:
+            self.assertEqual(self.pragma(conn, "journal_mode"), "wal")
+            self.assertEqual(self.pragma(conn, "synchronous"), 1)  # NORMAL
+            self.assertEqual(self.pragma(conn, "temp_store"), 2)   # MEMORY
+            self.assertEqual(self.pragma(conn, "busy_timeout"), 5000)
+            self.assertEqual(self.pragma(conn, "cache_size"), -64000)
+        print("✓ PRAGMA 확인")
+
+    def test_reader_not_blocked_by_writer(self):
+        """쓰기 트랜잭션이 열려 있어도 다른 연결에서 조회할 수 있는지 테스트"""
+        print("\n=== WAL 동시 읽기 테스트 ===")
+        init_db(self.engine)
+        with self.engine.connect() as writer, self.engine.connect() as reader:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(text("INSERT INTO job_postings (company_name, job_title) VALUES ('회사', '공고')"))
+            self.assertEqual(reader.execute(text("SELECT count(*) FROM job_postings")).scalar(), 0)
+            writer.execute(text("COMMIT"))
+        print("✓ 쓰기 중 조회 확인")
+
+    def test_memory_database(self):
+        """메모리 데이터베이스도 같은 팩토리로 만들 수 있는지 테스트"""
+        engine = create_db_engine("sqlite://")
+        init_db(engine)
+        self.assertIn("job_postings", inspect(engine).get_table_names())
+        engine.dispose()
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,153 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
+from sqlalchemy import create_engine
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from models import JobPosting
+from database import Database, SqlDatabase
+from deadline import parse_deadline, parse_duration, DEADLINE_FIXED, DEADLINE_ROLLING, DEADLINE_UNTIL_FILLED
+from backfill_deadlines import backfill, backfill_records
+
+class TestParseDeadline(unittest.TestCase):
+    def test_formats(self):
+        """사이트별 마감일 표기 해석 테스트"""
+        print("\n=== 마감일 해석 테스트 ===")
+
+        now = datetime(2025, 3, 20, 10, 0)
+        cases = {
+            "~ 4/6(일)": datetime(2025, 4, 6, 23, 59, 59),
+            "2025.04.30": datetime(2025, 4, 30, 23, 59, 59),
+            "2024.03.01 09:00 ~ 2024.03.31 18:00": datetime(2024, 3, 31, 18, 0),
+            "이 기간동안 모집해요 ~ 2025. 04. 06 (일)": datetime(2025, 4, 6, 23, 59, 59),
+            "2025년 4월 30일": datetime(2025, 4, 30, 23, 59, 59),
+            "D-5": datetime(2025, 3, 25, 23, 59, 59),
+            "오늘마감": datetime(2025, 3, 20, 23, 59, 59),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(parse_deadline(text, now), (expected, DEADLINE_FIXED), text)
+        print("✓ 날짜 형식 해석 확인")
+
+        # 연도가 없고 기준 시점보다 한참 이전이면 다음 해
+        self.assertEqual(parse_deadline("~ 1/5(월)", datetime(2025, 12, 20))[0], datetime(2026, 1, 5, 23, 59, 59))
+        self.assertEqual(parse_deadline("채용시 마감", now), (None, DEADLINE_UNTIL_FILLED))
+        self.assertEqual(parse_deadline("상시채용", now), (None, DEADLINE_ROLLING))
+        self.assertEqual(parse_deadline({'접수기간': '2025.05.01 ~ 2025.05.10'}, now)[0], datetime(2025, 5, 10, 23, 59, 59))
+        self.assertEqual(parse_deadline("정보 없음", now), (None, None))
+        self.assertEqual(parse_deadline("2025.02.30", now), (None, None))
+        print("✓ 상시채용/채용시 마감/해석 불가 확인")
+
+        self.assertEqual(parse_duration("3d"), timedelta(days=3))
+        self.assertEqual(parse_duration("12h"), timedelta(hours=12))
+        with self.assertRaises(ValueError):
+            parse_duration("사흘")
+        print("✓ 기간 형식 확인")
+
+class TestClosingWithin(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+        self.engine = create_engine('sqlite://')
+        self.now = datetime.now()
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.engine.dispose()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def save_jobs(self, db):
+        for i, deadline in enumerate([
+            (self.now + timedelta(days=2)).strftime("%Y.%m.%d"),
+            (self.now + timedelta(days=1)).strftime("~ %m/%d"),
+            (self.now + timedelta(days=10)).strftime("%Y-%m-%d"),
+            (self.now - timedelta(days=1)).strftime("%Y.%m.%d"),
+            "상시채용",
+        ]):
+            db.save_job_posting({'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com', 'deadline': deadline})
+
+    def test_sql_storage(self):
+        """SQL 저장소: 저장 시 마감 일시 계산 및 closing_within 조회 테스트"""
+        print("\n=== SQL 마감 임박 조회 테스트 ===")
+
+        db = SqlDatabase(bind=self.engine)
+        self.save_jobs(db)
+        page = db.get_job_postings_closing(timedelta(days=3))
+        self.assertEqual([job['title'] for job in page['jobs']], ['공고1', '공고0'])
+        self.assertEqual(page['total'], 2)
+        self.assertEqual(db.get_job_posting(page['jobs'][0]['id'])['deadline_kind'], DEADLINE_FIXED)
+
+        # 마감일을 고치면 다시 계산
+        job = db.get_job_posting(page['jobs'][0]['id'])
+        db.update_job_posting(job['id'], {**job, 'deadline': '채용시 마감'})
+        self.assertEqual(db.get_job_posting(job['id'])['deadline_kind'], DEADLINE_UNTIL_FILLED)
+        self.assertEqual(db.get_job_postings_closing(timedelta(days=3))['total'], 1)
+        print("✓ SQL 마감 임박 조회 확인")
+
+    def check_storage(self, db):
+        self.save_jobs(db)
+        # 전체 공고를 훑지 않고 정렬 인덱스로 범위 조회
+        with mock.patch.object(db.jobs, 'all', side_effect=AssertionError("전체 조회")):
+            page = db.get_job_postings_closing(timedelta(days=3), limit=1)
+            self.assertEqual((page['total'], page['jobs'][0]['title']), (2, '공고1'))
+            self.assertEqual(db.get_job_postings_closing(timedelta(days=3), skip=1)['jobs'][0]['title'], '공고0')
+
+            # 마감일 수정/삭제가 인덱스에 반영됨
+            job = page['jobs'][0]
+            db.update_job_posting(job['id'], {**job, 'deadline': (self.now + timedelta(days=5)).strftime("%Y.%m.%d")})
+            self.assertEqual(db.get_job_postings_closing(timedelta(days=3))['total'], 1)
+            self.assertEqual(db.get_job_postings_closing(timedelta(days=6))['jobs'][-1]['id'], job['id'])
+            db.delete_job_posting(job['id'])
+            self.assertEqual([job['title'] for job in db.get_job_postings_closing(timedelta(days=30))['jobs']],
+                             ['공고0', '공고2'])
+
+    def test_json_storage(self):
+        """JSON 저장소 closing_within 조회 테스트"""
+        print("\n=== JSON 마감 임박 조회 테스트 ===")
+        self.check_storage(Database(data_dir=self.data_dir, storage="json"))
+        print("✓ JSON 마감 임박 조회 확인")
+
+    def test_jsonl_storage(self):
+        """JSONL 저장소 closing_within 조회 테스트"""
+        print("\n=== JSONL 마감 임박 조회 테스트 ===")
+        self.check_storage(Database(data_dir=self.data_dir, storage="jsonl"))
+        print("✓ JSONL 마감 임박 조회 확인")
+
+    def test_backfill(self):
+        """기존 공고 마감일 채우기 테스트"""
+        print("\n=== 마감일 채우기 테스트 ===")
+
+        db = SqlDatabase(bind=self.engine)
+        with db.Session() as session:
+            session.add_all([
+                JobPosting(job_title='예전 공고', link='http://a.com', deadline='~ 4/6(일)', created_at=datetime(2024, 3, 1)),
+                JobPosting(job_title='상시', link='http://b.com', deadline='상시채용'),
+                JobPosting(job_title='접수기간', link='http://c.com', extra={'application_period': {'접수기간': '2024.05.01 ~ 2024.05.10'}}),
+                JobPosting(job_title='알 수 없음', link='http://d.com', deadline='홈페이지 참조'),
+            ])
+            session.commit()
+
+        result = backfill(self.engine, batch_size=2)
+        self.assertEqual((result['updated'], result['unparsed']), (3, 1))
+        with db.Session() as session:
+            old = session.query(JobPosting).filter_by(link='http://a.com').one()
+            self.assertEqual(old.deadline_at, datetime(2024, 4, 6, 23, 59, 59))
+            self.assertEqual(session.query(JobPosting).filter_by(link='http://c.com').one().deadline_at.day, 10)
+        # 이미 채운 공고는 건너뜀
+        self.assertEqual(backfill(self.engine).get('updated'), 0)
+
+        json_db = Database(data_dir=self.data_dir, storage="json")
+        json_db.jobs.insert({'id': '1', 'title': '예전 공고', 'deadline': '2024.12.31'})
+        self.assertEqual(backfill_records(json_db)['updated'], 1)
+        self.assertEqual(json_db.get_job_posting('1')['deadline_at'], '2024-12-31T23:59:59')
+        print("✓ 마감일 채우기 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,137 @@
+import unittest
+import os
+import sys
+import threading
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler import driver_pool
+from crawler.driver_pool import DriverPool
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+class FakeDriver:
+    """Chrome 없이 풀 동작을 확인하기 위한 가짜 웹드라이버"""
+
+    def __init__(self):
+        self.window_handles = ['main']
+        self.current = 'main'
+        self.cookies = {'session': '1'}
+        self.cdp = []
+        self.url = None
+        self.quit_called = False
+        self.broken = False
+        self.switch_to = FakeSwitchTo(self)
+
+    def get(self, url):
+        if self.broken:
+            raise RuntimeError("chrome not reachable")
+        self.url = url
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append(cmd)
+        if cmd == 'Network.clearBrowserCookies':
+            self.cookies = {}
+
+    def quit(self):
+        self.quit_called = True
+
+class TestDriverPool(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.created = []
+
+        def factory():
+            driver = FakeDriver()
+            self.created.append(driver)
+            return driver
+
+        self.pool = DriverPool(size=2, max_pages=3, max_memory_mb=1000, factory=factory)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.pool.close()
+
+    def test_reuse_and_reset(self):
+        """반환한 드라이버를 정리해서 다시 빌려주는지 테스트"""
+        print("\n=== 웹드라이버 풀 재사용 테스트 ===")
+
+        driver = self.pool.checkout()
+        driver.window_handles.append('popup')
+        driver.current = 'popup'
+        self.pool.checkin(driver)
+        self.assertEqual(driver.window_handles, ['main'])
+        self.assertEqual(driver.cookies, {})
+        self.assertEqual(driver.url, 'about:blank')
+        self.assertIn('Network.setUserAgentOverride', driver.cdp)
+
+        with self.pool.driver() as again:
+            self.assertIs(again, driver)
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.pool.stats['reused'], 1)
+        print("✓ 탭/쿠키 정리 후 재사용 확인")
+
+    def test_recycle(self):
+        """사용 횟수/메모리/정리 실패 시 드라이버를 교체하는지 테스트"""
+        print("\n=== 웹드라이버 재활용 테스트 ===")
+
+        for _ in range(3):
+            with self.pool.driver() as driver:
+                pass
+        self.assertTrue(driver.quit_called)
+        self.assertEqual(self.pool.stats['recycled'], 1)
+        self.assertIsNot(self.pool.checkout(), driver)
+        print("✓ 사용 횟수 초과 시 재시작 확인")
+
+        with mock.patch.object(driver_pool, '_driver_memory_mb', return_value=2000):
+            big = self.pool.checkout()
+            self.pool.checkin(big)
+        self.assertTrue(big.quit_called)
+        self.assertEqual(self.pool.stats['recycled'], 2)
+
+        broken = self.pool.checkout()
+        broken.broken = True
+        self.pool.checkin(broken)
+        self.assertTrue(broken.quit_called)
+        self.assertEqual(self.pool.stats['discarded'], 1)
+        print("✓ 메모리 초과/정리 실패 시 교체 확인")
+
+    def test_bounded_size(self):
+        """풀 크기만큼만 드라이버를 띄우고 나머지는 기다리는지 테스트"""
+        print("\n=== 웹드라이버 풀 크기 제한 테스트 ===")
+
+        first, second = self.pool.checkout(), self.pool.checkout()
+        with self.assertRaises(TimeoutError):
+            self.pool.checkout(timeout=0.05)
+
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(self.pool.checkout(timeout=5)))
+        waiter.start()
+        self.pool.checkin(first)
+        waiter.join(5)
+        self.assertIs(got[0], first)
+        self.assertEqual(len(self.created), 2)
+        self.pool.checkin(second)
+        self.pool.checkin(got[0])
+
+        # 풀 밖에서 만든 드라이버는 반환 시 종료
+        outside = FakeDriver()
+        with mock.patch.object(driver_pool, '_shared_pool', self.pool):
+            driver_pool.release_driver(outside)
+        self.assertTrue(outside.quit_called)
+        print("✓ 풀 크기 제한 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
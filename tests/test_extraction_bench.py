@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'benchmarks'))
+
+from bench_extraction import CASES, compare, measure
+
+class TestExtractionBench(unittest.TestCase):
+    def test_fixtures_extract(self):
+        """저장한 상세 페이지마다 추출 결과가 기대값과 같은지 테스트"""
+        print("\n=== 추출 벤치마크 픽스처 테스트 ===")
+
+        for case in CASES:
+            result = measure(case, iterations=2, blocks=1)
+            self.assertEqual(result['mismatches'], {}, case.site)
+            self.assertGreater(result['peak_kb'], 0)
+            self.assertGreater(result['calibration'], 0)
+            self.assertGreater(result['ratio'], 0)
+            self.assertEqual((result['iterations'], result['blocks']), (2, 1))
+            print(f"✓ {case.site}: {result['p50_ms']:.1f}ms, {result['peak_kb']:.0f}KB")
+
+    def test_compare(self):
+        """기준 작업 대비 비율로 느려졌거나 메모리가 늘어난 사이트만 걸러내는지 테스트"""
+        print("\n=== 추출 벤치마크 기준값 비교 테스트 ===")
+
+        def result(ratio, peak_kb, mismatches=None):
+            return {'ratio': ratio, 'peak_kb': peak_kb, 'mismatches': mismatches or {}}
+
+        baseline = {'sites': {site: {'ratio': 0.5, 'peak_kb': 100.0}
+                              for site in ('Saramin', 'Incruit', 'Wanted', 'JobKorea', 'LinkedIn')}}
+        problems = compare({
+            'Saramin': result(0.7, 105),                     # 허용 범위 안 (+40%)
+            'Incruit': result(0.8, 100),                     # 느려짐 (+60%)
+            'Wanted': result(0.5, 120),                      # 메모리 증가
+            'JobKorea': result(0.3, 100),                    # 빨라짐
+            'LinkedIn': result(0.5, 100, mismatches={'title': ''}),
+            'JobPlanet': result(9.9, 999),                   # 기준값 없음
+        }, baseline)
+        self.assertEqual([problem.split(':')[0] for problem in problems], ['Incruit', 'Wanted', 'LinkedIn'])
+        self.assertEqual(compare({'Saramin': result(9.9, 999)}, None), [])
+        self.assertEqual(len(compare({'Saramin': result(0.7, 100)}, baseline, tolerance=0.3)), 1)
+        print("✓ p50/메모리/추출 결과 비교 확인")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import os
+import sys
+import asyncio
+import tempfile
+
+import httpx
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler.http_cache import CACHE_STATUS_HEADER, HttpCache
+from crawler.http_client import AsyncHttpClient
+from crawler.rate_limit import RateLimiter
+
+UNLIMITED = RateLimiter(rate=10000, burst=10000)
+
+class FakeSite:
+    """ETag/Last-Modified로 조건부 요청에 304를 돌려주는 가짜 사이트"""
+
+    def __init__(self):
+        self.pages = {}
+        self.sent = {'200': 0, '304': 0}
+        self.conditional = []
+
+    def __call__(self, request):
+        body, version = self.pages[request.url.path]
+        etag = f'"v{version}"'
+        self.conditional.append(request.headers.get('if-none-match'))
+        if request.headers.get('if-none-match') == etag:
+            self.sent['304'] += 1
+            return httpx.Response(304, headers={'etag': etag})
+        self.sent['200'] += 1
+        headers = {'etag': etag, 'last-modified': 'Wed, 01 Oct 2025 00:00:00 GMT', 'content-type': 'text/html'}
+        if request.url.path == '/private':
+            headers['cache-control'] = 'no-store'
+        return httpx.Response(200, headers=headers, text=body)
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'http_cache.sqlite')
+        self.site = FakeSite()
+        self.site.pages['/job/1'] = ("<html>공고 1</html>", 1)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.temp_dir.cleanup()
+
+    def fetch_all(self, cache, paths):
+        async def run():
+            async with AsyncHttpClient(rate_limiter=UNLIMITED, cache=cache,
+                                       transport=httpx.MockTransport(self.site)) as client:
+                return [await client.get(f"https://www.saramin.co.kr{path}") for path in paths]
+        return asyncio.run(run())
+
+    def test_fresh_hit_and_revalidation(self):
+        """TTL 안에서는 캐시로, 지나면 304 재검증으로, 바뀌면 새로 받는지 테스트"""
+        print("\n=== HTTP 캐시 적중/재검증 테스트 ===")
+
+        cache = HttpCache(self.path, ttl=3600)
+        first, second = self.fetch_all(cache, ['/job/1', '/job/1'])
+        self.assertNotIn(CACHE_STATUS_HEADER, first.headers)
+        self.assertEqual(second.headers[CACHE_STATUS_HEADER], 'HIT')
+        self.assertEqual(second.text, "<html>공고 1</html>")
+        self.assertEqual(self.site.sent, {'200': 1, '304': 0})
+        print("✓ TTL 안 캐시 적중 확인")
+
+        cache.ttl = 0
+        (again,) = self.fetch_all(cache, ['/job/1'])
+        self.assertEqual(again.headers[CACHE_STATUS_HEADER], 'REVALIDATED')
+        self.assertEqual(again.text, "<html>공고 1</html>")
+        self.assertEqual(self.site.conditional[-1], '"v1"')
+        self.assertEqual(self.site.sent, {'200': 1, '304': 1})
+
+        self.site.pages['/job/1'] = ("<html>공고 1 (수정)</html>", 2)
+        changed, cached = self.fetch_all(cache, ['/job/1', '/job/1'])
+        self.assertEqual(changed.text, "<html>공고 1 (수정)</html>")
+        self.assertEqual(cached.headers[CACHE_STATUS_HEADER], 'REVALIDATED')
+        self.assertEqual(cached.text, "<html>공고 1 (수정)</html>")
+        print("✓ 304 재검증/변경 감지 확인")
+
+        summary = cache.summary()
+        self.assertEqual((summary['hits'], summary['revalidated'], summary['misses']), (1, 2, 2))
+        self.assertAlmostEqual(summary['hit_rate'], 3 / 5)
+        cache.close()
+
+        # 다시 열어도 남아 있음
+        reopened = HttpCache(self.path, ttl=3600)
+        self.assertEqual(reopened.lookup("https://www.saramin.co.kr/job/1").etag, '"v2"')
+        self.assertEqual(reopened.total_bytes, len("<html>공고 1 (수정)</html>".encode()))
+        reopened.close()
+        print("✓ 통계/디스크 보존 확인")
+
+    def test_lru_eviction_and_no_store(self):
+        """크기 상한을 넘으면 가장 오래 안 쓴 항목부터 지우고 no-store는 저장하지 않는지 테스트"""
+        print("\n=== HTTP 캐시 LRU/no-store 테스트 ===")
+
+        for i in range(2, 5):
+            self.site.pages[f'/job/{i}'] = ("x" * 400, 1)
+        self.site.pages['/private'] = ("비공개", 1)
+        cache = HttpCache(':memory:', ttl=3600, max_bytes=1000)
+
+        self.fetch_all(cache, ['/job/2', '/job/3', '/job/2', '/job/4', '/private'])
+        urls = {url for (url,) in cache._conn.execute("SELECT url FROM http_cache")}
+        self.assertEqual(urls, {"https://www.saramin.co.kr/job/2", "https://www.saramin.co.kr/job/4"})
+        self.assertEqual(cache.stats['evictions'], 1)
+        self.assertLessEqual(cache.total_bytes, 1000)
+        print("✓ LRU 삭제/no-store 제외 확인")
+
+    def test_size_limit_across_processes(self):
+        """여러 워커가 같은 캐시 파일을 써도 전체 크기 상한이 지켜지는지 테스트"""
+        print("\n=== HTTP 캐시 다중 워커 크기 상한 테스트 ===")
+
+        # 워커마다 자기 연결(인스턴스)을 가짐
+        workers = [HttpCache(self.path, ttl=3600, max_bytes=1000) for _ in range(2)]
+        for i in range(4):
+            url = f"https://www.saramin.co.kr/job/{i}"
+            response = httpx.Response(200, text="x" * 400, request=httpx.Request('GET', url))
+            self.assertTrue(workers[i % 2].store(url, response))
+
+        for worker in workers:
+            self.assertLessEqual(worker.total_bytes, 1000)
+            self.assertEqual(worker.summary()['bytes'], 800)
+            worker.close()
+        reopened = HttpCache(self.path, ttl=3600, max_bytes=1000)
+        self.assertEqual(reopened.total_bytes, 800)
+        reopened.close()
+        print("✓ 다른 워커가 저장한 항목까지 포함한 크기 상한 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,100 @@
+import unittest
+import os
+import sys
+import asyncio
+from unittest import mock
+
+import httpx
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler import http_client
+from crawler.http_client import AsyncHttpClient
+from crawler.rate_limit import RateLimiter
+
+# 테스트에서는 속도 제한이 걸리지 않도록 넉넉한 제한기 사용
+UNLIMITED = RateLimiter(rate=10000, burst=10000)
+
+class FakeServer:
+    """호스트별 동시 요청 수를 기록하는 가짜 서버 (httpx.MockTransport 핸들러)"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.headers = []
+
+    async def __call__(self, request):
+        host = request.url.host
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        self.headers.append(dict(request.headers))
+        try:
+            await asyncio.sleep(self.delay)
+            if request.url.path == '/missing':
+                return httpx.Response(404, text='not found')
+            if request.url.path == '/broken':
+                raise httpx.ConnectError('connection refused', request=request)
+            return httpx.Response(200, text=f"{host}{request.url.path}")
+        finally:
+            self.active[host] -= 1
+
+class TestHttpClient(unittest.TestCase):
+    def test_per_host_limit(self):
+        """호스트별 동시 요청 수를 제한하면서 여러 URL을 한 번에 가져오는지 테스트"""
+        print("\n=== 호스트별 동시 요청 제한 테스트 ===")
+
+        server = FakeServer()
+        urls = [f"https://a.example/{i}" for i in range(8)] + [f"https://b.example/{i}" for i in range(3)]
+
+        async def run():
+            async with AsyncHttpClient(per_host_limit=2, rate_limiter=UNLIMITED, transport=httpx.MockTransport(server)) as client:
+                return await client.get_many(urls, headers={'Referer': 'https://a.example/'}), client.stats
+
+        pages, stats = asyncio.run(run())
+        self.assertEqual(pages, [url.replace('https://', '') for url in urls])
+        self.assertEqual(server.peak, {'a.example': 2, 'b.example': 2})
+        self.assertEqual(stats['requests'], len(urls))
+        self.assertIn('Mozilla', server.headers[0]['user-agent'])
+        self.assertEqual(server.headers[0]['referer'], 'https://a.example/')
+        print("✓ URL 순서 유지/호스트별 동시 요청 제한 확인")
+
+    def test_errors_and_sync_fetch(self):
+        """실패한 URL은 None으로, 동기 코드에서는 공유 클라이언트로 가져오는지 테스트"""
+        print("\n=== 실패 처리/공유 클라이언트 테스트 ===")
+
+        server = FakeServer(delay=0)
+        factory = lambda **kwargs: AsyncHttpClient(rate_limiter=UNLIMITED, transport=httpx.MockTransport(server))
+        with mock.patch.object(http_client, 'AsyncHttpClient', side_effect=factory), \
+                mock.patch.dict(os.environ, {'CRAWLER_HTTP_CACHE': '0'}):
+            try:
+                pages = http_client.fetch_many(['https://a.example/ok', 'https://a.example/missing',
+                                                'https://a.example/broken'])
+                self.assertEqual(pages, ['a.example/ok', None, None])
+                self.assertEqual(http_client.fetch('https://a.example/missing').status_code, 404)
+                with self.assertRaises(httpx.ConnectError):
+                    http_client.fetch('https://a.example/broken')
+                self.assertEqual(http_client.fetch_text('https://b.example/x'), 'b.example/x')
+            finally:
+                http_client.close_shared_client()
+        self.assertIsNone(http_client._shared_client)
+        print("✓ 실패 URL None 처리/동기 공유 클라이언트 확인")
+
+    def test_timeouts(self):
+        """연결/읽기 제한 시간이 설정되는지 테스트"""
+        print("\n=== 제한 시간 설정 테스트 ===")
+
+        async def run():
+            async with AsyncHttpClient(connect_timeout=2, read_timeout=7, rate_limiter=UNLIMITED) as client:
+                return client._client.timeout
+
+        timeout = asyncio.run(run())
+        self.assertEqual(timeout.connect, 2)
+        self.assertEqual(timeout.read, 7)
+        print("✓ 제한 시간 설정 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
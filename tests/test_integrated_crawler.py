@@ -0,0 +1,107 @@
+import unittest
+import os
+import sys
+import time
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler.integrated_crawler import IntegratedCrawler
+
+SARAMIN_A = 'https://www.saramin.co.kr/zf_user/search/recruit?searchword=python'
+SARAMIN_B = 'https://www.saramin.co.kr/zf_user/search/recruit?searchword=java'
+JOBPLANET = 'https://www.jobplanet.co.kr/job/search?q=개발자'
+INCRUIT = 'https://www.incruit.com/list/search.asp?col=all&kw=개발자'
+
+class Tracker:
+    """사이트별 동시 실행 수를 기록"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+
+    def enter(self, site):
+        with self.lock:
+            self.active[site] = self.active.get(site, 0) + 1
+            self.peak[site] = max(self.peak.get(site, 0), self.active[site])
+
+    def leave(self, site):
+        with self.lock:
+            self.active[site] -= 1
+
+def fake_crawler(site, tracker, delay=0.2, fail_on=None):
+    """crawl(url, max_jobs)만 있는 가짜 크롤러 클래스"""
+
+    class FakeCrawler:
+        def crawl(self, url, max_jobs=None):
+            tracker.enter(site)
+            try:
+                time.sleep(delay)
+                if fail_on and fail_on in url:
+                    raise RuntimeError("페이지 구조 변경")
+                return [{'site': site, 'url': f"{url}#{i}"} for i in range(max_jobs)]
+            finally:
+                tracker.leave(site)
+
+    return FakeCrawler
+
+class TestIntegratedCrawler(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.tracker = Tracker()
+        self.crawler = IntegratedCrawler(site_workers={'Saramin': 2, 'JobPlanet': 1, 'Incruit': 1})
+        self.crawler.crawler_factories = {
+            'Saramin': fake_crawler('Saramin', self.tracker),
+            'JobPlanet': fake_crawler('JobPlanet', self.tracker, fail_on='jobplanet'),
+            'Incruit': fake_crawler('Incruit', self.tracker),
+        }
+
+    def test_parallel_sites(self):
+        """사이트끼리 동시에 돌고 결과가 URL별로 모이는지 테스트"""
+        print("\n=== 사이트 병렬 크롤링 테스트 ===")
+
+        streamed = []
+        start = time.monotonic()
+        results = self.crawler.crawl_multiple([SARAMIN_A, INCRUIT, SARAMIN_B, SARAMIN_A, 'https://example.com/'],
+                                              max_jobs=2, on_result=streamed.append)
+        elapsed = time.monotonic() - start
+
+        # 가장 느린 사이트(0.2초) 수준, 합(0.6초)이 아님
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(list(results), [SARAMIN_A, INCRUIT, SARAMIN_B])
+        self.assertEqual(results[SARAMIN_B], [{'site': 'Saramin', 'url': f"{SARAMIN_B}#{i}"} for i in range(2)])
+        self.assertEqual(len(streamed), 3)
+        print(f"✓ 병렬 실행/URL별 결과 확인 ({elapsed:.2f}초)")
+
+    def test_site_budget_and_errors(self):
+        """사이트별 워커 수를 지키고 한 URL의 오류가 다른 URL에 번지지 않는지 테스트"""
+        print("\n=== 사이트별 워커 수/오류 격리 테스트 ===")
+
+        incruit_urls = [f"{INCRUIT}&page={i}" for i in range(3)]
+        saramin_urls = [f"{SARAMIN_A}&page={i}" for i in range(4)]
+        streamed = list(self.crawler.crawl_stream(saramin_urls + incruit_urls + [JOBPLANET], max_jobs=1))
+
+        self.assertEqual(self.tracker.peak, {'Saramin': 2, 'Incruit': 1, 'JobPlanet': 1})
+        failed = [result for result in streamed if result['error']]
+        self.assertEqual([result['url'] for result in failed], [JOBPLANET])
+        self.assertEqual(failed[0]['jobs'], [])
+        self.assertEqual(sum(len(result['jobs']) for result in streamed), 7)
+        print("✓ 사이트별 워커 수/오류 격리 확인")
+
+    def test_lazy_crawlers(self):
+        """crawl()용 크롤러는 처음 쓸 때만 만들고 이후 재사용하는지 테스트"""
+        print("\n=== 크롤러 지연 생성 테스트 ===")
+
+        self.assertEqual(IntegratedCrawler()._crawlers, {})
+        site, jobs = self.crawler.crawl(INCRUIT, max_jobs=1)
+        self.assertEqual((site, len(jobs)), ('Incruit', 1))
+        self.assertIs(self.crawler.get_crawler('Incruit'), self.crawler._crawlers['Incruit'])
+        self.assertEqual(list(self.crawler._crawlers), ['Incruit'])
+        print("✓ 지연 생성/재사용 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
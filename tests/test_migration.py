@@ -0,0 +1,165 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from models import JobPosting, Application, ResumeProfile
+from database import SqlDatabase
+from migrate_json_to_sql import migrate
+
+class TestJsonToSqlMigration(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.data_dir, 'test.db')}")
+        self.Session = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.engine.dispose()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def write_json(self, name, records):
+        with open(os.path.join(self.data_dir, name), 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False)
+
+    def test_migrate(self):
+        """채용 공고/이력서/지원 현황 이전 테스트"""
+        print("\n=== JSON → SQLite 이전 테스트 ===")
+
+        self.write_json("jobs.json", [
+            {'id': '3', 'site': 'saramin', 'title': '백엔드 개발자', 'company_name': '회사1', 'url': 'http://a.com',
+             'application_period': '2024.03.01 ~ 2024.03.31', 'created_at': '2024-03-01T10:00:00'},
+            {'id': '7', 'title': '중복 링크 공고', 'company_name': '회사1', 'url': 'http://a.com'},
+            {'id': 'x', 'title': '프론트엔드 개발자', 'company_name': '회사2', 'url': 'http://b.com'},
+        ])
+        self.write_json("resumes.json", [{'id': '1', 'name': '홍길동', 'email': 'hong@example.com'}])
+        self.write_json("applications.json", [
+            {'id': '1', 'job_id': '7', 'status': '지원중', 'applied_at': '2024-03-02T09:00:00'},
+            {'id': '2', 'job_id': '99', 'status': '지원중', 'applied_at': '날짜 아님'},
+        ])
+
+        calls = []
+        result = migrate(data_dir=self.data_dir, storage="json", bind=self.engine, batch_size=1,
+                         progress=lambda name, done, total: calls.append((name, done, total)))
+
+        self.assertEqual((result['jobs'], result['resumes'], result['applications']), (2, 1, 2))
+        self.assertEqual(result['skipped_duplicate_jobs'], 1)
+        self.assertEqual(result['unlinked_applications'], 1)
+        self.assertIn(("채용 공고", 2, 3), calls)
+
+        with self.Session() as session:
+            job = session.get(JobPosting, 3)
+            self.assertEqual(job.job_title, '백엔드 개발자')
+            self.assertEqual(job.extra, {'application_period': '2024.03.01 ~ 2024.03.31'})
+            self.assertEqual(job.created_at, datetime(2024, 3, 1, 10, 0))
+            # 숫자가 아닌 id는 최대값 다음 번호로 부여
+            self.assertEqual(session.get(JobPosting, 8).link, 'http://b.com')
+            # 중복 링크 공고를 가리키던 지원 현황은 남은 공고로 연결
+            self.assertEqual(session.get(Application, 1).job_id, 3)
+            self.assertIsNone(session.get(Application, 2).job_id)
+            self.assertEqual(session.get(ResumeProfile, 1).name, '홍길동')
+        print("✓ 이전 결과 확인")
+
+        # 대상에 데이터가 있으면 replace 없이는 중단
+        with self.assertRaises(RuntimeError):
+            migrate(data_dir=self.data_dir, storage="json", bind=self.engine)
+        result = migrate(data_dir=self.data_dir, storage="json", bind=self.engine, replace=True)
+        self.assertEqual(result['jobs'], 2)
+        print("✓ 재실행 확인")
+
+    def test_sql_database_reads_migrated_data(self):
+        """이전한 데이터를 SqlDatabase가 JSON 저장소와 같은 모양으로 돌려주는지 테스트"""
+        print("\n=== SQL 저장소 조회 테스트 ===")
+
+        self.write_json("jobs.json", [{'id': '1', 'title': '공고', 'company_name': '회사', 'url': 'http://a.com'}])
+        self.write_json("resumes.json", [])
+        self.write_json("applications.json", [{'id': '1', 'job_id': '1', 'status': '지원중', 'applied_at': '날짜 아님'}])
+        migrate(data_dir=self.data_dir, storage="json", bind=self.engine)
+
+        db = SqlDatabase(bind=self.engine)
+        job = db.get_job_posting_by_link('http://a.com')
+        self.assertEqual((job['id'], job['title'], job['site']), ('1', '공고', 'saramin'))
+        application = db.get_application('1')
+        self.assertEqual((application['job_id'], application['applied_at']), ('1', '날짜 아님'))
+        print("✓ SQL 저장소 조회 확인")
+
+class TestSqlDatabase(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.engine = create_engine('sqlite://')
+        self.db = SqlDatabase(bind=self.engine)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.engine.dispose()
+
+    def test_crud_and_dashboard(self):
+        """SQL 저장소 CRUD 및 대시보드 집계 테스트"""
+        print("\n=== SQL 저장소 CRUD 테스트 ===")
+
+        job = self.db.save_job_posting({'title': '공고', 'company_name': '회사', 'url': 'http://a.com', 'company_info': '스타트업'})
+        self.assertEqual(self.db.get_job_posting(job['id'])['company_info'], '스타트업')
+        updated = self.db.update_job_posting(job['id'], {'title': '수정된 공고', 'company_name': '회사', 'url': 'http://a.com'})
+        self.assertEqual(updated['title'], '수정된 공고')
+        self.assertNotIn('company_info', updated)
+        self.assertEqual(self.db.count_job_postings(), 1)
+
+        resume = self.db.save_resume({'name': '홍길동', 'email': 'hong@example.com', 'phone': '010', 'education': '학사',
+                                      'experience': '신입', 'skills': 'Python'})
+        self.assertEqual(self.db.get_resumes()[0]['name'], '홍길동')
+
+        application = self.db.save_application({'job_id': job['id'], 'status': '지원중'})
+        self.assertEqual(application['job_title'], '수정된 공고')
+        self.assertEqual(self.db.update_application(application['id'], {'status': '서류합격'})['status'], '서류합격')
+
+        stats = self.db.get_dashboard_stats()
+        self.assertEqual(stats, {'total_jobs': 1, 'total_resumes': 1, 'total_applications': 1, 'today_applications': 1})
+        self.assertEqual(self.db.get_application_series(days=3)['counts'], [0, 0, 1])
+
+        self.assertTrue(self.db.delete_application(application['id']))
+        self.assertTrue(self.db.delete_resume(resume['id']))
+        self.assertTrue(self.db.delete_job_posting(job['id']))
+        self.assertFalse(self.db.delete_job_posting(job['id']))
+        self.assertIsNone(self.db.get_job_posting('없는 id'))
+        print("✓ SQL 저장소 CRUD 확인")
+
+    def test_cursor_pagination(self):
+        """SQL 저장소 커서 페이지네이션 및 전체 건수 캐시 테스트"""
+        print("\n=== SQL 커서 페이지네이션 테스트 ===")
+
+        for i in range(25):
+            self.db.save_job_posting({'title': f'공고{i}', 'company_name': '회사', 'url': f'http://{i}.com'})
+
+        titles, cursor = [], None
+        while True:
+            page = self.db.get_job_postings_page(limit=10, cursor=cursor)
+            titles += [job['title'] for job in page['jobs']]
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(titles, [f'공고{i}' for i in range(25)])
+
+        last = page
+        previous = self.db.get_job_postings_page(limit=10, cursor=last['prev_cursor'])
+        self.assertEqual([job['title'] for job in previous['jobs']], [f'공고{i}' for i in range(10, 20)])
+        self.assertIsNotNone(previous['prev_cursor'])
+
+        # 전체 건수는 캐시되지만 이 프로세스의 쓰기는 바로 반영
+        self.assertEqual(self.db.count_job_postings(), 25)
+        self.db.delete_job_posting(page['jobs'][0]['id'])
+        self.assertEqual(self.db.count_job_postings(), 24)
+        print("✓ SQL 커서 페이지네이션 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+import time
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler import page_wait
+from crawler.page_wait import wait_for_page
+
+class FakePage:
+    """시간이 지나면서 준비되는 페이지를 흉내 내는 가짜 웹드라이버"""
+
+    def __init__(self, ready_after=0.0, selectors=(), requests_until=0.0):
+        self.started = time.monotonic()
+        self.ready_after = ready_after
+        self.selectors = set(selectors)
+        self.requests_until = requests_until
+
+    def execute_script(self, script, selectors):
+        elapsed = time.monotonic() - self.started
+        state = 'complete' if elapsed >= self.ready_after else 'loading'
+        found = elapsed >= self.ready_after and all(selector in self.selectors for selector in selectors)
+        # requests_until까지는 리소스 요청이 계속 늘어남
+        resources = int(min(elapsed, self.requests_until) * 100)
+        return [state, found, resources]
+
+class TestWaitForPage(unittest.TestCase):
+    def test_ready_page(self):
+        """준비된 페이지는 고정 대기 없이 바로 반환하는지 테스트"""
+        print("\n=== 페이지 준비 대기 테스트 ===")
+
+        selectors = ['.jv_summary, .jv_header', '.jv_cont, .jv_detail']
+        start = time.monotonic()
+        self.assertTrue(wait_for_page(FakePage(0.2, selectors), selectors, site='saramin'))
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.2 + page_wait.NETWORK_IDLE_SECONDS)
+        self.assertLess(elapsed, 2)
+        print(f"✓ 준비 직후 반환 확인 ({elapsed:.1f}초)")
+
+        # 네트워크 요청이 잦아들 때까지 조금 더 기다림
+        start = time.monotonic()
+        self.assertTrue(wait_for_page(FakePage(0.0, selectors, requests_until=0.6), selectors))
+        self.assertGreaterEqual(time.monotonic() - start, 0.6 + page_wait.NETWORK_IDLE_SECONDS)
+        print("✓ 네트워크 유휴 대기 확인")
+
+    def test_timeouts(self):
+        """핵심 요소가 없으면 제한 시간 뒤 False, 전체 대기는 상한을 넘지 않는지 테스트"""
+        print("\n=== 페이지 대기 제한 시간 테스트 ===")
+
+        start = time.monotonic()
+        self.assertFalse(wait_for_page(FakePage(0.0), ['.jv_cont'], timeout=0.3))
+        self.assertLess(time.monotonic() - start, 1)
+
+        # 요청이 끝나지 않는 페이지도 SETTLE_SECONDS/MAX_PAGE_WAIT 안에서 끝남
+        with mock.patch.object(page_wait, 'MAX_PAGE_WAIT', 0.5):
+            start = time.monotonic()
+            self.assertFalse(wait_for_page(FakePage(5.0), ['.x'], timeout=10))
+            self.assertLess(time.monotonic() - start, 1)
+            start = time.monotonic()
+            self.assertTrue(wait_for_page(FakePage(0.0, requests_until=60), []))
+            self.assertLess(time.monotonic() - start, 1)
+        print("✓ 사이트별 제한 시간/상한 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
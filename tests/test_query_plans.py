@@ -0,0 +1,114 @@
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import crud
+from models import JobPosting, Resume, Application, Schedule
+from database import SqlDatabase, init_db
+from pagination import encode_cursor
+
+class TestQueryPlans(unittest.TestCase):
+    """
+    crud/SqlDatabase 조회가 인덱스를 쓰는지 EXPLAIN QUERY PLAN으로 확인
+
+    실행된 SELECT를 모두 모아 계획을 보고, 인덱스 없이 테이블 전체를 훑거나(SCAN <테이블>)
+    ORDER BY를 위해 임시 B-tree로 정렬하면 실패한다. 새 조회를 추가하면 여기에도 추가할 것.
+    (기간으로 먼저 좁힌 뒤의 GROUP BY date(...)용 임시 B-tree는 허용)
+    """
+
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.engine = create_engine('sqlite://')
+        init_db(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.db = self.Session()
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._capture)
+
+        now = datetime.now()
+        jobs = [JobPosting(company_name=f"회사{i}", job_title=f"직무{i}", link=f"http://{i}.com",
+                           platform="saramin" if i % 2 else "wanted", deadline=f"2024-12-{i + 1:02d}",
+                           application_status="미지원" if i % 3 else "서류합격") for i in range(20)]
+        self.db.add_all(jobs)
+        self.db.flush()
+        resume = Resume(title="자소서", file_path="resume.pdf", job_posting_id=jobs[0].id)
+        self.db.add(resume)
+        self.db.flush()
+        self.db.add_all([Application(job_id=job.id, resume_id=resume.id, status="지원중", applied_at=now) for job in jobs])
+        self.db.add_all([Schedule(title=f"일정{i}", start_date=now + timedelta(days=i), event_type="면접",
+                                  job_posting_id=jobs[i].id) for i in range(5)])
+        self.db.commit()
+        self.job_id = jobs[0].id
+        self.resume_id = resume.id
+        self.statements.clear()
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.db.close()
+        self.engine.dispose()
+
+    def _capture(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            self.statements.append((statement, parameters))
+
+    def assert_no_full_scans(self):
+        """모아 둔 SELECT마다 계획을 확인"""
+        self.assertTrue(self.statements)
+        with self.engine.connect() as conn:
+            raw = conn.connection.driver_connection
+            for statement, parameters in self.statements:
+                plan = [row[3] for row in raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+                for detail in plan:
+                    if detail.startswith("SCAN ") and "USING" not in detail and "CONSTANT ROW" not in detail:
+                        self.fail(f"인덱스 없이 전체 테이블 조회: {detail}\n{statement}")
+                    self.assertNotIn("TEMP B-TREE FOR ORDER BY", detail, f"정렬용 임시 B-tree 사용:\n{statement}")
+        self.statements.clear()
+
+    def test_job_posting_queries(self):
+        """채용 공고 조회 계획 테스트"""
+        print("\n=== 채용 공고 조회 계획 테스트 ===")
+
+        job = crud.get_job(self.db, self.job_id)
+        crud.get_job_by_link(self.db, "http://3.com")
+        crud.get_jobs_page(self.db, limit=5)
+        crud.get_jobs_page(self.db, limit=5, platform="wanted")
+        crud.get_jobs_page(self.db, limit=5, cursor=encode_cursor(job.created_at, job.id, "next"))
+        crud.get_jobs_page(self.db, limit=5, cursor=encode_cursor(job.created_at, job.id, "prev"))
+        crud.get_jobs_page(self.db, limit=5, cursor=encode_cursor(job.created_at, job.id, "next"), platform="saramin")
+        crud.get_jobs_closing_within(self.db, timedelta(days=3))
+        self.assert_no_full_scans()
+        print("✓ 채용 공고 조회 인덱스 사용 확인")
+
+    def test_related_record_queries(self):
+        """지원 현황/자소서/일정 조회 계획 테스트"""
+        print("\n=== 연관 데이터 조회 계획 테스트 ===")
+
+        self.assertEqual(len(crud.get_applications_by_resume(self.db, self.resume_id)), 20)
+        self.assert_no_full_scans()
+
+        # 공고 삭제 시 관계(resumes/schedules/applications)를 불러오는 조회
+        job = crud.get_job(self.db, self.job_id)
+        self.assertEqual((len(job.resumes), len(job.schedules), len(job.applications)), (1, 1, 1))
+        self.assert_no_full_scans()
+        print("✓ 연관 데이터 조회 인덱스 사용 확인")
+
+    def test_dashboard_queries(self):
+        """SQL 저장소 대시보드 집계 계획 테스트"""
+        print("\n=== 대시보드 집계 계획 테스트 ===")
+
+        db = SqlDatabase(bind=self.engine)
+        self.statements.clear()
+        self.assertEqual(db.get_application_series(days=3)['counts'][-1], 20)
+        self.assert_no_full_scans()
+        print("✓ 대시보드 집계 인덱스 사용 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
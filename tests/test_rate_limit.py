@@ -0,0 +1,91 @@
+import unittest
+import os
+import sys
+import time
+import asyncio
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler.rate_limit import RateLimiter, TokenBucket, _parse_domain_rates
+
+SARAMIN = 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=1'
+INCRUIT = 'https://job.incruit.com/jobdb_info/jobpost.asp?job=1'
+
+class TestRateLimiter(unittest.TestCase):
+    def test_token_bucket(self):
+        """burst만큼은 바로, 그 뒤로는 rate 간격으로 토큰을 내주는지 테스트"""
+        print("\n=== 토큰 버킷 테스트 ===")
+
+        bucket = TokenBucket(rate=10, burst=2)
+        delays = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(delays[:2], [0.0, 0.0])
+        self.assertAlmostEqual(delays[2], 0.1, delta=0.01)
+        self.assertAlmostEqual(delays[3], 0.2, delta=0.01)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        print("✓ 연속 허용/간격 확인")
+
+    def test_domains_are_independent(self):
+        """한 도메인이 밀려도 다른 도메인은 기다리지 않는지 테스트"""
+        print("\n=== 도메인별 독립 예산 테스트 ===")
+
+        limiter = RateLimiter(rate=5, burst=1)
+        start = time.monotonic()
+        limiter.acquire(SARAMIN)
+        self.assertGreater(limiter.bucket(SARAMIN).reserve(), 0)
+        self.assertEqual(limiter.acquire(INCRUIT), 0.0)
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(limiter.domain_of(SARAMIN), 'saramin.co.kr')
+        self.assertEqual(limiter.domain_of(INCRUIT), 'job.incruit.com')
+
+        # 도메인 설정은 하위 도메인에도 적용
+        limiter.set_rate('incruit.com', 100, 10)
+        self.assertEqual(limiter.domain_of(INCRUIT), 'incruit.com')
+        self.assertEqual(limiter.bucket('https://m.incruit.com/').rate, 100)
+        self.assertEqual(_parse_domain_rates("saramin.co.kr=2:4, linkedin.com=0.5,bad"),
+                         {'saramin.co.kr': (2.0, 4.0), 'linkedin.com': (0.5, 2.0)})
+        print("✓ 도메인별 예산 분리/설정 확인")
+
+    def test_threads_share_budget(self):
+        """여러 스레드가 같은 도메인 예산을 나눠 쓰는지 테스트"""
+        print("\n=== 스레드 공유 테스트 ===")
+
+        limiter = RateLimiter(rate=50, burst=1)
+        threads = [threading.Thread(target=lambda: [limiter.acquire(SARAMIN) for _ in range(3)]) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+        # 12건, burst 1, 초당 50건 → 최소 11/50초
+        self.assertGreaterEqual(elapsed, 11 / 50 - 0.01)
+        self.assertLess(elapsed, 1)
+        self.assertEqual(limiter.stats['requests'], 12)
+        self.assertEqual(limiter.stats['delayed'], 11)
+        print(f"✓ 스레드 간 예산 공유 확인 ({elapsed:.2f}초)")
+
+    def test_asyncio(self):
+        """asyncio에서 이벤트 루프를 막지 않고 기다리는지 테스트"""
+        print("\n=== asyncio 테스트 ===")
+
+        limiter = RateLimiter(rate=50, burst=1)
+
+        async def run():
+            saramin = asyncio.gather(*(limiter.acquire_async(SARAMIN) for _ in range(6)))
+            incruit_waited = await limiter.acquire_async(INCRUIT)
+            return await saramin, incruit_waited
+
+        start = time.monotonic()
+        delays, incruit_waited = asyncio.run(run())
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50 - 0.01)
+        self.assertEqual(delays, sorted(delays))
+        self.assertEqual(incruit_waited, 0.0)
+        print("✓ 비동기 대기/도메인 분리 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
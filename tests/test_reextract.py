@@ -0,0 +1,99 @@
+import unittest
+import os
+import sys
+import tempfile
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import crud
+from crawler.snapshot_archive import SnapshotArchive
+from database import init_db
+from reextract import reextract
+
+FIXTURE_PATH = os.path.join(current_dir, 'fixtures', 'saramin_detail.html')
+SARAMIN_URL = 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=50312877'
+INCRUIT_URL = 'https://www.incruit.com/jobdb/view.asp?job=1'
+BROKEN_URL = 'https://www.incruit.com/jobdb/view.asp?job=2'
+UNKNOWN_URL = 'https://www.incruit.com/jobdb/view.asp?job=3'
+
+INCRUIT_HTML = """<html><body><div class="jobview_wrap">
+<div class="jobpost_top_cpname">인크루트회사</div><div class="jobpost_top_title">데이터 엔지니어</div>
+<div class="jobview_section"><span class="info_period">~ 4/6(일)</span>
+<span class="info_salary">3,600만원</span><div class="jobview_cont">파이프라인 개발</div></div>
+</div></body></html>"""
+
+class TestReextract(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive = SnapshotArchive(os.path.join(self.temp_dir.name, 'snapshots'))
+        with open(FIXTURE_PATH, encoding='utf-8') as f:
+            self.archive.put(SARAMIN_URL, f.read(), site='Saramin', source='http')
+        fetched_at = datetime(2025, 3, 20).timestamp()
+        self.archive.put(INCRUIT_URL, INCRUIT_HTML, site='Incruit', source='browser', fetched_at=fetched_at)
+        self.archive.put(BROKEN_URL, "<html><body>점검 중</body></html>", site='Incruit', source='browser')
+        self.archive.put(UNKNOWN_URL, INCRUIT_HTML, site='Incruit', source='browser')
+
+        self.engine = create_engine('sqlite://')
+        init_db(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        crud.bulk_upsert_job_postings(self.db, [
+            {'link': SARAMIN_URL, 'platform': 'saramin', 'company_name': '테스트컴퍼니', 'job_title': '백엔드 개발자',
+             'salary': '협의', 'deadline': '', 'extra': {'memo': '직접 입력'}},
+            {'link': INCRUIT_URL, 'platform': 'incruit', 'company_name': '인크루트회사', 'job_title': '데이터 엔지니어'},
+            {'link': BROKEN_URL, 'platform': 'incruit', 'company_name': '그대로', 'job_title': '그대로'},
+        ])
+        job = crud.get_job_by_link(self.db, SARAMIN_URL)
+        job.application_status = "지원완료"
+        self.db.commit()
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.db.close()
+        self.engine.dispose()
+        self.archive.close()
+        self.temp_dir.cleanup()
+
+    def test_reextract(self):
+        """보관된 HTML을 다시 추출해 바뀐 공고만 고치는지 테스트"""
+        print("\n=== 스냅샷 다시 추출 테스트 ===")
+
+        result = reextract(self.archive, self.engine, workers=1, dry_run=True)
+        self.assertEqual({key: result[key] for key in ('scanned', 'skipped', 'failed', 'unchanged', 'updated')},
+                         {'scanned': 4, 'skipped': 1, 'failed': 1, 'unchanged': 0, 'updated': 2})
+        self.assertEqual(result['columns']['salary'], 2)
+        self.assertEqual(crud.get_job_by_link(self.db, SARAMIN_URL).salary, '협의')
+        print("✓ dry-run은 건수만 세고 저장하지 않음 확인")
+
+        result = reextract(self.archive, self.engine, workers=1)
+        self.assertEqual(result['updated'], 2)
+        self.db.expire_all()
+        job = crud.get_job_by_link(self.db, SARAMIN_URL)
+        self.assertEqual(job.salary, '회사 내규에 따름')
+        self.assertEqual(job.job_title, '백엔드 개발자 (Python)')
+        self.assertEqual(job.deadline_at, datetime(2026, 12, 31, 23, 59))
+        self.assertEqual(job.extra['memo'], '직접 입력')
+        self.assertEqual(job.extra['company_info'], {'기업형태': '중소기업', '사원수': '120명'})
+        self.assertEqual(job.application_status, "지원완료")
+        self.assertEqual(job.platform, 'saramin')
+        print("✓ 바뀐 컬럼 갱신, 사용자 관리 컬럼/platform/기존 extra 유지 확인")
+
+        job = crud.get_job_by_link(self.db, INCRUIT_URL)
+        self.assertEqual(job.salary, '3,600만원')
+        # 연도 없는 마감일은 스냅샷을 가져온 시각(2025-03-20) 기준
+        self.assertEqual(job.deadline_at, datetime(2025, 4, 6, 23, 59, 59))
+        self.assertEqual(crud.get_job_by_link(self.db, BROKEN_URL).job_title, '그대로')
+        print("✓ 가져온 시각 기준 마감일, 추출 실패 공고 유지 확인")
+
+        result = reextract(self.archive, self.engine, workers=2)
+        self.assertEqual((result['unchanged'], result['updated'], result['failed']), (2, 0, 1))
+        print("✓ 워커 프로세스로 다시 실행하면 바뀐 공고 없음 확인")
+
+if __name__ == '__main__':
+    unittest.main()
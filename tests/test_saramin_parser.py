@@ -0,0 +1,176 @@
+import unittest
+import os
+import sys
+from unittest import mock
+
+import httpx
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler import final_saramin_crawler
+from crawler.dom import element_text, parse_html
+from crawler.final_saramin_crawler import FinalSaraminCrawler
+from crawler.http_cache import CACHE_STATUS_HEADER
+
+FIXTURE_PATH = os.path.join(current_dir, 'fixtures', 'saramin_detail.html')
+FIXTURE_URL = 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=50312877'
+
+class FakeDriver:
+    """page_source 접근 횟수를 세는 가짜 웹드라이버"""
+
+    def __init__(self, html):
+        self.html = html
+        self.source_reads = 0
+        self.url = None
+
+    def get(self, url):
+        self.url = url
+
+    @property
+    def page_source(self):
+        self.source_reads += 1
+        return self.html
+
+class TestSaraminParser(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        with open(FIXTURE_PATH, encoding='utf-8') as f:
+            self.html = f.read()
+        self.crawler = FinalSaraminCrawler()
+
+    def test_element_text(self):
+        """WebElement.text처럼 보이는 텍스트만 줄 단위로 뽑는지 테스트"""
+        print("\n=== 요소 텍스트 추출 테스트 ===")
+
+        soup = parse_html("<div> 가  나<p>다</p><script>var x;</script><!-- 주석 --><span>라</span></div>")
+        self.assertEqual(element_text(soup.div), "가 나\n다\n라")
+        self.assertEqual(element_text(None), "")
+        print("✓ 블록 줄바꿈/공백 정리/스크립트 제외 확인")
+
+    def test_parse_job_detail(self):
+        """저장된 상세 페이지 HTML만으로 job_data를 만드는지 테스트"""
+        print("\n=== 사람인 상세 페이지 오프라인 추출 테스트 ===")
+
+        job = self.crawler.parse_job_detail(self.html, FIXTURE_URL)
+        self.assertEqual(job['site'], 'Saramin')
+        self.assertEqual(job['url'], FIXTURE_URL)
+        self.assertEqual(job['company_name'], '테스트컴퍼니')
+        self.assertEqual(job['title'], '백엔드 개발자 (Python)')
+        self.assertEqual(job['experience'], '경력 3년 이상')
+        self.assertEqual(job['education'], '대졸(4년제) 이상')
+        self.assertEqual(job['employment_type'], '정규직 수습 3개월')
+        self.assertEqual(job['location'], '서울 강남구')
+        self.assertEqual(job['salary'], '회사 내규에 따름')
+        self.assertEqual(job['welfare_benefits'], '4대보험\n유연근무제')
+        self.assertEqual(job['application_period']['지원방법'], '사람인 입사지원')
+        self.assertEqual(job['company_info'], {'기업형태': '중소기업', '사원수': '120명'})
+        self.assertIn('크롤링 파이프라인 운영', job['description'])
+        print("✓ 기본/근무조건/부가 정보 추출 확인")
+
+        self.assertEqual(job['deadline'], '~ 2026.12.31(목) 23:59')
+        self.assertEqual(job['deadline_at'], '2026-12-31T23:59:00')
+        self.assertEqual(job['deadline_kind'], 'fixed')
+        print("✓ 마감일 정규화 확인")
+
+    def test_regex_fallback(self):
+        """구조화된 영역이 없으면 원본 소스에서 정규식으로 찾는지 테스트"""
+        print("\n=== 정규식 대체 추출 테스트 ===")
+
+        html = "<html><body><h1>채용</h1><table><tr><th>경력</th><td>신입</td></tr></table></body></html>"
+        job = self.crawler.parse_job_detail(html, FIXTURE_URL)
+        self.assertEqual(job['experience'], '신입')
+        self.assertEqual(job['company_info'], {})
+        print("✓ 정규식 대체 추출 확인")
+
+    def test_single_page_source(self):
+        """상세 크롤링이 page_source를 한 번만 읽고 드라이버를 먼저 반환하는지 테스트"""
+        print("\n=== 페이지 소스 단일 조회 테스트 ===")
+
+        driver = FakeDriver(self.html)
+        released = []
+        self.crawler.http_first = False
+        with mock.patch.object(self.crawler, 'setup_driver', return_value=driver), \
+                mock.patch.object(final_saramin_crawler, 'wait_for_page', return_value=True), \
+                mock.patch.object(final_saramin_crawler, 'release_driver',
+                                  side_effect=lambda d, discard=False: released.append(d)), \
+                mock.patch.object(final_saramin_crawler, 'archive_page') as archive_page:
+            job = self.crawler.crawl_job_detail(FIXTURE_URL)
+        archive_page.assert_called_once_with(FIXTURE_URL, self.html, site='Saramin', source='browser')
+
+        self.assertEqual(driver.url, FIXTURE_URL)
+        self.assertEqual(driver.source_reads, 1)
+        self.assertEqual(released, [driver])
+        self.assertEqual(job.pop('fetch_tier'), 'browser')
+        self.assertEqual(job, self.crawler.parse_job_detail(self.html, FIXTURE_URL))
+        print("✓ 페이지 소스 1회 조회/드라이버 반환 확인")
+
+    def test_http_first(self):
+        """HTTP 결과가 충분하면 브라우저 없이, 필수 항목이 비면 브라우저로 가져오는지 테스트"""
+        print("\n=== HTTP 우선 조회 테스트 ===")
+
+        browser = mock.Mock(return_value={'title': '브라우저 결과'})
+        with mock.patch.object(self.crawler, 'fetch_html', return_value=self.html), \
+                mock.patch.object(self.crawler, 'crawl_job_detail_with_browser', browser):
+            job = self.crawler.crawl_job_detail(FIXTURE_URL)
+        self.assertEqual(job['fetch_tier'], 'http')
+        self.assertEqual(job['company_name'], '테스트컴퍼니')
+        browser.assert_not_called()
+        print("✓ HTTP 결과 사용 확인")
+
+        # 스크립트로 채워지는 빈 껍데기 페이지 / 요청 실패
+        shell = "<html><body><h1 class='tit_job'>백엔드 개발자</h1><div id='app'></div></body></html>"
+        for html in (shell, None):
+            with mock.patch.object(self.crawler, 'fetch_html', return_value=html), \
+                    mock.patch.object(self.crawler, 'crawl_job_detail_with_browser', browser):
+                job = self.crawler.crawl_job_detail(FIXTURE_URL)
+            self.assertEqual(job, {'title': '브라우저 결과', 'fetch_tier': 'browser'})
+        self.assertEqual(browser.call_count, 2)
+        self.assertEqual(self.crawler.fetch_tiers[FIXTURE_URL], 'browser')
+        print("✓ 필수 항목 누락/요청 실패 시 브라우저 전환 확인")
+
+    def test_fetch_html_archive(self):
+        """새로 받은 페이지만 보관하고 캐시에서 나온 페이지는 다시 보관하지 않는지 테스트"""
+        print("\n=== HTTP 페이지 보관 테스트 ===")
+
+        request = httpx.Request('GET', FIXTURE_URL)
+        fresh = httpx.Response(200, text=self.html, request=request)
+        cached = httpx.Response(200, text=self.html, request=request, headers={CACHE_STATUS_HEADER: 'REVALIDATED'})
+        for response, archived in ((fresh, 1), (cached, 0)):
+            with mock.patch.object(final_saramin_crawler, 'fetch', return_value=response), \
+                    mock.patch.object(final_saramin_crawler, 'archive_page') as archive_page:
+                self.assertEqual(self.crawler.fetch_html(FIXTURE_URL), self.html)
+            self.assertEqual(archive_page.call_count, archived)
+        print("✓ 캐시 응답(HIT/REVALIDATED) 보관 생략 확인")
+
+    def test_job_list(self):
+        """검색 결과에서 상세 URL을 모으고 crawl이 목록/상세 URL을 구분하는지 테스트"""
+        print("\n=== 사람인 검색 결과 목록 테스트 ===")
+
+        html = """
+        <div class="item_recruit"><div class="area_job"><h2 class="job_tit">
+          <a href="/zf_user/jobs/relay/view?view_type=search&rec_idx=101">백엔드</a></h2></div></div>
+        <div class="item_recruit"><div class="area_job"><h2 class="job_tit">
+          <a href="/zf_user/jobs/relay/view?view_type=search&rec_idx=102">프론트엔드</a></h2></div></div>
+        <a href="/zf_user/jobs/relay/view?view_type=search&rec_idx=101">중복 링크</a>
+        <a href="/zf_user/company-info/view?csn=1">회사 정보</a>
+        """
+        base = 'https://www.saramin.co.kr/zf_user/search/recruit?searchword=python'
+        urls = self.crawler.parse_job_list(html, base)
+        self.assertEqual(urls, [
+            'https://www.saramin.co.kr/zf_user/jobs/relay/view?view_type=search&rec_idx=101',
+            'https://www.saramin.co.kr/zf_user/jobs/relay/view?view_type=search&rec_idx=102',
+        ])
+
+        detail = mock.Mock(side_effect=lambda url: {'url': url})
+        with mock.patch.object(self.crawler, 'fetch_html', return_value=html), \
+                mock.patch.object(self.crawler, 'crawl_job_detail', detail):
+            self.assertEqual(self.crawler.crawl(base, max_jobs=1), [{'url': urls[0]}])
+            self.assertEqual(self.crawler.crawl(FIXTURE_URL), [{'url': FIXTURE_URL}])
+        self.assertEqual(len(self.crawler.data), 2)
+        print("✓ 상세 URL 목록/crawl 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
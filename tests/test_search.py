@@ -0,0 +1,137 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest import mock
+from sqlalchemy import create_engine, text
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from models import Base
+from database import Database, SqlDatabase, init_db
+from search import highlight_offsets, make_snippet
+
+JOBS = [
+    {'title': '백엔드개발자 (Python)', 'company_name': '가나소프트', 'url': 'http://1.com',
+     'description': '대용량 트래픽을 처리하는 파이썬 백엔드 서비스를 개발합니다.', 'welfare_benefits': '재택근무, 점심 식대'},
+    {'title': '프론트엔드 개발자', 'company_name': '다라테크', 'url': 'http://2.com',
+     'description': 'React 기반 웹 서비스 개발', 'welfare_benefits': '유연근무제'},
+    {'title': '데이터 엔지니어', 'company_name': '백엔드랩', 'url': 'http://3.com',
+     'description': 'AI 학습 데이터 파이프라인 구축', 'welfare_benefits': '재택근무'},
+]
+
+class TestSqlSearch(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.engine = create_engine('sqlite://')
+        self.db = SqlDatabase(bind=self.engine)
+        self.saved = [self.db.save_job_posting(dict(job)) for job in JOBS]
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.engine.dispose()
+
+    def test_search_ranking_and_highlights(self):
+        """FTS5 trigram 검색: 한글 부분 문자열, BM25 순위, 스니펫/강조 위치 테스트"""
+        print("\n=== FTS5 검색 테스트 ===")
+
+        result = self.db.search_job_postings('백엔드')
+        self.assertEqual(result['total'], 2)
+        # 공고명 일치(가중치 10)가 회사명 일치(가중치 5)보다 앞
+        self.assertEqual([job['url'] for job in result['jobs']], ['http://1.com', 'http://3.com'])
+        first = result['jobs'][0]
+        self.assertEqual(first['highlights']['title'], [[0, 3]])
+        self.assertEqual(first['snippet']['field'], 'description')
+        start, end = first['snippet']['highlights'][0]
+        self.assertEqual(first['snippet']['text'][start:end], '백엔드')
+        print("✓ 한글 부분 문자열 검색 및 순위 확인")
+
+        # 여러 단어는 AND, 짧은 단어(2글자 이하)도 검색
+        self.assertEqual(self.db.search_job_postings('재택근무 AI')['total'], 1)
+        self.assertEqual(self.db.search_job_postings('개발')['total'], 2)
+        self.assertEqual(self.db.search_job_postings('python')['jobs'][0]['url'], 'http://1.com')
+        # FTS5 연산자는 일반 문자로 취급
+        self.assertEqual(self.db.search_job_postings('"OR* NEAR(')['total'], 0)
+        with self.assertRaises(ValueError):
+            self.db.search_job_postings('   ')
+        print("✓ 여러 단어/짧은 단어/특수문자 검색 확인")
+
+    def test_rank_window(self):
+        """일치 건수가 RANK_WINDOW를 넘으면 최근 공고 안에서만 순위를 매기는지 테스트"""
+        print("\n=== 순위 계산 범위 테스트 ===")
+
+        with mock.patch('search.RANK_WINDOW', 1):
+            result = self.db.search_job_postings('재택근무')
+            self.assertEqual((result['total'], result['total_capped']), (1, True))
+            self.assertEqual([job['url'] for job in result['jobs']], ['http://3.com'])
+        self.assertFalse(self.db.search_job_postings('재택근무')['total_capped'])
+        print("✓ 순위 계산 범위 확인")
+
+    def test_index_follows_writes(self):
+        """트리거로 수정/삭제가 색인에 바로 반영되는지 테스트"""
+        print("\n=== 검색 색인 동기화 테스트 ===")
+
+        job_id = self.saved[1]['id']
+        self.db.update_job_posting(job_id, {**JOBS[1], 'title': '모바일 앱 개발자'})
+        self.assertEqual(self.db.search_job_postings('프론트엔드')['total'], 0)
+        self.assertEqual(self.db.search_job_postings('모바일')['jobs'][0]['id'], job_id)
+
+        self.db.delete_job_posting(job_id)
+        self.assertEqual(self.db.search_job_postings('모바일')['total'], 0)
+        print("✓ 수정/삭제 반영 확인")
+
+    def test_rebuild_after_table_recreated(self):
+        """job_postings를 다시 만들면(트리거 유실) init_db가 색인을 재구성하는지 테스트"""
+        print("\n=== 검색 색인 재구성 테스트 ===")
+
+        Base.metadata.drop_all(bind=self.engine)
+        init_db(self.engine)
+        self.assertEqual(self.db.search_job_postings('백엔드')['total'], 0)
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TRIGGER job_postings_fts_ai"))
+        self.db.save_job_posting(dict(JOBS[0]))
+        init_db(self.engine)
+        self.assertEqual(self.db.search_job_postings('백엔드')['total'], 1)
+        print("✓ 색인 재구성 확인")
+
+class TestJsonSearch(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.data_dir = tempfile.mkdtemp(prefix="test_data_")
+        self.db = Database(data_dir=self.data_dir, storage="json")
+        for job in JOBS:
+            self.db.save_job_posting(dict(job))
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def test_same_result_shape(self):
+        """JSON 저장소 검색이 SQL 저장소와 같은 모양/순서를 돌려주는지 테스트"""
+        print("\n=== JSON 저장소 검색 테스트 ===")
+
+        result = self.db.search_job_postings('백엔드', limit=1)
+        self.assertEqual(result['total'], 2)
+        self.assertEqual(result['jobs'][0]['url'], 'http://1.com')
+        self.assertIn('snippet', result['jobs'][0])
+        self.assertEqual(self.db.search_job_postings('백엔드', offset=1)['jobs'][0]['url'], 'http://3.com')
+        print("✓ JSON 저장소 검색 확인")
+
+    def test_snippet_offsets(self):
+        """긴 본문 스니펫의 강조 위치 테스트"""
+        print("\n=== 스니펫 테스트 ===")
+
+        record = {'description': '가' * 200 + '\n파이썬' + '나' * 200}
+        snippet = make_snippet(record, ['파이썬'], width=40)
+        self.assertTrue(snippet['text'].startswith('…') and snippet['text'].endswith('…'))
+        start, end = snippet['highlights'][0]
+        self.assertEqual(snippet['text'][start:end], '파이썬')
+        self.assertEqual(highlight_offsets('Python python', ['PYTHON', 'thon']), [[0, 6], [7, 13]])
+        print("✓ 스니펫 강조 위치 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
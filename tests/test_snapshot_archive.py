@@ -0,0 +1,105 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from crawler import snapshot_archive
+from crawler.snapshot_archive import SnapshotArchive, archive_page
+
+URL = 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=50312877'
+OTHER_URL = 'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=50312878'
+
+def page(title):
+    # 실제 채용 공고처럼 반복되는 마크업이 많은 페이지
+    rows = ''.join(f'<div class="row"><div class="col head">항목{i}</div><div class="col body">값{i}</div></div>'
+                   for i in range(50))
+    return f'<html><body><h1 class="tit_job">{title}</h1><div class="jv_summary">{rows}</div></body></html>'
+
+class TestSnapshotArchive(unittest.TestCase):
+    def setUp(self):
+        """테스트 전에 실행될 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive = SnapshotArchive(self.temp_dir.name)
+
+    def tearDown(self):
+        """테스트 후에 실행될 정리 작업"""
+        self.archive.close()
+        self.temp_dir.cleanup()
+
+    def test_dedup_and_history(self):
+        """같은 내용은 한 번만 저장하고 내용이 바뀔 때만 스냅샷이 늘어나는지 테스트"""
+        print("\n=== 스냅샷 중복 제거/이력 테스트 ===")
+
+        first = self.archive.put(URL, page("백엔드 개발자"), site='Saramin', source='http', fetched_at=100)
+        same = self.archive.put(URL, page("백엔드 개발자"), site='Saramin', source='http', fetched_at=200)
+        self.assertEqual(same.id, first.id)
+        self.assertEqual((same.first_seen_at, same.last_seen_at), (100, 200))
+
+        # 다른 URL이라도 내용이 같으면 본문은 공유
+        self.archive.put(OTHER_URL, page("백엔드 개발자"), site='Saramin', fetched_at=150)
+        changed = self.archive.put(URL, page("백엔드 개발자 (마감)"), site='Saramin', source='browser', fetched_at=300)
+        self.assertNotEqual(changed.sha256, first.sha256)
+
+        stats = self.archive.stats()
+        self.assertEqual((stats['urls'], stats['snapshots'], stats['blobs']), (2, 3, 2))
+        self.assertGreater(stats['compression_ratio'], 3)
+        self.assertEqual([snapshot.first_seen_at for snapshot in self.archive.history(URL)], [100, 300])
+        print(f"✓ 중복 제거/이력 확인 (압축률 {stats['compression_ratio']:.1f}배)")
+
+        # URL/시점별 조회
+        self.assertEqual(self.archive.get(URL), page("백엔드 개발자 (마감)"))
+        self.assertEqual(self.archive.get(URL, at=250), page("백엔드 개발자"))
+        self.assertIsNone(self.archive.get(URL, at=50))
+        self.assertIsNone(self.archive.get('https://www.saramin.co.kr/none'))
+        self.assertEqual([(s.url, s.sha256) for s in self.archive.iter_latest(site='Saramin')],
+                         [(URL, changed.sha256), (OTHER_URL, first.sha256)])
+        print("✓ URL/시점별 조회 확인")
+
+    def test_persistence_and_layout(self):
+        """다시 열어도 남아 있고 본문이 내용 해시 경로에 압축되어 저장되는지 테스트"""
+        print("\n=== 스냅샷 보관소 저장 형식 테스트 ===")
+
+        snapshot = self.archive.put(URL, page("프론트엔드 개발자"))
+        codec = snapshot_archive.DEFAULT_CODEC
+        path = os.path.join(self.temp_dir.name, 'objects', snapshot.sha256[:2], snapshot.sha256[2:4],
+                            f"{snapshot.sha256}.{codec}")
+        self.assertTrue(os.path.exists(path))
+        self.assertLess(os.path.getsize(path), len(page("프론트엔드 개발자").encode('utf-8')))
+        self.assertEqual([name for name in os.listdir(os.path.dirname(path)) if name.endswith('.tmp')], [])
+
+        reopened = SnapshotArchive(self.temp_dir.name)
+        self.assertEqual(reopened.get(URL), page("프론트엔드 개발자"))
+        reopened.close()
+        with self.assertRaises(KeyError):
+            self.archive.read('0' * 64)
+        print(f"✓ 내용 주소 저장/재시작 후 조회 확인 ({codec})")
+
+        # zstandard가 없어 zlib으로 대신하면 경고를 남김
+        with mock.patch.object(snapshot_archive, 'zstandard', None), \
+                mock.patch.object(snapshot_archive, 'DEFAULT_CODEC', 'zlib'), \
+                self.assertLogs(snapshot_archive.logger, 'WARNING'):
+            SnapshotArchive(os.path.join(self.temp_dir.name, 'fallback')).close()
+        print("✓ zlib 대체 경고 확인")
+
+    def test_archive_page(self):
+        """크롤러용 저장 함수가 설정을 따르고 오류를 삼키는지 테스트"""
+        print("\n=== 크롤러 스냅샷 저장 테스트 ===")
+
+        with mock.patch.object(snapshot_archive, '_shared_archive', self.archive):
+            self.assertIsNotNone(archive_page(URL, page("데이터 엔지니어"), site='Saramin'))
+            self.assertIsNone(archive_page(URL, ""))
+            with mock.patch.dict(os.environ, {'CRAWLER_SNAPSHOTS': '0'}):
+                self.assertIsNone(archive_page(OTHER_URL, page("데이터 엔지니어")))
+            with mock.patch.object(self.archive, 'put', side_effect=OSError("디스크 가득 참")):
+                self.assertIsNone(archive_page(URL, page("데이터 엔지니어")))
+        self.assertEqual(self.archive.stats()['urls'], 1)
+        print("✓ 설정/오류 처리 확인")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)